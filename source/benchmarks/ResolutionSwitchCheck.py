@@ -0,0 +1,313 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: ResolutionSwitchCheck.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file checks that switching the resolution while the game is running gives the same game as starting at that
+        resolution.
+    Every scenario from ScenarioBenchmark.py is run twice, each time in its own headless process:
+        - Started at the target resolution (Through the LASER_FIGHTER_SCREEN_SIZE environment variable)
+        - Started in the default window and switched to the target resolution by the display manager
+    After the scenario has run, the position, size and visibility of every sprite, the score, and the values of every
+        subsystem that is rescaled by the display manager are compared. Any value that is different is printed.
+    The switch is made before the first frame by default. When it is made during the scenario instead (--switch-frame),
+        only the values calculated from the scale factors are compared, since the frames before the switch play out
+        differently at the starting resolution (Ex: the machines spawn at other random spots).
+    The files in the config folder are backed up before the scenarios are run, and put back before every run (So both
+        runs start from the same player data) and afterwards.
+
+    Run from the source folder with: python -m benchmarks.ResolutionSwitchCheck
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from benchmarks.ScenarioBenchmark import SCENARIOS
+from benchmarks.ScenarioBenchmark import prepare_scenario
+from benchmarks import ScenarioBenchmark
+
+# The values calculated from the scale factors in every rescaled subsystem (None for every numeric value)
+SCALED_VALUES = {
+    "machine_kinematics": ["_health_bar_offset"],
+    "machine_collision": ["laser_speed"],
+    "alien_collision": [],
+    "projectile_system": ["_reach", "_speed", "_reload_y", "_hide_y", "_hit_radius", "_hit_width"],
+    "machine_mode_setup": None,
+    "alien_mode_setup": None,
+    "human_player": ["initial_velocity"],
+}
+
+
+def get_values(item, names=None):
+    """
+        Gathers the numeric attributes of an object or a class.
+
+        :param item: The object or class
+        :type item: object
+
+        :param names: The attributes to gather (Default: every numeric attribute)
+        :type names: list
+
+        :return: The value of every numeric attribute (Arrays and tuples are turned into lists)
+        :type: dict
+    """
+
+    import numpy as np
+
+    values = {}
+    for name, value in vars(item).items():
+        if names is not None and name not in names:
+            continue
+        if isinstance(value, np.ndarray) and value.dtype.kind in "iuf":
+            values[name] = value.astype(float).tolist()
+        elif isinstance(value, tuple) and all(isinstance(v, (int, float)) for v in value):
+            values[name] = [float(v) for v in value]
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[name] = float(value)
+    return values
+
+
+def get_state(game, utility, scaled_only):
+    """
+        Gathers everything that has to match between the two runs of a scenario.
+
+        :param game: The main module of the game
+        :type game: module
+
+        :param utility: The utility setup module of the game (Holds the display manager)
+        :type utility: module
+
+        :param scaled_only: 1 to only gather the values calculated from the scale factors (See SCALED_VALUES)
+        :type scaled_only: int
+
+        :return: The state of the game
+        :type: dict
+    """
+
+    from components.ItemCoin import Coin
+    from physics.AlienCollision import AlienCollision
+    from physics.MachineCollision import MachineCollision
+    from physics.MachineKinematics import MachineKinematics
+    from setup.MachineModeSetup import MachineModeSetup
+
+    state = {"scale_factors": [utility.display_manager.scale_factor, utility.display_manager.scale_factor_x,
+                               utility.display_manager.scale_factor_y]}
+    if scaled_only == 0:
+        state["score"] = float(game.statistics.score)
+        for i, t in enumerate(game.window.turtles()):
+            stretch_wid, stretch_len, _ = t.shapesize()
+            state[f"sprite {i}"] = [t.xcor(), t.ycor(), float(stretch_wid), float(stretch_len), float(t.isvisible())]
+
+    # Class variables
+    for scaled_class in (AlienCollision, MachineCollision, MachineKinematics, MachineModeSetup, Coin):
+        upper_names = [name for name in vars(scaled_class) if name.isupper()]
+        for name, value in get_values(scaled_class, upper_names).items():
+            state[f"{scaled_class.__name__}.{name}"] = value
+
+    # Values of the rescaled subsystems
+    subsystems = [("machine_kinematics", utility.machine_kinematics), ("machine_collision", utility.machine_collision),
+                  ("alien_collision", utility.alien_collision), ("projectile_system", utility.projectile_system),
+                  ("machine_mode_setup", game.machine_mode_setup), ("alien_mode_setup", utility.alien_mode_setup)]
+    for h in game.human_player.all_human:
+        subsystems.append(("human_player", h))
+    for i, (subsystem_name, subsystem) in enumerate(subsystems):
+        names = SCALED_VALUES[subsystem_name] if scaled_only == 1 else None
+        for name, value in get_values(subsystem, names).items():
+            state[f"{subsystem_name} {i}.{name}"] = value
+    return state
+
+
+def run_check(name, frames, frame_time, seed, switch, switch_frame):
+    """
+        Runs one scenario in this process and returns the state of the game at the end. The game is imported here,
+            in headless mode.
+
+        :param name: The name of the scenario
+        :type name: string
+
+        :param frames: The number of frames to run
+        :type frames: int
+
+        :param frame_time: The length of every frame in seconds
+        :type frame_time: float
+
+        :param seed: The seed for the random module
+        :type seed: int
+
+        :param switch: The fullscreen setting, width and height to switch to (None to keep the starting resolution)
+        :type switch: tuple
+
+        :param switch_frame: The frame the switch is requested on (0 switches before the first frame)
+        :type switch_frame: int
+
+        :return: The state of the game
+        :type: dict
+    """
+
+    os.environ["LASER_FIGHTER_HEADLESS"] = "1"
+    import main as game
+    from setup import UtilitySetup as utility
+
+    start_mode = [s[1] for s in SCENARIOS if s[0] == name][0]
+    script = getattr(ScenarioBenchmark, "script_" + name)
+    display_manager = utility.display_manager
+
+    def switch_resolution():
+        display_manager.request(*switch)
+        # Wait for the textures, so the switch is applied on the same frame in every run
+        display_manager._thread.join()
+
+    def run_frame(frame):
+        if switch is not None and switch_frame > 0 and frame == switch_frame:
+            switch_resolution()
+        script(game, utility, frame)
+
+    prepare_scenario(game, name)
+    random.seed(seed)
+    game.game_clock.fixed_frame_time = frame_time
+    if switch is not None and switch_frame == 0:
+        switch_resolution()
+        display_manager.update()
+    game.main(start_mode, frames, run_frame)
+    return get_state(game, utility, int(switch_frame > 0))
+
+
+def compare_states(fresh, switched, tolerance):
+    """
+        Finds every value that is different between the two runs of a scenario.
+
+        :param fresh: The state of the run that started at the target resolution
+        :type fresh: dict
+
+        :param switched: The state of the run that switched to the target resolution
+        :type switched: dict
+
+        :param tolerance: The largest difference allowed between two values (Relative to their size)
+        :type tolerance: float
+
+        :return: A description of every difference
+        :type: list
+    """
+
+    differences = []
+    for name in sorted(set(fresh) | set(switched)):
+        a = fresh.get(name)
+        b = switched.get(name)
+        if a is None or b is None:
+            differences.append(f"{name}: only in the {'switched' if a is None else 'fresh'} run")
+            continue
+        a_values = a if isinstance(a, list) else [a]
+        b_values = b if isinstance(b, list) else [b]
+        if len(a_values) != len(b_values) or \
+                any(abs(x - y) > tolerance * max(1.0, abs(x)) for x, y in zip(a_values, b_values)):
+            differences.append(f"{name}: fresh {a} switched {b}")
+    return differences
+
+
+def main():
+    """
+        Runs every requested scenario from a fresh start and after a switch, and prints any differences.
+
+        :return: None
+    """
+
+    parser = argparse.ArgumentParser(description="Laser Fighter resolution switch check")
+    parser.add_argument("scenarios", nargs="*", default=[s[0] for s in SCENARIOS],
+                        help="The scenarios to run (Default: all of them)")
+    parser.add_argument("--size", default="1920x1080", help="The resolution to switch to (Ex: 1920x1080)")
+    parser.add_argument("--frames", type=int, default=600, help="The number of frames to run for each scenario")
+    parser.add_argument("--frame-time", type=float, default=1 / 60,
+                        help="The amount of game time that passes every frame in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the random module")
+    parser.add_argument("--switch-frame", type=int, default=0,
+                        help="The frame the switch is requested on (Default: before the first frame)")
+    parser.add_argument("--tolerance", type=float, default=1e-6,
+                        help="The largest difference allowed between two values (Relative to their size)")
+    parser.add_argument("--run", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--switch", action="store_true", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+    width, height = (int(size) for size in arguments.size.lower().split("x"))
+
+    # Run a single scenario (Used by the parent process) and print its state as JSON
+    if arguments.run is not None:
+        switch = (1, width, height) if arguments.switch else None
+        print(json.dumps(run_check(arguments.run, arguments.frames, arguments.frame_time, arguments.seed, switch,
+                                   arguments.switch_frame)))
+        return
+
+    names = [s[0] for s in SCENARIOS]
+    for name in arguments.scenarios:
+        if name not in names:
+            parser.error(f"Unknown scenario {name} (Choose from: {', '.join(names)})")
+
+    # The scenarios earn coins and statistics, so the player's files are put back when they are done
+    config_backup = os.path.join(tempfile.mkdtemp(), "config")
+    shutil.copytree("config", config_backup)
+    failed = 0
+    try:
+        for name in arguments.scenarios:
+            states = []
+            for switch in (0, 1):
+                command = [sys.executable, "-m", "benchmarks.ResolutionSwitchCheck", "--run", name,
+                           "--size", arguments.size, "--frames", str(arguments.frames),
+                           "--frame-time", str(arguments.frame_time), "--seed", str(arguments.seed),
+                           "--switch-frame", str(arguments.switch_frame)]
+                environment = dict(os.environ)
+                if switch == 1:
+                    command.append("--switch")
+                    environment.pop("LASER_FIGHTER_SCREEN_SIZE", None)
+                else:
+                    environment["LASER_FIGHTER_SCREEN_SIZE"] = arguments.size
+                # Milestones and statistics are saved while a scenario runs, so every run starts from the same files
+                shutil.rmtree("config")
+                shutil.copytree(config_backup, "config")
+                process = subprocess.run(command, capture_output=True, text=True, env=environment)
+                output_lines = process.stdout.strip().splitlines()
+                if process.returncode != 0 or not output_lines:
+                    states.append(None)
+                    print(f"{name:<30} failed: {process.stderr.strip().splitlines()[-1:]}")
+                    break
+                states.append(json.loads(output_lines[-1]))
+            if len(states) < 2 or None in states:
+                failed = 1
+                continue
+
+            differences = compare_states(states[0], states[1], arguments.tolerance)
+            if differences:
+                failed = 1
+                print(f"{name:<30} {len(differences)} differences")
+                for difference in differences:
+                    print(f"    {difference}")
+            else:
+                print(f"{name:<30} matches ({len(states[0])} values)")
+    finally:
+        shutil.rmtree("config")
+        shutil.copytree(config_backup, "config")
+        shutil.rmtree(os.path.dirname(config_backup))
+
+    if failed == 1:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
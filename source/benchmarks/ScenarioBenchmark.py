@@ -0,0 +1,349 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: ScenarioBenchmark.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file runs the real game loop through scripted scenarios and measures how long the frames take.
+    Every scenario is run in its own headless process (So no window or virtual X server is needed, and the peak
+        memory of one scenario does not include the others). The game clock moves forward by the same amount every
+        frame and the random module is seeded, so every run of a scenario plays out the same way.
+    For each scenario, the p50, p95 and p99 frame times, the turtle calls per frame and the peak memory are written
+        to a JSON file.
+    The files in the config folder are backed up before the scenarios are run and put back afterwards.
+
+    Run from the source folder with: python -m benchmarks.ScenarioBenchmark
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+try:
+    import resource
+except ImportError:
+    # Only available on Linux and macOS
+    resource = None
+
+# (Name, screen to start on, description)
+SCENARIOS = [
+    ("machine_star_killer_yellow", "Machine_Mode",
+     "Machine Mode with the Star Killer, the yellow power up and every machine at death count 16"),
+    ("alien_ufo_large_aliens", "Alien_Mode",
+     "Alien Mode at score 300 with the UFO and all five large aliens"),
+    ("boss_coin_shower", "Machine_Mode",
+     "Machine Mode with the boss and the coin magnet pulling in a shower of platinum coins"),
+    ("screen_churn", "Title_Mode",
+     "Clicking from the title screen to the shop, the statistics screen and back"),
+]
+
+
+def script_machine_star_killer_yellow(game, utility, frame):
+    """
+        Keeps every machine on the screen at death count 16 with the yellow power up active, and fires constantly.
+
+        :param game: The main module of the game
+        :type game: module
+
+        :param utility: The utility setup module of the game (Holds the movement and click handlers)
+        :type utility: module
+
+        :param frame: The current frame number
+        :type frame: int
+
+        :return: None
+    """
+
+    if game.statistics.score < 160:
+        game.statistics.score = 160
+    for m in game.blue_machine.blue_machines + game.yellow_machine.yellow_machines + game.red_machine.red_machines:
+        if m.death_count < 16:
+            m.death_count = 16
+            game.machine_kinematics.set_death_count(m, m.death_count)
+    for yi in game.yellow_power_up_indicator.yellow_power_up_indicator_turtle:
+        if yi.get_power_up_active() == 0:
+            yi.set_power_up_active(1)
+            yi.time_value = 20
+    utility.movement.shoot()
+    if frame % 40 == 0:
+        if frame % 80 == 0:
+            utility.movement.go_left()
+        else:
+            utility.movement.go_right()
+
+
+def script_alien_ufo_large_aliens(game, utility, frame):
+    """
+        Keeps the score at 300 so that every alien and the UFO is on the screen, and fires, moves and jumps.
+
+        :param game: The main module of the game
+        :type game: module
+
+        :param utility: The utility setup module of the game (Holds the movement and click handlers)
+        :type utility: module
+
+        :param frame: The current frame number
+        :type frame: int
+
+        :return: None
+    """
+
+    if game.statistics.score < 300:
+        game.statistics.score = 300
+    utility.movement.shoot()
+    if frame % 60 == 0:
+        utility.movement.jump()
+    if frame % 30 == 0:
+        if frame % 120 < 60:
+            utility.movement.go_left()
+        else:
+            utility.movement.go_right()
+
+
+def script_boss_coin_shower(game, utility, frame):
+    """
+        Keeps the boss on the screen and drops 20 platinum coins around it every 30 frames for the coin magnet to pull in.
+
+        :param game: The main module of the game
+        :type game: module
+
+        :param utility: The utility setup module of the game (Holds the movement and click handlers)
+        :type utility: module
+
+        :param frame: The current frame number
+        :type frame: int
+
+        :return: None
+    """
+
+    if game.statistics.score < 200:
+        game.statistics.score = 200
+    if frame % 30 == 0:
+        for i in range(20):
+            x = random.uniform(-600, 600) * game.scale_factor_X
+            y = random.uniform(0, 300) * game.scale_factor_Y
+            game.coin.spawn_coin("platinum", x, y, "Machine_Mode")
+    utility.movement.shoot()
+
+
+# The buttons clicked in order during the screen churn (x and y before scaling)
+CHURN_CLICKS = [
+    (0, -97),     # Title screen: Shop
+    (-603, -210), # Shop: Gadgets tab
+    (-538, 339),  # Shop: Back to the title screen
+    (130, -187),  # Title screen: Statistics
+    (-538, 339),  # Statistics: Back to the title screen
+]
+
+
+def script_screen_churn(game, utility, frame):
+    """
+        Clicks through the title screen, the shop and the statistics screen, one click every 10 frames.
+
+        :param game: The main module of the game
+        :type game: module
+
+        :param utility: The utility setup module of the game (Holds the movement and click handlers)
+        :type utility: module
+
+        :param frame: The current frame number
+        :type frame: int
+
+        :return: None
+    """
+
+    if frame % 10 == 0:
+        x, y = CHURN_CLICKS[(frame // 10) % len(CHURN_CLICKS)]
+        utility.click.click(x * game.scale_factor_X, y * game.scale_factor_Y)
+
+
+def prepare_scenario(game, name):
+    """
+        Changes the shop selections (In memory only) that a scenario needs before the game loop starts.
+
+        :param game: The main module of the game
+        :type game: module
+
+        :param name: The name of the scenario
+        :type name: string
+
+        :return: None
+    """
+
+    if name == "machine_star_killer_yellow":
+        game.shop_config.machine_slot_selected = 5
+    elif name == "alien_ufo_large_aliens":
+        game.shop_config.alien_slot_selected = 1
+    elif name == "boss_coin_shower":
+        game.shop_config.coin_magnet_enabled = True
+
+
+def count_turtle_calls(turtle_class):
+    """
+        Counts every call made to the methods of the turtle class.
+
+        :param turtle_class: The turtle class from the headless backend
+        :type turtle_class: type
+
+        :return: The number of calls for each method (Updated as the game runs)
+        :type: dict
+    """
+
+    calls = {}
+
+    def counted(name, method):
+        def counted_method(*args, **kwargs):
+            calls[name] = calls[name] + 1
+            return method(*args, **kwargs)
+        return counted_method
+
+    for name, method in list(vars(turtle_class).items()):
+        if callable(method) and not name.startswith("_"):
+            calls[name] = 0
+            setattr(turtle_class, name, counted(name, method))
+    return calls
+
+
+def run_scenario(name, frames, frame_time, seed):
+    """
+        Runs one scenario in this process and returns its results. The game is imported here, in headless mode.
+
+        :param name: The name of the scenario
+        :type name: string
+
+        :param frames: The number of frames to run
+        :type frames: int
+
+        :param frame_time: The length of every frame in seconds
+        :type frame_time: float
+
+        :param seed: The seed for the random module
+        :type seed: int
+
+        :return: The results of the scenario
+        :type: dict
+    """
+
+    os.environ["LASER_FIGHTER_HEADLESS"] = "1"
+    import main as game
+    import turtle
+    from setup import UtilitySetup as utility
+
+    start_mode = [s[1] for s in SCENARIOS if s[0] == name][0]
+    script = globals()["script_" + name]
+
+    prepare_scenario(game, name)
+    random.seed(seed)
+    game.game_clock.fixed_frame_time = frame_time
+    game.frame_profiler.enabled = True
+    game.frame_profiler.WINDOW_SIZE = frames
+    # The game writes the profile when it closes, which is not needed here
+    profile_directory = tempfile.mkdtemp()
+    game.frame_profiler.export_path = os.path.join(profile_directory, "frame_profile")
+    turtle_calls = count_turtle_calls(turtle.Turtle)
+
+    frames_run = game.main(start_mode, frames, lambda frame: script(game, utility, frame))
+    shutil.rmtree(profile_directory)
+
+    frame_summary = {}
+    for s in game.frame_profiler.get_summary():
+        if s["section"] == "Frame":
+            frame_summary = s
+    total_calls = sum(turtle_calls.values())
+    busiest_calls = sorted(turtle_calls.items(), key=lambda c: c[1], reverse=True)[:10]
+    if resource is not None:
+        # Kilobytes on Linux
+        peak_memory_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    else:
+        peak_memory_kb = None
+
+    return {"scenario": name,
+            "frames": frames_run,
+            "frame_time_ms": {key[:-3]: frame_summary.get(key, 0.0)
+                              for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")},
+            "turtle_calls_per_frame": round(total_calls / max(frames_run, 1), 2),
+            "busiest_turtle_calls_per_frame": {n: round(c / max(frames_run, 1), 2) for n, c in busiest_calls if c > 0},
+            "peak_memory_kb": peak_memory_kb,
+            "sections": game.frame_profiler.get_summary(),
+            "counters": game.frame_profiler.counters}
+
+
+def main():
+    """
+        Runs every requested scenario in its own process and writes the results to a JSON file.
+
+        :return: None
+    """
+
+    parser = argparse.ArgumentParser(description="Laser Fighter scenario benchmarks")
+    parser.add_argument("scenarios", nargs="*", default=[s[0] for s in SCENARIOS],
+                        help="The scenarios to run (Default: all of them)")
+    parser.add_argument("--frames", type=int, default=2000, help="The number of frames to run for each scenario")
+    parser.add_argument("--frame-time", type=float, default=1 / 60,
+                        help="The amount of game time that passes every frame in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the random module")
+    parser.add_argument("--output", default="scenario_benchmark.json", help="Where to write the results")
+    parser.add_argument("--run", default=None, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    # Run a single scenario (Used by the parent process) and print its results as JSON
+    if arguments.run is not None:
+        print(json.dumps(run_scenario(arguments.run, arguments.frames, arguments.frame_time, arguments.seed)))
+        return
+
+    names = [s[0] for s in SCENARIOS]
+    for name in arguments.scenarios:
+        if name not in names:
+            parser.error(f"Unknown scenario {name} (Choose from: {', '.join(names)})")
+
+    # The scenarios earn coins and statistics, so the player's files are put back when they are done
+    config_backup = os.path.join(tempfile.mkdtemp(), "config")
+    shutil.copytree("config", config_backup)
+    results = []
+    try:
+        for name in arguments.scenarios:
+            process = subprocess.run([sys.executable, "-m", "benchmarks.ScenarioBenchmark", "--run", name,
+                                      "--frames", str(arguments.frames), "--frame-time", str(arguments.frame_time),
+                                      "--seed", str(arguments.seed)],
+                                     capture_output=True, text=True)
+            output_lines = process.stdout.strip().splitlines()
+            if process.returncode != 0 or not output_lines:
+                results.append({"scenario": name, "error": process.stderr.strip().splitlines()[-1:]})
+                print(f"{name:<30} failed")
+                continue
+            result = json.loads(output_lines[-1])
+            results.append(result)
+            print(f"{name:<30}p50 {result['frame_time_ms']['p50']:>8.3f} ms  p95 {result['frame_time_ms']['p95']:>8.3f} ms"
+                  f"  p99 {result['frame_time_ms']['p99']:>8.3f} ms  {result['turtle_calls_per_frame']:>8.1f} calls/frame"
+                  f"  {result['peak_memory_kb'] or 0:>8} KB")
+    finally:
+        shutil.rmtree("config")
+        shutil.copytree(config_backup, "config")
+        shutil.rmtree(os.path.dirname(config_backup))
+
+    with open(arguments.output, 'w') as json_file:
+        json.dump({"frames": arguments.frames, "frame_time": arguments.frame_time, "seed": arguments.seed,
+                   "scenarios": results}, json_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
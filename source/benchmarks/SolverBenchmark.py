@@ -0,0 +1,141 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: SolverBenchmark.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file measures the per-shot time of the laser and machine intersection solver. It compares the batched
+    IntersectionSolver against the previous approach of one scipy fsolve call per machine and laser.
+
+    Run from the source folder with: python -m benchmarks.SolverBenchmark
+"""
+
+import sys
+import time
+import numpy as np
+from physics.IntersectionSolver import IntersectionSolver
+
+FLOAT_AMPLITUDE = 50
+PERIOD = 10
+
+# (Name, machines on screen, lasers per shot, laser speed per 0.015 seconds)
+LOADOUTS = [
+    ("Default Laser", 4, 1, 14.5),
+    ("Machine Washer", 4, 2, 20),
+    ("Star Killer", 4, 3, 27),
+]
+
+
+def create_shots(machines, lasers, shots, seed=0):
+    """
+        Creates random float offsets and initial distances that match what is seen in Machine Mode.
+
+        :param machines: The number of machines on screen
+        :type machines: int
+
+        :param lasers: The number of lasers fired per shot
+        :type lasers: int
+
+        :param shots: The number of shots to create
+        :type shots: int
+
+        :param seed: The seed for the random number generator
+        :type seed: int
+
+        :return: The float offsets and initial distances for each shot
+        :type: tuple
+    """
+
+    rng = np.random.default_rng(seed)
+    phase = rng.uniform(0, 100, size=(shots, machines, 1))
+    distance = rng.uniform(250, 550, size=(shots, machines, lasers))
+    return phase, distance
+
+
+def time_fsolve(fsolve, phase, speed, distance):
+    """
+        Times the previous approach of one fsolve call per machine and laser.
+
+        :return: The average time per shot in seconds and the intersection times
+        :type: tuple
+    """
+
+    shots, machines, lasers = distance.shape
+    results = np.empty_like(distance)
+    start = time.perf_counter()
+    for s in range(shots):
+        for m in range(machines):
+            for i in range(lasers):
+                offset = phase[s, m, 0]
+                d = distance[s, m, i]
+                results[s, m, i] = fsolve(lambda t: (FLOAT_AMPLITUDE * np.sin((2 * np.pi * (t + offset)) / PERIOD)) - (speed * t + d), 1)[0]
+    return (time.perf_counter() - start) / shots, results
+
+
+def time_solver(solver, phase, speed, distance):
+    """
+        Times the batched solver with one call per shot.
+
+        :return: The average time per shot in seconds and the intersection times
+        :type: tuple
+    """
+
+    shots = distance.shape[0]
+    results = np.empty_like(distance)
+    start = time.perf_counter()
+    for s in range(shots):
+        results[s] = solver.solve(phase[s], speed, distance[s])
+    return (time.perf_counter() - start) / shots, results
+
+
+def main(shots=500):
+    """
+        Runs the benchmark for every laser loadout and prints the results.
+
+        :param shots: The number of shots to time for each loadout
+        :type shots: int
+
+        :return: None
+    """
+
+    try:
+        from scipy.optimize import fsolve
+    except ImportError:
+        fsolve = None
+        print("scipy is not installed, only the batched solver will be timed.")
+
+    solver = IntersectionSolver(FLOAT_AMPLITUDE, PERIOD)
+
+    print(f"{'Loadout':<16}{'Solves/shot':>12}{'fsolve (us)':>14}{'batched (us)':>14}{'speedup':>10}{'max |dt|':>12}")
+    for name, machines, lasers, laser_speed in LOADOUTS:
+        speed = laser_speed / 0.015
+        phase, distance = create_shots(machines, lasers, shots)
+        batched_time, batched_results = time_solver(solver, phase, speed, distance)
+
+        if fsolve is not None:
+            fsolve_time, fsolve_results = time_fsolve(fsolve, phase, speed, distance)
+            speedup = f"{fsolve_time / batched_time:.1f}x"
+            error = f"{np.max(np.abs(fsolve_results - batched_results)):.1e}"
+            fsolve_column = f"{fsolve_time * 1e6:.1f}"
+        else:
+            speedup = error = fsolve_column = "-"
+
+        print(f"{name:<16}{machines * lasers:>12}{fsolve_column:>14}{batched_time * 1e6:>14.1f}{speedup:>10}{error:>12}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
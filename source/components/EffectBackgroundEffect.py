@@ -22,9 +22,8 @@
     This includes the ground, player ship, the Sun, and the Earth.
 """
 
-import turtle
 import math
-import time
+from utils.CachedTurtle import CachedTurtle
 from setup.TextureSetup import EARTH_TEXTURE
 from setup.TextureSetup import SUN_TEXTURE
 from setup.TextureSetup import SPACE_SHIP_TEXTURE
@@ -36,7 +35,7 @@ class Earth:
         Represents the Earth sprite in Alien Mode's background. This is a stationary sprite and never moves.
 
         Attributes:
-            earth (turtle.Turtle()): The Earth sprite
+            earth (CachedTurtle()): The Earth sprite
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
@@ -53,7 +52,7 @@ class Earth:
             :type scale_factor_y: float
         """
 
-        self.earth = turtle.Turtle()
+        self.earth = CachedTurtle()
         self.earth.shape(EARTH_TEXTURE)
         self.earth.shapesize(3 * scale_factor_y, 3 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -108,14 +107,14 @@ class Sun:
             the day/night cycle.
 
         Attributes:
-            sun (turtle.Turtle()): The Sun sprite
+            sun (CachedTurtle()): The Sun sprite
 
             angle (int): The angle that the sun is currently moving at in the ellipse
             x-coordinate (float): Represents the current x-coordinate of the sun
             y-coordinate (float): Represents the current y-coordinate of the sun
             movement_activated (int): Determines if the suns orbit has started or not
 
-            start_time (float): Used as a timestamp for the suns movement (So that the movement is consistent
+            step_time (float): The game time since the sun last moved (So that the movement is consistent
                 regardless of frame rate)
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -133,7 +132,7 @@ class Sun:
             :type scale_factor_y: float
         """
 
-        self.sun = turtle.Turtle()
+        self.sun = CachedTurtle()
         self.sun.shape(SUN_TEXTURE)
         self.sun.shapesize(4 * scale_factor_y, 4 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -143,7 +142,7 @@ class Sun:
         self.angle = 90
         self.x_coordinate = 0
         self.y_coordinate = 0
-        self.start_time = 0
+        self.step_time = 0
         self.movement_activated = 0
 
         # Find the new x and y coordinate of the sun given the new angle
@@ -195,27 +194,29 @@ class Sun:
         self.sun.hideturtle()
         self.movement_activated = 0
 
-    def update_position(self):
+    def update_position(self, dt):
         """
             Updates the suns position over a given interval of time on its elliptical path across the screen.
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
-        # If the movement has just started, a start time is created for it
+        # If the movement has just started, the timer starts from 0
         if self.movement_activated == 0:
-            self.start_time = time.time()
+            self.step_time = 0
             self.movement_activated = 1
 
-        # Update the suns position every 0.2 seconds
-        current_time = time.time()
-        elapsed_time = current_time - self.start_time
-        if elapsed_time >= 0.2:
-            # Create a delta angle so that movement stays consistent regardless of lag
-            delta_angle = 0.1 * ((elapsed_time - 0.2) / 0.2)
-            # Move the angle 0.1 every iteration (Very slow movement)
+        # Update the suns position every 0.2 seconds of game time
+        self.step_time = self.step_time + dt
+        if self.step_time >= 0.2:
+            # Move the angle 0.1 for every 0.2 seconds that have passed (Very slow movement)
+            steps = int(self.step_time / 0.2)
+            self.step_time = self.step_time - steps * 0.2
             if self.angle > 0:
-                self.angle = self.angle - 0.1 - delta_angle
+                self.angle = self.angle - 0.1 * steps
             else:
                 self.angle = 180
             # Find the new x and y coordinate of the sun given the new angle
@@ -224,7 +225,6 @@ class Sun:
 
             # Move the sun to this new location
             self.sun.goto(self.x_coordinate * self.scale_factor_x, self.y_coordinate * self.scale_factor_y)
-            self.start_time = time.time()
 
 
 class BackgroundObjects:
@@ -233,8 +233,8 @@ class BackgroundObjects:
             never move.
 
         Attributes:
-            ground (turtle.Turtle()): The ground sprite
-            ship (turtle.Turtle()): The player's ship sprite
+            ground (CachedTurtle()): The ground sprite
+            ship (CachedTurtle()): The player's ship sprite
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
@@ -252,7 +252,7 @@ class BackgroundObjects:
         """
 
         # Ground is created
-        self.ground = turtle.Turtle()
+        self.ground = CachedTurtle()
         self.ground.shape(GROUND_TEXTURE)
         self.ground.shapesize(22.5 * scale_factor_y, 80 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -260,7 +260,7 @@ class BackgroundObjects:
         self.ground.goto(0, -731 * scale_factor_y)
 
         # The players ship is created
-        self.ship = turtle.Turtle()
+        self.ship = CachedTurtle()
         self.ship.shape(SPACE_SHIP_TEXTURE)
         self.ship.shapesize(3 * scale_factor_y, 6 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -22,7 +22,7 @@
     be used in the shop.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.WindowSetup import scale_factor_X
 from setup.TextureSetup import COPPER_COIN_TEXTURE
 from setup.TextureSetup import SILVER_COIN_TEXTURE
@@ -40,7 +40,7 @@ class Coin:
 
         Attributes:
             type (string): The type of coin (copper, silver, gold, platinum)
-            coin (turtle.Turtle()): The coin sprite
+            coin (CachedTurtle()): The coin sprite
 
             range (tuple): The range of the coins hitbox (Distance between one side to another on a specified axis)
             collision_coordinate (float): The point the laser has to pass in order to pick up the coin (Edge of the
@@ -50,6 +50,22 @@ class Coin:
 
     COIN_DISTANCE = 48 * scale_factor_X
 
+    @classmethod
+    def rescale(cls, ratio_x, ratio_y):
+        """
+            Rescales the class variables when the resolution is changed while the game is running.
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        cls.COIN_DISTANCE = cls.COIN_DISTANCE * ratio_x
+
     def __init__(self, type, pos_x, pos_y):
         """
             Creates and places a coin on the screen
@@ -64,7 +80,7 @@ class Coin:
             :type pos_y: float
         """
 
-        self.coin = turtle.Turtle()
+        self.coin = CachedTurtle()
         if type == "copper":
             self.coin.shape(COPPER_COIN_TEXTURE)
         if type == "silver":
@@ -177,7 +193,7 @@ class Coin:
             Returns the coin sprite so its class attributes can be accessed
 
             :return: coin: the coin sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.coin
@@ -207,7 +223,7 @@ class CoinIndicator:
         Represents the coin counter in Laser Fighter.
 
         Attributes:
-            coin_indicator(turtle.Turtle()): The coin_indicator sprite
+            coin_indicator(CachedTurtle()): The coin_indicator sprite
     """
 
     def __init__(self, scale_factor_x, scale_factor_y):
@@ -221,7 +237,7 @@ class CoinIndicator:
             :type scale_factor_y: float
         """
 
-        self.coin_indicator = turtle.Turtle()
+        self.coin_indicator = CachedTurtle()
         self.coin_indicator.shape(COIN_INDICATOR_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
         self.coin_indicator.penup()
@@ -251,7 +267,7 @@ class CoinIndicator:
             Returns the coin_indicator sprite so its class attributes can be accessed
 
             :return: coin_indicator: the coin counter sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.coin_indicator
@@ -22,8 +22,7 @@
     If they do need specific sprites for displaying them, they will be created here.
 """
 
-import time
-import math
+import numpy as np
 
 
 class Gadget:
@@ -37,8 +36,6 @@ class Gadget:
 
         Attributes:
             _scale_factor (float): The general scale factor used in fullscreen mode based off of the shortest axis
-            start_time (float): Used as a starting timestamp for the delta time for the coins movement towards the
-                player
     """
 
     def __init__(self, machine_player, human_player, coins, scale_factor):
@@ -65,9 +62,6 @@ class Gadget:
 
         self._scale_factor = scale_factor
 
-        # Start the timer
-        self.start_time = time.time()
-
     def __del__(self):
         """
             Cleans up the variables from memory once the program has terminated
@@ -79,65 +73,50 @@ class Gadget:
         del self._human_player
         del self._coins
         del self._scale_factor
-        del self.start_time
 
-    def start_timer(self):
-        """
-            Begin tracking the time for the coins movement delta time.
-
-            :return: None
-        """
-
-        self.start_time = time.time()
-
-    def attract_coins(self, mode):
+    def attract_coins(self, mode, dt):
         """
             Function for moving the coins towards the player while the coin magnet is enabled.
 
             :param mode: The current mode of the game
             :type mode: string
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
+        if dt <= 0:
+            return
+
+        # Move the coins 1.75 units for every 0.002 seconds of game time that passed this frame
+        distance = 1.75 * self._scale_factor * (dt / 0.002)
         if mode == "Machine_Mode":
-            for p in self._machine_player.current_player:
-                player_position = p.player.position()
-
-                current_time = time.time()
-                elapsed_time = current_time - self.start_time
-                # Every 0.002 seconds, move the coin 1.75 units
-                if elapsed_time >= 0.002:
-                    for c in self._coins.coins_on_screen_list:
-                        if c.coin.isvisible():
-                            # Get the coins current position
-                            coin_position = c.coin.position()
-
-                            # Find the angle that it needs to move at in order to move towards the player and set
-                            #   its heading towards that angle
-                            angle = math.degrees(math.atan2(player_position[1] - coin_position[1], player_position[0] - coin_position[0]))
-                            c.coin.setheading(angle)
-
-                            # Move the coin 1.75 units with the delta movement
-                            delta_movement = 1.75 * self._scale_factor * ((elapsed_time - 0.002) / 0.002)
-                            c.coin.forward(1.75 * self._scale_factor + delta_movement)
-                # Reset the timer
-                self.start_time = time.time()
+            players = [p.player for p in self._machine_player.current_player]
         elif mode == "Alien_Mode":
             # Same procedure here as in Machine Mode, but with the human player being the object to move towards
-            for h in self._human_player.current_human:
-                player_position = h.player.position()
-
-                current_time = time.time()
-                elapsed_time = current_time - self.start_time
-                if elapsed_time >= 0.002:
-                    for c in self._coins.coins_on_screen_list:
-                        if c.coin.isvisible():
-                            coin_position = c.coin.position()
-
-                            angle = math.degrees(math.atan2(player_position[1] - coin_position[1], player_position[0] - coin_position[0]))
-                            c.coin.setheading(angle)
-
-                            delta_movement = 1.75 * self._scale_factor * ((elapsed_time - 0.002) / 0.002)
-                            c.coin.forward(1.75 * self._scale_factor + delta_movement)
-                self.start_time = time.time()
+            players = [h.player for h in self._human_player.current_human]
+        else:
+            return
+
+        positions = self._coins.coin_positions
+        if len(positions) == 0:
+            return
+
+        # Move every coin towards the player at once from the cached coin positions
+        for player in players:
+            player_position = np.array(player.position())
+            offsets = player_position - positions
+            lengths = np.hypot(offsets[:, 0], offsets[:, 1])
+            # Coins that are already on top of the player do not move
+            steps = np.divide(distance, lengths, out=np.zeros_like(lengths), where=lengths > 0)
+            positions = positions + offsets * steps[:, np.newaxis]
+        self._coins.coin_positions = positions
+
+        # Only one position write is needed per coin
+        for c, (pos_x, pos_y) in zip(self._coins.coins_on_screen_list, positions.tolist()):
+            c.coin.goto(pos_x, pos_y)
+
+        # The coins have moved, so their sorted index needs to be rebuilt
+        self._coins.index_update = 1
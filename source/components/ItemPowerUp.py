@@ -25,10 +25,8 @@
     When the hearts gadget is enabled, it allows for the hearts power up to spawn.
 """
 
-import turtle
 import random
-import time
-import pygame
+from utils.CachedTurtle import CachedTurtle
 from setup.ModeSetupMaster import power_up_setup
 from setup.TextureSetup import YELLOW_LIGHTNING_POWER_UP_TEXTURE
 from setup.TextureSetup import BLUE_LIGHTNING_POWER_UP_TEXTURE
@@ -43,6 +41,7 @@ from setup.TextureSetup import GREEN_POWER_UP_INDICATOR_ON_TEXTURE
 from setup.TextureSetup import GREEN_POWER_UP_INDICATOR_OFF_TEXTURE
 from setup.TextureSetup import RED_POWER_UP_INDICATOR_ON_TEXTURE
 from setup.TextureSetup import RED_POWER_UP_INDICATOR_OFF_TEXTURE
+from setup.WindowSetup import sound_bank
 
 
 class PowerUp:
@@ -51,7 +50,7 @@ class PowerUp:
             and Alien Mode.
 
         Attributes:
-            power_up (turtle.Turtle()): The power up sprite
+            power_up (CachedTurtle()): The power up sprite
 
             type (int): Determines the type of power up that this object is
             mode (int): Determines the current mode of the game (Machine mode or Alien mode)
@@ -80,7 +79,7 @@ class PowerUp:
             :type scale_factor_y: float
         """
 
-        self.power_up = turtle.Turtle()
+        self.power_up = CachedTurtle()
         # Type 1 = yellow power up
         if type == 1:
             self.power_up.shape(YELLOW_LIGHTNING_POWER_UP_TEXTURE)
@@ -105,8 +104,7 @@ class PowerUp:
         elif mode == 2:
             self.power_up.goto(random.randint(int(-620 * scale_factor_x), int(620 * scale_factor_x)), -150 * scale_factor_y)
         if spawn_sound == 1:
-            sound = pygame.mixer.Sound("sound/Power_Up_Spawn_Sound.wav")
-            sound.play()
+            sound_bank.play("power_up_spawn")
 
         self.type = type
         self.mode = mode
@@ -160,8 +158,7 @@ class PowerUp:
         elif mode == 2:
             self.power_up.goto(random.randint(int(-620 * self.scale_factor_x), int(620 * self.scale_factor_x)), -150 * self.scale_factor_y)
         if spawn_sound == 1:
-            sound = pygame.mixer.Sound("sound/Power_Up_Spawn_Sound.wav")
-            sound.play()
+            sound_bank.play("power_up_spawn")
         self.power_up.showturtle()
 
         self.type = type
@@ -172,7 +169,7 @@ class PowerUp:
             Returns the power up sprite so its class attributes can be accessed
 
             :return: power_up: the power up sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.power_up
@@ -212,8 +209,7 @@ class PowerUp:
             # Spawn it back
             self.power_up.showturtle()
             if spawn_sound == 1:
-                sound = pygame.mixer.Sound("sound/Power_Up_Spawn_Sound.wav")
-                sound.play()
+                sound_bank.play("power_up_spawn")
 
     def pick_up(self, pickup_sound):
         """
@@ -232,8 +228,7 @@ class PowerUp:
         elif self.mode == 2:
             self.power_up.goto(random.randint(int(-620 * self.scale_factor_x), int(620 * self.scale_factor_x)), -150 * self.scale_factor_y)
         if pickup_sound == 1:
-            sound = pygame.mixer.Sound("sound/Power_Up_Pickup_Sound.wav")
-            sound.play()
+            sound_bank.play("power_up_pickup")
 
 
 class YellowIndicator:
@@ -242,12 +237,9 @@ class YellowIndicator:
             unlit depending on if the yellow power up is active or not.
 
         Attributes:
-            power_up_indicator (turtle.Turtle()): The yellow power up indicator sprite
+            power_up_indicator (CachedTurtle()): The yellow power up indicator sprite
             yellow_power_up_active (int): Determines if the yellow power up is currently active or not
-            activate_time (float): Used to calculate the duration of exactly how long the yellow power up can be active
-                for.
-            current_time (float): Also used in the calculation of how long the yellow power up can be active for by
-                determining the current time at each iteration of the loop
+            elapsed_time (float): The game time since the timer of the yellow power up last dropped by a second
             time_value (int): The amount of seconds left before the power up deactivates (0 when it is not active)
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -265,7 +257,7 @@ class YellowIndicator:
             :type scale_factor_y: float
         """
 
-        self.power_up_indicator = turtle.Turtle()
+        self.power_up_indicator = CachedTurtle()
         self.power_up_indicator.color("#737000")
         self.power_up_indicator.shape(YELLOW_POWER_UP_INDICATOR_OFF_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -273,8 +265,7 @@ class YellowIndicator:
         self.power_up_indicator.goto(-95 * scale_factor_x, 300 * scale_factor_y)
 
         self.yellow_power_up_active = 0
-        self.activate_time = 0
-        self.current_time = 0
+        self.elapsed_time = 0
         self.time_value = 0
 
         self.scale_factor_x = scale_factor_x
@@ -306,7 +297,7 @@ class YellowIndicator:
             Returns the yellow power up indicator sprite so its class attributes can be accessed
 
             :return: yellow_power_up_indicator: the yellow power up indicator sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.power_up_indicator
@@ -341,7 +332,7 @@ class YellowIndicator:
         """
 
         self.yellow_power_up_active = new_value
-        self.activate_time = time.time()
+        self.elapsed_time = 0
         self.time_value = power_up_setup.yellow_power_up_duration
 
     def remove(self):
@@ -353,8 +344,7 @@ class YellowIndicator:
 
         self.power_up_indicator.hideturtle()
         self.yellow_power_up_active = 0
-        self.activate_time = 0
-        self.current_time = 0
+        self.elapsed_time = 0
         self.time_value = 0
 
     def set_texture(self):
@@ -369,31 +359,28 @@ class YellowIndicator:
         else:
             self.power_up_indicator.shape(YELLOW_POWER_UP_INDICATOR_OFF_TEXTURE)
 
-    def set_timer(self):
+    def set_timer(self, dt):
         """
             Updates the timer for the the yellow power up indicator when the yellow power up is active.
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
         if self.yellow_power_up_active == 1:
-            current_time = time.time()
-            elapsed_time = current_time - self.activate_time
+            self.elapsed_time = self.elapsed_time + dt
             # Every second, the value of "time_value" drops by 1 since "time_value" represents a 20 second timer
-            if elapsed_time >= 1.0:
-                # See if more than 1 whole second has passed (Just in case there is EXTREME lag)
-                # If it has, decrease the timer by the amount of whole seconds that have passed
-                delta_movement = (elapsed_time - 1.0) / 1.0
-                delta_movement = int(delta_movement)
-                iterations = 1 + delta_movement
-                for i in range(iterations):
-                    if self.time_value != 0:
-                        self.time_value = self.time_value - 1
-                        self.activate_time = time.time()
-                    else:
-                        self.yellow_power_up_active = 0
-                        self.activate_time = 0
-                        break
+            # (Once for every whole second that has passed, just in case there is EXTREME lag)
+            while self.elapsed_time >= 1.0:
+                self.elapsed_time = self.elapsed_time - 1.0
+                if self.time_value != 0:
+                    self.time_value = self.time_value - 1
+                else:
+                    self.yellow_power_up_active = 0
+                    self.elapsed_time = 0
+                    break
 
 
 class BlueIndicator:
@@ -402,12 +389,9 @@ class BlueIndicator:
             unlit depending on if the blue power up is active or not.
 
         Attributes:
-            power_up_indicator (turtle.Turtle()): The blue power up indicator sprite
+            power_up_indicator (CachedTurtle()): The blue power up indicator sprite
             blue_power_up_active (int): Determines if the blue power up is currently active or not
-            activate_time (float): Used to calculate the duration of exactly how long the blue power up can be active
-                for.
-            current_time (float): Also used in the calculation of how long the blue power up can be active for by
-                determining the current time at each iteration of the loop
+            elapsed_time (float): The game time since the timer of the blue power up last dropped by a second
             time_value (int): The amount of seconds left before the power up deactivates (0 when it is not active)
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -425,7 +409,7 @@ class BlueIndicator:
             :type scale_factor_y: float
         """
 
-        self.power_up_indicator = turtle.Turtle()
+        self.power_up_indicator = CachedTurtle()
         self.power_up_indicator.color("#00004A")
         self.power_up_indicator.shape(BLUE_POWER_UP_INDICATOR_OFF_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -433,8 +417,7 @@ class BlueIndicator:
         self.power_up_indicator.goto(-20 * scale_factor_x, 300 * scale_factor_y)
 
         self.blue_power_up_active = 0
-        self.activate_time = 0
-        self.current_time = 0
+        self.elapsed_time = 0
         self.time_value = 0
 
         self.scale_factor_x = scale_factor_x
@@ -466,7 +449,7 @@ class BlueIndicator:
             Returns the blue power up indicator sprite so its class attributes can be accessed
 
             :return: blue_power_up_indicator: the blue power up indicator sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.power_up_indicator
@@ -501,7 +484,7 @@ class BlueIndicator:
         """
 
         self.blue_power_up_active = new_value
-        self.activate_time = time.time()
+        self.elapsed_time = 0
         self.time_value = power_up_setup.blue_power_up_duration
 
     def remove(self):
@@ -513,8 +496,7 @@ class BlueIndicator:
 
         self.power_up_indicator.hideturtle()
         self.blue_power_up_active = 0
-        self.activate_time = 0
-        self.current_time = 0
+        self.elapsed_time = 0
         self.time_value = 0
 
     def set_texture(self):
@@ -529,31 +511,28 @@ class BlueIndicator:
         else:
             self.power_up_indicator.shape(BLUE_POWER_UP_INDICATOR_OFF_TEXTURE)
 
-    def set_timer(self):
+    def set_timer(self, dt):
         """
             Updates the timer for the the blue power up indicator when the blue power up is active.
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
         if self.blue_power_up_active == 1:
-            current_time = time.time()
-            elapsed_time = current_time - self.activate_time
+            self.elapsed_time = self.elapsed_time + dt
             # Every second, the value of "time_value" drops by 1 since "time_value" represents a 45 second timer
-            if elapsed_time >= 1.0:
-                # See if more than 1 whole second has passed (Just in case there is EXTREME lag)
-                # If it has, decrease the timer by the amount of whole seconds that have passed
-                delta_movement = (elapsed_time - 1.0) / 1.0
-                delta_movement = int(delta_movement)
-                iterations = 1 + delta_movement
-                for i in range(iterations):
-                    if self.time_value != 0:
-                        self.time_value = self.time_value - 1
-                        self.activate_time = time.time()
-                    else:
-                        self.blue_power_up_active = 0
-                        self.activate_time = 0
-                        break
+            # (Once for every whole second that has passed, just in case there is EXTREME lag)
+            while self.elapsed_time >= 1.0:
+                self.elapsed_time = self.elapsed_time - 1.0
+                if self.time_value != 0:
+                    self.time_value = self.time_value - 1
+                else:
+                    self.blue_power_up_active = 0
+                    self.elapsed_time = 0
+                    break
 
 
 class ExtraIndicator:
@@ -563,12 +542,9 @@ class ExtraIndicator:
             current mode of the game.
 
         Attributes:
-            power_up_indicator (turtle.Turtle()): The third power up indicator sprite
+            power_up_indicator (CachedTurtle()): The third power up indicator sprite
             extra_power_up_active (int): Determines if the third power up is currently active or not (red or green)
-            activate_time (float): Used to calculate the duration of exactly how long the third power up can be active
-                for.
-            current_time (float): Also used in the calculation of how long the third power up can be active for by
-                determining the current time at each iteration of the loop
+            elapsed_time (float): The game time since the timer of the third power up last dropped by a second
             time_value (int): The amount of seconds left before the power up deactivates (0 when it is not active)
             mode (int): The current mode of the game
 
@@ -590,7 +566,7 @@ class ExtraIndicator:
             :type scale_factor_y: float
         """
 
-        self.power_up_indicator = turtle.Turtle()
+        self.power_up_indicator = CachedTurtle()
         self.power_up_indicator.color("#001C00")
         # The color depends on the mode (Machine Mode = green and Alien Mode = red)
         if mode == 1:
@@ -602,8 +578,7 @@ class ExtraIndicator:
         self.power_up_indicator.goto(50 * scale_factor_x, 300 * scale_factor_y)
 
         self.extra_power_up_active = 0
-        self.activate_time = 0
-        self.current_time = 0
+        self.elapsed_time = 0
         self.time_value = 0
         self.mode = mode
 
@@ -645,7 +620,7 @@ class ExtraIndicator:
             Returns the third power up indicator sprite so its class attributes can be accessed
 
             :return: extra_power_up_indicator: the third power up indicator sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.power_up_indicator
@@ -680,7 +655,7 @@ class ExtraIndicator:
         """
 
         self.extra_power_up_active = new_value
-        self.activate_time = time.time()
+        self.elapsed_time = 0
         if self.mode == 1:
             self.time_value = power_up_setup.green_power_up_duration
         else:
@@ -695,8 +670,7 @@ class ExtraIndicator:
 
         self.power_up_indicator.hideturtle()
         self.extra_power_up_active = 0
-        self.activate_time = 0
-        self.current_time = 0
+        self.elapsed_time = 0
         self.time_value = 0
 
     def set_texture(self):
@@ -721,28 +695,25 @@ class ExtraIndicator:
             else:
                 self.power_up_indicator.shape(RED_POWER_UP_INDICATOR_OFF_TEXTURE)
 
-    def set_timer(self):
+    def set_timer(self, dt):
         """
             Updates the timer for the the extra power up indicator when the extra power up is active.
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
         if self.extra_power_up_active == 1:
-            current_time = time.time()
-            elapsed_time = current_time - self.activate_time
+            self.elapsed_time = self.elapsed_time + dt
             # Every second, the value of "time_value" drops by 1 since "time_value" represents a 15 second timer
-            if elapsed_time >= 1.0:
-                # See if more than 1 whole second has passed (Just in case there is EXTREME lag)
-                # If it has, decrease the timer by the amount of whole seconds that have passed
-                delta_movement = (elapsed_time - 1.0) / 1.0
-                delta_movement = int(delta_movement)
-                iterations = 1 + delta_movement
-                for i in range(iterations):
-                    if self.time_value != 0:
-                        self.time_value = self.time_value - 1
-                        self.activate_time = time.time()
-                    else:
-                        self.extra_power_up_active = 0
-                        self.activate_time = 0
-                        break
+            # (Once for every whole second that has passed, just in case there is EXTREME lag)
+            while self.elapsed_time >= 1.0:
+                self.elapsed_time = self.elapsed_time - 1.0
+                if self.time_value != 0:
+                    self.time_value = self.time_value - 1
+                else:
+                    self.extra_power_up_active = 0
+                    self.elapsed_time = 0
+                    break
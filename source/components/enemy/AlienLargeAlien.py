@@ -26,10 +26,8 @@
     The large alien also grants the player 1 point each time it is hit.
 """
 
-import turtle
-import pygame
 import random
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.ItemCoin import Coin
 from setup.ModeSetupMaster import alien_mode_setup
 from setup.TextureSetup import ALIEN_STILL_RIGHT_11_15_TEXTURE
@@ -41,6 +39,8 @@ from setup.TextureSetup import ALIEN_DEATH_2_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_13_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_23_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_33_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class LargeAlien:
@@ -49,8 +49,8 @@ class LargeAlien:
             towards the player at all times.
 
         Attributes:
-            large_alien (turtle.Turtle()): The large alien sprite
-            large_alien_health_bar (turtle.Turtle()): The large alien health bar sprite
+            large_alien (CachedTurtle()): The large alien sprite
+            large_alien_health_bar (CachedTurtle()): The large alien health bar sprite
 
             death_animation (float): Iterated during the large aliens death animation
             death_count (int): Stores the amount of times the large alien has died since the player has last died
@@ -71,11 +71,6 @@ class LargeAlien:
                 it can create a start time for it)
 
             got_hit (int): Determines if the alien has already gotten hit or not
-            collision_point (int): Determines the x-axis collision line for the alien
-            already_ahead (int): Determines if the player is already ahead of the alien (larger x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the alien)
-            already_behind (int): Determines of the player is already behind the alien (smaller x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the alien)
             thorns_initiated_damage (int): Checks if the enemy has damaged the player while the player has thorns on
 
             id (int): The id of the alien
@@ -98,7 +93,7 @@ class LargeAlien:
             :type scale_factor_y: float
         """
 
-        self.large_alien = turtle.Turtle()
+        self.large_alien = CachedTurtle()
         self.large_alien.shape(ALIEN_STILL_RIGHT_11_15_TEXTURE)
         self.large_alien.shapesize(8.5 * scale_factor_y, 3.5 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -116,7 +111,7 @@ class LargeAlien:
             self.large_alien.goto(-825 * scale_factor_x, -85 * scale_factor_y)
         self.large_alien.direction = "stop"
 
-        self.large_alien_health_bar = turtle.Turtle()
+        self.large_alien_health_bar = CachedTurtle()
         self.large_alien_health_bar.shape(HEALTH_BAR_33_TEXTURE)
         self.large_alien_health_bar.shapesize(1 * scale_factor_y, 1 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -136,9 +131,6 @@ class LargeAlien:
 
         # For collision
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
         self.scale_factor_x = scale_factor_x
@@ -182,7 +174,7 @@ class LargeAlien:
         self.large_alien_health_bar.shape(HEALTH_BAR_33_TEXTURE)
         self.large_alien_health_bar.goto(self.large_alien.xcor(), 38 * self.scale_factor_y)
         self.large_alien_health_bar.showturtle()
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
 
     def get_large_alien(self):
         """
@@ -253,9 +245,6 @@ class LargeAlien:
         self.walk_start_time = 0
         self.move_start_time = 0
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
     def set_alien_direction(self, player_x):
@@ -293,7 +282,7 @@ class LargeAlien:
         """
 
         # Updates the walking animation every 0.005 seconds
-        current_time = time.time()
+        current_time = game_clock.now
         elapsed_time = current_time - self.walk_start_time
         if elapsed_time >= 0.005:
             # If the large aliens direction is right
@@ -310,9 +299,9 @@ class LargeAlien:
                     self.large_alien.shape(ALIEN_WALKING_LEFT_11_15_TEXTURE)
                 else:
                     self.large_alien.shape(ALIEN_STILL_LEFT_11_15_TEXTURE)
-            self.walk_start_time = time.time()
+            self.walk_start_time = game_clock.now
 
-    def kill_alien(self, death_sound, coins_on_screen, all_coins):
+    def kill_alien(self, death_sound, coins):
         """
             Kills the alien and plays the aliens death animation. After that, it respawns the alien on a random
                 side of the screen.
@@ -320,12 +309,8 @@ class LargeAlien:
             :param death_sound: Determines if the death sound for the enemy is toggled on or off
             :type death_sound: int
 
-            :param coins_on_screen: Array that lists all of the coins currently on the screen
-            :type coins_on_screen: list
-
-            :param all_coins: Array that lists all of the coin sprites generated since the
-                programs execution (for reusing purposes)
-            :type all_coins: list
+            :param coins: The coin container (Used to spawn a coin where the enemy died)
+            :type coins: SpawnCoin()
 
             :return: None
         """
@@ -333,26 +318,7 @@ class LargeAlien:
         if 4 <= self.death_animation < 5:
             # Spawn a coin where the alien has died
             self.large_alien.hideturtle()
-            if len(all_coins) <= len(coins_on_screen):
-                gold_coin = Coin(type="gold", pos_x=self.large_alien.xcor(), pos_y=self.large_alien.ycor())
-                # Set the hitbox for the coin
-                gold_coin.range = (gold_coin.coin.ycor() - gold_coin.COIN_DISTANCE, gold_coin.coin.ycor() + gold_coin.COIN_DISTANCE)
-                gold_coin.collision_coordinate = gold_coin.coin.xcor()
-                gold_coin.just_fired = 0
-                coins_on_screen.append(gold_coin)
-                all_coins.append(gold_coin)
-            else:
-                for coin in all_coins:
-                    if coin.get_coin().isvisible():
-                        continue
-                    else:
-                        coin.reinstate_to_gold(pos_x=self.large_alien.xcor(), pos_y=self.large_alien.ycor())
-                        # Set the hitbox for the coin
-                        coin.range = (coin.coin.ycor() - coin.COIN_DISTANCE, coin.coin.ycor() + coin.COIN_DISTANCE)
-                        coin.collision_coordinate = coin.coin.xcor()
-                        coin.just_fired = 0
-                        coins_on_screen.append(coin)
-                        break
+            coins.spawn_coin("gold", self.large_alien.xcor(), self.large_alien.ycor(), "Alien_Mode")
             # Respawn the large alien in a random location (side of the screen)
             alien_random = random.randint(1, 2)
             if alien_random == 1:
@@ -372,7 +338,7 @@ class LargeAlien:
 
         # Wait 0.15 seconds
         if 3 <= self.death_animation < 4.5:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.15:
                 self.death_animation = 4.5
@@ -383,14 +349,14 @@ class LargeAlien:
             # Change the large aliens texture to the second frame in the death scene
             self.large_alien.shape(ALIEN_DEATH_2_TEXTURE)
             self.death_animation = 3
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
         # Wait 0.1 seconds
         if 1 <= self.death_animation < 2:
             if self.death_animation == 1:
                 self.death_animation = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.1:
                 self.death_animation = 2
@@ -404,18 +370,15 @@ class LargeAlien:
             self.large_alien_health_bar.hideturtle()
             # Play the death sound
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Alien_Death_Sound.wav")
-                sound.play()
+                sound_bank.play("alien_death")
             # Set the texture of the large alien to the first frame in the death scene
             self.large_alien.shape(ALIEN_DEATH_1_TEXTURE)
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.death_animation = 1
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
     def hit_alien(self, hit_sound):
@@ -437,7 +400,7 @@ class LargeAlien:
         if 1 <= self.hit_delay < 9:
             if self.hit_delay == 1:
                 self.hit_delay = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.hit_start_time
             if elapsed_time >= 0.1:
                 self.hit_delay = 9
@@ -453,16 +416,13 @@ class LargeAlien:
                 self.large_alien_health_bar.shape(HEALTH_BAR_13_TEXTURE)
             # Play the hit sound
             if hit_sound == 1:
-                sound = pygame.mixer.Sound("sound/Alien_Hit_Sound.wav")
-                sound.play()
+                sound_bank.play("alien_hit")
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.hit_delay = 1
-            self.hit_start_time = time.time()
+            self.hit_start_time = game_clock.now
             return
 
     def set_movement_speed(self):
@@ -476,10 +436,10 @@ class LargeAlien:
         if self.large_alien.isvisible() and self.death_animation == 0:
             # If the movement has just started, a start time is created for it
             if self.movement_activated == 0:
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
                 self.movement_activated = 1
             # Move the large alien every 0.012 seconds
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.move_start_time
             if elapsed_time >= 0.012:
                 # If the aliens direction is right
@@ -537,6 +497,6 @@ class LargeAlien:
                         delta_movement = 1.8 * self.scale_factor_x * ((elapsed_time - 0.012) / 0.012)
                         self.large_alien.setx(self.large_alien.xcor() - 1.8 * self.scale_factor_x - delta_movement)
                         self.large_alien_health_bar.setx(self.large_alien_health_bar.xcor() - 1.8 * self.scale_factor_x - delta_movement)
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
         else:
             self.move_start_time = 0
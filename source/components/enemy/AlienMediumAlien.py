@@ -26,10 +26,8 @@
     The medium alien also grants the player 1 point when it is hit for the first time.
 """
 
-import turtle
-import pygame
 import random
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.ItemCoin import Coin
 from setup.TextureSetup import ALIEN_STILL_RIGHT_6_10_TEXTURE
 from setup.TextureSetup import ALIEN_STILL_LEFT_6_10_TEXTURE
@@ -39,6 +37,8 @@ from setup.TextureSetup import ALIEN_DEATH_1_TEXTURE
 from setup.TextureSetup import ALIEN_DEATH_2_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_12_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_22_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class MediumAlien:
@@ -47,8 +47,8 @@ class MediumAlien:
             the player at all times.
 
         Attributes:
-            medium_alien (turtle.Turtle()): The medium alien sprite
-            medium_alien_health_bar (turtle.Turtle()): The medium alien health bar sprite
+            medium_alien (CachedTurtle()): The medium alien sprite
+            medium_alien_health_bar (CachedTurtle()): The medium alien health bar sprite
 
             death_animation (float): Iterated during the medium aliens death animation
             death_count (int): Stores the amount of times the medium alien has died since the player has last died
@@ -69,11 +69,6 @@ class MediumAlien:
                 it can create a start time for it)
 
             got_hit (int): Determines if the alien has already gotten hit or not
-            collision_point (int): Determines the x-axis collision line for the alien
-            already_ahead (int): Determines if the player is already ahead of the alien (larger x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the alien)
-            already_behind (int): Determines of the player is already behind the alien (smaller x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the alien)
             thorns_initiated_damage (int): Checks if the enemy has damaged the player while the player has thorns on
 
             id (int): The id of the alien
@@ -96,7 +91,7 @@ class MediumAlien:
             :type scale_factor_y: float
         """
 
-        self.medium_alien = turtle.Turtle()
+        self.medium_alien = CachedTurtle()
         self.medium_alien.shape(ALIEN_STILL_RIGHT_6_10_TEXTURE)
         self.medium_alien.shapesize(5.5 * scale_factor_y, 3 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -114,7 +109,7 @@ class MediumAlien:
             self.medium_alien.goto(725 * scale_factor_x, -124 * scale_factor_y)
         self.medium_alien.direction = "stop"
 
-        self.medium_alien_health_bar = turtle.Turtle()
+        self.medium_alien_health_bar = CachedTurtle()
         self.medium_alien_health_bar.shape(HEALTH_BAR_22_TEXTURE)
         self.medium_alien_health_bar.shapesize(1 * scale_factor_y, 1 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -129,14 +124,11 @@ class MediumAlien:
         self.kill_start_time = 0
         self.hit_start_time = 0
         self.walk_start_time = 0
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
         self.movement_activated = 0
 
         # For collision
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
         self.scale_factor_x = scale_factor_x
@@ -180,7 +172,7 @@ class MediumAlien:
         self.medium_alien_health_bar.shape(HEALTH_BAR_22_TEXTURE)
         self.medium_alien_health_bar.goto(self.medium_alien.xcor(), -39 * self.scale_factor_y)
         self.medium_alien_health_bar.showturtle()
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
 
     def get_medium_alien(self):
         """
@@ -252,9 +244,6 @@ class MediumAlien:
         self.move_start_time = 0
         self.movement_activated = 0
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
     def set_alien_direction(self, player_x):
@@ -292,7 +281,7 @@ class MediumAlien:
         """
 
         # Updates the walking animation every 0.005 seconds
-        current_time = time.time()
+        current_time = game_clock.now
         elapsed_time = current_time - self.walk_start_time
         if elapsed_time >= 0.005:
             # If the medium aliens direction is right
@@ -309,9 +298,9 @@ class MediumAlien:
                     self.medium_alien.shape(ALIEN_WALKING_LEFT_6_10_TEXTURE)
                 else:
                     self.medium_alien.shape(ALIEN_STILL_LEFT_6_10_TEXTURE)
-            self.walk_start_time = time.time()
+            self.walk_start_time = game_clock.now
 
-    def kill_alien(self, death_sound, coins_on_screen, all_coins):
+    def kill_alien(self, death_sound, coins):
         """
             Kills the alien and plays the aliens death animation. After that, it respawns the alien on a random
                 side of the screen.
@@ -319,12 +308,8 @@ class MediumAlien:
             :param death_sound: Determines if the death sound for the enemy is toggled on or off
             :type death_sound: int
 
-            :param coins_on_screen: Array that lists all of the coins currently on the screen
-            :type coins_on_screen: list
-
-            :param all_coins: Array that lists all of the coin sprites generated since the
-                programs execution (for reusing purposes)
-            :type all_coins: list
+            :param coins: The coin container (Used to spawn a coin where the enemy died)
+            :type coins: SpawnCoin()
 
             :return: None
         """
@@ -332,26 +317,7 @@ class MediumAlien:
         if 4 <= self.death_animation < 5:
             # Spawn a coin where the alien has died
             self.medium_alien.hideturtle()
-            if len(all_coins) <= len(coins_on_screen):
-                silver_coin = Coin(type="silver", pos_x=self.medium_alien.xcor(), pos_y=self.medium_alien.ycor())
-                # Set the hitbox for the coin
-                silver_coin.range = (silver_coin.coin.ycor() - silver_coin.COIN_DISTANCE, silver_coin.coin.ycor() + silver_coin.COIN_DISTANCE)
-                silver_coin.collision_coordinate = silver_coin.coin.xcor()
-                silver_coin.just_fired = 0
-                coins_on_screen.append(silver_coin)
-                all_coins.append(silver_coin)
-            else:
-                for coin in all_coins:
-                    if coin.get_coin().isvisible():
-                        continue
-                    else:
-                        coin.reinstate_to_silver(pos_x=self.medium_alien.xcor(), pos_y=self.medium_alien.ycor())
-                        # Set the hitbox for the coin
-                        coin.range = (coin.coin.ycor() - coin.COIN_DISTANCE, coin.coin.ycor() + coin.COIN_DISTANCE)
-                        coin.collision_coordinate = coin.coin.xcor()
-                        coin.just_fired = 0
-                        coins_on_screen.append(coin)
-                        break
+            coins.spawn_coin("silver", self.medium_alien.xcor(), self.medium_alien.ycor(), "Alien_Mode")
             # Respawn the medium alien in a random location (side of the screen)
             alien_random = random.randint(1, 2)
             if alien_random == 1:
@@ -371,7 +337,7 @@ class MediumAlien:
 
         # Wait 0.15 seconds
         if 3 <= self.death_animation < 4.5:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.15:
                 self.death_animation = 4.5
@@ -382,14 +348,14 @@ class MediumAlien:
             # Change the medium aliens texture to the second frame in the death scene
             self.medium_alien.shape(ALIEN_DEATH_2_TEXTURE)
             self.death_animation = 3
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
         # Wait 0.1 seconds
         if 1 <= self.death_animation < 2:
             if self.death_animation == 1:
                 self.death_animation = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.1:
                 self.death_animation = 2
@@ -403,18 +369,15 @@ class MediumAlien:
             self.medium_alien_health_bar.hideturtle()
             # Play the death sound
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Alien_Death_Sound.wav")
-                sound.play()
+                sound_bank.play("alien_death")
             # Set the texture of the medium alien to the first frame in the death scene
             self.medium_alien.shape(ALIEN_DEATH_1_TEXTURE)
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.death_animation = 1
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
     def hit_alien(self, hit_sound):
@@ -436,7 +399,7 @@ class MediumAlien:
         if 1 <= self.hit_delay < 9:
             if self.hit_delay == 1:
                 self.hit_delay = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.hit_start_time
             if elapsed_time >= 0.1:
                 self.hit_delay = 9
@@ -448,17 +411,14 @@ class MediumAlien:
             self.medium_alien_health_bar.shape(HEALTH_BAR_12_TEXTURE)
             # Play the hit sound
             if hit_sound == 1:
-                sound = pygame.mixer.Sound("sound/Alien_Hit_Sound.wav")
-                sound.play()
+                sound_bank.play("alien_hit")
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.health = 1
             self.hit_delay = 1
-            self.hit_start_time = time.time()
+            self.hit_start_time = game_clock.now
             return
 
     def set_movement_speed(self):
@@ -472,10 +432,10 @@ class MediumAlien:
         if self.medium_alien.isvisible() and self.death_animation == 0:
             # If the movement has just started, a start time is created for it
             if self.movement_activated == 0:
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
                 self.movement_activated = 1
             # Move the medium alien every 0.012 seconds
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.move_start_time
             if elapsed_time >= 0.012:
                 # If the aliens direction is right
@@ -533,6 +493,6 @@ class MediumAlien:
                         delta_movement = 1.8 * self.scale_factor_x * ((elapsed_time - 0.012) / 0.012)
                         self.medium_alien.setx(self.medium_alien.xcor() - 1.8 * self.scale_factor_x - delta_movement)
                         self.medium_alien_health_bar.setx(self.medium_alien_health_bar.xcor() - 1.8 * self.scale_factor_x - delta_movement)
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
         else:
             self.move_start_time = 0
@@ -25,10 +25,8 @@
     The small aliens die in one hit from the players laser and grant the player one point.
 """
 
-import turtle
-import pygame
 import random
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.ItemCoin import Coin
 from setup.TextureSetup import ALIEN_STILL_RIGHT_1_5_TEXTURE
 from setup.TextureSetup import ALIEN_STILL_LEFT_1_5_TEXTURE
@@ -36,6 +34,8 @@ from setup.TextureSetup import ALIEN_WALKING_RIGHT_1_5_TEXTURE
 from setup.TextureSetup import ALIEN_WALKING_LEFT_1_5_TEXTURE
 from setup.TextureSetup import ALIEN_DEATH_1_TEXTURE
 from setup.TextureSetup import ALIEN_DEATH_2_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class SmallAlien:
@@ -44,7 +44,7 @@ class SmallAlien:
             player.
 
         Attributes:
-            small_alien (turtle.Turtle()): The small alien sprite
+            small_alien (CachedTurtle()): The small alien sprite
 
             death_animation (float): Iterated during the small aliens death animation
             death_count (int): Stores the amount of times the small alien has died since the player has last died
@@ -62,11 +62,6 @@ class SmallAlien:
                 it can create a start time for it)
 
             got_hit (int): Determines if the alien has already gotten hit or not
-            collision_point (int): Determines the x-axis collision line for the alien
-            already_ahead (int): Determines if the player is already ahead of the alien (larger x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the alien)
-            already_behind (int): Determines of the player is already behind the alien (smaller x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the alien)
             thorns_initiated_damage (int): Checks if the enemy has damaged the player while the player has thorns on
 
             id (int): The id of the alien
@@ -89,7 +84,7 @@ class SmallAlien:
             :type scale_factor_y: float
         """
 
-        self.small_alien = turtle.Turtle()
+        self.small_alien = CachedTurtle()
         self.small_alien.shape(ALIEN_STILL_RIGHT_1_5_TEXTURE)
         self.small_alien.shapesize(4, 2)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -112,14 +107,11 @@ class SmallAlien:
         self.direction = 0
         self.kill_start_time = 0
         self.walk_start_time = 0
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
         self.movement_activated = 0
 
         # For collision
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
         self.id = id
@@ -159,7 +151,7 @@ class SmallAlien:
             self.small_alien.goto(750 * self.scale_factor_x, -141 * self.scale_factor_y)
         self.small_alien.direction = "stop"
         self.small_alien.showturtle()
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
         self.id = id
 
     def get_small_alien(self):
@@ -198,9 +190,6 @@ class SmallAlien:
         self.move_start_time = 0
         self.movement_activated = 0
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
     def set_alien_direction(self, player_x):
@@ -238,7 +227,7 @@ class SmallAlien:
         """
 
         # Updates the walking animation every 0.005 seconds
-        current_time = time.time()
+        current_time = game_clock.now
         elapsed_time = current_time - self.walk_start_time
         if elapsed_time >= 0.005:
             # If the small aliens direction is right
@@ -255,9 +244,9 @@ class SmallAlien:
                     self.small_alien.shape(ALIEN_WALKING_LEFT_1_5_TEXTURE)
                 else:
                     self.small_alien.shape(ALIEN_STILL_LEFT_1_5_TEXTURE)
-            self.walk_start_time = time.time()
+            self.walk_start_time = game_clock.now
 
-    def kill_alien(self, death_sound, coins_on_screen, all_coins):
+    def kill_alien(self, death_sound, coins):
         """
             Kills the alien and plays the aliens death animation. After that, it respawns the alien on a random
                 side of the screen.
@@ -265,12 +254,8 @@ class SmallAlien:
             :param death_sound: Determines if the death sound for the enemy is toggled on or off
             :type death_sound: int
 
-            :param coins_on_screen: Array that lists all of the coins currently on the screen
-            :type coins_on_screen: list
-
-            :param all_coins: Array that lists all of the coin sprites generated since the
-                programs execution (for reusing purposes)
-            :type all_coins: list
+            :param coins: The coin container (Used to spawn a coin where the enemy died)
+            :type coins: SpawnCoin()
 
             :return: None
         """
@@ -278,26 +263,7 @@ class SmallAlien:
         if 4 <= self.death_animation < 5:
             # Spawn a coin where the alien has died
             self.small_alien.hideturtle()
-            if len(all_coins) <= len(coins_on_screen):
-                copper_coin = Coin(type="copper", pos_x=self.small_alien.xcor(), pos_y=self.small_alien.ycor())
-                # Set the hitbox for the coin
-                copper_coin.range = (copper_coin.coin.ycor() - copper_coin.COIN_DISTANCE, copper_coin.coin.ycor() + copper_coin.COIN_DISTANCE)
-                copper_coin.collision_coordinate = copper_coin.coin.xcor()
-                copper_coin.just_fired = 0
-                coins_on_screen.append(copper_coin)
-                all_coins.append(copper_coin)
-            else:
-                for coin in all_coins:
-                    if coin.get_coin().isvisible():
-                        continue
-                    else:
-                        coin.reinstate_to_copper(pos_x=self.small_alien.xcor(), pos_y=self.small_alien.ycor())
-                        # Set the hitbox for the coin
-                        coin.range = (coin.coin.ycor() - coin.COIN_DISTANCE, coin.coin.ycor() + coin.COIN_DISTANCE)
-                        coin.collision_coordinate = coin.coin.xcor()
-                        coin.just_fired = 0
-                        coins_on_screen.append(coin)
-                        break
+            coins.spawn_coin("copper", self.small_alien.xcor(), self.small_alien.ycor(), "Alien_Mode")
             # Respawn the small alien in a random location (side of the screen)
             alien_random = random.randint(1, 2)
             if alien_random == 1:
@@ -311,7 +277,7 @@ class SmallAlien:
 
         # Wait 0.15 seconds
         if 3 <= self.death_animation < 4.5:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.15:
                 self.death_animation = 4.5
@@ -322,14 +288,14 @@ class SmallAlien:
             # Change the small aliens texture to the second frame in the death scene
             self.small_alien.shape(ALIEN_DEATH_2_TEXTURE)
             self.death_animation = 3
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
         # Wait 0.1 seconds
         if 1 <= self.death_animation < 2:
             if self.death_animation == 1:
                 self.death_animation = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.1:
                 self.death_animation = 2
@@ -341,18 +307,15 @@ class SmallAlien:
             self.death_count = self.death_count + 1
             # Play the death sound
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Alien_Death_Sound.wav")
-                sound.play()
+                sound_bank.play("alien_death")
             # Set the texture of the small alien to the first frame in the death scene
             self.small_alien.shape(ALIEN_DEATH_1_TEXTURE)
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.death_animation = 1
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
     def set_movement_speed(self):
@@ -366,10 +329,10 @@ class SmallAlien:
         if self.small_alien.isvisible() and self.death_animation == 0:
             # If the movement has just started, a start time is created for it
             if self.movement_activated == 0:
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
                 self.movement_activated = 1
             # Move the small alien every 0.012 seconds
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.move_start_time
             if elapsed_time >= 0.012:
                 # If the aliens direction is right
@@ -415,6 +378,6 @@ class SmallAlien:
                     if 30 <= self.death_count:
                         delta_movement = 1.8 * self.scale_factor_x * ((elapsed_time - 0.012) / 0.012)
                         self.small_alien.setx(self.small_alien.xcor() - 1.8 * self.scale_factor_x - delta_movement)
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
         else:
             self.move_start_time = 0
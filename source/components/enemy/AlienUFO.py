@@ -27,10 +27,8 @@
     The UFO also grants the player 1 - 3 points each time it is hit.
 """
 
-import turtle
-import pygame
 import random
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.ItemCoin import Coin
 from setup.ModeSetupMaster import alien_mode_setup
 from setup.TextureSetup import ALIEN_BOSS_TEXTURE
@@ -47,6 +45,8 @@ from setup.TextureSetup import HEALTH_BAR_410_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_310_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_210_TEXTURE
 from setup.TextureSetup import HEALTH_BAR_110_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class UFO:
@@ -54,9 +54,9 @@ class UFO:
         Represents a UFO in Alien Mode. The UFO hovers in the air and moves towards the player at all times.
 
         Attributes:
-            ufo (turtle.Turtle()): The UFO sprite
-            ufo_laser (turtle.Turtle()): The UFO laser sprite
-            ufo_health_bar (turtle.Turtle()): The UFO health bar sprite
+            ufo (CachedTurtle()): The UFO sprite
+            ufo_laser (CachedTurtle()): The UFO laser sprite
+            ufo_health_bar (CachedTurtle()): The UFO health bar sprite
 
             death_animation (float): Iterated during the UFOs death animation
             death_count (int): Stores the amount of times the UFO has died since the player has last died
@@ -68,8 +68,6 @@ class UFO:
                 animation run in a consistent amount of time)
             hit_start_time (float): Used as a timestamp for the hit delay of the UFO (To make sure that the
                 hit delay lasts a consistent amount of time)
-            laser_start_time (float): Used as a timestamp for the UFO's laser movement (To make sure the movement
-                happens in a consistent amount of time)
             move_start_time (float): Used as a timestamp for the UFOs movement (To make the UFOs
                 movement happen in a consistent amount of time and not based on code execution speed)
 
@@ -77,11 +75,6 @@ class UFO:
                 it can create a start time for it)
 
             got_hit (int): Determines if the UFO has already been hit by the players laser since it was last fired
-            collision_point (int): Determines the x-axis collision line for the UFO
-            already_ahead (int): Determines if the player is already ahead of the UFO (larger x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the UFO)
-            already_behind (int): Determines of the player is already behind the UFO (smaller x-cor) (This is used
-                for detecting what point the laser need to pass in order to kill the UFO)
             thorns_initiated_damage (int): Checks if the enemy has damaged the player while the player has thorns on
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -99,7 +92,7 @@ class UFO:
             :type scale_factor_y: float
         """
 
-        self.ufo = turtle.Turtle()
+        self.ufo = CachedTurtle()
         self.ufo.shape(ALIEN_BOSS_TEXTURE)
         self.ufo.shapesize(1.75 * scale_factor_y, 6 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -107,7 +100,7 @@ class UFO:
         self.ufo.goto(875 * scale_factor_x, -20 * scale_factor_y)
         self.ufo.direction = "stop"
 
-        self.ufo_laser = turtle.Turtle()
+        self.ufo_laser = CachedTurtle()
         self.ufo_laser.shape(YELLOW_MACHINE_LASER_TEXTURE)
         self.ufo_laser.shapesize(2.25 * scale_factor_y, 0.5 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -115,7 +108,7 @@ class UFO:
         self.ufo_laser.goto(877 * scale_factor_x, -90 * scale_factor_y)
         self.ufo_laser.direction = "stop"
 
-        self.ufo_health_bar = turtle.Turtle()
+        self.ufo_health_bar = CachedTurtle()
         self.ufo_health_bar.shape(HEALTH_BAR_1010_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
         self.ufo_health_bar.penup()
@@ -129,15 +122,11 @@ class UFO:
         self.health = 10
         self.kill_start_time = 0
         self.hit_start_time = 0
-        self.laser_start_time = 0
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
         self.movement_activated = 0
 
         # For collision
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
         self.scale_factor_x = scale_factor_x
@@ -176,7 +165,7 @@ class UFO:
         self.ufo_health_bar.shape(HEALTH_BAR_1010_TEXTURE)
         self.ufo_health_bar.goto(875 * self.scale_factor_x, 50 * self.scale_factor_y)
         self.ufo_health_bar.showturtle()
-        self.move_start_time = time.time()
+        self.move_start_time = game_clock.now
 
     def get_ufo(self):
         """
@@ -198,6 +187,16 @@ class UFO:
 
         return self.ufo_laser
 
+    def get_laser_spawn(self):
+        """
+            Returns the position the UFOs laser is fired from (Right below the UFO)
+
+            :return: The x and y coordinates of the laser when it is fired
+            :type: tuple
+        """
+
+        return self.ufo.xcor() + 2 * self.scale_factor_x, -90 * self.scale_factor_y
+
     def get_ufo_health_bar(self):
         """
             Returns the UFOs health bar sprite so that its class attributes can be accessed.
@@ -267,58 +266,11 @@ class UFO:
         self.health = 10
         self.kill_start_time = 0
         self.hit_start_time = 0
-        self.laser_start_time = 0
         self.move_start_time = 0
         self.movement_activated = 0
         self.got_hit = 1
-        self.collision_point = 0
-        self.already_ahead = 1
-        self.already_behind = 1
         self.thorns_initiated_damage = 0
 
-    def shoot_laser(self, shooting_sound):
-        """
-            Shoots the UFOs laser and moves it down to the ground after it is fired.
-
-            :param shooting_sound: Determines whether the toggle for the enemy lasers shooting sound is on. If it is,
-                the shooting sound will play when the enemy laser is fired.
-            :type shooting_sound: int
-
-            :return: None
-        """
-
-        self.ufo_laser.showturtle()
-        if self.ufo.isvisible() or self.death_animation != 0:
-            if self.ufo_laser.ycor() > -600 * self.scale_factor_y:
-                # Move the laser down 3.2 units every 0.0075 seconds
-                current_time = time.time()
-                elapsed_time = current_time - self.laser_start_time
-                if elapsed_time >= 0.0075:
-                    # Calculate the delta movement
-                    # This the extra movement required to make up for the amount of time passed beyond 0.015 seconds
-                    # Done to ensure the game speed stays the same regardless of frame rate
-                    delta_movement = 3.2 * self.scale_factor_y * ((elapsed_time - 0.0075) / 0.0075)
-                    self.ufo_laser.sety(self.ufo_laser.ycor() - 3.2 * self.scale_factor_y - delta_movement)
-                    self.laser_start_time = time.time()
-            # If the UFO is not dying
-            elif self.death_animation == 0:
-                # Fire the laser
-                self.ufo_laser.setx(self.ufo.xcor() + 2 * self.scale_factor_x)
-                self.ufo_laser.sety(-90 * self.scale_factor_y)
-                if shooting_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Laser_Gun_Enemy.wav")
-                    sound.play()
-                self.laser_start_time = time.time()
-        # If the ufo is not visible, then stop firing the laser
-        else:
-            self.ufo_laser.setx(self.ufo.xcor() + 2 * self.scale_factor_x)
-            self.ufo_laser.sety(-90 * self.scale_factor_y)
-            self.laser_start_time = time.time()
-
-        # Make the laser disappear once it hits the ground
-        if self.ufo_laser.ycor() < -170 * self.scale_factor_y:
-            self.ufo_laser.hideturtle()
-
     def set_ufo_direction(self, player_x):
         """
             Sets the direction of the UFO so that it is facing the player
@@ -339,7 +291,7 @@ class UFO:
                 self.ufo.direction = "right"
                 self.direction = 1
 
-    def kill_ufo(self, death_sound, coins_on_screen, all_coins):
+    def kill_ufo(self, death_sound, coins):
         """
             Kills the UFO and plays the aliens death animation. After that, it respawns the UFO on a random
                 side of the screen.
@@ -347,12 +299,8 @@ class UFO:
             :param death_sound: Determines if the death sound for the enemy is toggled on or off
             :type death_sound: int
 
-            :param coins_on_screen: Array that lists all of the coins currently on the screen
-            :type coins_on_screen: list
-
-            :param all_coins: Array that lists all of the coin sprites generated since the
-                programs execution (for reusing purposes)
-            :type all_coins: list
+            :param coins: The coin container (Used to spawn a coin where the enemy died)
+            :type coins: SpawnCoin()
 
             :return: None
         """
@@ -360,26 +308,7 @@ class UFO:
         if 4 <= self.death_animation < 5:
             # Spawn a coin where the UFO has died
             self.ufo.hideturtle()
-            if len(all_coins) <= len(coins_on_screen):
-                platinum_coin = Coin(type="platinum", pos_x=self.ufo.xcor(), pos_y=self.ufo.ycor())
-                # Set the hitbox for the coin
-                platinum_coin.range = (platinum_coin.coin.ycor() - platinum_coin.COIN_DISTANCE, platinum_coin.coin.ycor() + platinum_coin.COIN_DISTANCE)
-                platinum_coin.collision_coordinate = platinum_coin.coin.xcor()
-                platinum_coin.just_fired = 0
-                coins_on_screen.append(platinum_coin)
-                all_coins.append(platinum_coin)
-            else:
-                for coin in all_coins:
-                    if coin.get_coin().isvisible():
-                        continue
-                    else:
-                        coin.reinstate_to_platinum(pos_x=self.ufo.xcor(), pos_y=self.ufo.ycor())
-                        # Set the hitbox for the coin
-                        coin.range = (coin.coin.ycor() - coin.COIN_DISTANCE, coin.coin.ycor() + coin.COIN_DISTANCE)
-                        coin.collision_coordinate = coin.coin.xcor()
-                        coin.just_fired = 0
-                        coins_on_screen.append(coin)
-                        break
+            coins.spawn_coin("platinum", self.ufo.xcor(), self.ufo.ycor(), "Alien_Mode")
             # Respawn the UFO in a random location (side of the screen)
             alien_random = random.randint(1, 2)
             if alien_random == 1:
@@ -400,7 +329,7 @@ class UFO:
 
         # Wait 0.15 seconds
         if 3 <= self.death_animation < 4.5:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.15:
                 self.death_animation = 4.5
@@ -411,14 +340,14 @@ class UFO:
             # Change the UFOs texture to the second frame in the death scene
             self.ufo.shape(EXPLOSION_2_TEXTURE)
             self.death_animation = 3
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
         # Wait 0.1 seconds
         if 1 <= self.death_animation < 2:
             if self.death_animation == 1:
                 self.death_animation = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.1:
                 self.death_animation = 2
@@ -433,18 +362,15 @@ class UFO:
             self.ufo_health_bar.hideturtle()
             # Play the death sound
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Explosion.wav")
-                sound.play()
+                sound_bank.play("explosion")
             # Set the texture of the large alien to the first frame in the death scene
             self.ufo.shape(EXPLOSION_1_TEXTURE)
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.death_animation = 1
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
     def hit_ufo(self, hit_sound):
@@ -466,7 +392,7 @@ class UFO:
         if 1 <= self.hit_delay < 100:
             if self.hit_delay == 1:
                 self.hit_delay = 1.5
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.hit_start_time
             if elapsed_time >= 0.1:
                 self.hit_delay = 100
@@ -496,16 +422,13 @@ class UFO:
                 self.ufo_health_bar.shape(HEALTH_BAR_110_TEXTURE)
             # Play the hit sound
             if hit_sound == 1:
-                sound = pygame.mixer.Sound("sound/Explosion2.wav")
-                sound.play()
+                sound_bank.play("explosion_2")
             # Reset collision variables
             self.got_hit = 1
-            self.already_ahead = 0
-            self.already_behind = 0
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
             self.hit_delay = 1
-            self.hit_start_time = time.time()
+            self.hit_start_time = game_clock.now
             return
 
     def set_movement_speed(self):
@@ -520,10 +443,10 @@ class UFO:
         if self.ufo.isvisible() and self.death_animation == 0:
             # If the movement has just started, a start time is created for it
             if self.movement_activated == 0:
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
                 self.movement_activated = 1
             # Move the UFO every 0.012 seconds
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.move_start_time
             if elapsed_time >= 0.012:
                 # If the UFOs direction is right
@@ -581,6 +504,6 @@ class UFO:
                         delta_movement = 4 * self.scale_factor_x * ((elapsed_time - 0.012) / 0.012)
                         self.ufo.setx(self.ufo.xcor() - 4 * self.scale_factor_x - delta_movement)
                         self.ufo_health_bar.setx(self.ufo_health_bar.xcor() - 4 * self.scale_factor_x - delta_movement)
-                self.move_start_time = time.time()
+                self.move_start_time = game_clock.now
         else:
             self.move_start_time = 0
@@ -27,16 +27,16 @@
     it has been killed enough times.
 """
 
-import turtle
 import random
-import pygame
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.ItemCoin import Coin
 from setup.ModeSetupMaster import machine_mode_setup
 from setup.TextureSetup import YELLOW_MACHINE_TEXTURE
 from setup.TextureSetup import YELLOW_MACHINE_LASER_TEXTURE
 from setup.TextureSetup import EXPLOSION_1_TEXTURE
 from setup.TextureSetup import EXPLOSION_2_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class YellowMachine:
@@ -44,40 +44,22 @@ class YellowMachine:
         Represents a yellow machine in Laser Fighter. The second enemy in Machine Mode that is yellow
             and fires yellow lasers.
 
+        Pointers:
+            _kinematics (MachineKinematics()): A pointer to the movement logic of every machine (Moves the yellow machine
+                side to side and creates its float effect)
+
         Attributes:
-            yellow_machine (turtle.Turtle()): The yellow machine enemy sprite.
-            yellow_machine_laser (turtle.Turtle()): The laser sprite for each yellow machine enemy.
+            yellow_machine (CachedTurtle()): The yellow machine enemy sprite.
+            yellow_machine_laser (CachedTurtle()): The laser sprite for each yellow machine enemy.
 
             death_count (int): Stores the death count for the enemy since the player has last died.
             update (float): Value that is incremented during the death animation of the enemy.
 
-            movement (int): Stores the direction that the enemy is supposed to move on
-                the x-axis (1 = right and -1 = left)
-            float (int): Stores the direction that the enemy is supposed to move on the y-axis (1 = up and -1 == down)
-            start_y_float (float): Stores the y-coordinate of the enemy when the float effect is starting or when
-                it is changing direction
-            float_activated (int): Determines if the float effect is currently active or not (For timing purposes)
-
             start_time (float): Used as a timestamp for the death animation of the enemy (To make the animation run in
                 a consistent amount of time)
-            laser_start_time (float): Used as a timestamp for the laser movement of the enemy (To make the movement
-                happen in a consistent amount of time)
-            move_start_time (float): Used as a timestamp for the enemies movement (To make the enemies movement
-                happen in a consistent amount of time and not based on code execution speed)
-            float_start_time (float): Used as a timestamp for the enemies floating effect movement (To make the
-                movement happen in a consistent amount of time)
-
-            laser_has_attacked (int): Determines if the enemy has been hit by the players laser since it was last fired
-                (So that it does not get hit two times in a row)
-            movement_activated (int): Check if the enemies side to side movement is currently happening or not. (So
-                that it can create a start time for it)
 
             id (int): The id of the current yellow machine (Used for counting how many are on the screen)
 
-            enemy_center (float): The y-axis center of the sine wave created by the machines float effect
-                (when t=0, where is it?)
-            float_time_offset (float): The timestamp when the float effect for the machine begins
-
             x_range_list (tuple): The x-axis of the hitboxes for the machine. (The range of x-coordinates the laser
                 has to be in in order to hit the enemy)
             collision_y_coordinate_list: The y-axis point that the players lasers have to pass in order to
@@ -88,7 +70,7 @@ class YellowMachine:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
-    def __init__(self, id, scale_factor_x, scale_factor_y):
+    def __init__(self, id, kinematics, scale_factor_x, scale_factor_y):
         """
             Creates a yellow machine object and spawns it on the screen
 
@@ -96,6 +78,9 @@ class YellowMachine:
                 the screen)
             :type id: int
 
+            :param kinematics: A pointer to the movement logic of every machine
+            :type kinematics: MachineKinematics()
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
             :type scale_factor_x: float
 
@@ -103,7 +88,7 @@ class YellowMachine:
             :type scale_factor_y: float
         """
 
-        self.yellow_machine = turtle.Turtle()
+        self.yellow_machine = CachedTurtle()
         self.yellow_machine.shape(YELLOW_MACHINE_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
         self.yellow_machine.penup()
@@ -121,7 +106,7 @@ class YellowMachine:
             self.yellow_machine.goto(350 * scale_factor_x, 220 * scale_factor_y)
         self.yellow_machine.direction = "down"
 
-        self.yellow_machine_laser = turtle.Turtle()
+        self.yellow_machine_laser = CachedTurtle()
         self.yellow_machine_laser.shape(YELLOW_MACHINE_LASER_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
         self.yellow_machine_laser.penup()
@@ -141,21 +126,10 @@ class YellowMachine:
 
         self.death_count = 0
         self.update = 0
-        self.movement = 1
-        self.float = 1
-        self.start_y_float = 0
-        self.float_activated = 0
         self.start_time = 0
-        self.laser_start_time = 0
-        self.move_start_time = time.time()
-        self.float_start_time = time.time()
-        self.laser_has_attacked = 0
-        self.movement_activated = 0
         self.id = id
 
         # For collision
-        self.enemy_center = self.yellow_machine.ycor()
-        self.float_time_offset = time.time()
         self.x_range_list = [(0, 0)] * machine_mode_setup.laser_count
         self.collision_y_coordinate_list = [0] * machine_mode_setup.laser_count
         self.thorns_initiated_damage = 0
@@ -163,6 +137,10 @@ class YellowMachine:
         self.scale_factor_x = scale_factor_x
         self.scale_factor_y = scale_factor_y
 
+        # Start the float effect
+        self._kinematics = kinematics
+        self._kinematics.register(self, self.yellow_machine)
+
     def __del__(self):
         """
             Cleans up the sprite from memory once the program has terminated
@@ -206,8 +184,8 @@ class YellowMachine:
             self.yellow_machine.goto(350 * self.scale_factor_x, 220 * self.scale_factor_y)
             self.yellow_machine_laser.goto(350 * self.scale_factor_x, 158 * self.scale_factor_y)
 
-        self.enemy_center = self.yellow_machine.ycor()
-        self.float_time_offset = time.time()
+        # Restart the float effect
+        self._kinematics.register(self, self.yellow_machine)
 
         self.x_range_list = [(0, 0)] * machine_mode_setup.laser_count
         self.collision_y_coordinate_list = [0] * machine_mode_setup.laser_count
@@ -220,15 +198,12 @@ class YellowMachine:
         self.yellow_machine.showturtle()
         self.yellow_machine_laser.showturtle()
 
-        self.move_start_time = time.time()
-        self.float_start_time = time.time()
-
     def get_yellow_machine(self):
         """
             Returns the yellow_machine sprite so its class attributes can be accessed
 
             :return: yellow_machine: the yellow machine sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.yellow_machine
@@ -238,33 +213,30 @@ class YellowMachine:
             Returns the yellow_machine_laser sprite so its class attributes can be accessed
 
             :return: yellow_machine_laser: the yellow machine laser sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.yellow_machine_laser
 
-    def get_update_value(self):
+    def get_laser_spawn(self):
         """
-            Returns the death animation update value of the yellow machine
+            Returns the position the yellow machine laser is fired from (Right below the sprite)
 
-            :return: update: the death animation update value of the yellow machine
-            :type: float
+            :return: The x and y coordinates of the laser when it is fired
+            :type: tuple
         """
 
-        return self.update
+        return self.yellow_machine.xcor(), self.yellow_machine.ycor() - 62 * self.scale_factor_y
 
-    def set_laser_has_attacked(self, new_value):
+    def get_update_value(self):
         """
-            Sets the laser_has_attacked of the yellow machine (Used for when the player fires a new laser and this value
-                has to be reset to 0)
-
-            :param new_value: The new laser_has_attacked of the yellow machine.
-            :type new_value: int
+            Returns the death animation update value of the yellow machine
 
-            :return: None
+            :return: update: the death animation update value of the yellow machine
+            :type: float
         """
 
-        self.laser_has_attacked = new_value
+        return self.update
 
     def remove(self):
         """
@@ -273,20 +245,12 @@ class YellowMachine:
             :return: None
         """
 
+        self._kinematics.unregister(self)
         self.yellow_machine.hideturtle()
         self.yellow_machine_laser.hideturtle()
         self.death_count = 0
         self.update = 0
-        self.movement = 1
-        self.float = 1
-        self.start_y_float = 0
-        self.float_activated = 0
         self.start_time = 0
-        self.laser_start_time = 0
-        self.move_start_time = 0
-        self.float_start_time = 0
-        self.laser_has_attacked = 0
-        self.movement_activated = 0
         self.x_range_list.clear()
         self.collision_y_coordinate_list.clear()
         self.thorns_initiated_damage = 0
@@ -306,69 +270,15 @@ class YellowMachine:
         self.x_range_list = [(0, 0)] * machine_mode_setup.laser_count
         self.collision_y_coordinate_list = [0] * machine_mode_setup.laser_count
 
-    def shoot_laser(self, green_power_up, shooting_sound):
-        """
-            Shoots the yellow machine laser (Spawning it right below the sprite) and move it down across the screen)
-
-            :param green_power_up: Variable used to determine if the green power up is active or not. If it is active,
-                the enemy laser will not fire.
-            :type green_power_up: int
-
-            :param shooting_sound: Determines whether the toggle for the enemy lasers shooting sound is on. If it is,
-                the shooting sound will play when the enemy laser is fired.
-            :type shooting_sound: int
-
-            :return: None
-        """
-
-        if green_power_up == 0:
-            # Remove the laser from the screen once it has hit the player
-            if self.laser_has_attacked == 1:
-                self.yellow_machine_laser.hideturtle()
-            else:
-                self.yellow_machine_laser.showturtle()
-            # If the laser is still visible in the frame of the screen
-            if self.yellow_machine_laser.ycor() > -360 * self.scale_factor_y:
-                # Keep moving the laser down the screen 8.7 units every 0.015 seconds
-                current_time = time.time()
-                elapsed_time = current_time - self.laser_start_time
-                if elapsed_time >= 0.015:
-                    # Calculate the delta movement
-                    # This the extra movement required to make up for the amount of time passed beyond 0.015 seconds
-                    # Done to ensure the game speed stays the same regardless of frame rate
-                    delta_movement = 8.7 * self.scale_factor_y * ((elapsed_time - 0.015) / 0.015)
-                    self.yellow_machine_laser.sety(self.yellow_machine_laser.ycor() - 8.7 * self.scale_factor_y - delta_movement)
-                    self.laser_start_time = time.time()
-            else:
-                # Otherwise, set the laser to its original state and shoot it again
-                self.yellow_machine_laser.setx(self.yellow_machine.xcor())
-                self.yellow_machine_laser.sety(self.yellow_machine.ycor() - 62 * self.scale_factor_y)
-                self.laser_has_attacked = 0
-                if shooting_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Laser_Gun_Enemy.wav")
-                    sound.play()
-                self.laser_start_time = time.time()
-        # If the green power up is active, hide the laser and do not fire
-        else:
-            self.yellow_machine_laser.hideturtle()
-            self.yellow_machine_laser.setx(self.yellow_machine.xcor())
-            self.yellow_machine_laser.sety(self.yellow_machine.ycor() - 62 * self.scale_factor_y)
-            self.laser_has_attacked = 0
-            self.laser_start_time = time.time()
-
-    def kill_enemy(self, death_sound, coins_on_screen, all_coins):
+    def kill_enemy(self, death_sound, coins):
         """
             Kills the enemy and plays the enemies death animation. After that, it spawns the enemy in a new location.
 
             :param death_sound: Determines if the death sound for the enemy is toggled on or off
             :type death_sound: int
 
-            :param coins_on_screen: Array that lists all of the coins currently on the screen
-            :type coins_on_screen: list
-
-            :param all_coins: Array that lists all of the coin sprites generated since the
-                programs execution (for reusing purposes)
-            :type all_coins: list
+            :param coins: The coin container (Used to spawn a coin where the enemy died)
+            :type coins: SpawnCoin()
 
             :return: None
         """
@@ -376,13 +286,14 @@ class YellowMachine:
         # When the death animation and respawning is finished, the yellow machine appears on the screen again
         if self.update == 6:
             self.yellow_machine.showturtle()
-            self.movement_activated = 0
             self.update = 0
+            # Start moving side to side again
+            self._kinematics.set_moving(self, 1)
             return
 
         # Wait 0.05 seconds
         if 3.5 <= self.update < 6:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.start_time
             if elapsed_time >= 0.05:
                 self.update = 6
@@ -392,45 +303,25 @@ class YellowMachine:
         if self.update == 3:
             # Hide the yellow machine and spawn a silver coin where the yellow machine died
             self.yellow_machine.hideturtle()
-            if len(all_coins) <= len(coins_on_screen):
-                silver_coin = Coin(type="silver", pos_x=self.yellow_machine.xcor(), pos_y=self.yellow_machine.ycor())
-                # Set the hitbox for the coin
-                silver_coin.range = (silver_coin.coin.xcor() - silver_coin.COIN_DISTANCE, silver_coin.coin.xcor() + silver_coin.COIN_DISTANCE)
-                silver_coin.collision_coordinate = silver_coin.coin.ycor() - silver_coin.COIN_DISTANCE
-                coins_on_screen.append(silver_coin)
-                all_coins.append(silver_coin)
-            else:
-                for coin in all_coins:
-                    if coin.get_coin().isvisible():
-                        continue
-                    else:
-                        coin.reinstate_to_silver(pos_x=self.yellow_machine.xcor(), pos_y=self.yellow_machine.ycor())
-                        # Set the hitbox for the coin
-                        coin.range = (coin.coin.xcor() - coin.COIN_DISTANCE, coin.coin.xcor() + coin.COIN_DISTANCE)
-                        coin.collision_coordinate = coin.coin.ycor() - coin.COIN_DISTANCE
-                        coins_on_screen.append(coin)
-                        break
+            coins.spawn_coin("silver", self.yellow_machine.xcor(), self.yellow_machine.ycor(), "Machine_Mode")
             # Respawn the yellow machine in a different random location
             self.yellow_machine.shape(YELLOW_MACHINE_TEXTURE)
             # Want to cast these ranges to integers to avoid a crash at certain resolutions
             self.yellow_machine.goto(random.randint(int(-640 * self.scale_factor_x), int(640 * self.scale_factor_x)), random.randint(int(120 * self.scale_factor_y), int(220 * self.scale_factor_y)))
             # Restart the float effect
-            self.float_activated = 0
-            self.float = 1
-            self.float_time_offset = time.time()
-            self.enemy_center = self.yellow_machine.ycor()
+            self._kinematics.register(self, self.yellow_machine)
             # Reset the hitboxes
             self.x_range_list.clear()
             self.collision_y_coordinate_list.clear()
             self.x_range_list = [(0, 0)] * machine_mode_setup.laser_count
             self.collision_y_coordinate_list = [0] * machine_mode_setup.laser_count
             self.update = 3.5
-            self.start_time = time.time()
+            self.start_time = game_clock.now
             return
 
         # Wait 0.15 seconds
         if 1.5 <= self.update < 3:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.start_time
             if elapsed_time >= 0.15:
                 self.update = 3
@@ -441,13 +332,13 @@ class YellowMachine:
         if 1.0 <= self.update <= 1.1:
             self.yellow_machine.shape(EXPLOSION_2_TEXTURE)
             self.update = 1.5
-            self.start_time = time.time()
-            self.kill_enemy(death_sound, coins_on_screen, all_coins)
+            self.start_time = game_clock.now
+            self.kill_enemy(death_sound, coins)
             return
 
         # Wait 0.1 seconds
         if 0.5 <= self.update < 1:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.start_time
             if elapsed_time >= 0.1:
                 self.update = 1
@@ -455,115 +346,17 @@ class YellowMachine:
             return
 
         if self.update == 0:
-            # Increase the death count
+            # Increase the death count and stop moving side to side
             self.death_count = self.death_count + 1
+            self._kinematics.set_death_count(self, self.death_count)
+            self._kinematics.set_moving(self, 0)
             # Play the death sound
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Explosion.wav")
-                sound.play()
+                sound_bank.play("explosion")
             # Change the texture of the yellow machine to the first frame of the death explosion
             self.yellow_machine.shape(EXPLOSION_1_TEXTURE)
             self.update = 0.5
             # Set the thorns initiated damage back to 0 if needed
             self.thorns_initiated_damage = 0
-            self.start_time = time.time()
+            self.start_time = game_clock.now
             return
-
-    def float_effect(self):
-        """
-            Moves the yellow machine up and down to create a float effect and make it seem as if the enemy is moving
-                fast through outer space.
-
-            :return: None
-        """
-
-        # Activate the float effect
-        if self.float_activated == 0:
-            self.float_activated = 1
-            self.start_y_float = self.yellow_machine.ycor()
-
-        if self.start_y_float + 50 * self.scale_factor_y < self.yellow_machine.ycor():
-            # Move down
-            self.float = -1
-        elif self.start_y_float - 50 * self.scale_factor_y > self.yellow_machine.ycor():
-            # Move up
-            self.float = 1
-        current_time = time.time()
-        elapsed_time = current_time - self.float_start_time
-        # Make a movement every 0.0075 seconds to reduce the effects of lag
-        if elapsed_time >= 0.0075:
-            if self.float == 1:
-                # Calculate the delta movement and add it as additional movement required
-                delta_movement = machine_mode_setup.MACHINE_FLOAT * ((elapsed_time - 0.0075) / 0.0075)
-                self.yellow_machine.goto(self.yellow_machine.xcor(), self.yellow_machine.ycor() + machine_mode_setup.MACHINE_FLOAT + delta_movement)
-            elif self.float == -1:
-                # Calculate the delta movement and add it as additional movement required
-                delta_movement = machine_mode_setup.MACHINE_FLOAT * ((elapsed_time - 0.0075) / 0.0075)
-                self.yellow_machine.goto(self.yellow_machine.xcor(), self.yellow_machine.ycor() - machine_mode_setup.MACHINE_FLOAT - delta_movement)
-            self.float_start_time = time.time()
-
-    def move_enemy(self, death):
-        """
-            When the yellow machine has died enough times, this function will cause it to start moving left and
-                right, which will speed up the more times that the yellow machine dies.
-
-            :param death: Determines whether the death animation for the player is active or not.
-            :type death: int
-
-            :return: None
-        """
-
-        if self.death_count >= 4 and death == 0 and self.update == 0:
-            # If the movement has just started, a start time is created for it
-            if self.movement_activated == 0:
-                self.move_start_time = time.time()
-                self.movement_activated = 1
-            # Move the yellow machine every 0.02 seconds
-            current_time = time.time()
-            elapsed_time = current_time - self.move_start_time
-            if elapsed_time >= 0.02:
-                # Yellow machine reaches the right end of the screen
-                if 640 * self.scale_factor_x < self.yellow_machine.xcor():
-                    # Move left
-                    self.movement = -1
-                # Yellow machine reaches the left end of the screen
-                if -640 * self.scale_factor_x > self.yellow_machine.xcor():
-                    # Move right
-                    self.movement = 1
-                if self.movement == 1:
-                    # Speeds up based on the death_count variable
-                    if 4 <= self.death_count < 7:
-                        # Calculate the delta movement as extra movement needed
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_2 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() + machine_mode_setup.MACHINE_MOVE_2 + delta_movement)
-                    elif 7 <= self.death_count < 10:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_4 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() + machine_mode_setup.MACHINE_MOVE_4 + delta_movement)
-                    elif 10 <= self.death_count < 13:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_6 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() + machine_mode_setup.MACHINE_MOVE_6 + delta_movement)
-                    elif 13 <= self.death_count < 16:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_8 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() + machine_mode_setup.MACHINE_MOVE_8 + delta_movement)
-                    elif 16 <= self.death_count:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_10 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() + machine_mode_setup.MACHINE_MOVE_10 + delta_movement)
-                elif self.movement == -1:
-                    if 4 <= self.death_count < 7:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_2 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() - machine_mode_setup.MACHINE_MOVE_2 - delta_movement)
-                    elif 7 <= self.death_count < 10:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_4 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() - machine_mode_setup.MACHINE_MOVE_4 - delta_movement)
-                    elif 10 <= self.death_count < 13:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_6 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() - machine_mode_setup.MACHINE_MOVE_6 - delta_movement)
-                    elif 13 <= self.death_count < 16:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_8 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() - machine_mode_setup.MACHINE_MOVE_8 - delta_movement)
-                    elif 16 <= self.death_count:
-                        delta_movement = machine_mode_setup.MACHINE_MOVE_10 * ((elapsed_time - 0.02) / 0.02)
-                        self.yellow_machine.setx(self.yellow_machine.xcor() - machine_mode_setup.MACHINE_MOVE_10 - delta_movement)
-                self.move_start_time = time.time()
-        else:
-            self.move_start_time = 0
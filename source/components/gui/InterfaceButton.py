@@ -28,7 +28,7 @@
         visuals.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.TextureSetup import TITLE_SCREEN_BUTTON_TEXTURE
 from setup.TextureSetup import TITLE_SCREEN_BUTTON_HIGHLIGHTED_TEXTURE
 from setup.TextureSetup import TITLE_SCREEN_BUTTON_SMALL_TEXTURE
@@ -74,13 +74,15 @@ class Button:
         Represents a button object in Laser Fighter. When a button is clicked, its function will be executed.
 
         Attributes:
-            button_frame (turtle.Turtle()): Sprite that represents the frame and shape of the button
-            button_text (turtle.Turtle()): Displays the buttons text
-            button_indicator (turtle.Turtle()): (Only for the toggle buttons on the settings screen) Displays the
+            button_frame (CachedTurtle()): Sprite that represents the frame and shape of the button
+            button_text (CachedTurtle()): Displays the buttons text
+            button_indicator (CachedTurtle()): (Only for the toggle buttons on the settings screen) Displays the
                 button indicator text
 
             type (string): Determines the type of button
             id (int): A unique identifier for the button to further determine and locate the button.
+            highlighted (bool): Determines if the button is currently highlighted (None if it is not known, so that
+                the next highlight update is always drawn)
 
             scale_factor (float): The general scale factor used in fullscreen mode based off of the shortest axis
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -107,7 +109,7 @@ class Button:
             :type page: string
         """
 
-        self.button_frame = turtle.Turtle()
+        self.button_frame = CachedTurtle()
         self.button_frame.color("#3D3D3D")
         # Ensure that the turtle does not draw lines on the screen while moving
         self.button_frame.penup()
@@ -181,7 +183,7 @@ class Button:
             self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
             self.button_frame.goto(-325 * scale_factor_x, (195 - (80 * (id - 1))) * scale_factor_y)
 
-        self.button_text = turtle.Turtle()
+        self.button_text = CachedTurtle()
         self.button_text.color("white")
         # Ensure that the turtle does not draw lines on the screen while moving
         self.button_text.penup()
@@ -264,7 +266,7 @@ class Button:
 
         # Create the indicators for the toggle buttons on the settings screen
         if type == "Settings_Toggle":
-            self.button_indicator = turtle.Turtle()
+            self.button_indicator = CachedTurtle()
             # Ensure that the turtle does not draw lines on the screen while moving
             self.button_indicator.penup()
             if id == 1:
@@ -296,7 +298,7 @@ class Button:
             self.indicator = 1
         # Create the locks for the slots in the shop
         elif type == "Shop_Slot" or type == "Power_Up_Slot" or type == "Gadgets_Slot":
-            self.button_indicator = turtle.Turtle()
+            self.button_indicator = CachedTurtle()
             # Ensure that the turtle does not draw lines on the screen while moving
             self.button_indicator.penup()
             self.button_indicator.color("white")
@@ -307,7 +309,7 @@ class Button:
             self.indicator_toggled = 0
         # The indicator here is used as the coin icon
         elif type == "Buy":
-            self.button_indicator = turtle.Turtle()
+            self.button_indicator = CachedTurtle()
             self.button_indicator.penup()
             self.button_indicator.shape(COIN_INDICATOR_TEXTURE)
             self.button_indicator.goto(self.button_frame.xcor() - 125 * scale_factor_x, self.button_frame.ycor() - 28 * scale_factor_y)
@@ -318,6 +320,7 @@ class Button:
 
         self.type = type
         self.id = id
+        self.highlighted = None
 
         self.scale_factor = scale_factor
         self.scale_factor_x = scale_factor_x
@@ -579,7 +582,7 @@ class Button:
 
         # If the button indicator does not already exist, create one
         if self.indicator == 0:
-            self.button_indicator = turtle.Turtle()
+            self.button_indicator = CachedTurtle()
             # Ensure that the turtle does not draw lines on the screen while moving
             self.button_indicator.penup()
             self.indicator = 1
@@ -605,7 +608,7 @@ class Button:
 
         # If the button indicator does not already exist, create one
         if self.indicator == 0:
-            self.button_indicator = turtle.Turtle()
+            self.button_indicator = CachedTurtle()
             # Ensure that the turtle does not draw lines on the screen while moving
             self.button_indicator.penup()
             self.indicator = 1
@@ -689,7 +692,7 @@ class Button:
 
         # If the button indicator does not already exist, create one
         if self.indicator == 0:
-            self.button_indicator = turtle.Turtle()
+            self.button_indicator = CachedTurtle()
             self.button_indicator.penup()
             self.button_indicator.hideturtle()
             self.indicator = 1
@@ -750,7 +753,7 @@ class Button:
             Returns the button frame sprite so its class attributes can be accessed
 
             :return: button_frame: the button frame sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.button_frame
@@ -760,7 +763,7 @@ class Button:
             Returns the button text sprite so its class attributes can be accessed
 
             :return: button_text: the button text sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.button_text
@@ -770,7 +773,7 @@ class Button:
             Returns the button indicator sprite so its class attributes can be accessed
 
             :return: button_indicator: the button indicator sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         # If the button indicator exists
@@ -1083,192 +1086,120 @@ class Button:
             else:
                 self.button_indicator.goto(self.button_frame.xcor(), self.button_frame.ycor() - 75 * self.scale_factor_y)
 
-    def update_highlight(self, x, y):
+    def get_hitbox(self):
         """
-            Used to change the color of the buttons text when the user decides to hover their mouse over the area
-                that the  button takes up.
+            Finds the area of the screen that the button takes up, in canvas coordinates (The origin is the top left
+                corner of the window, like the cursor position of a Tk event).
 
-            :param x: The current x-coordinate of the cursor
-            :type x: int
-
-            :param y: The current y-coordinate of the cursor
-            :type y: int
-
-            :return: None
+            :return: The left, right, top and bottom edges of the button (None if the button cannot be hovered over)
+            :type: tuple
         """
 
+        x_1 = x_2 = y_1 = y_2 = None
         if self.type == "Title":
-            if self.id == 1:
-                if 388 * self.scale_factor_x < x < 890 * self.scale_factor_x and 239 * self.scale_factor_y < y < 311 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_TEXTURE)
-            elif self.id == 2:
-                if 388 * self.scale_factor_x < x < 890 * self.scale_factor_x and 419 * self.scale_factor_y < y < 491 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_TEXTURE)
-            elif self.id == 3:
-                if 388 * self.scale_factor_x < x < 890 * self.scale_factor_x and 599 * self.scale_factor_y < y < 671 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_TEXTURE)
+            if 1 <= self.id <= 3:
+                x_1, x_2 = 388, 890
+                y_1, y_2 = 239 + (180 * (self.id - 1)), 311 + (180 * (self.id - 1))
         elif self.type == "Title_Locked":
             if self.id == 1:
-                if 388 * self.scale_factor_x < x < 890 * self.scale_factor_x and 329 * self.scale_factor_y < y < 401 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_TEXTURE)
+                x_1, x_2, y_1, y_2 = 388, 890, 329, 401
         elif self.type == "Title_Small":
             if self.id == 1:
-                if 388 * self.scale_factor_x < x < 630 * self.scale_factor_x and 509 * self.scale_factor_y < y < 581 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_SMALL_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_SMALL_TEXTURE)
+                x_1, x_2, y_1, y_2 = 388, 630, 509, 581
             elif self.id == 2:
-                if 648 * self.scale_factor_x < x < 890 * self.scale_factor_x and 509 * self.scale_factor_y < y < 581 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_SMALL_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(TITLE_SCREEN_BUTTON_SMALL_TEXTURE)
+                x_1, x_2, y_1, y_2 = 648, 890, 509, 581
         elif self.type == "Game":
-            if 6 * self.scale_factor_x < x < 197 * self.scale_factor_x and 5 * self.scale_factor_y < y < 37 * self.scale_factor_y:
-                self.button_frame.color("yellow")
-                self.button_frame.shape(MAIN_MENU_BUTTON_MAIN_HIGHLIGHTED_TEXTURE)
-                return 1
-            else:
-                self.button_frame.color("white")
-                self.button_frame.shape(MAIN_MENU_BUTTON_MAIN_TEXTURE)
-                return 0
+            x_1, x_2, y_1, y_2 = 6, 197, 5, 37
         elif self.type == "Tab":
-            if 0 * self.scale_factor_x < x < 75 * self.scale_factor_x and (159 + (120 * (self.id - 1))) * self.scale_factor_y < y < (259 + (120 * (self.id - 1))) * self.scale_factor_y:
-                self.button_frame.color("yellow")
-                self.button_frame.shape(TAB_HIGHLIGHTED_TEXTURE)
-            else:
-                self.button_frame.color("white")
-                self.button_frame.shape(TAB_TEXTURE)
+            x_1, x_2 = 0, 75
+            y_1, y_2 = 159 + (120 * (self.id - 1)), 259 + (120 * (self.id - 1))
         elif self.type == "Shop_Slot" or self.type == "Power_Up_Slot" or self.type == "Gadget_Slot":
             if self.id < 5:
-                if (137 + (170 * (self.id - 1))) * self.scale_factor_x < x < (288 + (170 * (self.id - 1))) * self.scale_factor_x and 178 * self.scale_factor_y < y < 349 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(INVENTORY_SLOT_FRAME_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(INVENTORY_SLOT_FRAME_TEXTURE)
+                x_1, x_2 = 137 + (170 * (self.id - 1)), 288 + (170 * (self.id - 1))
+                y_1, y_2 = 178, 349
             elif 4 < self.id < 9:
-                if (137 + (170 * (self.id - 1 - 4))) * self.scale_factor_x < x < (288 + (170 * (self.id - 1 - 4))) * self.scale_factor_x and 368 * self.scale_factor_y < y < 539 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(INVENTORY_SLOT_FRAME_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("White")
-                    self.button_frame.shape(INVENTORY_SLOT_FRAME_TEXTURE)
+                x_1, x_2 = 137 + (170 * (self.id - 1 - 4)), 288 + (170 * (self.id - 1 - 4))
+                y_1, y_2 = 368, 539
         elif self.type == "Buy" or self.type == "Enable":
-            if 939 * self.scale_factor_x < x < 1240 * self.scale_factor_x and 572 * self.scale_factor_y < y < 688 * self.scale_factor_y:
-                self.button_frame.color("yellow")
-                self.button_frame.shape(BUY_BUTTON_HIGHLIGHTED_TEXTURE)
-            else:
-                self.button_frame.color("white")
-                self.button_frame.shape(BUY_BUTTON_TEXTURE)
+            x_1, x_2, y_1, y_2 = 939, 1240, 572, 688
         elif self.type == "Regular_Settings_And_Controls":
             if self.id == 1:
-                if 669 * self.scale_factor_x < x < 1240 * self.scale_factor_x and 614 * self.scale_factor_y < y < 675 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                    return 1
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-                    return 0
+                x_1, x_2, y_1, y_2 = 669, 1240, 614, 675
             elif self.id == 2 or self.id == 3:
-                if 669 * self.scale_factor_x < x < 1240 * self.scale_factor_x and 534 * self.scale_factor_y < y < 595 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
+                x_1, x_2, y_1, y_2 = 669, 1240, 534, 595
         elif self.type == "Settings_Toggle":
             if self.id < 8:
-                if 28 * self.scale_factor_x < x < 599 * self.scale_factor_x and (134 + (80 * (self.id - 1))) * self.scale_factor_y < y < (195 + (80 * (self.id - 1))) * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 8:
-                if 671 * self.scale_factor_x < x < 1243 * self.scale_factor_x and 134 * self.scale_factor_y < y < 195 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 9:
-                if 671 * self.scale_factor_x < x < 1243 * self.scale_factor_x and 214 * self.scale_factor_y < y < 275 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 10:
-                if 671 * self.scale_factor_x < x < 1243 * self.scale_factor_x and 294 * self.scale_factor_y < y < 355 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 11:
-                if 671 * self.scale_factor_x < x < 1243 * self.scale_factor_x and 374 * self.scale_factor_y < y < 435 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 12:
-                if 671 * self.scale_factor_x < x < 1243 * self.scale_factor_x and 454 * self.scale_factor_y < y < 515 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
+                x_1, x_2 = 28, 599
+                y_1, y_2 = 134 + (80 * (self.id - 1)), 195 + (80 * (self.id - 1))
+            elif 8 <= self.id <= 12:
+                x_1, x_2 = 671, 1243
+                y_1, y_2 = 134 + (80 * (self.id - 8)), 195 + (80 * (self.id - 8))
         elif self.type == "Controls_Toggle":
-            if self.id == 1:
-                if 28 * self.scale_factor_x < x < 599 * self.scale_factor_x and 134 * self.scale_factor_y < y < 195 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 2:
-                if 28 * self.scale_factor_x < x < 599 * self.scale_factor_x and 214 * self.scale_factor_y < y < 275 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 3:
-                if 28 * self.scale_factor_x < x < 599 * self.scale_factor_x and 294 * self.scale_factor_y < y < 355 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
-            elif self.id == 4:
-                if 28 * self.scale_factor_x < x < 599 * self.scale_factor_x and 374 * self.scale_factor_y < y < 435 * self.scale_factor_y:
-                    self.button_frame.color("yellow")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE)
-                else:
-                    self.button_frame.color("white")
-                    self.button_frame.shape(SETTINGS_AND_CONTROLS_BUTTON_TEXTURE)
+            if 1 <= self.id <= 4:
+                x_1, x_2 = 28, 599
+                y_1, y_2 = 134 + (80 * (self.id - 1)), 195 + (80 * (self.id - 1))
+
+        if x_1 is None:
+            return None
+        return (x_1 * self.scale_factor_x, x_2 * self.scale_factor_x,
+                y_1 * self.scale_factor_y, y_2 * self.scale_factor_y)
+
+    def get_highlight_textures(self):
+        """
+            Finds the textures used for the button frame when it is and is not highlighted.
+
+            :return: The regular texture and the highlighted texture of the button frame
+            :type: tuple
+        """
+
+        if self.type == "Title" or self.type == "Title_Locked":
+            return TITLE_SCREEN_BUTTON_TEXTURE, TITLE_SCREEN_BUTTON_HIGHLIGHTED_TEXTURE
+        elif self.type == "Title_Small":
+            return TITLE_SCREEN_BUTTON_SMALL_TEXTURE, TITLE_SCREEN_BUTTON_SMALL_HIGHLIGHTED_TEXTURE
+        elif self.type == "Game":
+            return MAIN_MENU_BUTTON_MAIN_TEXTURE, MAIN_MENU_BUTTON_MAIN_HIGHLIGHTED_TEXTURE
+        elif self.type == "Tab":
+            return TAB_TEXTURE, TAB_HIGHLIGHTED_TEXTURE
+        elif self.type == "Shop_Slot" or self.type == "Power_Up_Slot" or self.type == "Gadget_Slot":
+            return INVENTORY_SLOT_FRAME_TEXTURE, INVENTORY_SLOT_FRAME_HIGHLIGHTED_TEXTURE
+        elif self.type == "Buy" or self.type == "Enable":
+            return BUY_BUTTON_TEXTURE, BUY_BUTTON_HIGHLIGHTED_TEXTURE
+        else:
+            return SETTINGS_AND_CONTROLS_BUTTON_TEXTURE, SETTINGS_AND_CONTROLS_BUTTON_HIGHLIGHTED_TEXTURE
+
+    def set_highlight(self, highlighted):
+        """
+            Highlights the button frame in yellow, or sets it back to white. The sprite is only changed if the
+                highlight is different from before (When the cursor enters or leaves the button).
+
+            :param highlighted: Determines if the button should be highlighted or not
+            :type highlighted: bool
+
+            :return: None
+        """
+
+        if highlighted == self.highlighted:
+            return
+        self.highlighted = highlighted
+
+        texture, highlighted_texture = self.get_highlight_textures()
+        if highlighted:
+            self.button_frame.color("yellow")
+            self.button_frame.shape(highlighted_texture)
+        else:
+            self.button_frame.color("white")
+            self.button_frame.shape(texture)
+
+    def is_main_menu_button(self):
+        """
+            Checks if the button takes the user back to the main menu (Used for the hover effect on the main menu
+                button, which can be in different locations depending on the screen).
+
+            :return: True if the button is a main menu button
+            :type: bool
+        """
+
+        return self.type == "Game" or (self.type == "Regular_Settings_And_Controls" and self.id == 1)
 
     def update_controls_text_color(self, alert):
         """
@@ -1305,20 +1236,3 @@ class Button:
                 self.button_text.color("red")
             else:
                 self.button_text.color("white")
-
-    def click_button(self):
-        """
-            Returns the required attributes of the shop slot to determine if it has been clicked or not.
-
-            :return: button_color: the current color of the buttons frame
-            :type: string
-
-            :return: type: The type of button that the current button is
-            :type: string
-
-            :return: id: The unique identifier for the current button
-            :type: int
-        """
-
-        button_color = self.button_frame.fillcolor()
-        return button_color, self.type, self.id
@@ -22,7 +22,7 @@
         loading all of the preview data of the item currently selected.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.ConfigurationSetup import shop_config
 from setup.data.MilestoneMessages import MILESTONE_1_MESSAGE
 from setup.data.MilestoneMessages import MILESTONE_2_MESSAGE
@@ -64,9 +64,9 @@ class Panel:
         Represents the panel in Laser Fighter for displaying important information.
 
         Attributes:
-            panel (turtle.Turtle()): The sprite that represents the frame of the panel
-            panel_text (turtle.Turtle()): The sprite that displays the panels text
-            panel_indicator (turtle.Turtle()): The sprite that displays the visual element on the panel
+            panel (CachedTurtle()): The sprite that represents the frame of the panel
+            panel_text (CachedTurtle()): The sprite that displays the panels text
+            panel_indicator (CachedTurtle()): The sprite that displays the visual element on the panel
 
             type (string): The type of panel generated (depending on the current screen)
             category (string): The current type of description being displayed
@@ -97,7 +97,7 @@ class Panel:
             :type id: int
         """
 
-        self.panel = turtle.Turtle()
+        self.panel = CachedTurtle()
         self.panel.color("#3D3D3D")
         # Ensure that the turtle does not draw lines on the screen while moving
         self.panel.penup()
@@ -111,7 +111,7 @@ class Panel:
             self.panel.shape(POP_UP_MESSAGE_FRAME_TEXTURE)
             self.panel.goto(-400 * self.scale_factor_x, 100 * scale_factor_y)
 
-        self.panel_text = turtle.Turtle()
+        self.panel_text = CachedTurtle()
         self.panel_text.color("white")
         # Ensure that the turtle does not draw lines on the screen while moving
         self.panel_text.penup()
@@ -122,7 +122,7 @@ class Panel:
         self.panel_text.hideturtle()
 
         if type == "Shop":
-            self.panel_indicator = turtle.Turtle()
+            self.panel_indicator = CachedTurtle()
             # Ensure that the turtle does not draw lines on the screen while moving
             self.panel_indicator.penup()
             self.panel_indicator.goto(self.panel.xcor(), self.panel.ycor() + 190 * scale_factor_y)
@@ -171,7 +171,7 @@ class Panel:
 
         # Create the panel indicator if it does not exist already
         if self.indicator_created == 0:
-            self.panel_indicator = turtle.Turtle()
+            self.panel_indicator = CachedTurtle()
             # Ensure that the turtle does not draw lines on the screen while moving
             self.panel_indicator.penup()
             self.panel_indicator.hideturtle()
@@ -229,7 +229,7 @@ class Panel:
             Returns the panel frame so that its class attributes can be accessed.
 
             :return: panel_frame: the panel frame
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.panel
@@ -239,7 +239,7 @@ class Panel:
             Returns the panel text so that its class attributes can be accessed.
 
             :return: panel_text: the panel text
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.panel_text
@@ -249,7 +249,7 @@ class Panel:
             Returns the panel indicator so that its class attributes can be accessed.
 
             :return: panel_indicator: the panel indicator
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.panel_indicator
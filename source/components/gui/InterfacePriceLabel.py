@@ -22,7 +22,7 @@
     The price label is the little coin icon next to the displayed price of the item in a shop slot/power up slot.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.TextureSetup import COIN_INDICATOR_TEXTURE
 
 
@@ -31,7 +31,7 @@ class PriceLabel:
         Represents the price label in Laser Fighter.
 
         Attributes:
-            price_label (turtle.Turtle()): The price label icon sprite
+            price_label (CachedTurtle()): The price label icon sprite
             id (int): The id of the current price label
     """
 
@@ -49,7 +49,7 @@ class PriceLabel:
             :type y: float
         """
 
-        self.price_label = turtle.Turtle()
+        self.price_label = CachedTurtle()
         # Ensure that the turtle does not draw lines on the screen while moving
         self.price_label.penup()
         self.price_label.shape(COIN_INDICATOR_TEXTURE)
@@ -94,7 +94,7 @@ class PriceLabel:
             Returns the price label icon so its class attributes can be accessed.
 
             :return: price_label: the price label icon
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.price_label
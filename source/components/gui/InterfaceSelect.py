@@ -23,7 +23,7 @@
         configurations eyes.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.TextureSetup import SLOT_SELECTOR_TEXTURE
 from setup.TextureSetup import TAB_SELECTOR_TEXTURE
 
@@ -33,7 +33,7 @@ class Selector:
         Represents the selector object in Laser Fighter.
 
         Attributes:
-            selector (turtle.Turtle()): The selector sprite
+            selector (CachedTurtle()): The selector sprite
             type (string): The type of selector
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -41,7 +41,7 @@ class Selector:
     """
 
     def __init__(self, type, scale_factor_x, scale_factor_y):
-        self.selector = turtle.Turtle()
+        self.selector = CachedTurtle()
         # Ensure that the turtle does not draw lines on the screen while moving
         self.selector.penup()
         if type == "Tab":
@@ -100,7 +100,7 @@ class Selector:
             Returns the selector sprite so its class attributes can be accessed.
 
             :return: selector: the selector sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.selector
@@ -23,16 +23,25 @@
     It creates text using turtles text box feature and hiding the text turtle.
 """
 
-import turtle
-import time
+from utils.CachedTurtle import CachedTurtle
+from setup.WindowSetup import game_clock
 
 
 class Text:
     """
         Represents a standalone textbox in the game.
+        Text is only redrawn when the string, font, alignment, colour or position of the text box has changed since
+            the last time it was drawn.
+
+        Class Variables:
+            redraw_count (int): The number of times any text box has been redrawn since the game started
 
         Attributes:
             text_box (turtle): The text box turtle object
+            written (tuple): The text, alignment, font, colour and position of the last thing drawn (None if nothing
+                is drawn)
+            source (function): The function that returns the text the text box is bound to (None if it is not bound)
+            source_font (tuple): The font size, font type and alignment used to draw the bound text
 
             moving (int): Determines the direction the text box will move
             start_time (float): Stores the timestamp for when the text box should move
@@ -45,6 +54,8 @@ class Text:
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
     """
 
+    redraw_count = 0
+
     def __init__(self, id, x, y, color, scale_factor, scale_factor_x):
         """
             Creates a text box object on the screen
@@ -68,12 +79,15 @@ class Text:
             :type scale_factor_x: float
         """
 
-        self.text_box = turtle.Turtle()
+        self.text_box = CachedTurtle()
         self.text_box.color(color)
         # Ensure that the turtle does not draw lines on the screen while moving
         self.text_box.penup()
         self.text_box.goto(x, y)
         self.text_box.hideturtle()
+        self.written = None
+        self.source = None
+        self.source_font = None
 
         self.moving = 1
         self.start_time = 0
@@ -125,7 +139,7 @@ class Text:
             Returns the text_box sprite so its class attributes can be accessed
 
             :return: text_box: the text box sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.text_box
@@ -149,6 +163,9 @@ class Text:
 
         self.text_box.clear()
         self.text_box.hideturtle()
+        self.written = None
+        self.source = None
+        self.source_font = None
         self.in_use = 0
         self.movement_activated = 0
 
@@ -168,8 +185,7 @@ class Text:
             :return: None
         """
 
-        self.text_box.clear()
-        self.text_box.write(text, align="center", font=("Courier", int(size * self.scale_factor), type))
+        self.draw(text, size, type, "center")
 
     def write_left(self, text, size, type):
         """
@@ -187,8 +203,7 @@ class Text:
             :return: None
         """
 
-        self.text_box.clear()
-        self.text_box.write(text, align="left", font=("Courier", int(size * self.scale_factor), type))
+        self.draw(text, size, type, "left")
 
     def write_right(self, text, size, type):
         """
@@ -206,8 +221,69 @@ class Text:
             :return: None
         """
 
+        self.draw(text, size, type, "right")
+
+    def draw(self, text, size, type, align):
+        """
+            Draws the given text on the text box object, unless the exact same text is already drawn in the same place.
+
+            :param text: The text to be written
+            :type text: string
+
+            :param size: The font size of the text to be written
+            :type size: int
+
+            :param type: The type of text to be written (bold, underlines, normal, italic)
+            :type type: string
+
+            :param align: The alignment of the text (center, left or right)
+            :type align: string
+
+            :return: None
+        """
+
+        font = ("Courier", int(size * self.scale_factor), type)
+        written = (text, align, font, self.text_box.pencolor(), self.text_box.position())
+        if written == self.written:
+            return
         self.text_box.clear()
-        self.text_box.write(text, align="right", font=("Courier", int(size * self.scale_factor), type))
+        self.text_box.write(text, align=align, font=font)
+        self.written = written
+        Text.redraw_count = Text.redraw_count + 1
+
+    def bind(self, source, size, type, align="center"):
+        """
+            Binds the text box to a value so that refresh() can redraw it whenever the value changes.
+
+            :param source: A function that returns the text to be written (Or None if nothing should be written)
+            :type source: function
+
+            :param size: The font size of the text to be written
+            :type size: int
+
+            :param type: The type of text to be written (bold, underlines, normal, italic)
+            :type type: string
+
+            :param align: The alignment of the text (center, left or right)
+            :type align: string
+
+            :return: None
+        """
+
+        self.source = source
+        self.source_font = (size, type, align)
+
+    def refresh(self):
+        """
+            Redraws the bound text if it has changed.
+
+            :return: None
+        """
+
+        if self.source is not None:
+            text = self.source()
+            if text is not None:
+                self.draw(text, *self.source_font)
 
     def set_color(self, color):
         """
@@ -230,10 +306,10 @@ class Text:
 
         # If the movement has just started, a start time is created for it
         if self.movement_activated == 0:
-            self.start_time = time.time()
+            self.start_time = game_clock.now
             self.movement_activated = 1
         # Move the text box every 0.02 seconds
-        current_time = time.time()
+        current_time = game_clock.now
         elapsed_time = current_time - self.start_time
         if elapsed_time >= 0.02:
             if mode == "Shop":
@@ -264,4 +340,4 @@ class Text:
             if self.moving == -1:
                 delta_movement = 5 * self.scale_factor_x * ((elapsed_time - 0.02) / 0.02)
                 self.text_box.setx(self.text_box.xcor() - 5 * self.scale_factor_x - delta_movement)
-            self.start_time = time.time()
+            self.start_time = game_clock.now
@@ -22,7 +22,7 @@
     For some guns, multiple laser sprites are needed.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.ModeSetupMaster import alien_mode_setup
 
 
@@ -31,7 +31,7 @@ class HumanLaser:
         Represents the player's laser in Alien Mode.
 
         Attributes:
-            _laser (turtle.Turtle()): The player laser sprite
+            _laser (CachedTurtle()): The player laser sprite
             laser_update (int): Determines the lasers current pierce value
 
             scale_factor_x: The scale factor for the x-axis used in fullscreen mode
@@ -55,7 +55,7 @@ class HumanLaser:
             :type scale_factor_y: float
         """
 
-        self._laser = turtle.Turtle()
+        self._laser = CachedTurtle()
         self.laser.shape(alien_mode_setup.laser_right_texture)
         self.laser.shapesize(0.33 * scale_factor_y, 2 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
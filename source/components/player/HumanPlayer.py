@@ -25,10 +25,8 @@
     The player is supposed to be a human figure with an oxygen tank attached to him.
 """
 
-import turtle
-import pygame
 import math
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.player.HumanLaser import HumanLaser
 from setup.ModeSetupMaster import alien_mode_setup
 from setup.TextureSetup import HUMAN_STILL_RIGHT_TEXTURE
@@ -58,18 +56,27 @@ from setup.TextureSetup import ARMOR_BAR_10_4_TEXTURE
 from setup.TextureSetup import ARMOR_BAR_10_3_TEXTURE
 from setup.TextureSetup import ARMOR_BAR_10_2_TEXTURE
 from setup.TextureSetup import ARMOR_BAR_10_1_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class Human:
     """
         Represents a player in Alien Mode. The player is controlled based on the key controls and fires a red laser.
 
+        Class Variables:
+            GRAVITY (float): The force of gravity on the moon, used for jumping (Per jump step squared)
+            GROUND_Y (float): The y-coordinate of the ground that the player lands on
+            JUMP_STEP_DISTANCE (float): The distance the player moves along the x-axis each jump step
+            LASER_STEP_TIME (float): The amount of game time it takes for a laser to move by the laser speed
+            MOVE_STEP_TIME (float): The amount of game time it takes for the player to move by the player movement
+
         Attributes:
-            player (turtle.Turtle()): The player sprite
-            oxygen_tank (turtle.Turtle()): The players oxygen tank sprite
-            gun (turtle.Turtle()): The player gun sprite
-            health_bar (turtle.Turtle()): The players health bar sprite
-            armor_bar (turtle.Turtle()): The players armor bar sprite
+            player (CachedTurtle()): The player sprite
+            oxygen_tank (CachedTurtle()): The players oxygen tank sprite
+            gun (CachedTurtle()): The player gun sprite
+            health_bar (CachedTurtle()): The players health bar sprite
+            armor_bar (CachedTurtle()): The players armor bar sprite
             armor_created (int): Determines if the armor bar has already been created or not for the player
 
             laser_list (list): The list of the current lasers on the screen
@@ -108,14 +115,10 @@ class Human:
 
             kill_start_time (float): Used as a timestamp for the death animation of the player (To make the animation
                 run in a consistent amount of time)
-            laser_start_time (float): Used as a timestamp for the laser movement of the player (To make the movement
-                happen in a consistent amount of time)
             hit_start_time (float): Used as a timestamp for the hit duration of the player (To make sure that the hit
                 delay is constant)
-            jump_start_time (float): Used as a timestamp for the jump duration of the player (To make sure that the
-                time it takes to jump stays consistent)
-            move_start_time (float): Used as a timestamp for the players movement (To make the players movement
-                happen in a consistent amount of time and not based on code execution speed)
+            jump_time (float): The game time since the player started jumping (Sped up while the yellow power up is
+                active)
             walk_start_time (float): Used as a timestamp for the players walking texture update (To make sure the
                 walking animation happens in a consistent amount of time)
             gun_start_time (float): Used as a timestamp for updating the guns texture when the player changes
@@ -125,6 +128,12 @@ class Human:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
+    GRAVITY = 1.625
+    GROUND_Y = -141
+    JUMP_STEP_DISTANCE = 7
+    LASER_STEP_TIME = 0.01
+    MOVE_STEP_TIME = 0.012
+
     def __init__(self, god_mode, scale_factor_x, scale_factor_y):
         """
             Creates a human object and spawns it on the screen
@@ -139,7 +148,7 @@ class Human:
             :type scale_factor_y: float
         """
 
-        self.player = turtle.Turtle()
+        self.player = CachedTurtle()
         self.player.shape(HUMAN_STILL_RIGHT_TEXTURE)
         self.player.shapesize(4 * scale_factor_y, 2 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -147,7 +156,7 @@ class Human:
         self.player.goto(0, -141 * scale_factor_y)
         self.player.direction = "stop"
 
-        self.oxygen_tank = turtle.Turtle()
+        self.oxygen_tank = CachedTurtle()
         self.oxygen_tank.shape(OXYGEN_TANK_TEXTURE)
         self.oxygen_tank.shapesize(1.5 * scale_factor_y, 0.75 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -155,7 +164,7 @@ class Human:
         self.oxygen_tank.goto(self.player.xcor() - 30.5 * scale_factor_x, self.player.ycor() + 11 * scale_factor_y)
         self.oxygen_tank.direction = "stop"
 
-        self.gun = turtle.Turtle()
+        self.gun = CachedTurtle()
         self.gun.shape(alien_mode_setup.gun_right_texture)
         self.gun.shapesize(0.67 * scale_factor_y, 2 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -175,7 +184,7 @@ class Human:
             self.laser_list.append(laser)
             self.all_laser_list.append(laser)
 
-        self.health_bar = turtle.Turtle()
+        self.health_bar = CachedTurtle()
         self.health_bar.shape(HEALTH_BAR_1010_TEXTURE)
         self.health_bar.shapesize(1 * scale_factor_y, 1 * scale_factor_x)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -187,7 +196,7 @@ class Human:
 
         # If the shield is enabled, an armor bar is created in the top right corner of the screen
         if alien_mode_setup.health == 20:
-            self.armor_bar = turtle.Turtle()
+            self.armor_bar = CachedTurtle()
             self.armor_bar.shape(ARMOR_BAR_10_10_TEXTURE)
             self.armor_bar.shapesize(1 * scale_factor_y, 1 * scale_factor_x)
             # Ensure that the turtle does not draw lines on the screen while moving
@@ -227,9 +236,7 @@ class Human:
         self.do_jump = 0
         self.kill_start_time = 0
         self.hit_start_time = 0
-        self.laser_start_time = 0
-        self.jump_start_time = 0
-        self.move_start_time = 0
+        self.jump_time = 0
         self.walk_start_time = 0
         self.gun_start_time = 0
 
@@ -265,6 +272,24 @@ class Human:
         del self.laser_list
         del self.all_laser_list
 
+    def rescale(self, ratio_x, ratio_y):
+        """
+            Rescales the jump when the resolution is changed while the game is running.
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        self.initial_velocity = self.initial_velocity * ratio_y
+        self.current_velocity = self.current_velocity * ratio_y
+        self.Start_X = self.Start_X * ratio_x
+        self.Start_Y = self.Start_Y * ratio_y
+
     def reinstate(self, god_mode):
         """
             Reuses the existing sprite to spawn a human player on the screen
@@ -321,7 +346,7 @@ class Human:
         # If the shield is enabled, create the armor bar if it does not exist already
         if self.health == 20:
             if self.armor_created == 0:
-                self.armor_bar = turtle.Turtle()
+                self.armor_bar = CachedTurtle()
                 self.armor_bar.shapesize(1 * self.scale_factor_y, 1 * self.scale_factor_x)
                 # Ensure that the turtle does not draw lines on the screen while moving
                 self.armor_bar.penup()
@@ -359,7 +384,7 @@ class Human:
             Returns the players health bar sprite so that its class attributes can be accessed
 
             :return: health_bar: The players health bar sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.health_bar
@@ -369,7 +394,7 @@ class Human:
             Returns the players armor bar sprite so that its class attributes can be accessed
 
             :return: armor_bar: The players armor bar sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.armor_bar
@@ -455,9 +480,7 @@ class Human:
         self.do_jump = 0
         self.kill_start_time = 0
         self.hit_start_time = 0
-        self.laser_start_time = 0
-        self.jump_start_time = 0
-        self.move_start_time = 0
+        self.jump_time = 0
         self.walk_start_time = 0
         self.gun_start_time = 0
 
@@ -481,7 +504,6 @@ class Human:
             # Mark the starting point
             self.Start_X = self.player.xcor()
             self.move_right = 1
-            self.move_start_time = time.time()
 
     def go_left(self):
         """
@@ -503,7 +525,6 @@ class Human:
             # Mark the starting point
             self.Start_X = self.player.xcor()
             self.move_left = 1
-            self.move_start_time = time.time()
 
     def jump(self):
         """
@@ -520,7 +541,7 @@ class Human:
                 self.Start_Y = self.player.ycor()
                 self.Start_X = self.player.xcor()
                 self.do_jump = 1
-                self.jump_start_time = time.time()
+                self.jump_time = 0
 
     def shoot(self, shooting_sound):
         """
@@ -549,11 +570,9 @@ class Human:
                 self.laser_start_X = self.laser_list[0].laser.xcor()
                 self.laser_list[1].laser_update = 100
             if shooting_sound == 1:
-                sound = pygame.mixer.Sound("sound/Laser_Gun_Player.wav")
-                sound.play()
+                sound_bank.play("player_laser")
             # Ensure that the second laser is not fired right when the first one is
             self.laser_fire = 0
-            self.laser_start_time = time.time()
         # If the player is facing left
         elif self.direction == 2:
             # Shoot to the left
@@ -570,34 +589,33 @@ class Human:
                 self.laser_start_X = self.laser_list[0].laser.xcor()
                 self.laser_list[1].laser_update = 100
             if shooting_sound == 1:
-                sound = pygame.mixer.Sound("sound/Laser_Gun_Player.wav")
-                sound.play()
+                sound_bank.play("player_laser")
             # Ensure that the second laser is not fired right when the first one is
             self.laser_fire = 0
-            self.laser_start_time = time.time()
 
-    def execute_right_movement(self, yellow_power_up):
+    def execute_right_movement(self, yellow_power_up, dt):
         """
-            Move the player to the right 100 units in 0.012 seconds
+            Move the player to the right 100 units, by the player movement every MOVE_STEP_TIME seconds of game time
+
+            :param yellow_power_up: Determines if the yellow power up is active or not
+            :type yellow_power_up: int
+
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
 
             :return: None
         """
 
         # If the right movement has been initialized and the player is not dying
         if self.move_right == 1 and self.direction == 1 and self.death_animation == 0:
-            # Move right in 0.012 seconds
-            current_time = time.time()
-            elapsed_time = current_time - self.move_start_time
             # How fast the player moves depends on if the yellow power up is activated or not
             player_movement = alien_mode_setup.player_movement
             if yellow_power_up == 1:
                 player_movement = alien_mode_setup.yellow_player_movement
-            if elapsed_time >= 0.012:
+            if dt > 0:
                 self.move_update = 1
                 if self.player.xcor() < (self.Start_X + 100 * self.scale_factor_x):
-                    # Calculate the delta movement and add it as additional movement required
-                    delta_movement = player_movement * ((elapsed_time - 0.012) / 0.012)
-                    self.player.setx(self.player.xcor() + player_movement + delta_movement)
+                    self.player.setx(self.player.xcor() + player_movement * (dt / self.MOVE_STEP_TIME))
                     self.oxygen_tank.goto(self.player.xcor() - 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
                     self.gun.goto(self.player.xcor() + alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
                     self.moving_right = 1
@@ -606,30 +624,30 @@ class Human:
                     self.moving_right = 0
                     self.move_right = 0
                 self.move_update = 0
-                self.move_start_time = time.time()
 
-    def execute_left_movement(self, yellow_power_up):
+    def execute_left_movement(self, yellow_power_up, dt):
         """
-            Move the player to the left 100 units in 0.012 seconds
+            Move the player to the left 100 units, by the player movement every MOVE_STEP_TIME seconds of game time
+
+            :param yellow_power_up: Determines if the yellow power up is active or not
+            :type yellow_power_up: int
+
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
 
             :return: None
         """
 
         # If the left movement has been initialized and the player is not dying
         if self.move_left == 1 and self.direction == 2 and self.death_animation == 0:
-            # Move left in 0.012 seconds
-            current_time = time.time()
-            elapsed_time = current_time - self.move_start_time
             # How fast the player moves depends on if the yellow power up is activated or not
             player_movement = alien_mode_setup.player_movement
             if yellow_power_up == 1:
                 player_movement = alien_mode_setup.yellow_player_movement
-            if elapsed_time >= 0.012:
+            if dt > 0:
                 self.move_update = 1
                 if self.player.xcor() > (self.Start_X - 100 * self.scale_factor_x):
-                    # Calculate the delta movement and add it as additional movement required
-                    delta_movement = player_movement * ((elapsed_time - 0.012) / 0.012)
-                    self.player.setx(self.player.xcor() - player_movement - delta_movement)
+                    self.player.setx(self.player.xcor() - player_movement * (dt / self.MOVE_STEP_TIME))
                     self.oxygen_tank.goto(self.player.xcor() + 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
                     self.gun.goto(self.player.xcor() - alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
                     self.moving_left = 1
@@ -638,11 +656,19 @@ class Human:
                     self.moving_left = 0
                     self.move_left = 0
                 self.move_update = 0
-                self.move_start_time = time.time()
 
-    def execute_jump(self, yellow_power_up):
+    def execute_jump(self, yellow_power_up, dt):
         """
             Executes the jump movement of the player in the specified direction based on the variable "direction"
+            The height of the player is found straight from the time since the jump started (y = y0 + vt - gt^2 / 2,
+                where g is the force of gravity on the moon), so the jump costs the same no matter how long the frame
+                took.
+
+            :param yellow_power_up: Determines whether the yellow power up is currently on or off
+            :type yellow_power_up: int
+
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
 
             :return: None
         """
@@ -650,119 +676,60 @@ class Human:
         # If the jump has been initialized
         if self.do_jump == 1 and self.death_animation == 0:
             self.jump_update = 1
-            # If the direction is right
-            if (self.direction == 1 and self.jump_direction == 0) or (self.jump_direction == 1):
-                current_time = time.time()
-                elapsed_time = current_time - self.jump_start_time
-                # How fast the player jumps depends on if the yellow power up is active or not
-                jump_frequency = alien_mode_setup.jump_frequency
-                if yellow_power_up == 1:
-                    jump_frequency = alien_mode_setup.yellow_jump_frequency
-                if elapsed_time >= jump_frequency:
-                    # Find the delta time (How ,much more time has passed since 0.006 seconds)
-                    delta_movement = (elapsed_time - jump_frequency) / jump_frequency
-                    # Convert this value to an integer to get the whole number amounts of
-                    #   "0.006 seconds" that have passed
-                    delta_movement = int(delta_movement)
-                    # Account for delta time in the jump by doing the right number of iterations in a row to ensure
-                    #   that the jumps speed stays consistent
-                    iterations = 1 + delta_movement
-                    for i in range(iterations):
-                        # Turn all the sprites to the right
-                        self.jump_direction = 1
-                        self.gun.direction = "right"
-                        self.gun_direction = 1
-                        # Move the player
-                        self.player.sety(self.player.ycor() + self.current_velocity)
-                        self.player.setx(self.player.xcor() + 7 * self.scale_factor_x)
-                        self.oxygen_tank.goto(self.player.xcor() - 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
-                        self.gun.goto(self.player.xcor() + alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
-                        self.jump_start_time = time.time()
-                        # Finding the new velocity:
-                        # If the highest point has not been reached yet
-                        if self.current_velocity > 0:
-                            # Find the new velocity using the real world physics formula vf^2 = vi^2 + 2adx where
-                            #   a is the force of gravity on the moon in real life and dx is the distance between the
-                            #   starting point and the current player position
-                            velocity_squared = self.initial_velocity ** 2 + 2 * (-1.625 * self.scale_factor_y) * abs(self.player.ycor() - self.Start_Y)
-                            # Make sure there is no divide by zero error
-                            if velocity_squared > 0:
-                                self.current_velocity = math.sqrt(velocity_squared)
-                            else:
-                                self.current_velocity = 0
-                        # if the highest point has already been reached
-                        elif self.player.ycor() > self.Start_Y and self.current_velocity <= 0:
-                            # Use the same formula as before, but acceleration is increasing this time (because the
-                            #   player is moving down)
-                            self.current_velocity = math.sqrt(2 * (1.625 * self.scale_factor_y) * (self.Start_Y + 175 * self.scale_factor_y) - self.player.ycor())
-                            self.current_velocity = 0 - self.current_velocity
-                        # The jump is finished
-                        else:
-                            # Reset the variables
-                            self.jump_update = 0
-                            self.jump_direction = 0
-                            self.do_jump = 0
-                            self.current_velocity = 23.84848 * self.scale_factor_y
-                            self.player.sety(-141 * self.scale_factor_y)
-                            self.oxygen_tank.goto(self.player.xcor() - 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
-                            self.gun.goto(self.player.xcor() + alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
-                            break
-            # If the direction is left
-            elif (self.direction == 2 and self.jump_direction == 0) or (self.jump_direction == 2):
-                current_time = time.time()
-                elapsed_time = current_time - self.jump_start_time
-                # How fast the player jumps depends on if the yellow power up is active or not
-                jump_frequency = alien_mode_setup.jump_frequency
-                if yellow_power_up == 1:
-                    jump_frequency = alien_mode_setup.yellow_jump_frequency
-                if elapsed_time >= jump_frequency:
-                    # Same process as above to find the delta time
-                    delta_movement = (elapsed_time - jump_frequency) / jump_frequency
-                    delta_movement = int(delta_movement)
-                    iterations = 1 + delta_movement
-                    for i in range(iterations):
-                        # Turn all the sprites to the left
-                        self.jump_direction = 2
-                        self.gun.direction = "left"
-                        self.gun_direction = 2
-                        # Move the player
-                        self.player.sety(self.player.ycor() + self.current_velocity)
-                        self.player.setx(self.player.xcor() - 7 * self.scale_factor_x)
-                        self.oxygen_tank.goto(self.player.xcor() + 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
-                        self.gun.goto(self.player.xcor() - alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
-                        self.jump_start_time = time.time()
-                        # Finding the new velocity:
-                        # If the highest point has not been reached yet
-                        if self.current_velocity > 0:
-                            # Find the new velocity using the real world physics formula vf^2 = vi^2 + 2adx where
-                            #   a is the force of gravity on the moon in real life and dx is the distance between the
-                            #   starting point and the current player position
-                            velocity_squared = self.initial_velocity ** 2 + 2 * (-1.625 * self.scale_factor_y) * abs(self.player.ycor() - self.Start_Y)
-                            if velocity_squared > 0:
-                                self.current_velocity = math.sqrt(velocity_squared)
-                            else:
-                                self.current_velocity = 0
-                        # if the highest point has already been reached
-                        elif self.player.ycor() > self.Start_Y and self.current_velocity <= 0:
-                            # Use the same formula as before, but acceleration is increasing this time (because the
-                            #   player is moving down)
-                            self.current_velocity = math.sqrt(2 * (1.625 * self.scale_factor_y) * (self.Start_Y + 175 * self.scale_factor_y) - self.player.ycor())
-                            self.current_velocity = 0 - self.current_velocity
-                        # The jump is finished
-                        else:
-                            # Reset the variables
-                            self.jump_update = 0
-                            self.jump_direction = 0
-                            self.do_jump = 0
-                            self.current_velocity = 23.84848 * self.scale_factor_y
-                            self.player.sety(-141 * self.scale_factor_y)
-                            self.oxygen_tank.goto(self.player.xcor() + 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
-                            self.gun.goto(self.player.xcor() - alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
-                            break
-
-    def execute_shoot(self, shooting_sound, yellow_power_up):
+            # Lock in the direction of the jump when it starts
+            if self.jump_direction == 0:
+                if self.direction == 1:
+                    self.jump_direction = 1
+                elif self.direction == 2:
+                    self.jump_direction = 2
+                else:
+                    return
+            # The sprites face right (1) or left (-1)
+            if self.jump_direction == 1:
+                self.gun.direction = "right"
+                self.gun_direction = 1
+                facing = 1
+            else:
+                self.gun.direction = "left"
+                self.gun_direction = 2
+                facing = -1
+
+            # The jump is measured in steps of "jump_frequency" seconds (The velocity and gravity are per step)
+            # The yellow power up makes time pass faster during the jump
+            time_scale = 1
+            if yellow_power_up == 1:
+                time_scale = alien_mode_setup.jump_frequency / alien_mode_setup.yellow_jump_frequency
+            previous_steps = self.jump_time / alien_mode_setup.jump_frequency
+            self.jump_time = self.jump_time + dt * time_scale
+            steps = self.jump_time / alien_mode_setup.jump_frequency
+
+            # Find when the player lands on the ground
+            gravity = self.GRAVITY * self.scale_factor_y
+            ground = self.GROUND_Y * self.scale_factor_y
+            landing_steps = (self.initial_velocity + math.sqrt(max(self.initial_velocity ** 2 + 2 * gravity * (self.Start_Y - ground), 0))) / gravity
+            steps = min(steps, landing_steps)
+
+            # Move the player (The x-axis movement is added on so that it can happen along with walking)
+            self.player.goto(self.player.xcor() + facing * self.JUMP_STEP_DISTANCE * self.scale_factor_x * (steps - previous_steps),
+                             self.Start_Y + self.initial_velocity * steps - gravity * steps ** 2 / 2)
+            self.current_velocity = self.initial_velocity - gravity * steps
+
+            # The jump is finished
+            if steps >= landing_steps:
+                # Reset the variables
+                self.jump_update = 0
+                self.jump_direction = 0
+                self.do_jump = 0
+                self.jump_time = 0
+                self.current_velocity = self.initial_velocity
+                self.player.sety(ground)
+            self.oxygen_tank.goto(self.player.xcor() - facing * 30.5 * self.scale_factor_x, self.player.ycor() + 11 * self.scale_factor_y)
+            self.gun.goto(self.player.xcor() + facing * alien_mode_setup.gun_offset, self.player.ycor() + 12 * self.scale_factor_y)
+
+    def execute_shoot(self, shooting_sound, yellow_power_up, dt):
         """
-            Move the lasers across the screen in the specified direction after they have been shot
+            Move the lasers across the screen in the specified direction by the game time that passed this frame after
+                they have been shot
 
             :param shooting_sound: Variable that determines if the player shooting sound is toggled on or off
             :type shooting_sound: int
@@ -770,6 +737,9 @@ class Human:
             :param yellow_power_up: Determines if the yellow power up is currently active or not
             :type yellow_power_up: int
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
@@ -786,32 +756,18 @@ class Human:
                 self.laser_fire = 1
                 self.laser_list[1].laser_update = 0
                 if shooting_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Laser_Gun_Player.wav")
-                    sound.play()
-            # Move the laser every 0.01 seconds
-            current_time = time.time()
-            elapsed_time = current_time - self.laser_start_time
-            if elapsed_time >= 0.01:
-                # Check if the yellow power up is on
-                if yellow_power_up == 1:
-                    # Calculate the delta movement
-                    # This the extra movement required to make up for the amount of time passed beyond 0.015 seconds
-                    # Done to ensure the game speed stays the same regardless of frame rate
-                    delta_movement = alien_mode_setup.yellow_power_up_speed * ((elapsed_time - 0.01) / 0.01)
-                    # Check if the second laser has already been fired or not
-                    if self.laser_fire == 0:
-                        self.laser_list[0].laser.setx(self.laser_list[0].laser.xcor() + alien_mode_setup.yellow_power_up_speed + delta_movement)
-                    else:
-                        for l in self.laser_list:
-                            l.laser.setx(l.laser.xcor() + alien_mode_setup.yellow_power_up_speed + delta_movement)
-                else:
-                    delta_movement = alien_mode_setup.laser_speed * ((elapsed_time - 0.01) / 0.01)
-                    if self.laser_fire == 0:
-                        self.laser_list[0].laser.setx(self.laser_list[0].laser.xcor() + alien_mode_setup.laser_speed + delta_movement)
-                    else:
-                        for l in self.laser_list:
-                            l.laser.setx(l.laser.xcor() + alien_mode_setup.laser_speed + delta_movement)
-                self.laser_start_time = time.time()
+                    sound_bank.play("player_laser")
+            # Move the laser by the laser speed every LASER_STEP_TIME seconds of game time
+            if yellow_power_up == 1:
+                movement = alien_mode_setup.yellow_power_up_speed * (dt / self.LASER_STEP_TIME)
+            else:
+                movement = alien_mode_setup.laser_speed * (dt / self.LASER_STEP_TIME)
+            # Check if the second laser has already been fired or not
+            if self.laser_fire == 0:
+                self.laser_list[0].laser.setx(self.laser_list[0].laser.xcor() + movement)
+            else:
+                for l in self.laser_list:
+                    l.laser.setx(l.laser.xcor() + movement)
         # If the direction is left
         elif -1080 * self.scale_factor_x < self.laser_list[0].laser.xcor() < 1080 * self.scale_factor_x and self.laser_direction == 2:
             self.shoot_update = 1
@@ -824,27 +780,17 @@ class Human:
             if len(self.laser_list) > 1 and self.laser_fire == 0 and self.laser_list[0].laser.xcor() <= self.laser_start_X - 100 * self.scale_factor_x:
                 self.laser_fire = 1
                 self.laser_list[1].laser_update = 0
-            current_time = time.time()
-            elapsed_time = current_time - self.laser_start_time
-            # Move the laser every 0.01 seconds
-            if elapsed_time >= 0.01:
-                # Check if the yellow power up is on
-                if yellow_power_up == 1:
-                    delta_movement = alien_mode_setup.yellow_power_up_speed * ((elapsed_time - 0.01) / 0.01)
-                    # Check if the second laser has already been fired or not
-                    if self.laser_fire == 0:
-                        self.laser_list[0].laser.setx(self.laser_list[0].laser.xcor() - alien_mode_setup.yellow_power_up_speed - delta_movement)
-                    else:
-                        for l in self.laser_list:
-                            l.laser.setx(l.laser.xcor() - alien_mode_setup.yellow_power_up_speed - delta_movement)
-                else:
-                    delta_movement = alien_mode_setup.laser_speed * ((elapsed_time - 0.01) / 0.01)
-                    if self.laser_fire == 0:
-                        self.laser_list[0].laser.setx(self.laser_list[0].laser.xcor() - alien_mode_setup.laser_speed - delta_movement)
-                    else:
-                        for l in self.laser_list:
-                            l.laser.setx(l.laser.xcor() - alien_mode_setup.laser_speed - delta_movement)
-                self.laser_start_time = time.time()
+            # Move the laser by the laser speed every LASER_STEP_TIME seconds of game time
+            if yellow_power_up == 1:
+                movement = alien_mode_setup.yellow_power_up_speed * (dt / self.LASER_STEP_TIME)
+            else:
+                movement = alien_mode_setup.laser_speed * (dt / self.LASER_STEP_TIME)
+            # Check if the second laser has already been fired or not
+            if self.laser_fire == 0:
+                self.laser_list[0].laser.setx(self.laser_list[0].laser.xcor() - movement)
+            else:
+                for l in self.laser_list:
+                    l.laser.setx(l.laser.xcor() - movement)
         # If the laser has finished moving
         else:
             # reset the variables
@@ -867,7 +813,7 @@ class Human:
         """
 
         # Updates the walking animation every 0.005 seconds
-        current_time = time.time()
+        current_time = game_clock.now
         elapsed_time = current_time - self.walk_start_time
         if elapsed_time >= 0.005:
             # If the players direction is right
@@ -884,7 +830,7 @@ class Human:
                     self.player.shape(HUMAN_WALKING_LEFT_TEXTURE)
                 else:
                     self.player.shape(HUMAN_STILL_LEFT_TEXTURE)
-            self.walk_start_time = time.time()
+            self.walk_start_time = game_clock.now
 
     def set_gun_texture(self):
         """
@@ -894,7 +840,7 @@ class Human:
         """
 
         # Change the guns texture every 0.005 seconds
-        current_time = time.time()
+        current_time = game_clock.now
         elapsed_time = current_time - self.gun_start_time
         if elapsed_time >= 0.005:
             # If the players direction is right, make the gun face right
@@ -903,7 +849,7 @@ class Human:
             # If the players direction is left, make the gun face left
             elif self.gun_direction == 2:
                 self.gun.shape(alien_mode_setup.gun_left_texture)
-            self.gun_start_time = time.time()
+            self.gun_start_time = game_clock.now
 
     def grant_player_health(self):
         """
@@ -983,7 +929,7 @@ class Human:
         if self.death_animation == 1:
             if 0 < self.death_iterator < 2:
                 # Wait 0.1 seconds
-                current_time = time.time()
+                current_time = game_clock.now
                 elapsed_time = current_time - self.kill_start_time
                 if elapsed_time >= 0.1:
                     self.death_iterator = 2
@@ -994,10 +940,10 @@ class Human:
                 # Change the players texture to the second frame of the explosion
                 self.player.shape(PLAYER_DEATH_2_TEXTURE)
                 self.death_iterator = self.death_iterator + 0.125
-                self.kill_start_time = time.time()
+                self.kill_start_time = game_clock.now
             elif 3 < self.death_iterator < 5:
                 # wait 0.15 seconds
-                current_time = time.time()
+                current_time = game_clock.now
                 elapsed_time = current_time - self.kill_start_time
                 if elapsed_time >= 0.15:
                     self.death_iterator = 5
@@ -1041,13 +987,12 @@ class Human:
             # Set the players texture to the first frame of the explosion
             self.player.shape(PLAYER_DEATH_1_TEXTURE)
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Player_Death_Sound.wav")
-                sound.play()
+                sound_bank.play("player_death")
             self.oxygen_tank.hideturtle()
             self.gun.hideturtle()
             self.death_iterator = 0.125
             self.death_animation = 1
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
     def hit_player(self, hit_sound):
@@ -1067,7 +1012,7 @@ class Human:
 
         if self.hit_delay == 3:
             # Wait 0.5 seconds
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.hit_start_time
             if elapsed_time >= 0.5:
                 self.hit_delay = 10
@@ -1120,14 +1065,13 @@ class Human:
             elif self.health == 1:
                 self.health_bar.shape(HEALTH_BAR_110_TEXTURE)
             self.hit_delay = self.hit_delay + 1
-            self.hit_start_time = time.time()
+            self.hit_start_time = game_clock.now
             return
 
         if self.hit_delay == 0 and self.death_animation == 0:
             # Decrease the players health by 1
             self.health = self.health - 1
             if hit_sound == 1:
-                sound = pygame.mixer.Sound("sound/Player_Hit_Sound.wav")
-                sound.play()
+                sound_bank.play("player_hit")
             self.hit_delay = 1
             return
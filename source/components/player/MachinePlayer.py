@@ -24,9 +24,7 @@
     The player is supposed to a be a cylinder laser gun that is sticking out of a ship that we cannot see in the frame.
 """
 
-import turtle
-import pygame
-import time
+from utils.CachedTurtle import CachedTurtle
 from components.player.MachinePlayerLaser import MachineLaser
 from setup.ModeSetupMaster import machine_mode_setup
 from setup.TextureSetup import EXPLOSION_1_TEXTURE
@@ -51,16 +49,21 @@ from setup.TextureSetup import ARMOR_BAR_10_4_TEXTURE
 from setup.TextureSetup import ARMOR_BAR_10_3_TEXTURE
 from setup.TextureSetup import ARMOR_BAR_10_2_TEXTURE
 from setup.TextureSetup import ARMOR_BAR_10_1_TEXTURE
+from setup.WindowSetup import sound_bank
+from setup.WindowSetup import game_clock
 
 
 class Player:
     """
         Represents a player in Machine Mode. The player is controlled based on controls and fires a green laser.
 
+        Class Variables:
+            LASER_STEP_TIME (float): The amount of game time it takes for a laser to move by the laser speed
+
         Attributes:
-            player (turtle.Turtle()): The player sprite
-            health_bar (turtle.Turtle()): The players health bar sprite
-            armor_bar (turtle.Turtle()): The players armor bar sprite
+            player (CachedTurtle()): The player sprite
+            health_bar (CachedTurtle()): The players health bar sprite
+            armor_bar (CachedTurtle()): The players armor bar sprite
             armor_created (int): Determines if the armor bar has already been created or not for the player
 
             laser_list (list): The list of the current lasers on the screen
@@ -82,8 +85,6 @@ class Player:
 
             kill_start_time (float): Used as a timestamp for the death animation of the player (To make the animation
                 run in a consistent amount of time)
-            laser_start_time (float): Used as a timestamp for the laser movement of the player (To make the movement
-                happen in a consistent amount of time)
             hit_start_time (float): Used as a timestamp for the hit duration of the player (To make sure that the hit
                 delay is constant)
 
@@ -91,6 +92,8 @@ class Player:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
+    LASER_STEP_TIME = 0.015
+
     def __init__(self, god_mode, scale_factor_x, scale_factor_y):
         """
             Creates a player object and spawns it on the screen
@@ -105,7 +108,7 @@ class Player:
             :type scale_factor_y: float
         """
 
-        self.player = turtle.Turtle()
+        self.player = CachedTurtle()
         self.player.shape(machine_mode_setup.player_texture)
         self.player.shapesize(5, 2)
         # Ensure that the turtle does not draw lines on the screen while moving
@@ -127,7 +130,7 @@ class Player:
 
         self.do_collision = 0
 
-        self.health_bar = turtle.Turtle()
+        self.health_bar = CachedTurtle()
         self.health_bar.shape(HEALTH_BAR_1010_TEXTURE)
         # Ensure that the turtle does not draw lines on the screen while moving
         self.health_bar.penup()
@@ -139,7 +142,7 @@ class Player:
 
         # If the shield is enabled, an armor bar is created in the top right corner of the screen
         if machine_mode_setup.health == 20:
-            self.armor_bar = turtle.Turtle()
+            self.armor_bar = CachedTurtle()
             self.armor_bar.shape(ARMOR_BAR_10_10_TEXTURE)
             self.armor_bar.shapesize(1 * scale_factor_y, 1 * scale_factor_x)
             # Ensure that the turtle does not draw lines on the screen while moving
@@ -157,7 +160,6 @@ class Player:
         self.hit_delay = 0
         self.update = 0
         self.direction = 0
-        self.laser_start_time = 0
         self.kill_start_time = 0
         self.hit_start_time = 0
 
@@ -245,7 +247,7 @@ class Player:
         # If the shield is enabled, create the armor bar if it does not exist already
         if self.health_bar_indicator == 20:
             if self.armor_created == 0:
-                self.armor_bar = turtle.Turtle()
+                self.armor_bar = CachedTurtle()
                 self.armor_bar.shapesize(1 * self.scale_factor_y, 1 * self.scale_factor_x)
                 # Ensure that the turtle does not draw lines on the screen while moving
                 self.armor_bar.penup()
@@ -283,7 +285,7 @@ class Player:
             Returns the players health bar sprite so that its class attributes can be accessed
 
             :return: health_bar: The players health bar sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.health_bar
@@ -293,7 +295,7 @@ class Player:
             Returns the players armor bar sprite so that its class attributes can be accessed
 
             :return: armor_bar: The players armor bar sprite
-            :type: turtle.Turtle()
+            :type: CachedTurtle()
         """
 
         return self.armor_bar
@@ -389,7 +391,6 @@ class Player:
         self.health_bar_indicator = machine_mode_setup.health
         self.update = 0
         # self.laser_has_attacked = 0
-        self.laser_start_time = 0
         self.kill_start_time = 0
         self.hit_start_time = 0
 
@@ -406,7 +407,6 @@ class Player:
         self.laser_start_y_list = [0] * self.laser_count
         self.laser_has_attacked_list = [0] * self.laser_count
         self.lasers_fired_list = [0] * self.laser_count
-        self.laser_start_time = time.time()
 
     def set_direction_left(self):
         """
@@ -466,8 +466,7 @@ class Player:
 
         self.laser_list[index].laser.showturtle()
         if shooting_sound == 1:
-            sound = pygame.mixer.Sound("sound/Laser_Gun_Player.wav")
-            sound.play()
+            sound_bank.play("player_laser")
         # Moves the specified laser back to the player to be fired
         self.laser_list[index].laser.setx(self.player.xcor())
         self.laser_list[index].laser.sety(self.player.ycor() + machine_mode_setup.laser_offset)
@@ -479,9 +478,9 @@ class Player:
         # Initiate the calculation of the hitboxes for the specified laser
         self.do_collision = index + 1
 
-    def shoot(self, shooting_sound, yellow_power_up):
+    def shoot(self, shooting_sound, yellow_power_up, dt):
         """
-            Moves the player's lasers across the screen after they are fired.
+            Moves the player's lasers across the screen by the game time that passed this frame after they are fired.
 
             :param shooting_sound: Determines if the player shooting sound is toggled on or off
             :type shooting_sound: int
@@ -489,6 +488,9 @@ class Player:
             :param yellow_power_up: Determines if the yellow power up is currently active or not
             :type yellow_power_up: int
 
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
             :return: None
         """
 
@@ -507,46 +509,28 @@ class Player:
 
         # While the last laser is still in the frame of the screen
         if self.laser_list[0].laser.ycor() < machine_mode_setup.laser_max_distance:
-            # Keep moving it a number of units every 0.015 seconds
-            # The number of units depends on the laser speed and the yellow power up
-            current_time = time.time()
-            elapsed_time = current_time - self.laser_start_time
-            if elapsed_time >= 0.015:
-                # If the yellow power up is not activated/is activated
-                if yellow_power_up == 0:
-                    # Calculate the delta movement
-                    # This the extra movement required to make up for the amount of time passed beyond 0.015 seconds
-                    # Done to ensure the game speed stays the same regardless of frame rate
-                    delta_movement = machine_mode_setup.laser_speed * ((elapsed_time - 0.015) / 0.015)
-                    # If the third laser has been fired
-                    if len(self.lasers_fired_list) == 3 and self.lasers_fired_list[2] == 1:
-                        self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + machine_mode_setup.laser_speed + delta_movement)
-                        self.laser_list[1].laser.sety(self.laser_list[1].laser.ycor() + machine_mode_setup.laser_speed + delta_movement)
-                        self.laser_list[2].laser.sety(self.laser_list[2].laser.ycor() + machine_mode_setup.laser_speed + delta_movement)
-                    # If the second laser has been fired and not the third
-                    elif len(self.lasers_fired_list) >= 2 and self.lasers_fired_list[1] == 1:
-                        self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + machine_mode_setup.laser_speed + delta_movement)
-                        self.laser_list[1].laser.sety(self.laser_list[1].laser.ycor() + machine_mode_setup.laser_speed + delta_movement)
-                    # If only the first laser has been fired
-                    elif len(self.lasers_fired_list) >= 1 or self.lasers_fired_list[1] == 0:
-                        self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + machine_mode_setup.laser_speed + delta_movement)
-                elif yellow_power_up == 1:
-                    delta_movement = machine_mode_setup.yellow_power_up_speed * ((elapsed_time - 0.015) / 0.015)
-                    if len(self.lasers_fired_list) == 3 and self.lasers_fired_list[2] == 1:
-                        self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + machine_mode_setup.yellow_power_up_speed + delta_movement)
-                        self.laser_list[1].laser.sety(self.laser_list[1].laser.ycor() + machine_mode_setup.yellow_power_up_speed + delta_movement)
-                        self.laser_list[2].laser.sety(self.laser_list[2].laser.ycor() + machine_mode_setup.yellow_power_up_speed + delta_movement)
-                    elif len(self.lasers_fired_list) >= 2 and self.lasers_fired_list[1] == 1:
-                        self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + machine_mode_setup.yellow_power_up_speed + delta_movement)
-                        self.laser_list[1].laser.sety(self.laser_list[1].laser.ycor() + machine_mode_setup.yellow_power_up_speed + delta_movement)
-                    elif len(self.lasers_fired_list) >= 1 or self.lasers_fired_list[1] == 0:
-                        self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + machine_mode_setup.yellow_power_up_speed + delta_movement)
-                self.laser_start_time = time.time()
+            # Keep moving it by the laser speed every LASER_STEP_TIME seconds of game time
+            # The speed depends on the shop configuration and the yellow power up
+            if yellow_power_up == 1:
+                movement = machine_mode_setup.yellow_power_up_speed * (dt / self.LASER_STEP_TIME)
+            else:
+                movement = machine_mode_setup.laser_speed * (dt / self.LASER_STEP_TIME)
+            # If the third laser has been fired
+            if len(self.lasers_fired_list) == 3 and self.lasers_fired_list[2] == 1:
+                self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + movement)
+                self.laser_list[1].laser.sety(self.laser_list[1].laser.ycor() + movement)
+                self.laser_list[2].laser.sety(self.laser_list[2].laser.ycor() + movement)
+            # If the second laser has been fired and not the third
+            elif len(self.lasers_fired_list) >= 2 and self.lasers_fired_list[1] == 1:
+                self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + movement)
+                self.laser_list[1].laser.sety(self.laser_list[1].laser.ycor() + movement)
+            # If only the first laser has been fired
+            elif len(self.lasers_fired_list) >= 1 or self.lasers_fired_list[1] == 0:
+                self.laser_list[0].laser.sety(self.laser_list[0].laser.ycor() + movement)
         else:
             # Remove all lasers from the screen when they are done being fired
             for l in self.laser_list:
                 l.laser.hideturtle()
-            self.laser_start_time = 0
 
     def grant_player_health(self):
         """
@@ -633,7 +617,7 @@ class Player:
 
         # Wait 0.05 seconds
         if 4 <= self.update < 6:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.05:
                 self.update = 6
@@ -647,7 +631,7 @@ class Player:
                 self.armor_bar.shape(ARMOR_BAR_10_10_TEXTURE)
                 self.armor_bar.showturtle()
             self.update = 4
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
             return
 
         # Respawns the player at the origin
@@ -659,7 +643,7 @@ class Player:
 
         # Wait 0.15 seconds
         if 1.5 <= self.update < 3:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.15:
                 self.update = 3
@@ -669,7 +653,7 @@ class Player:
         if 1.0 <= self.update <= 1.1:
             self.player.shape(EXPLOSION_2_TEXTURE)
             self.update = 1.5
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
 
         # Wait 0.1 seconds
         if 0.5 <= self.update < 1:
@@ -677,7 +661,7 @@ class Player:
                 self.update = 0.6
             elif self.update == 0.6:
                 self.update = 0.7
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.kill_start_time
             if elapsed_time >= 0.1:
                 self.update = 1
@@ -689,12 +673,11 @@ class Player:
             self.health_bar_indicator = 0
             # Death sound plays
             if death_sound == 1:
-                sound = pygame.mixer.Sound("sound/Explosion3.wav")
-                sound.play()
+                sound_bank.play("explosion_3")
             # Sets the players texture to the first frame of the explosion
             self.player.shape(EXPLOSION_1_TEXTURE)
             self.update = 0.5
-            self.kill_start_time = time.time()
+            self.kill_start_time = game_clock.now
 
     def hit_player(self, hit_sound):
         """
@@ -714,7 +697,7 @@ class Player:
 
         # Wait 0.5 seconds
         if 3 <= self.hit_delay < 39:
-            current_time = time.time()
+            current_time = game_clock.now
             elapsed_time = current_time - self.hit_start_time
             if elapsed_time >= 0.5:
                 self.hit_delay = 39
@@ -769,9 +752,8 @@ class Player:
             elif self.health_bar_indicator == 2:
                 self.health_bar.shape(HEALTH_BAR_110_TEXTURE)
             if hit_sound == 1:
-                sound = pygame.mixer.Sound("sound/Explosion4.wav")
-                sound.play()
+                sound_bank.play("explosion_4")
             self.hit_delay = 1
             # Decrease the players health by 1
             self.health_bar_indicator = self.health_bar_indicator - 1
-            self.hit_start_time = time.time()
+            self.hit_start_time = game_clock.now
@@ -22,7 +22,7 @@
     For some machine players, multiple laser sprites are needed.
 """
 
-import turtle
+from utils.CachedTurtle import CachedTurtle
 from setup.ModeSetupMaster import machine_mode_setup
 
 
@@ -31,7 +31,7 @@ class MachineLaser:
         Represents the players laser in Machine Mode.
 
         Attributes:
-            _laser (turtle.Turtle()): The machine players laser sprite
+            _laser (CachedTurtle()): The machine players laser sprite
     """
 
     def __init__(self, x, y):
@@ -45,7 +45,7 @@ class MachineLaser:
             :type y: float
         """
 
-        self._laser = turtle.Turtle()
+        self._laser = CachedTurtle()
         self._laser.shape(machine_mode_setup.laser_texture)
         # Ensure that the turtle does not draw lines on the screen while moving
         self._laser.penup()
@@ -26,6 +26,7 @@ from components.enemy.AlienSmallAlien import SmallAlien
 from components.enemy.AlienMediumAlien import MediumAlien
 from components.enemy.AlienLargeAlien import LargeAlien
 from components.enemy.AlienUFO import UFO
+from utils.ObjectPool import ObjectPool
 
 
 class SpawnSmallAlien:
@@ -33,8 +34,8 @@ class SpawnSmallAlien:
         Represents the Small Alien container in Laser Fighter.
 
         Attributes:
-            all_small_aliens (list): Contains all of the small alien sprites created since the game has launched, even
-                ones removed from the screen
+            small_alien_pool (ObjectPool()): Contains all of the small alien sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             small_aliens (list): Contains all of the small alien sprites currently visible/active on the screen.
             small_aliens_kill_values (list): Contains all of the death animation values for each small alien
                 on the screen.
@@ -55,7 +56,7 @@ class SpawnSmallAlien:
             :type scale_factor_y: float
         """
 
-        self.all_small_aliens = []
+        self.small_alien_pool = ObjectPool("Small_Alien")
         self.small_aliens = []
         self.small_aliens_kill_values = []
         self.small_alien_index = 0
@@ -70,7 +71,7 @@ class SpawnSmallAlien:
             :return: None
         """
 
-        del self.all_small_aliens
+        del self.small_alien_pool
         del self.small_aliens
         del self.small_aliens_kill_values
         del self.small_alien_index
@@ -85,22 +86,29 @@ class SpawnSmallAlien:
             :return: None
         """
 
-        if len(self.all_small_aliens) <= len(self.small_aliens):
+        small_alien = self.small_alien_pool.acquire()
+        if small_alien is None:
             small_alien = SmallAlien(id, self.scale_factor_x, self.scale_factor_y)
-            self.small_aliens.append(small_alien)
-            self.small_alien_index = self.small_alien_index + 1
-            self.all_small_aliens.append(small_alien)
-            self.small_aliens_kill_values.append(0)
+            self.small_alien_pool.add(small_alien)
         else:
-            for sa in self.all_small_aliens:
-                if sa.get_small_alien().isvisible():
-                    continue
-                else:
-                    sa.reinstate(id)
-                    self.small_aliens.append(sa)
-                    self.small_alien_index = self.small_alien_index + 1
-                    self.small_aliens_kill_values.append(0)
-                    break
+            small_alien.reinstate(id)
+        self.small_aliens.append(small_alien)
+        self.small_alien_index = self.small_alien_index + 1
+        self.small_aliens_kill_values.append(0)
+
+    def clear_small_aliens(self):
+        """
+            Removes every small alien from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for sa in self.small_aliens:
+            sa.remove()
+            self.small_alien_pool.release(sa)
+        self.small_aliens.clear()
+        self.small_alien_index = 0
+        self.small_aliens_kill_values.clear()
 
 
 class SpawnMediumAlien:
@@ -108,8 +116,8 @@ class SpawnMediumAlien:
         Represents the Medium Alien container in Laser Fighter.
 
         Attributes:
-            all_medium_aliens (list): Contains all of the medium alien sprites created since the game has launched, even
-                ones removed from the screen
+            medium_alien_pool (ObjectPool()): Contains all of the medium alien sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             medium_aliens (list): Contains all of the medium alien sprites currently visible/active on the screen.
             medium_aliens_kill_values (list): Contains all of the death animation values for each medium alien
                 on the screen.
@@ -131,7 +139,7 @@ class SpawnMediumAlien:
             :type scale_factor_y: float
         """
 
-        self.all_medium_aliens = []
+        self.medium_alien_pool = ObjectPool("Medium_Alien")
         self.medium_aliens = []
         self.medium_aliens_kill_values = []
         self.medium_aliens_hit_values = []
@@ -147,7 +155,7 @@ class SpawnMediumAlien:
             :return: None
         """
 
-        del self.all_medium_aliens
+        del self.medium_alien_pool
         del self.medium_aliens
         del self.medium_aliens_kill_values
         del self.medium_aliens_hit_values
@@ -163,24 +171,31 @@ class SpawnMediumAlien:
             :return: None
         """
 
-        if len(self.all_medium_aliens) <= len(self.medium_aliens):
+        medium_alien = self.medium_alien_pool.acquire()
+        if medium_alien is None:
             medium_alien = MediumAlien(id, self.scale_factor_x, self.scale_factor_y)
-            self.medium_aliens.append(medium_alien)
-            self.medium_alien_index = self.medium_alien_index + 1
-            self.all_medium_aliens.append(medium_alien)
-            self.medium_aliens_kill_values.append(0)
-            self.medium_aliens_hit_values.append(0)
+            self.medium_alien_pool.add(medium_alien)
         else:
-            for ma in self.all_medium_aliens:
-                if ma.get_medium_alien().isvisible():
-                    continue
-                else:
-                    ma.reinstate(id)
-                    self.medium_aliens.append(ma)
-                    self.medium_alien_index = self.medium_alien_index + 1
-                    self.medium_aliens_kill_values.append(0)
-                    self.medium_aliens_hit_values.append(0)
-                    break
+            medium_alien.reinstate(id)
+        self.medium_aliens.append(medium_alien)
+        self.medium_alien_index = self.medium_alien_index + 1
+        self.medium_aliens_kill_values.append(0)
+        self.medium_aliens_hit_values.append(0)
+
+    def clear_medium_aliens(self):
+        """
+            Removes every medium alien from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for ma in self.medium_aliens:
+            ma.remove()
+            self.medium_alien_pool.release(ma)
+        self.medium_aliens.clear()
+        self.medium_alien_index = 0
+        self.medium_aliens_kill_values.clear()
+        self.medium_aliens_hit_values.clear()
 
 
 class SpawnLargeAlien:
@@ -188,8 +203,8 @@ class SpawnLargeAlien:
         Represents the Large Alien container in Laser Fighter.
 
         Attributes:
-            all_large_aliens (list): Contains all of the large alien sprites created since the game has launched, even
-                ones removed from the screen
+            large_alien_pool (ObjectPool()): Contains all of the large alien sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             large_aliens (list): Contains all of the large alien sprites currently visible/active on the screen.
             large_aliens_kill_values (list): Contains all of the death animation values for each large alien
                 on the screen.
@@ -211,7 +226,7 @@ class SpawnLargeAlien:
             :type scale_factor_y: float
         """
 
-        self.all_large_aliens = []
+        self.large_alien_pool = ObjectPool("Large_Alien")
         self.large_aliens = []
         self.large_aliens_kill_values = []
         self.large_aliens_hit_values = []
@@ -227,7 +242,7 @@ class SpawnLargeAlien:
             :return: None
         """
 
-        del self.all_large_aliens
+        del self.large_alien_pool
         del self.large_aliens
         del self.large_aliens_kill_values
         del self.large_aliens_hit_values
@@ -243,24 +258,31 @@ class SpawnLargeAlien:
             :return: None
         """
 
-        if len(self.all_large_aliens) <= len(self.large_aliens):
+        large_alien = self.large_alien_pool.acquire()
+        if large_alien is None:
             large_alien = LargeAlien(id, self.scale_factor_x, self.scale_factor_y)
-            self.large_aliens.append(large_alien)
-            self.large_alien_index = self.large_alien_index + 1
-            self.all_large_aliens.append(large_alien)
-            self.large_aliens_kill_values.append(0)
-            self.large_aliens_hit_values.append(0)
+            self.large_alien_pool.add(large_alien)
         else:
-            for la in self.all_large_aliens:
-                if la.get_large_alien().isvisible():
-                    continue
-                else:
-                    la.reinstate(id)
-                    self.large_aliens.append(la)
-                    self.large_alien_index = self.large_alien_index + 1
-                    self.large_aliens_kill_values.append(0)
-                    self.large_aliens_hit_values.append(0)
-                    break
+            large_alien.reinstate(id)
+        self.large_aliens.append(large_alien)
+        self.large_alien_index = self.large_alien_index + 1
+        self.large_aliens_kill_values.append(0)
+        self.large_aliens_hit_values.append(0)
+
+    def clear_large_aliens(self):
+        """
+            Removes every large alien from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for la in self.large_aliens:
+            la.remove()
+            self.large_alien_pool.release(la)
+        self.large_aliens.clear()
+        self.large_alien_index = 0
+        self.large_aliens_kill_values.clear()
+        self.large_aliens_hit_values.clear()
 
 
 class SpawnUFO:
@@ -268,7 +290,8 @@ class SpawnUFO:
         Represents the UFO container in Laser Fighter.
 
         Attributes:
-            all_ufos (list): Contains the one ufo sprite that should be spawn throughout the entire game.
+            ufo_pool (ObjectPool()): Contains the one ufo sprite that should be spawn throughout the entire game, and
+                stores it when it is removed from the screen so that it can be reused
             ufos (list): Contains the ufo sprite if it is visible on the screen
             ufo_kill_value (list): Contains the death animation value for the ufo
             ufo_hit_value (list): Contains the hit delay value for the ufo
@@ -289,7 +312,7 @@ class SpawnUFO:
             :type scale_factor_y: float
         """
 
-        self.all_ufos = []
+        self.ufo_pool = ObjectPool("UFO")
         self.ufos = []
         self.ufo_kill_value = 0
         self.ufo_hit_value = 0
@@ -305,7 +328,7 @@ class SpawnUFO:
             :return: None
         """
 
-        del self.all_ufos
+        del self.ufo_pool
         del self.ufos
         del self.ufo_kill_value
         del self.ufo_hit_value
@@ -318,17 +341,26 @@ class SpawnUFO:
             :return: None
         """
 
-        if len(self.all_ufos) <= len(self.ufos):
+        spawn_ufo = self.ufo_pool.acquire()
+        if spawn_ufo is None:
             spawn_ufo = UFO(self.scale_factor_x, self.scale_factor_y)
-            self.ufos.append(spawn_ufo)
-            self.ufo_index = self.ufo_index + 1
-            self.all_ufos.append(spawn_ufo)
+            self.ufo_pool.add(spawn_ufo)
         else:
-            for u in self.all_ufos:
-                if u.get_ufo().isvisible():
-                    continue
-                else:
-                    u.reinstate()
-                    self.ufos.append(u)
-                    self.ufo_index = self.ufo_index + 1
-                    break
+            spawn_ufo.reinstate()
+        self.ufos.append(spawn_ufo)
+        self.ufo_index = self.ufo_index + 1
+
+    def clear_ufos(self):
+        """
+            Removes the ufo from the screen and puts it back in the pool to be reused.
+
+            :return: None
+        """
+
+        for u in self.ufos:
+            u.remove()
+            self.ufo_pool.release(u)
+        self.ufos.clear()
+        self.ufo_index = 0
+        self.ufo_kill_value = 0
+        self.ufo_hit_value = 0
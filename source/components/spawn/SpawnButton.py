@@ -23,6 +23,7 @@
 """
 
 from components.gui.InterfaceButton import Button
+from utils.ObjectPool import ObjectPool
 
 
 class SpawnButton:
@@ -30,16 +31,16 @@ class SpawnButton:
         Represents the Button container in Laser Fighter.
 
         Attributes:
-            all_button_list (list): Contains all of the button sprites created since the game has launched, even
-                ones removed from the screen
+            button_pool (ObjectPool()): Contains all of the button sprites created since the game has launched, and
+                the ones removed from the screen that can be reused (Grouped by whether they have a button indicator)
             buttons_on_screen_list (list): Contains all of the button sprites currently visible/active on the screen.
             current_button_index (int): Stores the number of buttons currently active and visible on the screen.
 
             button_update (int): Used for the main menu button when being hovered over (Main Menu Button Can be in
                 different locations depending on the screen)
-            clickable (int): Used to ensure that certain buttons can be clicked right away when the screen is changed
-                (Without the mouse needing to move at all)
             buy_button_pressed (int): Determines if the buy button in the shop side panel has been pressed or not
+            hitbox_update (int): Determines if the buttons on the screen have changed since the hover hit-test index
+                was last built
 
             scale_factor (float): The general scale factor used in fullscreen mode based off of the shortest axis
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -61,13 +62,13 @@ class SpawnButton:
             :type scale_factor_y: float
         """
 
-        self.all_button_list = []
+        self.button_pool = ObjectPool("Button")
         self.buttons_on_screen_list = []
         self.current_button_index = 0
 
         self.button_update = 0
-        self.clickable = 0
         self.buy_button_pressed = 0
+        self.hitbox_update = 1
 
         self.scale_factor = scale_factor
         self.scale_factor_x = scale_factor_x
@@ -80,12 +81,12 @@ class SpawnButton:
             :return: None
         """
 
-        del self.all_button_list
+        del self.button_pool
         del self.buttons_on_screen_list
         del self.current_button_index
         del self.button_update
-        del self.clickable
         del self.buy_button_pressed
+        del self.hitbox_update
 
     def spawn_button(self, type, id, page=None):
         """
@@ -103,92 +104,85 @@ class SpawnButton:
             :return: None
         """
 
+        # Buttons that need a button indicator take a free sprite that already has one first, so that a new
+        #   indicator does not need to be created
+        if type == "Settings_Toggle" or type == "Shop_Slot" or type == "Power_Up_Slot" or type == "Gadget_Slot" or type == "Buy":
+            button = self.button_pool.acquire(1)
+            if button is None:
+                button = self.button_pool.acquire(0)
+        # Buttons that do not need a button indicator take any free sprite
+        else:
+            button = self.button_pool.acquire()
+
         # If a usable button sprite does not exist
-        if len(self.all_button_list) <= len(self.buttons_on_screen_list):
+        if button is None:
             # Create a new button object
             if type != "Shop_Slot":
                 button = Button(type, id, self.scale_factor, self.scale_factor_x, self.scale_factor_y)
             else:
                 # The page the user is on is needed for the Shop Slot
                 button = Button(type, id, self.scale_factor, self.scale_factor_x, self.scale_factor_y, page=page)
-            self.buttons_on_screen_list.append(button)
-            self.current_button_index = self.current_button_index + 1
-            self.all_button_list.append(button)
-        # If a usable button sprite does exist
-        else:
-            # If the button to create does not need a button indicator
-            if type != "Settings_Toggle" and type != "Shop_Slot" and type != "Power_Up_Slot" and type != "Gadget_Slot" and type != "Buy":
-                # Reinstate the button like normal
-                # Go through all the button sprites
-                for bu in self.all_button_list:
-                    # If the current sprite is already in use
-                    if bu.get_button_frame().isvisible():
-                        continue
-                    # If the current sprite is free and ready to be used
-                    else:
-                        # Reinstate the button to the correct type and id
-                        if type == "Title":
-                            bu.reinstate_to_title(id)
-                        elif type == "Title_Locked":
-                            bu.reinstate_to_title_locked(id)
-                        elif type == "Title_Small":
-                            bu.reinstate_to_title_small(id)
-                        elif type == "Game":
-                            bu.reinstate_to_game()
-                        elif type == "Tab":
-                            bu.reinstate_to_tab(id)
-                        elif type == "Enable":
-                            bu.reinstate_to_enable()
-                        elif type == "Regular_Settings_And_Controls":
-                            bu.reinstate_to_regular_settings_and_controls(id)
-                        elif type == "Controls_Toggle":
-                            bu.reinstate_to_controls_toggle(id)
-                        # Add it to the screen
-                        self.buttons_on_screen_list.append(bu)
-                        self.current_button_index = self.current_button_index + 1
-                        break
-            # If the button to create does need a button indicator
-            else:
-                found = 0
-                # Go through all the button sprites
-                for bu in self.all_button_list:
-                    # First check if one can be found with a button indicator
-                    if bu.get_button_frame().isvisible() or bu.indicator == 0:
-                        continue
-                    # If found, reinstate that one
-                    else:
-                        if type == "Settings_Toggle":
-                            bu.reinstate_to_settings_toggle(id)
-                        elif type == "Shop_Slot":
-                            bu.reinstate_to_shop_slot(id, page)
-                        elif type == "Power_Up_Slot":
-                            bu.reinstate_to_power_up_slot(id)
-                        elif type == "Gadget_Slot":
-                            bu.reinstate_to_gadget_slot(id)
-                        elif type == "Buy":
-                            bu.reinstate_to_buy()
-                        self.buttons_on_screen_list.append(bu)
-                        self.current_button_index = self.current_button_index + 1
-                        found = 1
-                        break
-                # If not found
-                if found == 0:
-                    # Find any available button sprite
-                    for bu in self.all_button_list:
-                        if bu.get_button_frame().isvisible():
-                            continue
-                        else:
-                            # Reinstate it and add the button indicator to the object
-                            if type == "Settings_Toggle":
-                                bu.reinstate_to_settings_toggle(id)
-                            elif type == "Shop_Slot":
-                                bu.reinstate_to_shop_slot(id, page)
-                            elif type == "Power_Up_Slot":
-                                bu.reinstate_to_power_up_slot(id)
-                            elif type == "Gadget_Slot":
-                                bu.reinstate_to_gadget_slot(id)
-                            elif type == "Buy":
-                                bu.reinstate_to_buy()
-                            self.buttons_on_screen_list.append(bu)
-                            self.current_button_index = self.current_button_index + 1
-                            break
+            self.button_pool.add(button)
+        # If a usable button sprite does exist, reinstate the button to the correct type and id
+        elif type == "Title":
+            button.reinstate_to_title(id)
+        elif type == "Title_Locked":
+            button.reinstate_to_title_locked(id)
+        elif type == "Title_Small":
+            button.reinstate_to_title_small(id)
+        elif type == "Game":
+            button.reinstate_to_game()
+        elif type == "Tab":
+            button.reinstate_to_tab(id)
+        elif type == "Enable":
+            button.reinstate_to_enable()
+        elif type == "Regular_Settings_And_Controls":
+            button.reinstate_to_regular_settings_and_controls(id)
+        elif type == "Controls_Toggle":
+            button.reinstate_to_controls_toggle(id)
+        # Reinstating these also adds the button indicator to the object if it does not have one
+        elif type == "Settings_Toggle":
+            button.reinstate_to_settings_toggle(id)
+        elif type == "Shop_Slot":
+            button.reinstate_to_shop_slot(id, page)
+        elif type == "Power_Up_Slot":
+            button.reinstate_to_power_up_slot(id)
+        elif type == "Gadget_Slot":
+            button.reinstate_to_gadget_slot(id)
+        elif type == "Buy":
+            button.reinstate_to_buy()
+        # Add it to the screen
+        self.buttons_on_screen_list.append(button)
+        self.current_button_index = self.current_button_index + 1
+        self.hitbox_update = 1
+
+    def remove_button(self, button):
+        """
+            Removes a button from the screen and puts it back in the pool to be reused.
+
+            :param button: The button to remove
+            :type button: Button()
+
+            :return: None
+        """
+
+        button.remove()
+        self.buttons_on_screen_list.remove(button)
+        self.current_button_index = self.current_button_index - 1
+        # Free buttons are grouped by whether they have a button indicator or not
+        self.button_pool.release(button, button.indicator)
+        self.hitbox_update = 1
+
+    def clear_buttons(self):
+        """
+            Removes every button from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for bu in self.buttons_on_screen_list:
+            bu.remove()
+            self.button_pool.release(bu, bu.indicator)
+        self.buttons_on_screen_list.clear()
+        self.current_button_index = 0
+        self.hitbox_update = 1
@@ -23,7 +23,11 @@
         the player has.
 """
 
+import bisect
+import numpy as np
+from components.ItemCoin import Coin
 from components.ItemCoin import CoinIndicator
+from utils.ObjectPool import ObjectPool
 
 
 class SpawnCoin:
@@ -31,12 +35,19 @@ class SpawnCoin:
         Represents the Coin container in Laser Fighter.
 
         Attributes:
-            all_coins_list (list): Contains all of the coin sprites created since the game has launched, even
-                ones removed from the screen
+            coin_pool (ObjectPool()): Contains all of the coin sprites created since the game has launched, and the
+                ones removed from the screen that can be reused
             coins_on_screen_list (list): Contains all of the coin sprites currently visible/active on the screen.
             current_coin_index (int): Stores the number of coins currently active and visible on the screen.
             coin_pickup_delay (int): Creates a delay to pick up coins (So that they are not picked up immediately when
                 the enemy is killed)
+
+            index_x (list): The x-coordinates of the coins on the screen, sorted from left to right (So that only the
+                coins near a laser or a player need to be checked)
+            index_coins (list): The coins on the screen in the same order as index_x
+            index_update (int): Determines if the index needs to be rebuilt (When coins are added, removed or moved)
+            coin_positions (numpy.ndarray): The x and y-coordinates of each coin in the coins on screen list, in the
+                same order (So that the coins do not need to ask Tk where they are)
     """
 
     def __init__(self):
@@ -44,11 +55,16 @@ class SpawnCoin:
             Creates the lists necessary to store the Coin sprite.
         """
 
-        self.all_coins_list = []
+        self.coin_pool = ObjectPool("Coin")
         self.coins_on_screen_list = []
         self.current_coin_index = 0
         self.coin_pickup_delay = 0
 
+        self.index_x = []
+        self.index_coins = []
+        self.index_update = 0
+        self.coin_positions = np.empty((0, 2))
+
     def __del__(self):
         """
             Clear the variables from memory once the program has terminated
@@ -56,10 +72,175 @@ class SpawnCoin:
             :return: None
         """
 
-        del self.all_coins_list
+        del self.coin_pool
         del self.coins_on_screen_list
         del self.current_coin_index
         del self.coin_pickup_delay
+        del self.index_x
+        del self.index_coins
+        del self.index_update
+        del self.coin_positions
+
+    def spawn_coin(self, type, pos_x, pos_y, mode):
+        """
+            Spawn a coin on the screen where an enemy has died and set its hitbox.
+
+            :param type: Determines the type of coin to spawn (copper, silver, gold, platinum)
+            :type type: string
+
+            :param pos_x: The x-coordinate of the coin
+            :type pos_x: float
+
+            :param pos_y: The y-coordinate of the coin
+            :type pos_y: float
+
+            :param mode: The current mode of the game (The hitbox is different in each mode)
+            :type mode: string
+
+            :return: None
+        """
+
+        coin = self.coin_pool.acquire()
+        if coin is None:
+            coin = Coin(type=type, pos_x=pos_x, pos_y=pos_y)
+            self.coin_pool.add(coin)
+        elif type == "copper":
+            coin.reinstate_to_copper(pos_x=pos_x, pos_y=pos_y)
+        elif type == "silver":
+            coin.reinstate_to_silver(pos_x=pos_x, pos_y=pos_y)
+        elif type == "gold":
+            coin.reinstate_to_gold(pos_x=pos_x, pos_y=pos_y)
+        elif type == "platinum":
+            coin.reinstate_to_platinum(pos_x=pos_x, pos_y=pos_y)
+
+        # Set the hitbox for the coin
+        # In Machine Mode, the lasers move up the screen, in Alien Mode, the lasers move across the screen
+        if mode == "Machine_Mode":
+            coin.range = (coin.coin.xcor() - coin.COIN_DISTANCE, coin.coin.xcor() + coin.COIN_DISTANCE)
+            coin.collision_coordinate = coin.coin.ycor() - coin.COIN_DISTANCE
+        elif mode == "Alien_Mode":
+            coin.range = (coin.coin.ycor() - coin.COIN_DISTANCE, coin.coin.ycor() + coin.COIN_DISTANCE)
+            coin.collision_coordinate = coin.coin.xcor()
+            coin.just_fired = 0
+        self.coins_on_screen_list.append(coin)
+        self.coin_positions = np.vstack((self.coin_positions, (pos_x, pos_y)))
+        self.index_update = 1
+
+    def update_index(self):
+        """
+            Rebuilds the sorted index of the coins on the screen if coins have been added, removed or moved since the
+                last time it was built.
+
+            :return: None
+        """
+
+        if self.index_update == 1:
+            order = np.argsort(self.coin_positions[:, 0], kind="stable")
+            self.index_x = self.coin_positions[order, 0].tolist()
+            self.index_coins = [self.coins_on_screen_list[i] for i in order]
+            self.index_update = 0
+
+    def get_coins_near(self, pos_x, distance):
+        """
+            Finds the coins whose x-coordinate is within a distance of a point, using the sorted index.
+
+            :param pos_x: The x-coordinate to check around (Ex: a laser or a player)
+            :type pos_x: float
+
+            :param distance: The furthest a coin can be from the x-coordinate (Not included)
+            :type distance: float
+
+            :return: The coins that are close enough to the x-coordinate
+            :type: list
+        """
+
+        self.update_index()
+        start = bisect.bisect_right(self.index_x, pos_x - distance)
+        end = bisect.bisect_left(self.index_x, pos_x + distance)
+        return self.index_coins[start:end]
+
+    def get_coins_within(self, pos_x, pos_y, distance):
+        """
+            Finds the coins that are closer than a distance to a point, using the cached coin positions.
+
+            :param pos_x: The x-coordinate of the point (Ex: the player)
+            :type pos_x: float
+
+            :param pos_y: The y-coordinate of the point
+            :type pos_y: float
+
+            :param distance: The furthest a coin can be from the point (Not included)
+            :type distance: float
+
+            :return: The coins that are close enough to the point
+            :type: list
+        """
+
+        distances = np.hypot(self.coin_positions[:, 0] - pos_x, self.coin_positions[:, 1] - pos_y)
+        return [self.coins_on_screen_list[i] for i in np.flatnonzero(distances < distance)]
+
+    def collect_coins(self, coins, coin_values, blue_power_up_active):
+        """
+            Removes the coins that were picked up this frame and finds how much they are worth in total.
+
+            :param coins: The coins that were picked up
+            :type coins: list
+
+            :param coin_values: The value of each type of coin with and without the blue power up (From PowerUpSetup)
+            :type coin_values: dict
+
+            :param blue_power_up_active: Determines if the blue power up (coin multiplier) is active or not
+            :type blue_power_up_active: int
+
+            :return: The total value of the coins
+            :type: int
+        """
+
+        total_value = 0
+        for c in coins:
+            total_value = total_value + coin_values[(c.get_type(), blue_power_up_active)]
+        self.remove_coins(coins)
+        return total_value
+
+    def remove_coins(self, coins):
+        """
+            Removes the given coins from the screen and puts them back in the pool to be reused. The coins on screen
+                list is only rebuilt once, no matter how many coins are removed.
+
+            :param coins: The coins to remove
+            :type coins: list
+
+            :return: None
+        """
+
+        if not coins:
+            return
+        removed_ids = set()
+        for c in coins:
+            c.remove()
+            self.coin_pool.release(c)
+            removed_ids.add(id(c))
+        keep = [id(c) not in removed_ids for c in self.coins_on_screen_list]
+        self.coins_on_screen_list = [c for c, k in zip(self.coins_on_screen_list, keep) if k]
+        self.coin_positions = self.coin_positions[np.array(keep, dtype=bool)]
+        self.index_update = 1
+
+    def clear_coins(self):
+        """
+            Removes every coin from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for c in self.coins_on_screen_list:
+            c.remove()
+            self.coin_pool.release(c)
+        self.coins_on_screen_list.clear()
+        self.current_coin_index = 0
+        self.index_x.clear()
+        self.index_coins.clear()
+        self.index_update = 0
+        self.coin_positions = np.empty((0, 2))
 
 
 class SpawnCoinIndicator:
@@ -26,15 +26,19 @@ from components.enemy.MachineBlueMachine import BlueMachine
 from components.enemy.MachineYellowMachine import YellowMachine
 from components.enemy.MachineRedMachine import RedMachine
 from components.enemy.MachineBoss import Boss
+from utils.ObjectPool import ObjectPool
 
 
 class SpawnBlueMachine:
     """
         Represents the Blue Machine container in Laser Fighter.
 
+        Pointers:
+            _kinematics (MachineKinematics()): A pointer to the movement logic of every machine
+
         Attributes:
-            all_blue_machines (list): Contains all of the blue machine sprites created since the game has launched, even
-                ones removed from the screen
+            blue_machine_pool (ObjectPool()): Contains all of the blue machine sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             blue_machines (list): Contains all of the blue machine sprites currently visible/active on the screen.
             blue_machines_update_values (list): Contains all of the death animation values for each blue machine
                 on the screen.
@@ -44,10 +48,13 @@ class SpawnBlueMachine:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
-    def __init__(self, scale_factor_x, scale_factor_y):
+    def __init__(self, kinematics, scale_factor_x, scale_factor_y):
         """
             Creates the lists necessary to store the Blue Machine.
 
+            :param kinematics: A pointer to the movement logic of every machine (Given to every machine spawned)
+            :type kinematics: MachineKinematics()
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
             :type scale_factor_x: float
 
@@ -55,11 +62,13 @@ class SpawnBlueMachine:
             :type scale_factor_y: float
         """
 
-        self.all_blue_machines = []
+        self.blue_machine_pool = ObjectPool("Blue_Machine")
         self.blue_machines = []
         self.blue_machines_update_values = []
         self.blue_machine_index = 0
 
+        self._kinematics = kinematics
+
         self.scale_factor_x = scale_factor_x
         self.scale_factor_y = scale_factor_y
 
@@ -70,10 +79,11 @@ class SpawnBlueMachine:
             :return: None
         """
 
-        del self.all_blue_machines
+        del self.blue_machine_pool
         del self.blue_machines
         del self.blue_machines_update_values
         del self.blue_machine_index
+        del self._kinematics
 
     def spawn_blue_machine(self, id):
         """
@@ -85,31 +95,58 @@ class SpawnBlueMachine:
             :return: None
         """
 
-        if len(self.all_blue_machines) <= len(self.blue_machines):
-            blue_machine = BlueMachine(id, self.scale_factor_x, self.scale_factor_y)
-            self.blue_machines.append(blue_machine)
-            self.blue_machine_index = self.blue_machine_index + 1
-            self.all_blue_machines.append(blue_machine)
-            self.blue_machines_update_values.append(0)
+        blue_machine = self.blue_machine_pool.acquire()
+        if blue_machine is None:
+            blue_machine = BlueMachine(id, self._kinematics, self.scale_factor_x, self.scale_factor_y)
+            self.blue_machine_pool.add(blue_machine)
         else:
-            for bm in self.all_blue_machines:
-                if bm.get_blue_machine().isvisible():
-                    continue
-                else:
-                    bm.reinstate(id)
-                    self.blue_machines.append(bm)
-                    self.blue_machine_index = self.blue_machine_index + 1
-                    self.blue_machines_update_values.append(0)
-                    break
+            blue_machine.reinstate(id)
+        self.blue_machines.append(blue_machine)
+        self.blue_machine_index = self.blue_machine_index + 1
+        self.blue_machines_update_values.append(0)
+
+    def remove_blue_machine(self, blue_machine):
+        """
+            Removes a blue machine from the screen and puts it back in the pool to be reused.
+
+            :param blue_machine: The blue machine to remove
+            :type blue_machine: BlueMachine()
+
+            :return: None
+        """
+
+        blue_machine.remove()
+        index = self.blue_machines.index(blue_machine)
+        self.blue_machines.pop(index)
+        self.blue_machines_update_values.pop(index)
+        self.blue_machine_index = self.blue_machine_index - 1
+        self.blue_machine_pool.release(blue_machine)
+
+    def clear_blue_machines(self):
+        """
+            Removes every blue machine from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for bm in self.blue_machines:
+            bm.remove()
+            self.blue_machine_pool.release(bm)
+        self.blue_machines.clear()
+        self.blue_machine_index = 0
+        self.blue_machines_update_values.clear()
 
 
 class SpawnYellowMachine:
     """
         Represents the Yellow Machine container in Laser Fighter.
 
+        Pointers:
+            _kinematics (MachineKinematics()): A pointer to the movement logic of every machine
+
         Attributes:
-            all_yellow_machines (list): Contains all of the yellow machine sprites created since the game has
-                launched, even ones removed from the screen
+            yellow_machine_pool (ObjectPool()): Contains all of the yellow machine sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             yellow_machines (list): Contains all of the yellow machine sprites currently visible/active on the screen.
             yellow_machines_update_values (list): Contains all of the death animation values for each yellow machine
                 on the screen.
@@ -119,10 +156,13 @@ class SpawnYellowMachine:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
-    def __init__(self, scale_factor_x, scale_factor_y):
+    def __init__(self, kinematics, scale_factor_x, scale_factor_y):
         """
             Creates the lists necessary to store the Yellow Machine.
 
+            :param kinematics: A pointer to the movement logic of every machine (Given to every machine spawned)
+            :type kinematics: MachineKinematics()
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
             :type scale_factor_x: float
 
@@ -130,11 +170,13 @@ class SpawnYellowMachine:
             :type scale_factor_y: float
         """
 
-        self.all_yellow_machines = []
+        self.yellow_machine_pool = ObjectPool("Yellow_Machine")
         self.yellow_machines = []
         self.yellow_machines_update_values = []
         self.yellow_machine_index = 0
 
+        self._kinematics = kinematics
+
         self.scale_factor_x = scale_factor_x
         self.scale_factor_y = scale_factor_y
 
@@ -145,10 +187,11 @@ class SpawnYellowMachine:
             :return: None
         """
 
-        del self.all_yellow_machines
+        del self.yellow_machine_pool
         del self.yellow_machines
         del self.yellow_machines_update_values
         del self.yellow_machine_index
+        del self._kinematics
 
     def spawn_yellow_machine(self, id):
         """
@@ -160,31 +203,41 @@ class SpawnYellowMachine:
             :return: None
         """
 
-        if len(self.all_yellow_machines) <= len(self.yellow_machines):
-            yellow_machine = YellowMachine(id, self.scale_factor_x, self.scale_factor_y)
-            self.yellow_machines.append(yellow_machine)
-            self.yellow_machine_index = self.yellow_machine_index + 1
-            self.all_yellow_machines.append(yellow_machine)
-            self.yellow_machines_update_values.append(0)
+        yellow_machine = self.yellow_machine_pool.acquire()
+        if yellow_machine is None:
+            yellow_machine = YellowMachine(id, self._kinematics, self.scale_factor_x, self.scale_factor_y)
+            self.yellow_machine_pool.add(yellow_machine)
         else:
-            for ym in self.all_yellow_machines:
-                if ym.get_yellow_machine().isvisible():
-                    continue
-                else:
-                    ym.reinstate(id)
-                    self.yellow_machines.append(ym)
-                    self.yellow_machine_index = self.yellow_machine_index + 1
-                    self.yellow_machines_update_values.append(0)
-                    break
+            yellow_machine.reinstate(id)
+        self.yellow_machines.append(yellow_machine)
+        self.yellow_machine_index = self.yellow_machine_index + 1
+        self.yellow_machines_update_values.append(0)
+
+    def clear_yellow_machines(self):
+        """
+            Removes every yellow machine from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for ym in self.yellow_machines:
+            ym.remove()
+            self.yellow_machine_pool.release(ym)
+        self.yellow_machines.clear()
+        self.yellow_machine_index = 0
+        self.yellow_machines_update_values.clear()
 
 
 class SpawnRedMachine:
     """
         Represents the Red Machine container in Laser Fighter.
 
+        Pointers:
+            _kinematics (MachineKinematics()): A pointer to the movement logic of every machine
+
         Attributes:
-            all_red_machines (list): Contains all of the red machine sprites created since the game has
-                launched, even ones removed from the screen
+            red_machine_pool (ObjectPool()): Contains all of the red machine sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             red_machines (list): Contains all of the red machine sprites currently visible/active on the screen.
             red_machines_update_values (list): Contains all of the death animation values for each red machine
                 on the screen.
@@ -195,10 +248,13 @@ class SpawnRedMachine:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
-    def __init__(self, scale_factor_x, scale_factor_y):
+    def __init__(self, kinematics, scale_factor_x, scale_factor_y):
         """
             Creates the lists necessary to store the Red Machine.
 
+            :param kinematics: A pointer to the movement logic of every machine (Given to every machine spawned)
+            :type kinematics: MachineKinematics()
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
             :type scale_factor_x: float
 
@@ -206,12 +262,14 @@ class SpawnRedMachine:
             :type scale_factor_y: float
         """
 
-        self.all_red_machines = []
+        self.red_machine_pool = ObjectPool("Red_Machine")
         self.red_machines = []
         self.red_machines_update_values = []
         self.red_machines_hit_values = []
         self.red_machine_index = 0
 
+        self._kinematics = kinematics
+
         self.scale_factor_x = scale_factor_x
         self.scale_factor_y = scale_factor_y
 
@@ -222,11 +280,12 @@ class SpawnRedMachine:
             :return: None
         """
 
-        del self.all_red_machines
+        del self.red_machine_pool
         del self.red_machines
         del self.red_machines_update_values
         del self.red_machines_hit_values
         del self.red_machine_index
+        del self._kinematics
 
     def spawn_red_machine(self, id):
         """
@@ -238,32 +297,43 @@ class SpawnRedMachine:
             :return: None
         """
 
-        if len(self.all_red_machines) <= len(self.red_machines):
-            red_machine = RedMachine(id, self.scale_factor_x, self.scale_factor_y)
-            self.red_machines.append(red_machine)
-            self.red_machine_index = self.red_machine_index + 1
-            self.all_red_machines.append(red_machine)
-            self.red_machines_update_values.append(0)
-            self.red_machines_hit_values.append(0)
+        red_machine = self.red_machine_pool.acquire()
+        if red_machine is None:
+            red_machine = RedMachine(id, self._kinematics, self.scale_factor_x, self.scale_factor_y)
+            self.red_machine_pool.add(red_machine)
         else:
-            for rm in self.all_red_machines:
-                if rm.get_red_machine().isvisible():
-                    continue
-                else:
-                    rm.reinstate(id)
-                    self.red_machines.append(rm)
-                    self.red_machine_index = self.red_machine_index + 1
-                    self.red_machines_update_values.append(0)
-                    self.red_machines_hit_values.append(0)
-                    break
+            red_machine.reinstate(id)
+        self.red_machines.append(red_machine)
+        self.red_machine_index = self.red_machine_index + 1
+        self.red_machines_update_values.append(0)
+        self.red_machines_hit_values.append(0)
+
+    def clear_red_machines(self):
+        """
+            Removes every red machine from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for rm in self.red_machines:
+            rm.remove()
+            self.red_machine_pool.release(rm)
+        self.red_machines.clear()
+        self.red_machine_index = 0
+        self.red_machines_update_values.clear()
+        self.red_machines_hit_values.clear()
 
 
 class SpawnMachineBoss:
     """
         Represents the Machine Boss container in Laser Fighter.
 
+        Pointers:
+            _kinematics (MachineKinematics()): A pointer to the movement logic of every machine
+
         Attributes:
-            all_boss (list): Contains the one boss sprite that should be spawn throughout the entire game.
+            boss_pool (ObjectPool()): Contains the one boss sprite that should be spawn throughout the entire game, and
+                stores it when it is removed from the screen so that it can be reused
             boss (list): Contains the boss sprite if it is visible on the screen
             boss_update_value (list): Contains the death animation value for the boss
             boss_hit_value (list): Contains the hit delay value for the boss
@@ -273,10 +343,13 @@ class SpawnMachineBoss:
             scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
     """
 
-    def __init__(self, scale_factor_x, scale_factor_y):
+    def __init__(self, kinematics, scale_factor_x, scale_factor_y):
         """
             Creates the lists necessary to store the Machine Boss.
 
+            :param kinematics: A pointer to the movement logic of every machine (Given to every machine spawned)
+            :type kinematics: MachineKinematics()
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
             :type scale_factor_x: float
 
@@ -284,12 +357,14 @@ class SpawnMachineBoss:
             :type scale_factor_y: float
         """
 
-        self.all_boss = []
+        self.boss_pool = ObjectPool("Machine_Boss")
         self.boss = []
         self.boss_update_value = 0
         self.boss_hit_value = 0
         self.boss_index = 0
 
+        self._kinematics = kinematics
+
         self.scale_factor_x = scale_factor_x
         self.scale_factor_y = scale_factor_y
 
@@ -300,11 +375,12 @@ class SpawnMachineBoss:
             :return: None
         """
 
-        del self.all_boss
+        del self.boss_pool
         del self.boss
         del self.boss_update_value
         del self.boss_hit_value
         del self.boss_index
+        del self._kinematics
 
     def spawn_boss(self):
         """
@@ -313,17 +389,26 @@ class SpawnMachineBoss:
             :return: None
         """
 
-        if len(self.all_boss) <= len(self.boss):
-            spawn_boss = Boss(self.scale_factor_x, self.scale_factor_y)
-            self.boss.append(spawn_boss)
-            self.boss_index = self.boss_index + 1
-            self.all_boss.append(spawn_boss)
+        spawn_boss = self.boss_pool.acquire()
+        if spawn_boss is None:
+            spawn_boss = Boss(self._kinematics, self.scale_factor_x, self.scale_factor_y)
+            self.boss_pool.add(spawn_boss)
         else:
-            for b in self.all_boss:
-                if b.get_boss().isvisible():
-                    continue
-                else:
-                    b.reinstate()
-                    self.boss.append(b)
-                    self.boss_index = self.boss_index + 1
-                    break
+            spawn_boss.reinstate()
+        self.boss.append(spawn_boss)
+        self.boss_index = self.boss_index + 1
+
+    def clear_boss(self):
+        """
+            Removes the boss from the screen and puts it back in the pool to be reused.
+
+            :return: None
+        """
+
+        for b in self.boss:
+            b.remove()
+            self.boss_pool.release(b)
+        self.boss.clear()
+        self.boss_index = 0
+        self.boss_update_value = 0
+        self.boss_hit_value = 0
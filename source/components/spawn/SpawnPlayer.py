@@ -158,6 +158,22 @@ class SpawnHumanPlayer:
         del self.right_update
         del self.left_update
 
+    def rescale(self, ratio_x, ratio_y):
+        """
+            Rescales every human player when the resolution is changed while the game is running.
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        for h in self.all_human:
+            h.rescale(ratio_x, ratio_y)
+
     def spawn_human_player(self, god_mode):
         """
             Spawn the human player on the screen.
@@ -26,6 +26,7 @@ from components.ItemPowerUp import PowerUp
 from components.ItemPowerUp import YellowIndicator
 from components.ItemPowerUp import BlueIndicator
 from components.ItemPowerUp import ExtraIndicator
+from utils.ObjectPool import ObjectPool
 
 
 class SpawnPowerUp:
@@ -33,13 +34,13 @@ class SpawnPowerUp:
         Represents the Power Up container in Laser Fighter.
 
         Attributes:
-            all_power_ups (list): Contains all of the power up sprites created since the game has
-                launched, even the ones removed from the screen
+            power_up_pool (ObjectPool()): Contains all of the power up sprites created since the game has
+                launched, and the ones removed from the screen that can be reused
             current_power_ups (list): Contains all of the power up sprites currently visible/active on the screen.
             power_up_index (list): Stores which of each of the different power up types is currently on the screen
                 (There are 4 different types, 3 possible per mode (5 with the Hearts Gadget))
             power_up_update (int): The random variable used for randomly spawning the power ups on the screen
-            power_up_time (float): Used as a timestamp for the spawning of power ups on the screen (Every 0.4 seconds,
+            power_up_time (float): The game time since the power up spawn chance was last rolled (Every 0.4 seconds,
                 the random variable power_up_update is determined to see if a power up will spawn)
 
             scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -57,7 +58,7 @@ class SpawnPowerUp:
             :type scale_factor_y: float
         """
 
-        self.all_power_ups = []
+        self.power_up_pool = ObjectPool("Power_Up")
         self.current_power_ups = []
         self.power_up_index = [0, 0, 0, 0, 0]
         self.power_up_update = 0
@@ -73,7 +74,7 @@ class SpawnPowerUp:
             :return: None
         """
 
-        del self.all_power_ups
+        del self.power_up_pool
         del self.current_power_ups
         del self.power_up_index
         del self.power_up_update
@@ -97,93 +98,34 @@ class SpawnPowerUp:
             :return: None
         """
 
-        if len(self.all_power_ups) <= len(self.current_power_ups):
-            # Yellow power up
-            if type == 1:
-                if mode == "Machine_Mode":
-                    power_up = PowerUp(1, 1, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                elif mode == "Alien_Mode":
-                    power_up = PowerUp(1, 2, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                self.power_up_index[0] = 1
-                self.current_power_ups.append(power_up)
-                self.all_power_ups.append(power_up)
-            # Blue power up
-            elif type == 2:
-                if mode == "Machine_Mode":
-                    power_up = PowerUp(2, 1, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                elif mode == "Alien_Mode":
-                    power_up = PowerUp(2, 2, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                self.power_up_index[1] = 1
-                self.current_power_ups.append(power_up)
-                self.all_power_ups.append(power_up)
-            # Green power up
-            elif type == 3:
-                if mode == "Machine_Mode":
-                    power_up = PowerUp(3, 1, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                elif mode == "Alien_Mode":
-                    power_up = PowerUp(3, 2, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                self.power_up_index[2] = 1
-                self.current_power_ups.append(power_up)
-                self.all_power_ups.append(power_up)
-            # Red power up
-            elif type == 4:
-                if mode == "Machine_Mode":
-                    power_up = PowerUp(4, 1, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                elif mode == "Alien_Mode":
-                    power_up = PowerUp(4, 2, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                self.power_up_index[3] = 1
-                self.current_power_ups.append(power_up)
-                self.all_power_ups.append(power_up)
-            # Heart power up (If Heart power up gadget is on)
-            elif type == 5:
-                if mode == "Machine_Mode":
-                    power_up = PowerUp(5, 1, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                elif mode == "Alien_Mode":
-                    power_up = PowerUp(5, 2, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
-                self.power_up_index[4] = 1
-                self.current_power_ups.append(power_up)
-                self.all_power_ups.append(power_up)
+        # The power ups spawn at a different height in each mode
+        if mode == "Machine_Mode":
+            power_up_mode = 1
+        elif mode == "Alien_Mode":
+            power_up_mode = 2
+
+        # 1 = yellow, 2 = blue, 3 = green, 4 = red and 5 = heart (If Heart power up gadget is on)
+        power_up = self.power_up_pool.acquire()
+        if power_up is None:
+            power_up = PowerUp(type, power_up_mode, power_up_spawn_sound, self.scale_factor_x, self.scale_factor_y)
+            self.power_up_pool.add(power_up)
         else:
-            for pu in self.all_power_ups:
-                if pu.get_power_up().isvisible():
-                    continue
-                else:
-                    if type == 1:
-                        if mode == "Machine_Mode":
-                            pu.reinstate(1, 1, power_up_spawn_sound)
-                        elif mode == "Alien_Mode":
-                            pu.reinstate(1, 2, power_up_spawn_sound)
-                        self.power_up_index[0] = 1
-                        self.current_power_ups.append(pu)
-                    elif type == 2:
-                        if mode == "Machine_Mode":
-                            pu.reinstate(2, 1, power_up_spawn_sound)
-                        elif mode == "Alien_Mode":
-                            pu.reinstate(2, 2, power_up_spawn_sound)
-                        self.power_up_index[1] = 1
-                        self.current_power_ups.append(pu)
-                    elif type == 3:
-                        if mode == "Machine_Mode":
-                            pu.reinstate(3, 1, power_up_spawn_sound)
-                        elif mode == "Alien_Mode":
-                            pu.reinstate(3, 2, power_up_spawn_sound)
-                        self.power_up_index[2] = 1
-                        self.current_power_ups.append(pu)
-                    elif type == 4:
-                        if mode == "Machine_Mode":
-                            pu.reinstate(4, 1, power_up_spawn_sound)
-                        elif mode == "Alien_Mode":
-                            pu.reinstate(4, 2, power_up_spawn_sound)
-                        self.power_up_index[3] = 1
-                        self.current_power_ups.append(pu)
-                    elif type == 5:
-                        if mode == "Machine_Mode":
-                            pu.reinstate(5, 1, power_up_spawn_sound)
-                        elif mode == "Alien_Mode":
-                            pu.reinstate(5, 2, power_up_spawn_sound)
-                        self.power_up_index[4] = 1
-                        self.current_power_ups.append(pu)
-                    break
+            power_up.reinstate(type, power_up_mode, power_up_spawn_sound)
+        self.power_up_index[type - 1] = 1
+        self.current_power_ups.append(power_up)
+
+    def clear_power_ups(self):
+        """
+            Removes every power up from the screen and puts them back in the pool to be reused.
+
+            :return: None
+        """
+
+        for pu in self.current_power_ups:
+            pu.remove()
+            self.power_up_pool.release(pu)
+        self.current_power_ups.clear()
+        self.power_up_index = [0, 0, 0, 0, 0]
 
 
 class SpawnYellowPowerUpIndicator:
@@ -29,12 +29,20 @@
 import time
 import random
 import gc
+import argparse
+# The backend must be selected before anything imports turtle
+from setup.BackendSetup import HEADLESS
+from setup.BackendSetup import LAUNCH_TIME
 from setup.ConfigurationSetup import refresh_variables
 from setup.ConfigurationSetup import controls_toggle
 from setup.ConfigurationSetup import milestones
 from setup.ConfigurationSetup import statistics
 from setup.ConfigurationSetup import shop_config
+from setup.ConfigurationSetup import config_manager
+from setup.ConfigurationSetup import player_data_manager
+from setup.ConfigurationSetup import config_backup
 from setup.WindowSetup import *
+from setup.TextureSetup import texture_registry
 from setup.SpriteSetup import button
 from setup.SpriteSetup import textbox
 from setup.SpriteSetup import panel
@@ -55,36 +63,72 @@ from setup.SpriteSetup import blue_machine
 from setup.SpriteSetup import yellow_machine
 from setup.SpriteSetup import red_machine
 from setup.SpriteSetup import machine_boss
+from setup.SpriteSetup import machine_kinematics
 from setup.SpriteSetup import small_alien
 from setup.SpriteSetup import medium_alien
 from setup.SpriteSetup import large_alien
 from setup.SpriteSetup import ufo
 from setup.SpriteSetup import gadget
+from components.ItemCoin import Coin
 from setup.ModeSetupMaster import power_up_setup
 from setup.ModeSetupMaster import machine_mode_setup
 from setup.ModeSetupMaster import alien_mode_setup
 from physics.CollisionMaster import machine_collision
 from physics.CollisionMaster import alien_collision
+from physics.CollisionMaster import projectile_system
 from setup.UtilitySetup import screen
 from setup.UtilitySetup import shop
-from setup.UtilitySetup import settings_toggle
 from setup.UtilitySetup import controls
 from setup.UtilitySetup import text_refresh
+from setup.UtilitySetup import hover
+from setup.UtilitySetup import frame_profiler
+from setup.UtilitySetup import input_recorder
+from setup.UtilitySetup import display_manager
 from utils.PreventSleep import MonitorSleepController
+from utils.ObjectPool import ObjectPool
+from utils.CachedTurtle import CachedTurtle
 
 
-def main():
+def main(start_mode=None, max_frames=None, frame_callback=None):
+    """
+        Runs the game loop until the game is closed.
+
+        :param start_mode: The screen to start on instead of the title screen (Ex: "Machine_Mode")
+        :type start_mode: string
+
+        :param max_frames: The number of frames to run before the game closes itself (Runs forever if None)
+        :type max_frames: int
+
+        :param frame_callback: A function run with the frame number at the start of every event handler (Used by the
+            scenario benchmarks to script the game)
+        :type frame_callback: function
+
+        :return: The number of frames that were run
+        :type: int
+    """
+
+    # Skip the title screen if requested (Through the same checks and setup as the title screen buttons)
+    if start_mode is not None and not screen.start_in_mode(start_mode):
+        raise ValueError(f"{start_mode} has not been unlocked yet")
+    frame_count = 0
     # Start the game tick counting
-    start_ticks = pygame.time.get_ticks()
+    start_ticks = get_ticks()
     # The main game loop:
     while True:
         # Update the screen based on the refresh rate
         # For example, if the refresh rate is 60, update the screen 60 times a second
-        current_ticks = pygame.time.get_ticks()
+        current_ticks = get_ticks()
         elapsed_time = (current_ticks - start_ticks) / 1000.0
 
-        # Limit the frames if VSync is on
-        if elapsed_time >= MONITOR_DELAY or settings.vsync == 0:
+        # Limit the frames if VSync is on (Headless mode and replays always run uncapped)
+        if elapsed_time >= MONITOR_DELAY or settings.vsync == 0 or HEADLESS or input_recorder.mode == "Replay":
+            # Sample the time once for the whole frame and find how much game time has passed
+            # When replaying, the recorded frame length is used instead
+            game_clock.tick(input_recorder.next_frame_time())
+            input_recorder.begin_frame(game_clock.frame_time)
+            # Time each section of the game loop (Only when profiling is on)
+            frame_profiler.begin_frame()
+            frame_profiler.start("Screen_Updater")
             """
                 Screen Updater - Updates the screen with the events that occurred in the event handler
             """
@@ -92,17 +136,32 @@ def main():
             # If VSync is on
             if settings.vsync == 1:
                 # Reset the frame timer
-                start_ticks = pygame.time.get_ticks()
+                start_ticks = get_ticks()
 
             # Update the screen as many times as the hardware allows (Not ideal)
             # "tick_update" is used for updating text because the game lags when the text is updated too often
-            # The frequency of updating depends on the screen
-            if screen.mode == "Machine_Mode" and screen.mode == "Alien_Mode":
+            # When VSync is off, the text in Machine Mode and Alien Mode is only checked every 25 frames
+            frame_profiler.start("Text_Refresh")
+            if (screen.mode == "Machine_Mode" or screen.mode == "Alien_Mode") and settings.vsync == 0:
                 if screen.tick_update % 25 == 0:
                     text_refresh.update_text()
             else:
                 text_refresh.update_text()
+            frame_profiler.stop("Text_Refresh")
+            frame_profiler.set_counter("Text_Redraws_Per_Second", text_refresh.redraws_per_second)
+            # The shape, colour and visibility writes skipped since the last frame because nothing changed
+            frame_profiler.set_counter("Suppressed_Sprite_Writes", CachedTurtle.take_suppressed_writes())
+            frame_profiler.start("Window_Update")
             window.update()
+            if frame_count == 0:
+                # The time from launching the game to the first frame being drawn
+                frame_profiler.set_counter("Time_To_First_Frame_ms", (time.perf_counter() - LAUNCH_TIME) * 1000)
+            # Run the recorded inputs for this frame (Live inputs are run in window.update())
+            input_recorder.dispatch()
+            if input_recorder.is_replay_finished() and screen.quit_loop == 0:
+                screen.on_quit()
+            frame_profiler.stop("Window_Update")
+            frame_profiler.stop("Screen_Updater")
 
             """
                 Loop Terminator - Terminates the game loop
@@ -110,41 +169,87 @@ def main():
 
             # If requested, terminates the game loop
             if screen.quit_loop == 1:
+                # Let the backup finish first, so that it is of the files from before the game was launched
+                config_backup.wait()
+                config_backup.report_errors()
+                # Write any unsaved settings and player data to the disk before closing
+                config_manager.flush()
+                player_data_manager.flush()
+                # Write the recording to the disk if recording is on
+                input_recorder.save()
+                # Write the frame times to the disk if profiling is on
+                if frame_profiler.enabled:
+                    # Add the sprite pool stats (live, free, total and high water mark) to the counters
+                    for pool in ObjectPool.all_pools:
+                        for stat, value in pool.get_stats().items():
+                            frame_profiler.set_counter(pool.name + "_Pool_" + stat, value)
+                    # Add how often the settings and the player data were written to the disk
+                    frame_profiler.set_counter("Config_Writes", config_manager.write_count)
+                    frame_profiler.set_counter("Config_Writes_Per_Minute", config_manager.get_writes_per_minute())
+                    frame_profiler.set_counter("Player_Data_Writes", player_data_manager.write_count)
+                    frame_profiler.set_counter("Player_Data_Writes_Per_Minute",
+                                               player_data_manager.get_writes_per_minute())
+                    frame_profiler.export()
                 break
 
+            # Close the game once the requested number of frames have been run
+            frame_count = frame_count + 1
+            if max_frames is not None and frame_count >= max_frames:
+                screen.on_quit()
+
+            frame_profiler.start("Event_Handler")
             """
                 Event Handler - Updates all the game parameters and variables as needed
             """
 
+            if frame_callback is not None:
+                frame_callback(frame_count)
+
             # Every 0.4 seconds, there is a 1/67 chance of a power up spawning (1/200 per a power up type)
-            current_power_up_time = time.time()
-            elapsed_power_up_time = current_power_up_time - power_up.power_up_time
-            if elapsed_power_up_time >= 0.4:
+            power_up.power_up_time = power_up.power_up_time + game_clock.dt
+            if power_up.power_up_time >= 0.4:
                 # See if more than 1 whole 0.4 seconds has passed (Just in case there is EXTREME lag)
                 # If it has, run the random chance the number of 0.4 that have passed
-                delta_movement = (elapsed_time - 1.0) / 1.0
-                delta_movement = int(delta_movement)
-                iterations = 1 + delta_movement
+                iterations = int(power_up.power_up_time / 0.4)
+                power_up.power_up_time = power_up.power_up_time - iterations * 0.4
                 for i in range(iterations):
                     # Random number between 1 and 200 to create the 1/200 random chance for each power up
                     power_up.power_up_update = random.randint(-50, 150)
-                    power_up.power_up_time = time.time()
 
             # Used when VSync is off
             screen.tick_update = screen.tick_update + 1
 
+            # Write any unsaved settings and player data to the disk every few seconds
+            config_manager.flush_if_due()
+            player_data_manager.flush_if_due()
+            # Show any errors from the config backup once it has finished
+            config_backup.report_errors()
+
+            # Update the button highlights once for all the cursor movement since the last frame
+            hover.update()
+
+            # Register a few of the textures for the screen most likely to be opened next
+            texture_registry.prefetch_step()
+            frame_profiler.set_counter("Textures_Registered_On_First_Use", texture_registry.registered_on_first_use)
+
+            # Apply a fullscreen switch once its textures have been scaled in the background
+            if display_manager.is_switching():
+                display_manager.update()
+                frame_profiler.set_counter("Resolution_Switch_Apply_ms", round(display_manager.last_apply_time * 1000, 3))
+
+            frame_profiler.stop("Event_Handler")
+            frame_profiler.start("Screen_Re_Setter")
             """
                 Screen Object Re-Setter
             """
 
             # Screen update is 1 when the screen has been changed
             if screen.screen_update == 1:
+                # Register the textures for the new screen before anything on it is spawned
+                texture_registry.load_screen(screen.mode)
                 # Things that need to be updated between screens are updated here
                 # Old button and text box sprites are removed
-                for bu in button.buttons_on_screen_list:
-                    bu.remove()
-                button.buttons_on_screen_list.clear()
-                button.current_button_index = 0
+                button.clear_buttons()
                 if screen.page_update != 1:
                     for pa in panel.panel_turtle:
                         pa.remove()
@@ -169,10 +274,13 @@ def main():
                 screen.screen_update = 0
                 screen.page_update = 0
                 button.buy_button_pressed = 0
-                if screen.mode == "Machine_Mode" or screen.mode == "Alien_Mode":
-                    gadget.start_timer()
+                # Write any unsaved settings and player data to the disk between screens
+                config_manager.flush()
+                player_data_manager.flush()
                 # Initiate garbage collection to help avoid memory crashes
                 gc.collect()
+                # Do not count the time it took to change screens as game time
+                game_clock.reset()
 
             # The game background objects and the panel is created right when the game is launched.
             # This is done to make sure that they are truly in the background and that nothing lies behind these sprites.
@@ -196,20 +304,15 @@ def main():
                     pa.remove()
                 panel.panel_index = 0
 
+            frame_profiler.stop("Screen_Re_Setter")
+            frame_profiler.start("Title_Mode")
             """
                 When Title Mode is on
             """
 
             if screen.mode == "Title_Mode":
                 # Remove and reset all power ups
-                for pu in power_up.current_power_ups:
-                    pu.remove()
-                power_up.current_power_ups.clear()
-                power_up.power_up_index[0] = 0
-                power_up.power_up_index[1] = 0
-                power_up.power_up_index[2] = 0
-                power_up.power_up_index[3] = 0
-                power_up.power_up_index[4] = 0
+                power_up.clear_power_ups()
 
                 # Remove the coin indicator
                 for ci in coin_indicator.coin_indicator_turtle:
@@ -228,10 +331,7 @@ def main():
                 extra_power_up_indicator.extra_power_up_indicator_index = 0
 
                 # Remove all the coins on the screen
-                for c in coin.coins_on_screen_list:
-                    c.remove()
-                coin.coins_on_screen_list.clear()
-                coin.current_coin_index = 0
+                coin.clear_coins()
                 coin.coin_pickup_delay = 0
 
                 # Spawn the title mode buttons
@@ -253,27 +353,8 @@ def main():
                     if t.id == 1:
                         t.move(screen.mode)
 
-                # detect if the buttons have been clicked
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Title":
-                        # If the mouse is hovering over the valid button
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            # Run the button function if clicked
-                            window.onscreenclick(screen.launch_machine_mode)
-                        elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_shop_mode)
-                        elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.exit_game)
-                    elif button_type == "Title_Locked":
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_alien_mode)
-                    elif button_type == "Title_Small":
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_settings_mode)
-                        elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_stats_mode)
-
+            frame_profiler.stop("Title_Mode")
+            frame_profiler.start("Machine_Mode")
             """
                 When Machine Mode is on
             """
@@ -283,12 +364,6 @@ def main():
                 if button.current_button_index == 0:
                     button.spawn_button("Game", 1)
 
-                # Check if the main menu button has been clicked or not
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Game" and button_color == "yellow" and bu.get_button_frame().isvisible():
-                        window.onscreenclick(screen.launch_title_mode)
-
                 # Check to see if the first milestone has been met
                 # If it has not been met, initiate the first milestone
                 if not milestones.game_played and milestones.milestone_1_displayed == 0:
@@ -300,11 +375,11 @@ def main():
                     milestones.game_played = True
                     milestones.save()
                     milestones.milestone_1_displayed = 1
-                    milestones.milestone_start_time = time.time()
+                    milestones.milestone_start_time = game_clock.now
 
                 # Display the first milestone for 30 seconds to allow the player to read the information
                 if milestones.milestone_1_displayed == 1:
-                    current_time = time.time()
+                    current_time = game_clock.now
                     elapsed_time = current_time - milestones.milestone_start_time
                     if elapsed_time > 30:
                         for pa in panel.panel_turtle:
@@ -314,7 +389,7 @@ def main():
 
                 # Display the second milestone for 30 seconds to allow the player to read the information
                 if milestones.milestone_2_displayed == 1:
-                    current_time = time.time()
+                    current_time = game_clock.now
                     elapsed_time = current_time - milestones.milestone_start_time
                     if elapsed_time > 30:
                         for pa in panel.panel_turtle:
@@ -368,7 +443,7 @@ def main():
 
                 # Used to shoot the players laser
                 for p in machine_player.current_player:
-                    p.shoot(settings.player_shooting_sound, yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active())
+                    p.shoot(settings.player_shooting_sound, yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), game_clock.dt)
 
                 # Spawn Machine enemies based on the players score
                 # At its peak, there will be 5 blue machines, 5 yellow machines, 5 red machines,
@@ -402,169 +477,70 @@ def main():
                     machine_boss.spawn_boss()
                 # If score is 0, reset the number of enemies back down to 3
                 elif statistics.score == 0:
-                    for bm in blue_machine.blue_machines:
-                        if bm.get_id() == 4 or bm.get_id() == 5:
-                            bm.remove()
-                            blue_machine.blue_machine_index = blue_machine.blue_machine_index - 1
-                    if len(blue_machine.blue_machines_update_values) == 4:
-                        blue_machine.blue_machines_update_values.pop(3)
-                        blue_machine.blue_machines.pop(3)
-                    elif len(blue_machine.blue_machines_update_values) == 5:
-                        blue_machine.blue_machines_update_values.pop(4)
-                        blue_machine.blue_machines_update_values.pop(3)
-                        blue_machine.blue_machines.pop(4)
-                        blue_machine.blue_machines.pop(3)
+                    for bm in [bm for bm in blue_machine.blue_machines if bm.get_id() == 4 or bm.get_id() == 5]:
+                        blue_machine.remove_blue_machine(bm)
 
-                    for ym in yellow_machine.yellow_machines:
-                        ym.remove()
-                    yellow_machine.yellow_machines.clear()
-                    yellow_machine.yellow_machine_index = 0
-                    yellow_machine.yellow_machines_update_values.clear()
-                    for rm in red_machine.red_machines:
-                        rm.remove()
-                    red_machine.red_machines.clear()
-                    red_machine.red_machine_index = 0
-                    red_machine.red_machines_update_values.clear()
-                    red_machine.red_machines_hit_values.clear()
-                    for b in machine_boss.boss:
-                        b.remove()
-                    machine_boss.boss.clear()
-                    machine_boss.boss_index = 0
-                    machine_boss.boss_update_value = 0
-                    machine_boss.boss_hit_value = 0
+                    yellow_machine.clear_yellow_machines()
+                    red_machine.clear_red_machines()
+                    machine_boss.clear_boss()
                     coin.coin_pickup_delay = 0
 
-                # Run the functions to shoot the lasers for each of the enemies
-                for bm in blue_machine.blue_machines:
-                    bm.shoot_laser(extra_power_up_indicator.extra_power_up_indicator_turtle[0].get_power_up_active(), settings.enemy_shooting_sound)
-
-                for ym in yellow_machine.yellow_machines:
-                    ym.shoot_laser(extra_power_up_indicator.extra_power_up_indicator_turtle[0].get_power_up_active(), settings.enemy_shooting_sound)
-
-                for rm in red_machine.red_machines:
-                    rm.shoot_laser(extra_power_up_indicator.extra_power_up_indicator_turtle[0].get_power_up_active(), settings.enemy_shooting_sound)
-
-                for b in machine_boss.boss:
-                    b.shoot_laser(extra_power_up_indicator.extra_power_up_indicator_turtle[0].get_power_up_active(), settings.enemy_shooting_sound)
+                # Move the lasers of every enemy at once (The green power up stops the machines from firing)
+                projectile_system.step("Machine_Mode", extra_power_up_indicator.extra_power_up_indicator_turtle[0].get_power_up_active(),
+                                       settings.enemy_shooting_sound, game_clock.dt)
+                frame_profiler.set_counter("Enemy_Projectiles", projectile_system.projectile_count)
 
+                frame_profiler.start("Machine_Coin_Pickup")
                 # Detects if the players has picked up a coin
+                # Only the coins near a laser or the player are checked (Using the coins sorted x-coordinates)
+                picked_up_coins = []
                 # If the coin magnet gadget is not enabled
                 if not shop_config.coin_magnet_enabled:
                     # Player has to pick up coins in their own
-                    hit_coin = 0
-                    for c in coin.coins_on_screen_list:
+                    if coin.coin_pickup_delay == 0:
                         for p in machine_player.current_player:
                             # Check each of the players lasers
                             for l in p.get_laser():
-                                # If the player picks up a coin
-                                if l.laser.isvisible() and \
-                                        (c.range[0] < l.laser.xcor() < c.range[1]) and \
-                                        l.laser.ycor() > c.collision_coordinate and \
-                                        coin.coin_pickup_delay == 0:
-                                    # Remove the coin from the screen
-                                    c.remove()
-                                    # Increase the amount of coins the users has based on the type of coin picked up
-                                    if c.get_type() == "copper":
-                                        # For each coin, check if the blue power up has a multiplier on it
-                                        if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_blue_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.copper_coin_blue_value
-                                        else:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.copper_coin_value
-                                    elif c.get_type() == "silver":
-                                        if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_blue_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.silver_coin_blue_value
-                                        else:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.silver_coin_value
-                                    elif c.get_type() == "gold":
-                                        if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_blue_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.gold_coin_blue_value
-                                        else:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.gold_coin_value
-                                    elif c.get_type() == "platinum":
-                                        if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_blue_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.platinum_coin_blue_value
-                                        else:
-                                            shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_value
-                                            statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.platinum_coin_value
-                                    shop_config.save()
-                                    statistics.save()
-                                    coin.coins_on_screen_list.pop(hit_coin)
-                                    # play the coin pickup sound
-                                    if settings.coin_pickup_sound == 1:
-                                        sound = pygame.mixer.Sound("sound/Coin_Pickup_Sound.wav")
-                                        sound.play()
-                                    break
-                            hit_coin = hit_coin + 1
+                                if l.laser.isvisible():
+                                    laser_y = l.laser.ycor()
+                                    # If the laser has gone through a coin in its column, pick it up
+                                    for c in coin.get_coins_near(l.laser.xcor(), Coin.COIN_DISTANCE):
+                                        if laser_y > c.collision_coordinate and c not in picked_up_coins:
+                                            picked_up_coins.append(c)
                 # If the coin magnet is enabled
                 else:
                     # Move the coins towards the player
-                    gadget.attract_coins("Machine_Mode")
-
-                    hit_coin = 0
-                    for c in coin.coins_on_screen_list:
-                        for p in machine_player.current_player:
-                            # When the player is close enough to the coin, pick it up
-                            if p.player.isvisible() and p.death_animation == 0 and p.player.distance(c.coin) < c.COIN_DISTANCE:
-                                # Remove the coin from the screen
-                                c.remove()
-                                # Increase the amount of coins the users has based on the type of coin picked up
-                                if c.get_type() == "copper":
-                                    # For each coin, check if the blue power up has a multiplier on it
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_blue_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.copper_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.copper_coin_value
-                                elif c.get_type() == "silver":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_blue_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.silver_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.silver_coin_value
-                                elif c.get_type() == "gold":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_blue_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.gold_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.gold_coin_value
-                                elif c.get_type() == "platinum":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_blue_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.platinum_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_value
-                                        statistics.machine_coins_collected = statistics.machine_coins_collected + power_up_setup.platinum_coin_value
-                                shop_config.save()
-                                statistics.save()
-                                coin.coins_on_screen_list.pop(hit_coin)
-                                # play the coin pickup sound
-                                if settings.coin_pickup_sound == 1:
-                                    sound = pygame.mixer.Sound("sound/Coin_Pickup_Sound.wav")
-                                    sound.play()
-                            hit_coin = hit_coin + 1
-
+                    gadget.attract_coins("Machine_Mode", game_clock.dt)
+
+                    for p in machine_player.current_player:
+                        # When the player is close enough to the coin, pick it up
+                        if p.player.isvisible() and p.death_animation == 0:
+                            player_x, player_y = p.player.position()
+                            for c in coin.get_coins_within(player_x, player_y, Coin.COIN_DISTANCE):
+                                if c not in picked_up_coins:
+                                    picked_up_coins.append(c)
+
+                # Add up the value of every coin picked up this frame and save the player data once
+                if picked_up_coins:
+                    coin_value = coin.collect_coins(picked_up_coins, power_up_setup.coin_values, blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active())
+                    shop_config.total_coins = shop_config.total_coins + coin_value
+                    statistics.machine_coins_collected = statistics.machine_coins_collected + coin_value
+                    shop_config.save()
+                    statistics.save()
+                    # play the coin pickup sound
+                    if settings.coin_pickup_sound == 1:
+                        sound_bank.play("coin_pickup")
+
+                frame_profiler.stop("Machine_Coin_Pickup")
+                frame_profiler.start("Machine_Collision")
                 # Create the machine hitboxes when requested (Value of do_collision is determined by the index of the laser)
                 for p in machine_player.current_player:
-                    if p.do_collision == 1:
-                        machine_collision.calculate_collisions(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), 0)
-                        p.do_collision = 0
-                    elif p.do_collision == 2:
-                        machine_collision.calculate_collisions(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), 1)
-                        p.do_collision = 0
-                    elif p.do_collision == 3:
-                        machine_collision.calculate_collisions(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), 2)
+                    if p.do_collision in (1, 2, 3):
+                        machine_collision.calculate_collisions(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), p.do_collision - 1)
                         p.do_collision = 0
 
+                frame_profiler.stop("Machine_Collision")
+                frame_profiler.start("Machine_Enemy_Killer")
                 # Enemy Killer
                 for p in machine_player.current_player:
                     current_blue_update_value_index = 0
@@ -593,7 +569,7 @@ def main():
                             # If the killing of the enemy has been initiated
                             if attacked == 1:
                                 # Kill the enemy
-                                bm.kill_enemy(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                                bm.kill_enemy(settings.enemy_death_sound, coin)
                                 blue_machine.blue_machines_update_values[current_blue_update_value_index] = blue_machine.blue_machines_update_values[current_blue_update_value_index] + 1
 
                                 # Increase the players score
@@ -609,7 +585,7 @@ def main():
                                     statistics.save()
                         elif blue_machine.blue_machines_update_values[current_blue_update_value_index] != 0:
                             # Kill the enemy
-                            bm.kill_enemy(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            bm.kill_enemy(settings.enemy_death_sound, coin)
                             blue_machine.blue_machines_update_values[current_blue_update_value_index] = blue_machine.blue_machines_update_values[current_blue_update_value_index] + 1
 
                             # Check if the death animation is finished
@@ -643,7 +619,7 @@ def main():
 
                             if attacked == 1:
                                 # Same procedure as before
-                                ym.kill_enemy(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                                ym.kill_enemy(settings.enemy_death_sound, coin)
                                 yellow_machine.yellow_machines_update_values[current_yellow_update_value_index] = yellow_machine.yellow_machines_update_values[current_yellow_update_value_index] + 1
 
                                 if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -656,7 +632,7 @@ def main():
                                     statistics.save()
                         elif yellow_machine.yellow_machines_update_values[current_yellow_update_value_index] != 0:
                             # Same procedure as before
-                            ym.kill_enemy(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            ym.kill_enemy(settings.enemy_death_sound, coin)
                             yellow_machine.yellow_machines_update_values[current_yellow_update_value_index] = yellow_machine.yellow_machines_update_values[current_yellow_update_value_index] + 1
 
                             if ym.get_update_value() == 0:
@@ -689,8 +665,7 @@ def main():
                                     attacked = 1
 
                                 if attacked == 1:
-                                    rm.kill_enemy(settings.enemy_death_sound, coin.coins_on_screen_list,
-                                                  coin.all_coins_list)
+                                    rm.kill_enemy(settings.enemy_death_sound, coin)
                                     red_machine.red_machines_update_values[current_red_update_value_index] = red_machine.red_machines_update_values[current_red_update_value_index] + 1
 
                                     if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -702,7 +677,7 @@ def main():
                                         statistics.red_bots_killed = statistics.red_bots_killed + 1
                                         statistics.save()
                         elif red_machine.red_machines_update_values[current_red_update_value_index] != 0:
-                            rm.kill_enemy(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            rm.kill_enemy(settings.enemy_death_sound, coin)
                             red_machine.red_machines_update_values[current_red_update_value_index] = red_machine.red_machines_update_values[current_red_update_value_index] + 1
 
                             if rm.get_update_value() == 0:
@@ -775,7 +750,7 @@ def main():
                                     attacked = 1
 
                                 if attacked == 1:
-                                    b.kill_boss(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                                    b.kill_boss(settings.enemy_death_sound, coin)
                                     machine_boss.boss_update_value = machine_boss.boss_update_value + 1
 
                                     if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -807,9 +782,9 @@ def main():
                                         shop_config.red_power_up_level = 1
                                         shop_config.save()
                                         milestones.milestone_2_displayed = 1
-                                        milestones.milestone_start_time = time.time()
+                                        milestones.milestone_start_time = game_clock.now
                         elif machine_boss.boss_update_value != 0:
-                            b.kill_boss(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            b.kill_boss(settings.enemy_death_sound, coin)
                             machine_boss.boss_update_value = machine_boss.boss_update_value + 1
 
                             if b.get_update_value() == 0:
@@ -860,8 +835,12 @@ def main():
                             if b.get_hit_value() == 0:
                                 machine_boss.boss_hit_value = 0
 
+                frame_profiler.stop("Machine_Enemy_Killer")
+                frame_profiler.start("Machine_Player_Killer")
                 # Player Killer
                 for p in machine_player.current_player:
+                    # Find every enemy laser that has hit the player (Used by both the player killer and the player hitter)
+                    projectile_system.check_player(p.get_player())
                     # If the death animation has already started
                     if machine_player.player_update_value != 0:
                         # Keep going with the player death animation if it has started
@@ -881,52 +860,18 @@ def main():
                             machine_player.player_update_value = 0
                     # If the death animation is not ongoing
                     else:
-                        # For every enemy, check if the enemies laser has hit the player
-                        for bm in blue_machine.blue_machines:
-                            if bm.get_blue_machine_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if bm.get_blue_machine_laser().isvisible() and -30 * scale_factor_X < (bm.get_blue_machine_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    bm.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() == 1 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        # If so kill the player and set the score down to 0 to reset the game
-                                        p.kill_player(settings.player_death_sound)
-                                        statistics.score = 0
-                                        machine_player.player_update_value = machine_player.player_update_value + 1
-                                        # If the player has thorns enabled, initiate the thorns damage on the enemy
-                                        if shop_config.thorns_enabled:
-                                            bm.thorns_initiated_damage = 1
-
-                        for ym in yellow_machine.yellow_machines:
-                            if ym.get_yellow_machine_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if ym.get_yellow_machine_laser().isvisible() and -30 * scale_factor_X < (ym.get_yellow_machine_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    ym.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() == 1 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        p.kill_player(settings.player_death_sound)
-                                        statistics.score = 0
-                                        machine_player.player_update_value = machine_player.player_update_value + 1
-                                        if shop_config.thorns_enabled:
-                                            ym.thorns_initiated_damage = 1
-
-                        for rm in red_machine.red_machines:
-                            if rm.get_red_machine_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if rm.get_red_machine_laser().isvisible() and -30 * scale_factor_X < (rm.get_red_machine_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    rm.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() == 1 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        p.kill_player(settings.player_death_sound)
-                                        statistics.score = 0
-                                        machine_player.player_update_value = machine_player.player_update_value + 1
-                                        if shop_config.thorns_enabled:
-                                            rm.thorns_initiated_damage = 1
-
-                        for b in machine_boss.boss:
-                            if b.get_boss_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if b.get_boss_laser().isvisible() and -30 * scale_factor_X < (b.get_boss_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    b.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() == 1 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        p.kill_player(settings.player_death_sound)
-                                        statistics.score = 0
-                                        machine_player.player_update_value = machine_player.player_update_value + 1
-                                        if shop_config.thorns_enabled:
-                                            b.thorns_initiated_damage = 1
+                        # The lasers that hit the player disappear
+                        projectile_system.consume_hits()
+                        # For every enemy laser that has hit the player
+                        for enemy in projectile_system.hits:
+                            if p.get_death_animation() == 0 and p.get_health_bar_indicator() == 1 and p.get_hit_delay() == 0 and settings.god_mode == 0:
+                                # If so kill the player and set the score down to 0 to reset the game
+                                p.kill_player(settings.player_death_sound)
+                                statistics.score = 0
+                                machine_player.player_update_value = machine_player.player_update_value + 1
+                                # If the player has thorns enabled, initiate the thorns damage on the enemy
+                                if shop_config.thorns_enabled:
+                                    enemy.thorns_initiated_damage = 1
 
                     # If the player has more than 1 health, only deal 1 health of damage
                     # If the hit delay is ongoing
@@ -941,78 +886,28 @@ def main():
                             machine_player.player_hit_value = 0
                     # If there is no hit delay
                     else:
+                        projectile_system.consume_hits()
                         # Check if the lasers of any enemies have hit the player
-                        for bm in blue_machine.blue_machines:
-                            if bm.get_blue_machine_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if bm.get_blue_machine_laser().isvisible() and -30 * scale_factor_X < (bm.get_blue_machine_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    bm.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() != 1 and p.get_health_bar_indicator() != 0 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        # Hit the player
-                                        p.hit_player(settings.player_hit_sound)
-                                        machine_player.player_hit_value = machine_player.player_hit_value + 1
-                                        # If the player has thorns enabled, initiate the thorns damage on the enemy
-                                        if shop_config.thorns_enabled:
-                                            bm.thorns_initiated_damage = 1
-
-                        for ym in yellow_machine.yellow_machines:
-                            if ym.get_yellow_machine_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if ym.get_yellow_machine_laser().isvisible() and -30 * scale_factor_X < (ym.get_yellow_machine_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    ym.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() != 1 and p.get_health_bar_indicator() != 0 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        p.hit_player(settings.player_hit_sound)
-                                        machine_player.player_hit_value = machine_player.player_hit_value + 1
-                                        if shop_config.thorns_enabled:
-                                            ym.thorns_initiated_damage = 1
-
-                        for rm in red_machine.red_machines:
-                            if rm.get_red_machine_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if rm.get_red_machine_laser().isvisible() and -30 * scale_factor_X < (rm.get_red_machine_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    rm.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() != 1 and p.get_health_bar_indicator() != 0 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        p.hit_player(settings.player_hit_sound)
-                                        machine_player.player_hit_value = machine_player.player_hit_value + 1
-                                        if shop_config.thorns_enabled:
-                                            rm.thorns_initiated_damage = 1
-
-                        for b in machine_boss.boss:
-                            if b.get_boss_laser().distance(p.get_player()) < 125 * scale_factor:
-                                if b.get_boss_laser().isvisible() and -30 * scale_factor_X < (b.get_boss_laser().xcor() - p.get_player().xcor()) < 30 * scale_factor_X:
-                                    b.set_laser_has_attacked(1)
-                                    if p.get_death_animation() == 0 and p.get_health_bar_indicator() != 1 and p.get_health_bar_indicator() != 0 and p.get_hit_delay() == 0 and settings.god_mode == 0:
-                                        p.hit_player(settings.player_hit_sound)
-                                        machine_player.player_hit_value = machine_player.player_hit_value + 1
-                                        if shop_config.thorns_enabled:
-                                            b.thorns_initiated_damage = 1
-
-                # Function for the float effect of the machine enemies
-                # This float effect was added to create the illusion that the enemies are flying through outer space at
-                #   fast speeds
-                for bm in blue_machine.blue_machines:
-                    bm.float_effect()
-
-                for ym in yellow_machine.yellow_machines:
-                    ym.float_effect()
-
-                for rm in red_machine.red_machines:
-                    rm.float_effect()
-
-                for b in machine_boss.boss:
-                    b.float_effect()
-
-                # For the enemy movement
-                # If the machine enemy has been killed enough times, it will start moving along the x-axis
+                        for enemy in projectile_system.hits:
+                            if p.get_death_animation() == 0 and p.get_health_bar_indicator() != 1 and p.get_health_bar_indicator() != 0 and p.get_hit_delay() == 0 and settings.god_mode == 0:
+                                # Hit the player
+                                p.hit_player(settings.player_hit_sound)
+                                machine_player.player_hit_value = machine_player.player_hit_value + 1
+                                # If the player has thorns enabled, initiate the thorns damage on the enemy
+                                if shop_config.thorns_enabled:
+                                    enemy.thorns_initiated_damage = 1
+
+                frame_profiler.stop("Machine_Player_Killer")
+                frame_profiler.start("Machine_Kinematics")
+                # Move every machine enemy at once
+                # The float effect was added to create the illusion that the enemies are flying through outer space at
+                #   fast speeds, and if a machine enemy has been killed enough times, it will start moving along the
+                #   x-axis (Only while the player is not in its death animation)
+                player_death = 1
                 for p in machine_player.current_player:
-                    for bm in blue_machine.blue_machines:
-                        bm.move_enemy(p.get_death_animation())
-
-                    for ym in yellow_machine.yellow_machines:
-                        ym.move_enemy(p.get_death_animation())
-
-                    for rm in red_machine.red_machines:
-                        rm.move_enemy(p.get_death_animation())
-
-                    for b in machine_boss.boss:
-                        b.move_boss(p.get_death_animation())
+                    player_death = p.get_death_animation()
+                machine_kinematics.step(player_death, game_clock.dt)
+                frame_profiler.stop("Machine_Kinematics")
 
                 # Check if the power ups are active or not
                 for t in textbox.text_on_screen_list:
@@ -1125,13 +1020,13 @@ def main():
 
                 # If the power ups are active, run their timers through these functions
                 for yi in yellow_power_up_indicator.yellow_power_up_indicator_turtle:
-                    yi.set_timer()
+                    yi.set_timer(game_clock.dt)
 
                 for bi in blue_power_up_indicator.blue_power_up_indicator_turtle:
-                    bi.set_timer()
+                    bi.set_timer(game_clock.dt)
 
                 for ei in extra_power_up_indicator.extra_power_up_indicator_turtle:
-                    ei.set_timer()
+                    ei.set_timer(game_clock.dt)
 
             # If Machine Mode is toggled off
             else:
@@ -1141,29 +1036,13 @@ def main():
                 machine_player.current_player.clear()
                 machine_player.current_player_index = 0
                 machine_player.player_update_value = 0
-                for bm in blue_machine.blue_machines:
-                    bm.remove()
-                blue_machine.blue_machines.clear()
-                blue_machine.blue_machine_index = 0
-                blue_machine.blue_machines_update_values.clear()
-                for ym in yellow_machine.yellow_machines:
-                    ym.remove()
-                yellow_machine.yellow_machines.clear()
-                yellow_machine.yellow_machine_index = 0
-                yellow_machine.yellow_machines_update_values.clear()
-                for rm in red_machine.red_machines:
-                    rm.remove()
-                red_machine.red_machines.clear()
-                red_machine.red_machine_index = 0
-                red_machine.red_machines_update_values.clear()
-                red_machine.red_machines_hit_values.clear()
-                for b in machine_boss.boss:
-                    b.remove()
-                machine_boss.boss.clear()
-                machine_boss.boss_index = 0
-                machine_boss.boss_update_value = 0
-                machine_boss.boss_hit_value = 0
+                blue_machine.clear_blue_machines()
+                yellow_machine.clear_yellow_machines()
+                red_machine.clear_red_machines()
+                machine_boss.clear_boss()
 
+            frame_profiler.stop("Machine_Mode")
+            frame_profiler.start("Alien_Mode")
             """
                 Code Below is for when Alien Mode is turned on.
             """
@@ -1173,12 +1052,6 @@ def main():
                 if button.current_button_index == 0:
                     button.spawn_button("Game", 1)
 
-                # Check if the main menu button has been clicked or not
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Game" and button_color == "yellow" and bu.get_button_frame().isvisible():
-                        window.onscreenclick(screen.launch_title_mode)
-
                 # Check to see if the third milestone has been met yet or not
                 # If it has not been met, initiate the third milestone
                 if not milestones.alien_mode_played and milestones.milestone_3_displayed == 0:
@@ -1190,11 +1063,11 @@ def main():
                     milestones.alien_mode_played = True
                     milestones.save()
                     milestones.milestone_3_displayed = 1
-                    milestones.milestone_start_time = time.time()
+                    milestones.milestone_start_time = game_clock.now
 
                 # Display the third milestone for 30 seconds so that the player has time to read the information
                 if milestones.milestone_3_displayed == 1:
-                    current_time = time.time()
+                    current_time = game_clock.now
                     elapsed_time = current_time - milestones.milestone_start_time
                     if elapsed_time > 30:
                         for pa in panel.panel_turtle:
@@ -1204,7 +1077,7 @@ def main():
 
                 # Display the fourth milestone for 30 seconds so that the player has time to read the information
                 if milestones.milestone_4_displayed == 1:
-                    current_time = time.time()
+                    current_time = game_clock.now
                     elapsed_time = current_time - milestones.milestone_start_time
                     if elapsed_time > 30:
                         for pa in panel.panel_turtle:
@@ -1375,13 +1248,13 @@ def main():
 
                 # If the power ups are active, run their timers through these functions
                 for yi in yellow_power_up_indicator.yellow_power_up_indicator_turtle:
-                    yi.set_timer()
+                    yi.set_timer(game_clock.dt)
 
                 for bi in blue_power_up_indicator.blue_power_up_indicator_turtle:
-                    bi.set_timer()
+                    bi.set_timer(game_clock.dt)
 
                 for ei in extra_power_up_indicator.extra_power_up_indicator_turtle:
-                    ei.set_timer()
+                    ei.set_timer(game_clock.dt)
 
                 # Spawn aliens based on the players score
                 # At its peak, there will be 5 small aliens, 5 medium aliens, 5 large aliens, and 1 UFO attacking the player
@@ -1414,37 +1287,19 @@ def main():
                 # If score is less than 7, reset the number of aliens back down to 3
                 elif statistics.score < 7:
                     if small_alien.small_alien_index == 4 or small_alien.small_alien_index == 5:
-                        for sa in small_alien.small_aliens:
-                            sa.remove()
-                        small_alien.small_aliens.clear()
-                        small_alien.small_alien_index = 0
-                        small_alien.small_aliens_kill_values.clear()
-                    for ma in medium_alien.medium_aliens:
-                        ma.remove()
-                    medium_alien.medium_aliens.clear()
-                    medium_alien.medium_alien_index = 0
-                    medium_alien.medium_aliens_kill_values.clear()
-                    medium_alien.medium_aliens_hit_values.clear()
-                    for la in large_alien.large_aliens:
-                        la.remove()
-                    large_alien.large_aliens.clear()
-                    large_alien.large_alien_index = 0
-                    large_alien.large_aliens_kill_values.clear()
-                    large_alien.large_aliens_hit_values.clear()
-                    for u in ufo.ufos:
-                        u.remove()
-                    ufo.ufos.clear()
-                    ufo.ufo_index = 0
-                    ufo.ufo_update_value = 0
-                    ufo.ufo_hit_value = 0
+                        small_alien.clear_small_aliens()
+                    medium_alien.clear_medium_aliens()
+                    large_alien.clear_large_aliens()
+                    ufo.clear_ufos()
 
+                frame_profiler.start("Alien_Movement")
                 # Move the sun along the ellipse
                 for s in sun.sun_turtle:
-                    s.update_position()
+                    s.update_position(game_clock.dt)
 
                 # Check if a right movement of the player needs to be executed
                 for h in human_player.current_human:
-                    h.execute_right_movement(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active())
+                    h.execute_right_movement(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), game_clock.dt)
 
                 # Update the time variable used to create the walking right animation
                 human_player.right_update = time.perf_counter()
@@ -1452,7 +1307,7 @@ def main():
 
                 # Check if a left movement of the player needs to be executed
                 for h in human_player.current_human:
-                    h.execute_left_movement(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active())
+                    h.execute_left_movement(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), game_clock.dt)
 
                 # Update the time variable used to create the walking left animation
                 human_player.left_update = time.perf_counter()
@@ -1460,11 +1315,11 @@ def main():
 
                 # Check if a player jump needs to be executed
                 for h in human_player.current_human:
-                    h.execute_jump(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active())
+                    h.execute_jump(yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), game_clock.dt)
 
                 # Check if the players laser needs to be shot
                 for h in human_player.current_human:
-                    h.execute_shoot(settings.player_shooting_sound, yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active())
+                    h.execute_shoot(settings.player_shooting_sound, yellow_power_up_indicator.yellow_power_up_indicator_turtle[0].get_power_up_active(), game_clock.dt)
 
                 # Execute the walking animation for the player
                 for h in human_player.current_human:
@@ -1499,8 +1354,7 @@ def main():
                     u.set_movement_speed()
 
                 # Shoot the UFOs laser
-                for u in ufo.ufos:
-                    u.shoot_laser(settings.enemy_shooting_sound)
+                projectile_system.step("Alien_Mode", 0, settings.enemy_shooting_sound, game_clock.dt)
 
                 # Update the aliens texture based on their direction and the walking animation
                 for sa in small_alien.small_aliens:
@@ -1515,111 +1369,56 @@ def main():
                     if la.get_large_alien().isvisible():
                         la.set_alien_texture(human_player.right_update, human_player.left_update)
 
+                frame_profiler.stop("Alien_Movement")
+                frame_profiler.start("Alien_Coin_Pickup")
                 # Detects if the players has picked up a coin
+                # Only the coins near the player are checked for distance (Using the coins sorted x-coordinates)
+                picked_up_coins = []
                 # If the coin magnet is not enabled
                 if not shop_config.coin_magnet_enabled:
                     # Player must pick up the coin in their own
-                    hit_coin = 0
-                    for c in coin.coins_on_screen_list:
-                        for h in human_player.current_human:
-                            # If the player picks up a coin
-                            # This can be done with any one of the players lasers
-                            if (any(l.laser.isvisible() and c.range[0] < l.laser.ycor() < c.range[1] and (
+                    for h in human_player.current_human:
+                        # If the player picks up a coin
+                        # This can be done with any one of the players lasers
+                        for c in coin.coins_on_screen_list:
+                            if c.just_fired == 1 and c not in picked_up_coins and any(l.laser.isvisible() and c.range[0] < l.laser.ycor() < c.range[1] and (
                                 h.direction == 1 and c.relative_laser_position == -1 and l.laser.xcor() > c.collision_coordinate or
                                 h.direction == 2 and c.relative_laser_position == 1 and l.laser.xcor() < c.collision_coordinate
-                            ) for l in h.get_laser()) and c.just_fired == 1) or h.get_player().distance(c.get_coin()) < 55 * scale_factor:
-                                # Remove the coin
-                                c.remove()
-                                # Increase the amount of coins based on the type of coin picked up
-                                if c.get_type() == "copper":
-                                    # Check if the blue power up has a multiplier activated for the coins value and use it
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.copper_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.copper_coin_value
-                                elif c.get_type() == "silver":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.silver_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.silver_coin_value
-                                elif c.get_type() == "gold":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.gold_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.gold_coin_value
-                                elif c.get_type() == "platinum":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.platinum_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.platinum_coin_value
-                                shop_config.save()
-                                statistics.save()
-                                coin.coins_on_screen_list.pop(hit_coin)
-                                # play the coin pickup sound
-                                if settings.coin_pickup_sound == 1:
-                                    sound = pygame.mixer.Sound("sound/Coin_Pickup_Sound.wav")
-                                    sound.play()
-                            hit_coin = hit_coin + 1
+                            ) for l in h.get_laser()):
+                                picked_up_coins.append(c)
+                        # Or by walking into the coin
+                        for c in coin.get_coins_near(h.get_player().xcor(), 55 * scale_factor):
+                            if h.get_player().distance(c.get_coin()) < 55 * scale_factor and c not in picked_up_coins:
+                                picked_up_coins.append(c)
                 # If the coin magnet is enabled
                 else:
                     # Move the ocins towards the player
-                    gadget.attract_coins("Alien_Mode")
-
-                    hit_coin = 0
-                    for c in coin.coins_on_screen_list:
-                        for h in human_player.current_human:
-                            # When the player gets close enough to the coin, pick it up
-                            if h.player.isvisible() and h.death_animation == 0 and h.player.distance(c.coin) < c.COIN_DISTANCE:
-                                # Remove the coin from the screen
-                                c.remove()
-                                # Increase the amount of coins the users has based on the type of coin picked up
-                                if c.get_type() == "copper":
-                                    # For each coin, check if the blue power up has a multiplier on it
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.copper_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.copper_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.copper_coin_value
-                                elif c.get_type() == "silver":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.silver_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.silver_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.silver_coin_value
-                                elif c.get_type() == "gold":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.gold_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.gold_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.gold_coin_value
-                                elif c.get_type() == "platinum":
-                                    if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_blue_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.platinum_coin_blue_value
-                                    else:
-                                        shop_config.total_coins = shop_config.total_coins + power_up_setup.platinum_coin_value
-                                        statistics.alien_coins_collected = statistics.alien_coins_collected + power_up_setup.platinum_coin_value
-                                shop_config.save()
-                                statistics.save()
-                                coin.coins_on_screen_list.pop(hit_coin)
-                                # play the coin pickup sound
-                                if settings.coin_pickup_sound == 1:
-                                    sound = pygame.mixer.Sound("sound/Coin_Pickup_Sound.wav")
-                                    sound.play()
-                            hit_coin = hit_coin + 1
-
+                    gadget.attract_coins("Alien_Mode", game_clock.dt)
+
+                    for h in human_player.current_human:
+                        # When the player gets close enough to the coin, pick it up
+                        if h.player.isvisible() and h.death_animation == 0:
+                            player_x, player_y = h.player.position()
+                            for c in coin.get_coins_within(player_x, player_y, Coin.COIN_DISTANCE):
+                                if c not in picked_up_coins:
+                                    picked_up_coins.append(c)
+
+                # Add up the value of every coin picked up this frame and save the player data once
+                if picked_up_coins:
+                    coin_value = coin.collect_coins(picked_up_coins, power_up_setup.coin_values, blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active())
+                    shop_config.total_coins = shop_config.total_coins + coin_value
+                    statistics.alien_coins_collected = statistics.alien_coins_collected + coin_value
+                    shop_config.save()
+                    statistics.save()
+                    # play the coin pickup sound
+                    if settings.coin_pickup_sound == 1:
+                        sound_bank.play("coin_pickup")
+
+                frame_profiler.stop("Alien_Coin_Pickup")
+                frame_profiler.start("Alien_Enemy_Killer")
                 # Alien Killer
+                # Find every alien that the player lasers passed through since the last frame
+                alien_collision.sweep_lasers()
                 for h in human_player.current_human:
                     current_small_alien_update_value_index = 0
                     for sa in small_alien.small_aliens:
@@ -1629,12 +1428,8 @@ def main():
                                 # Check for all player lasers first
                                 laser_killed = 0
                                 if sa.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.SMALL_ALIEN_Y_RANGE[0] < l.laser.ycor() < alien_collision.SMALL_ALIEN_Y_RANGE[1] and (
-                                            (l.laser.xcor() > sa.get_small_alien().xcor() + alien_collision.SMALL_ALIEN_X_DISTANCE * sa.collision_point and h.laser_direction == 1 and sa.already_ahead == 0) or
-                                            (l.laser.xcor() < sa.get_small_alien().xcor() + alien_collision.SMALL_ALIEN_X_DISTANCE * sa.collision_point and h.laser_direction == 2 and sa.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(sa):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             small_alien.small_aliens_kill_values[current_small_alien_update_value_index] = small_alien.small_aliens_kill_values[current_small_alien_update_value_index] + 1
 
                                             # Increase the players score
@@ -1679,7 +1474,7 @@ def main():
                                         statistics.save()
                         elif small_alien.small_aliens_kill_values[current_small_alien_update_value_index] != 0:
                             # Kill the alien
-                            sa.kill_alien(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            sa.kill_alien(settings.enemy_death_sound, coin)
                             small_alien.small_aliens_kill_values[current_small_alien_update_value_index] = small_alien.small_aliens_kill_values[current_small_alien_update_value_index] + 1
 
                             # If the death animation has finished, reset the update value back to 0 to signal it
@@ -1698,12 +1493,8 @@ def main():
                             if ma.health <= alien_mode_setup.damage and ma.get_medium_alien().isvisible() and ma.hit_delay == 0:
                                 laser_killed = 0
                                 if ma.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.MEDIUM_ALIEN_Y_RANGE[0] < l.laser.ycor() < alien_collision.MEDIUM_ALIEN_Y_RANGE[1] and (
-                                            (l.laser.xcor() > ma.get_medium_alien().xcor() + alien_collision.MEDIUM_ALIEN_X_DISTANCE * ma.collision_point and h.laser_direction == 1 and ma.already_ahead == 0) or
-                                            (l.laser.xcor() < ma.get_medium_alien().xcor() + alien_collision.MEDIUM_ALIEN_X_DISTANCE * ma.collision_point and h.laser_direction == 2 and ma.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(ma):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             medium_alien.medium_aliens_kill_values[current_medium_alien_update_value_index] = medium_alien.medium_aliens_kill_values[current_medium_alien_update_value_index] + 1
 
                                             if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -1733,7 +1524,7 @@ def main():
                                         statistics.medium_aliens_killed = statistics.medium_aliens_killed + 1
                                         statistics.save()
                         elif medium_alien.medium_aliens_kill_values[current_medium_alien_update_value_index] != 0:
-                            ma.kill_alien(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            ma.kill_alien(settings.enemy_death_sound, coin)
                             medium_alien.medium_aliens_kill_values[current_medium_alien_update_value_index] = medium_alien.medium_aliens_kill_values[current_medium_alien_update_value_index] + 1
 
                             if ma.get_death_animation() == 0:
@@ -1747,12 +1538,8 @@ def main():
                                 # Check if the laser hit the enemy first
                                 laser_hit = 0
                                 if ma.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.MEDIUM_ALIEN_Y_RANGE[0] < l.laser.ycor() < alien_collision.MEDIUM_ALIEN_Y_RANGE[1] and (
-                                            (l.laser.xcor() > ma.get_medium_alien().xcor() + alien_collision.MEDIUM_ALIEN_X_DISTANCE * ma.collision_point and h.laser_direction == 1 and ma.already_ahead == 0) or
-                                            (l.laser.xcor() < ma.get_medium_alien().xcor() + alien_collision.MEDIUM_ALIEN_X_DISTANCE * ma.collision_point and h.laser_direction == 2 and ma.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(ma):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             medium_alien.medium_aliens_hit_values[current_medium_alien_hit_value_index] = medium_alien.medium_aliens_hit_values[current_medium_alien_hit_value_index] + 1
 
                                             # Increase the players score by the hit amount
@@ -1805,12 +1592,8 @@ def main():
                             if la.health <= alien_mode_setup.damage and la.get_large_alien().isvisible() and la.hit_delay == 0:
                                 laser_killed = 0
                                 if la.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.LARGE_ALIEN_Y_RANGE[0] < l.laser.ycor() < alien_collision.LARGE_ALIEN_Y_RANGE[1] and (
-                                            (l.laser.xcor() > la.get_large_alien().xcor() + alien_collision.LARGE_ALIEN_X_DISTANCE * la.collision_point and h.laser_direction == 1 and la.already_ahead == 0) or
-                                            (l.laser.xcor() < la.get_large_alien().xcor() + alien_collision.LARGE_ALIEN_X_DISTANCE * la.collision_point and h.laser_direction == 2 and la.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(la):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             large_alien.large_aliens_kill_values[current_large_alien_update_value_index] = large_alien.large_aliens_kill_values[current_large_alien_update_value_index] + 1
 
                                             if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -1840,7 +1623,7 @@ def main():
                                         statistics.big_aliens_killed = statistics.big_aliens_killed + 1
                                         statistics.save()
                         elif large_alien.large_aliens_kill_values[current_large_alien_update_value_index] != 0:
-                            la.kill_alien(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            la.kill_alien(settings.enemy_death_sound, coin)
                             large_alien.large_aliens_kill_values[current_large_alien_update_value_index] = large_alien.large_aliens_kill_values[current_large_alien_update_value_index] + 1
 
                             if la.get_death_animation() == 0:
@@ -1854,12 +1637,8 @@ def main():
                             if la.get_large_alien_health() > alien_mode_setup.damage and la.get_large_alien().isvisible():
                                 laser_hit = 0
                                 if la.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.LARGE_ALIEN_Y_RANGE[0] < l.laser.ycor() < alien_collision.LARGE_ALIEN_Y_RANGE[1] and (
-                                            (l.laser.xcor() > la.get_large_alien().xcor() + alien_collision.LARGE_ALIEN_X_DISTANCE * la.collision_point and h.laser_direction == 1 and la.already_ahead == 0) or
-                                            (l.laser.xcor() < la.get_large_alien().xcor() + alien_collision.LARGE_ALIEN_X_DISTANCE * la.collision_point and h.laser_direction == 2 and la.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(la):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             large_alien.large_aliens_hit_values[current_large_alien_hit_value_index] = large_alien.large_aliens_hit_values[current_large_alien_hit_value_index] + 1
 
                                             if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -1895,12 +1674,8 @@ def main():
                             if u.get_ufo_health() <= alien_mode_setup.damage and u.get_ufo().isvisible() and u.hit_delay == 0:
                                 laser_killed = 0
                                 if u.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.UFO_Y_RANGE[0] < l.laser.ycor() < alien_collision.UFO_Y_RANGE[1] and (
-                                            (l.laser.xcor() > u.get_ufo().xcor() + alien_collision.UFO_X_DISTANCE * u.collision_point and h.laser_direction == 1 and u.already_ahead == 0) or
-                                            (l.laser.xcor() < u.get_ufo().xcor() + alien_collision.UFO_X_DISTANCE * u.collision_point and h.laser_direction == 2 and u.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(u):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             ufo.ufo_kill_value = ufo.ufo_kill_value + 1
 
                                             if blue_power_up_indicator.blue_power_up_indicator_turtle[0].get_power_up_active() == 1:
@@ -1921,7 +1696,7 @@ def main():
                                                 milestones.alien_mode_beaten = True
                                                 milestones.save()
                                                 milestones.milestone_4_displayed = 1
-                                                milestones.milestone_start_time = time.time()
+                                                milestones.milestone_start_time = game_clock.now
 
                                             l.laser.hideturtle()
                                             if extra_power_up_indicator.extra_power_up_indicator_turtle[0].get_power_up_active() == 0:
@@ -1952,9 +1727,9 @@ def main():
                                         milestones.alien_mode_beaten = True
                                         milestones.save()
                                         milestones.milestone_4_displayed = 1
-                                        milestones.milestone_start_time = time.time()
+                                        milestones.milestone_start_time = game_clock.now
                         elif ufo.ufo_kill_value != 0:
-                            u.kill_ufo(settings.enemy_death_sound, coin.coins_on_screen_list, coin.all_coins_list)
+                            u.kill_ufo(settings.enemy_death_sound, coin)
                             ufo.ufo_kill_value = ufo.ufo_kill_value + 1
 
                             if u.get_death_animation() == 0:
@@ -1966,12 +1741,8 @@ def main():
                             if u.get_ufo_health() > alien_mode_setup.damage and u.get_ufo().isvisible():
                                 laser_hit = 0
                                 if u.got_hit == 0:
-                                    for l in h.get_laser():
-                                        if l.laser_update < alien_mode_setup.piercing and \
-                                            alien_collision.UFO_Y_RANGE[0] < l.laser.ycor() < alien_collision.UFO_Y_RANGE[1] and (
-                                            (l.laser.xcor() > u.get_ufo().xcor() + alien_collision.UFO_X_DISTANCE * u.collision_point and h.laser_direction == 1 and u.already_ahead == 0) or
-                                            (l.laser.xcor() < u.get_ufo().xcor() + alien_collision.UFO_X_DISTANCE * u.collision_point and h.laser_direction == 2 and u.already_behind == 0)
-                                        ):
+                                    for l in alien_collision.get_laser_hits(u):
+                                        if l.laser_update < alien_mode_setup.piercing:
                                             ufo.ufo_hit_value = ufo.ufo_hit_value + 1
 
                                             # UFO health going down to 6 - 9 grants the player 1 point
@@ -2024,8 +1795,12 @@ def main():
                             if u.get_hit_delay() == 0:
                                 ufo.ufo_hit_value = 0
 
+                frame_profiler.stop("Alien_Enemy_Killer")
+                frame_profiler.start("Alien_Player_Killer")
                 # Player Killer
                 for h in human_player.current_human:
+                    # Find out if the UFOs laser has hit the player (Used by both the player killer and the player hitter)
+                    projectile_system.check_player(h.get_player())
                     # If the death animation has already started
                     if human_player.human_update_value != 0:
                         # Keep going with the players death animation
@@ -2080,10 +1855,11 @@ def main():
                                     if shop_config.thorns_enabled:
                                         u.thorns_initiated_damage = 1
 
-                            if u.get_ufo_laser().distance(h.get_player()) < 25 * scale_factor:
-                                if h.health == 1 and h.hit_delay == 0 and u.get_ufo_laser().isvisible() and settings.god_mode == 0 and human_player.human_update_value == 0:
-                                    h.kill_player(settings.player_death_sound)
-                                    human_player.human_update_value = human_player.human_update_value + 1
+                        # Check if the UFOs laser has hit the player
+                        for u in projectile_system.hits:
+                            if h.health == 1 and h.hit_delay == 0 and settings.god_mode == 0 and human_player.human_update_value == 0:
+                                h.kill_player(settings.player_death_sound)
+                                human_player.human_update_value = human_player.human_update_value + 1
 
                     # If the player has more than 1 health, only deal 1 health owrth of damage
                     # If the hit delay is ongoing
@@ -2138,10 +1914,12 @@ def main():
                                     if shop_config.thorns_enabled:
                                         u.thorns_initiated_damage = 1
 
-                            if u.get_ufo_laser().distance(h.get_player()) < 25 * scale_factor:
-                                if h.get_health() > 1 and u.get_ufo_laser().isvisible() and settings.god_mode == 0:
-                                    h.hit_player(settings.player_hit_sound)
-                                    human_player.human_hit_value = human_player.human_hit_value + 1
+                        # Check if the UFOs laser has hit the player
+                        for u in projectile_system.hits:
+                            if h.get_health() > 1 and settings.god_mode == 0:
+                                h.hit_player(settings.player_hit_sound)
+                                human_player.human_hit_value = human_player.human_hit_value + 1
+                frame_profiler.stop("Alien_Player_Killer")
             # If Alien Mode is toggled off
             else:
                 # Remove all the Alien Mode exclusive sprites from the screen
@@ -2161,30 +1939,13 @@ def main():
                 human_player.human_update_value = 0
                 human_player.human_hit_value = 0
                 human_player.laser_update = 0
-                for sa in small_alien.small_aliens:
-                    sa.remove()
-                small_alien.small_aliens.clear()
-                small_alien.small_alien_index = 0
-                small_alien.small_aliens_kill_values.clear()
-                for ma in medium_alien.medium_aliens:
-                    ma.remove()
-                medium_alien.medium_aliens.clear()
-                medium_alien.medium_alien_index = 0
-                medium_alien.medium_aliens_kill_values.clear()
-                medium_alien.medium_aliens_hit_values.clear()
-                for la in large_alien.large_aliens:
-                    la.remove()
-                large_alien.large_aliens.clear()
-                large_alien.large_alien_index = 0
-                large_alien.large_aliens_kill_values.clear()
-                large_alien.large_aliens_hit_values.clear()
-                for u in ufo.ufos:
-                    u.remove()
-                ufo.ufos.clear()
-                ufo.ufo_index = 0
-                ufo.ufo_kill_value = 0
-                ufo.ufo_hit_value = 0
+                small_alien.clear_small_aliens()
+                medium_alien.clear_medium_aliens()
+                large_alien.clear_large_aliens()
+                ufo.clear_ufos()
 
+            frame_profiler.stop("Alien_Mode")
+            frame_profiler.start("Shop")
             """
                 Code below is for when the Shop is entered
             """
@@ -2200,25 +1961,6 @@ def main():
                     for i in range(4):
                         button.spawn_button("Tab", i + 1)
 
-                # Check if the main menu button has been clicked or not
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Game" and button_color == "yellow" and bu.get_button_frame().isvisible():
-                        window.onscreenclick(screen.launch_title_mode)
-
-                # Check to see if the tabs have been click or not
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Tab":
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.display_machine_mode_page)
-                        elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.display_alien_mode_page)
-                        elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.display_power_up_page)
-                        elif id == 4 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.display_gadgets_page)
-
                 # Spawn all the necessary standalone text
                 if textbox.current_text_index == 0:
                     textbox.spawn_text_box(1, -75 * scale_factor_X, 240 * scale_factor_Y, "red")
@@ -2283,23 +2025,6 @@ def main():
                             elif bu.get_id() == 5:
                                 bu.toggle_indicator(shop_config.machine_slots_unlocked[4])
 
-                    # Check if the slots have been clicked or not
-                    for bu in button.buttons_on_screen_list:
-                        button_color, button_type, id = bu.click_button()
-                        if bu.get_type() == "Shop_Slot":
-                            if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_1_select)
-                            elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_2_select)
-                            elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_3_select)
-                            elif id == 4 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_4_select)
-                            elif id == 5 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_5_select)
-                        elif bu.get_type() == "Buy":
-                            if button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.execute_buy_button)
                 # If the page is "Alien_Mode"
                 elif screen.page == "Alien_Mode":
                     # Create 5 shop slots
@@ -2355,23 +2080,6 @@ def main():
                             elif bu.get_id() == 5:
                                 bu.toggle_indicator(shop_config.alien_slots_unlocked[4])
 
-                    # Check to see if each slot has been clicked or not
-                    for bu in button.buttons_on_screen_list:
-                        button_color, button_type, id = bu.click_button()
-                        if bu.get_type() == "Shop_Slot":
-                            if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_1_select)
-                            elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_2_select)
-                            elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_3_select)
-                            elif id == 4 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_4_select)
-                            elif id == 5 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_5_select)
-                        elif bu.get_type() == "Buy":
-                            if button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.execute_buy_button)
                 # If the page is "Power_Ups"
                 elif screen.page == "Power_Ups":
                     # Spawn 4 power up slots
@@ -2428,21 +2136,6 @@ def main():
                                 bu.toggle_indicator(shop_config.red_power_up_level)
                             bu.set_indicator_location()
 
-                    # Check if the slots have been clicked on or not
-                    for bu in button.buttons_on_screen_list:
-                        button_color, button_type, id = bu.click_button()
-                        if bu.get_type() == "Power_Up_Slot":
-                            if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_1_select)
-                            elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_2_select)
-                            elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_3_select)
-                            elif id == 4 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_4_select)
-                        elif bu.get_type() == "Buy":
-                            if button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.execute_buy_button)
                 # If the page is "Gadgets"
                 elif screen.page == "Gadgets":
                     # Spawn 4 gadget slots
@@ -2483,27 +2176,6 @@ def main():
                                         s.new_select(bu.get_button_frame().xcor() - 1 * scale_factor_X, bu.get_button_frame().ycor())
                                         refresh_variables.move_tab_selector = 0
 
-                    # Check if the slots have been clicked on or not
-                    for bu in button.buttons_on_screen_list:
-                        button_color, button_type, id = bu.click_button()
-                        if bu.get_type() == "Gadget_Slot":
-                            if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_1_select)
-                            elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_2_select)
-                            elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_3_select)
-                            elif id == 4 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.slot_4_select)
-                        # Check to see if the buy button has been clicked
-                        elif bu.get_type() == "Buy":
-                            if button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.execute_buy_button)
-                        # Check to see if the enable button has been clicked
-                        elif bu.get_type() == "Enable":
-                            if button_color == "yellow" and bu.get_button_frame().isvisible():
-                                window.onscreenclick(shop.execute_enable_button)
-
                 # Spawn the coin indicator
                 if coin_indicator.coin_indicator_index == 0:
                     coin_indicator.spawn_coin_indicator()
@@ -2514,6 +2186,8 @@ def main():
                         t.move(screen.mode)
                         break
 
+            frame_profiler.stop("Shop")
+            frame_profiler.start("Stats")
             """
                  Code Below is for when Statistics Mode is turned on.
             """
@@ -2523,12 +2197,6 @@ def main():
                 if button.current_button_index == 0:
                     button.spawn_button("Game", 1)
 
-                # Check if the button has been clicked
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Game" and button_color == "yellow" and bu.get_button_frame().isvisible():
-                        window.onscreenclick(screen.launch_title_mode)
-
                 # Create the statistics text
                 if textbox.current_text_index == 0:
                     textbox.spawn_text_box(1, 0, 240 * scale_factor_Y, "red")
@@ -2547,6 +2215,8 @@ def main():
                         t.move(screen.mode)
                         break
 
+            frame_profiler.stop("Stats")
+            frame_profiler.start("Settings")
             """
                 Code Below is for when Settings Mode is turned on.
             """
@@ -2559,41 +2229,6 @@ def main():
                     for i in range(12):
                         button.spawn_button("Settings_Toggle", i + 1)
 
-                # Check if each of the buttons has been clicked
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Regular_Settings_And_Controls":
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_title_mode)
-                        elif id == 2 and (button_color == "yellow" or button.clickable == 1) and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_controls_mode)
-                            button.clickable = 0
-                    elif button_type == "Settings_Toggle":
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_button_sound)
-                        elif id == 2 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_player_shooting_sound)
-                        elif id == 3 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_enemy_shooting_sound)
-                        elif id == 4 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_player_death_sound)
-                        elif id == 5 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_enemy_death_sound)
-                        elif id == 6 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_player_hit_sound)
-                        elif id == 7 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_enemy_hit_sound)
-                        elif id == 8 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_power_up_pickup_sound)
-                        elif id == 9 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_power_up_spawn_sound)
-                        elif id == 10 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_coin_pick_up_sound)
-                        elif id == 11 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_fullscreen)
-                        elif id == 12 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(settings_toggle.toggle_vsync)
-
                 # Create all additional text boxes
                 if textbox.current_text_index == 0:
                     textbox.spawn_text_box(1, 0, 240 * scale_factor_Y, "red")
@@ -2606,6 +2241,8 @@ def main():
                         t.move(screen.mode)
                         break
 
+            frame_profiler.stop("Settings")
+            frame_profiler.start("Controls")
             """
                 Code Below is for when Controls Mode is turned on.
             """
@@ -2618,25 +2255,6 @@ def main():
                     for i in range(4):
                         button.spawn_button("Controls_Toggle", i + 1)
 
-                # Check if any of the buttons have been clicked
-                for bu in button.buttons_on_screen_list:
-                    button_color, button_type, id = bu.click_button()
-                    if button_type == "Regular_Settings_And_Controls":
-                        if id == 1 and button_color == "yellow" and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_title_mode)
-                        elif id == 3 and (button_color == "yellow" or button.clickable == 2) and bu.get_button_frame().isvisible():
-                            window.onscreenclick(screen.launch_settings_mode)
-                            button.clickable = 0
-                    elif button_type == "Controls_Toggle":
-                        if id == 1 and (button_color == "yellow" or button_color == "orange") and bu.get_button_frame().isvisible():
-                            window.onscreenclick(controls.change_go_right_key)
-                        elif id == 2 and (button_color == "yellow" or button_color == "orange") and bu.get_button_frame().isvisible():
-                            window.onscreenclick(controls.change_go_left_key)
-                        elif id == 3 and (button_color == "yellow" or button_color == "orange") and bu.get_button_frame().isvisible():
-                            window.onscreenclick(controls.change_shoot_key)
-                        elif id == 4 and (button_color == "yellow" or button_color == "orange") and bu.get_button_frame().isvisible():
-                            window.onscreenclick(controls.change_jump_key)
-
                 # Create any additional text boxes
                 if textbox.current_text_index == 0:
                     textbox.spawn_text_box(1, 0, 240 * scale_factor_Y, "red")
@@ -2672,8 +2290,69 @@ def main():
                 else:
                     controls.jump_key_alert = 1
 
+            frame_profiler.stop("Controls")
+            frame_profiler.end_frame()
+
+
+    return frame_count
+
+
+def parse_arguments():
+    """
+        Reads the command line arguments.
+
+        :return: The command line arguments
+        :type: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(description="Laser Fighter")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without a window, sound or Win32 (Same as setting LASER_FIGHTER_HEADLESS=1)")
+    parser.add_argument("--mode", default=None,
+                        choices=["Title_Mode", "Machine_Mode", "Alien_Mode", "Shop", "Stats", "Settings", "Controls"],
+                        help="The screen to start on")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="The number of frames to run before closing the game")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each section of the game loop (Same as setting LASER_FIGHTER_PROFILE=1)")
+    parser.add_argument("--profile-overlay", action="store_true",
+                        help="Show the slowest sections of the game loop on the screen (Turns on --profile)")
+    parser.add_argument("--profile-output", default="frame_profile",
+                        help="Where to write the frame times on exit, without the file extension")
+    parser.add_argument("--record", default=None,
+                        help="Record the inputs, random seed and frame times to this file")
+    parser.add_argument("--replay", default=None,
+                        help="Replay a file made with --record (Live inputs are ignored)")
+    parser.add_argument("--replay-fast", action="store_true",
+                        help="Run the replay as fast as possible instead of at the recorded speed")
+    return parser.parse_known_args()[0]
+
 
 if __name__ == "__main__":
-    # Make sure the computer does not enter sleep mode while the game is running
-    with MonitorSleepController():
-        main()
+    arguments = parse_arguments()
+    if arguments.profile or arguments.profile_overlay:
+        frame_profiler.enabled = True
+    frame_profiler.export_path = arguments.profile_output
+    if arguments.profile_overlay:
+        frame_profiler.enable_overlay(-630 * scale_factor_X, -350 * scale_factor_Y)
+    start_mode = arguments.mode
+    if arguments.replay is not None:
+        input_recorder.start_replay(arguments.replay, 1 if arguments.replay_fast else 0)
+        start_mode = input_recorder.start_mode
+    elif arguments.record is not None:
+        input_recorder.start_recording(arguments.record, arguments.mode)
+    if start_mode is not None and not screen.is_mode_available(start_mode):
+        raise SystemExit(f"Laser Fighter: {start_mode} has not been unlocked yet, so the game can't start on it")
+    if HEADLESS:
+        # No window is opened, so the computer does not need to be kept awake
+        headless_start_time = time.perf_counter()
+        frames_run = main(start_mode, arguments.frames)
+        headless_elapsed_time = time.perf_counter() - headless_start_time
+        print(f"Ran {frames_run} frames in {headless_elapsed_time:.2f} seconds "
+              f"({frames_run / max(headless_elapsed_time, 1e-9):.0f} frames per second)")
+        if frame_profiler.enabled:
+            print(f"Time to first frame: {frame_profiler.counters['Time_To_First_Frame_ms']:.1f} ms")
+    else:
+        # Make sure the computer does not enter sleep mode while the game is running
+        with MonitorSleepController():
+            main(start_mode, arguments.frames)
@@ -19,8 +19,12 @@
     Date: 2024-08-01
     Description:
     This file contains the logic for calculating collisions in Alien Mode.
+    The player lasers are tested with a swept hitbox. Each frame, the section of the x-axis that a laser travelled
+        across since the last frame is checked against the hitbox of every alien at once, so a fast laser can never
+        skip over an alien between two frames.
 """
 
+import numpy as np
 from setup.WindowSetup import scale_factor_X
 from setup.WindowSetup import scale_factor_Y
 
@@ -56,6 +60,10 @@ class AlienCollision:
             _large_alien (SpawnLargeAlien()): A pointer to the large alien object
             _ufo (SpawnUFO()): A pointer to the UFO object
             _coin (SpawnCoin()): A pointer to the coin object
+
+        Attributes:
+            _laser_x (dict): Stores the x-coordinate of each player laser during the last frame
+            laser_hits (dict): Stores the lasers that passed through each alien during the current frame
     """
 
     SMALL_ALIEN_Y_RANGE = (-193 * scale_factor_Y, -88 * scale_factor_Y)
@@ -70,6 +78,32 @@ class AlienCollision:
 
     PLAYER_LASER_GAP = 30 * scale_factor_X
 
+    @classmethod
+    def rescale(cls, ratio_x, ratio_y):
+        """
+            Rescales the class variables when the resolution is changed while the game is running.
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        cls.SMALL_ALIEN_Y_RANGE = (cls.SMALL_ALIEN_Y_RANGE[0] * ratio_y, cls.SMALL_ALIEN_Y_RANGE[1] * ratio_y)
+        cls.MEDIUM_ALIEN_Y_RANGE = (cls.MEDIUM_ALIEN_Y_RANGE[0] * ratio_y, cls.MEDIUM_ALIEN_Y_RANGE[1] * ratio_y)
+        cls.LARGE_ALIEN_Y_RANGE = (cls.LARGE_ALIEN_Y_RANGE[0] * ratio_y, cls.LARGE_ALIEN_Y_RANGE[1] * ratio_y)
+        cls.UFO_Y_RANGE = (cls.UFO_Y_RANGE[0] * ratio_y, cls.UFO_Y_RANGE[1] * ratio_y)
+
+        cls.SMALL_ALIEN_X_DISTANCE = cls.SMALL_ALIEN_X_DISTANCE * ratio_x
+        cls.MEDIUM_ALIEN_X_DISTANCE = cls.MEDIUM_ALIEN_X_DISTANCE * ratio_x
+        cls.LARGE_ALIEN_X_DISTANCE = cls.LARGE_ALIEN_X_DISTANCE * ratio_x
+        cls.UFO_X_DISTANCE = cls.UFO_X_DISTANCE * ratio_x
+
+        cls.PLAYER_LASER_GAP = cls.PLAYER_LASER_GAP * ratio_x
+
     def __init__(self, human_player, small_alien, medium_alien, large_alien, ufo, coin):
         """
             Represents the hitboxes in Alien Mode.
@@ -100,6 +134,9 @@ class AlienCollision:
         self._ufo = ufo
         self._coin = coin
 
+        self._laser_x = {}
+        self.laser_hits = {}
+
     def __del__(self):
         """
             Clear the variables from memory once the program has terminated
@@ -113,91 +150,26 @@ class AlienCollision:
         del self._large_alien
         del self._ufo
         del self._coin
+        del self._laser_x
+        del self.laser_hits
 
     def calculate_collision(self):
         """
-            Calculates the collision hitboxes for Alien Mode based on the new laser that was just fired.
+            Resets the collision variables for the new laser that was just fired.
 
             :return: None
         """
 
         for h in self._human_player.current_human:
-            # Each Small Aliens Hitbox is calculated
-            for sa in self._small_alien.small_aliens:
-                # Make sure that the alien is not dying before resetting its status as being hit
-                if sa.death_animation == 0:
-                    sa.got_hit = 0
-                # If the collision lines for the Alien should be on the left (-1) or right (1) side
-                # Depends where the player is relative to the Alien.
-                if sa.get_small_alien().xcor() - self.SMALL_ALIEN_X_DISTANCE >= (h.get_player().xcor() + self.PLAYER_LASER_GAP) or \
-                        (sa.get_small_alien().xcor() - self.SMALL_ALIEN_X_DISTANCE < (h.get_player().xcor() - self.PLAYER_LASER_GAP) < sa.get_small_alien().xcor() + self.SMALL_ALIEN_X_DISTANCE and h.direction == 2):
-                    sa.collision_point = -1
-                else:
-                    sa.collision_point = 1
-                # If the player already has a greater x coordinate than the collision line
-                if h.get_player().xcor() > sa.get_small_alien().xcor() + (self.SMALL_ALIEN_X_DISTANCE * sa.collision_point):
-                    sa.already_ahead = 1
-                else:
-                    sa.already_ahead = 0
-                # If the player already has a smaller x coordinate than the collision line
-                if h.get_player().xcor() < sa.get_small_alien().xcor() + (self.SMALL_ALIEN_X_DISTANCE * sa.collision_point):
-                    sa.already_behind = 1
-                else:
-                    sa.already_behind = 0
-
-            # Each Medium Aliens Hitbox is calculated
-            for ma in self._medium_alien.medium_aliens:
-                if ma.death_animation == 0:
-                    ma.got_hit = 0
-                if ma.get_medium_alien().xcor() - self.MEDIUM_ALIEN_X_DISTANCE >= (h.get_player().xcor() + self.PLAYER_LASER_GAP) or \
-                        (ma.get_medium_alien().xcor() - self.MEDIUM_ALIEN_X_DISTANCE < (h.get_player().xcor() - self.PLAYER_LASER_GAP) < ma.get_medium_alien().xcor() + self.MEDIUM_ALIEN_X_DISTANCE and h.direction == 2):
-                    ma.collision_point = -1
-                else:
-                    ma.collision_point = 1
-                if h.get_player().xcor() > ma.get_medium_alien().xcor() + (self.MEDIUM_ALIEN_X_DISTANCE * ma.collision_point):
-                    ma.already_ahead = 1
-                else:
-                    ma.already_ahead = 0
-                if h.get_player().xcor() < ma.get_medium_alien().xcor() + (self.MEDIUM_ALIEN_X_DISTANCE * ma.collision_point):
-                    ma.already_behind = 1
-                else:
-                    ma.already_behind = 0
-
-            # Each Large Aliens Hitbox is calculated
-            for la in self._large_alien.large_aliens:
-                if la.death_animation == 0:
-                    la.got_hit = 0
-                if la.get_large_alien().xcor() - self.LARGE_ALIEN_X_DISTANCE >= (h.get_player().xcor() + self.PLAYER_LASER_GAP) or \
-                        (la.get_large_alien().xcor() - self.LARGE_ALIEN_X_DISTANCE < (h.get_player().xcor() - self.PLAYER_LASER_GAP) < la.get_large_alien().xcor() + self.LARGE_ALIEN_X_DISTANCE and h.direction == 2):
-                    la.collision_point = -1
-                else:
-                    la.collision_point = 1
-                if h.get_player().xcor() > la.get_large_alien().xcor() + (self.LARGE_ALIEN_X_DISTANCE * la.collision_point):
-                    la.already_ahead = 1
-                else:
-                    la.already_ahead = 0
-                if h.get_player().xcor() < la.get_large_alien().xcor() + (self.LARGE_ALIEN_X_DISTANCE * la.collision_point):
-                    la.already_behind = 1
-                else:
-                    la.already_behind = 0
-
-            # Each UFOs Hitbox is calculated
-            for u in self._ufo.ufos:
-                if u.death_animation == 0:
-                    u.got_hit = 0
-                if u.get_ufo().xcor() - self.UFO_X_DISTANCE >= (h.get_player().xcor() + self.PLAYER_LASER_GAP) or \
-                        (u.get_ufo().xcor() - self.UFO_X_DISTANCE < (h.get_player().xcor() - self.PLAYER_LASER_GAP) < u.get_ufo().xcor() + self.UFO_X_DISTANCE and h.direction == 2):
-                    u.collision_point = -1
-                else:
-                    u.collision_point = 1
-                if h.get_player().xcor() > u.get_ufo().xcor() + (self.UFO_X_DISTANCE * u.collision_point):
-                    u.already_ahead = 1
-                else:
-                    u.already_ahead = 0
-                if h.get_player().xcor() < u.get_ufo().xcor() + (self.UFO_X_DISTANCE * u.collision_point):
-                    u.already_behind = 1
-                else:
-                    u.already_behind = 0
+            # Make sure that the aliens are not dying before resetting their status as being hit
+            for alien in self._small_alien.small_aliens + self._medium_alien.medium_aliens + \
+                    self._large_alien.large_aliens + self._ufo.ufos:
+                if alien.death_animation == 0:
+                    alien.got_hit = 0
+
+            # The swept hitbox of each laser starts where it was just fired from
+            for l in h.get_laser():
+                self._laser_x[l] = l.laser.xcor()
 
             # Each Coins Hitbox is calculated
             for c in self._coin.coins_on_screen_list:
@@ -214,3 +186,63 @@ class AlienCollision:
                     else:
                         c.relative_laser_position = -1
                 c.just_fired = 1
+
+    def sweep_lasers(self):
+        """
+            Finds every alien that a player laser passed through since the last frame.
+            The section of the x-axis each laser travelled across ([x_prev, x_now]) is tested against the hitbox of
+                every alien ([x - x_distance, x + x_distance] and the y-axis range) in a single pass.
+
+            :return: None
+        """
+
+        self.laser_hits = {}
+        lasers = [l for h in self._human_player.current_human for l in h.get_laser()]
+        aliens = self._small_alien.small_aliens + self._medium_alien.medium_aliens + \
+            self._large_alien.large_aliens + self._ufo.ufos
+        if not lasers:
+            self._laser_x = {}
+            return
+
+        laser_x = np.array([l.laser.xcor() for l in lasers])
+        laser_y = np.array([l.laser.ycor() for l in lasers])
+        previous_x = np.array([self._laser_x.get(l, x) for l, x in zip(lasers, laser_x.tolist())])
+        self._laser_x = dict(zip(lasers, laser_x.tolist()))
+        if not aliens:
+            return
+
+        # The hitbox of every alien (One position read per alien)
+        alien_x = np.array([a.get_small_alien().xcor() for a in self._small_alien.small_aliens] +
+                           [a.get_medium_alien().xcor() for a in self._medium_alien.medium_aliens] +
+                           [a.get_large_alien().xcor() for a in self._large_alien.large_aliens] +
+                           [a.get_ufo().xcor() for a in self._ufo.ufos])
+        counts = (len(self._small_alien.small_aliens), len(self._medium_alien.medium_aliens),
+                  len(self._large_alien.large_aliens), len(self._ufo.ufos))
+        x_distance = np.repeat((self.SMALL_ALIEN_X_DISTANCE, self.MEDIUM_ALIEN_X_DISTANCE,
+                                self.LARGE_ALIEN_X_DISTANCE, self.UFO_X_DISTANCE), counts)
+        y_range = np.repeat((self.SMALL_ALIEN_Y_RANGE, self.MEDIUM_ALIEN_Y_RANGE, self.LARGE_ALIEN_Y_RANGE,
+                             self.UFO_Y_RANGE), counts, axis=0)
+
+        # A laser hits an alien if the section it travelled across overlaps the alien on the x-axis while the laser
+        #   is inside the aliens range on the y-axis
+        lowest_x = np.minimum(previous_x, laser_x)
+        highest_x = np.maximum(previous_x, laser_x)
+        hits = (lowest_x[None, :] <= (alien_x + x_distance)[:, None]) & \
+               (highest_x[None, :] >= (alien_x - x_distance)[:, None]) & \
+               (y_range[:, 0, None] < laser_y[None, :]) & (laser_y[None, :] < y_range[:, 1, None])
+
+        for alien_index, laser_index in zip(*np.nonzero(hits)):
+            self.laser_hits.setdefault(aliens[alien_index], []).append(lasers[laser_index])
+
+    def get_laser_hits(self, alien):
+        """
+            Returns the lasers that passed through the given alien during the current frame.
+
+            :param alien: The alien (Small, medium, large or UFO)
+            :type alien: SmallAlien() / MediumAlien() / LargeAlien() / UFO()
+
+            :return: The lasers that hit the alien
+            :type: list
+        """
+
+        return self.laser_hits.get(alien, [])
@@ -19,7 +19,8 @@
     Date: 2024-08-01
     Description:
     Creates the instances for collision detection in both Machine Mode and Alien Mode.
-    The collision for both modes can be accessed through this file.
+    The collision for both modes can be accessed through this file, along with the movement of the machines in
+        Machine Mode and the lasers fired by the enemies.
 """
 
 from setup.SpriteSetup import machine_player
@@ -27,6 +28,7 @@ from setup.SpriteSetup import blue_machine
 from setup.SpriteSetup import yellow_machine
 from setup.SpriteSetup import red_machine
 from setup.SpriteSetup import machine_boss
+from setup.SpriteSetup import machine_kinematics
 from setup.SpriteSetup import human_player
 from setup.SpriteSetup import small_alien
 from setup.SpriteSetup import medium_alien
@@ -35,9 +37,14 @@ from setup.SpriteSetup import ufo
 from setup.SpriteSetup import coin
 from physics.MachineCollision import MachineCollision
 from physics.AlienCollision import AlienCollision
+from physics.ProjectileSystem import ProjectileSystem
 
 # Machine Collision Calculation
-machine_collision = MachineCollision(machine_player, blue_machine, yellow_machine, red_machine, machine_boss)
+machine_collision = MachineCollision(machine_player, machine_kinematics, blue_machine, yellow_machine, red_machine,
+                                     machine_boss)
+
+# Enemy Lasers (Movement and hits on the player for every enemy laser in both modes)
+projectile_system = ProjectileSystem(blue_machine, yellow_machine, red_machine, machine_boss, ufo)
 
 # Alien Collision Calculation
 alien_collision = AlienCollision(human_player, small_alien, medium_alien, large_alien, ufo, coin)
@@ -0,0 +1,128 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: IntersectionSolver.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains a batched solver for the time at which a players laser meets a floating machine.
+"""
+
+import numpy as np
+
+
+class IntersectionSolver:
+    """
+        Solves A * sin(2 * pi * (t + phase) / P) = v * t + d for t, for many machines and lasers at once.
+
+        The laser side of the equation is a straight line with a positive slope and the machine side is bounded
+        between -A and A, so the root always lies between (-A - d) / v and (A - d) / v. Every root is found with a
+        Newton step that falls back to bisection whenever the step would leave that bracket, which guarantees
+        convergence without needing an initial guess.
+
+        Attributes:
+            amplitude (float): The amplitude of the machines float sin wave
+            angular_frequency (float): 2 * pi divided by the period of the machines float sin wave
+            tolerance (float): The largest change in t between two iterations that is accepted as converged
+            max_iterations (int): The most iterations that will be run before the current estimate is returned
+    """
+
+    def __init__(self, amplitude, period, tolerance=1e-9, max_iterations=60):
+        """
+            Creates the solver for a float sin wave of a given amplitude and period.
+
+            :param amplitude: The amplitude of the machines float sin wave
+            :type amplitude: float
+
+            :param period: The period of the machines float sin wave
+            :type period: float
+
+            :param tolerance: The largest change in t between two iterations that is accepted as converged
+            :type tolerance: float
+
+            :param max_iterations: The most iterations that will be run before the current estimate is returned
+            :type max_iterations: int
+        """
+
+        self.amplitude = amplitude
+        self.angular_frequency = (2 * np.pi) / period
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self.amplitude
+        del self.angular_frequency
+        del self.tolerance
+        del self.max_iterations
+
+    def solve(self, phase, speed, distance):
+        """
+            Finds the intersection time for every (phase, distance) pair. The arguments are broadcast together, so a
+            single call can cover every machine and every laser index.
+
+            :param phase: The time passed since each machines float effect began
+            :type phase: float or numpy.ndarray
+
+            :param speed: The speed of the laser in pixels per second, must be greater than 0
+            :type speed: float
+
+            :param distance: The initial distance between the laser and the center of each machines float sin wave
+            :type distance: float or numpy.ndarray
+
+            :return: The intersection times
+            :type: numpy.ndarray
+        """
+
+        if speed <= 0:
+            raise ValueError("The laser speed must be greater than 0")
+
+        phase, distance = np.broadcast_arrays(np.asarray(phase, dtype=float), np.asarray(distance, dtype=float))
+        amplitude = self.amplitude
+        omega = self.angular_frequency
+
+        # g(lower) >= 0 and g(upper) <= 0, so a root is always inside [lower, upper]
+        lower = (-amplitude - distance) / speed
+        upper = (amplitude - distance) / speed
+        t = (lower + upper) / 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for _ in range(self.max_iterations):
+                angle = omega * (t + phase)
+                g = amplitude * np.sin(angle) - speed * t - distance
+                slope = amplitude * omega * np.cos(angle) - speed
+
+                # Shrink the bracket around the root
+                above = g > 0
+                lower = np.where(above, t, lower)
+                upper = np.where(above, upper, t)
+
+                # Take the Newton step when it stays inside the bracket, otherwise bisect
+                newton = t - g / slope
+                inside = np.isfinite(newton) & (newton >= lower) & (newton <= upper)
+                next_t = np.where(inside, newton, (lower + upper) / 2)
+
+                converged = np.all(np.abs(next_t - t) <= self.tolerance)
+                t = next_t
+                if converged:
+                    break
+
+        return t
@@ -21,11 +21,11 @@
     This file contains the logic for calculating collisions in Machine Mode.
 """
 
-import time
-import math
-from scipy.optimize import fsolve
+import numpy as np
+from physics.IntersectionSolver import IntersectionSolver
+from physics.MachineKinematics import MachineKinematics
 from setup.WindowSetup import scale_factor_X
-from setup.WindowSetup import scale_factor_Y
+from setup.WindowSetup import game_clock
 from setup.ModeSetupMaster import machine_mode_setup
 
 
@@ -43,14 +43,10 @@ class MachineCollision:
             BOSS_DISTANCE (float): Stores the x axis distance away from the center of the boss that
                 the players laser can be in order to still hit it. (Size of the hitbox)
 
-            FLOAT_AMPLITUDE (float): Stores the amplitude of the sin wave created by the machine float effect.
-            PERIOD (int): Stores the period of the sin wave created by the machine float effect.
-
-            MACHINE_(Num)_MOVEMENT_SPEED (float): The speed of the machines movement from side to side depending on
-                how many times it has been killed.
-
         Pointers:
             _machine_player (SpawnMachinePlayer()): A pointer to the machine player object
+            _kinematics (MachineKinematics()): A pointer to the movement logic of every machine (Holds where every
+                machine is and how it moves)
             _blue_machine (SpawnBlueMachine()): A pointer to the blue machine object
             _yellow_machine (SpawnYellowMachine()): A pointer to the yellow machine object
             _red_machine (SpawnRedMachine()): A pointer to the red machine object
@@ -58,10 +54,7 @@ class MachineCollision:
 
         Attributes:
             laser_speed (float): The current laser speed based on the shop configuration
-            initial_distance (float): The initial distance between the players laser and the center of the machines
-                float sin wave.
-            enemy_center (float): The center point of the machines float sin wave
-            float_time_offset (float): The time passed since the float effect for the machine began.
+            _solver (IntersectionSolver()): Solves the laser and machine intersection times for all machines at once
     """
 
     BLUE_MACHINE_DISTANCE = 55 * scale_factor_X
@@ -69,22 +62,16 @@ class MachineCollision:
     RED_MACHINE_DISTANCE = 64 * scale_factor_X
     BOSS_DISTANCE = 75 * scale_factor_X
 
-    FLOAT_AMPLITUDE = 50 * scale_factor_Y
-    PERIOD = 10
-
-    MACHINE_0_2_MOVEMENT_SPEED = (2 * scale_factor_X) / 0.02
-    MACHINE_2_4_MOVEMENT_SPEED = (4 * scale_factor_X) / 0.02
-    MACHINE_4_6_MOVEMENT_SPEED = (6 * scale_factor_X) / 0.02
-    MACHINE_6_8_MOVEMENT_SPEED = (8 * scale_factor_X) / 0.02
-    MACHINE_8_10_MOVEMENT_SPEED = (10 * scale_factor_X) / 0.02
-
-    def __init__(self, machine_player, blue_machine, yellow_machine, red_machine, machine_boss):
+    def __init__(self, machine_player, kinematics, blue_machine, yellow_machine, red_machine, machine_boss):
         """
             Creates the hitboxes for all objects in Machine Mode.
 
             :param machine_player: A pointer to the machine player object
             :type machine_player: SpawnMachinePlayer()
 
+            :param kinematics: A pointer to the movement logic of every machine
+            :type kinematics: MachineKinematics()
+
             :param blue_machine: A pointer to the blue machine object
             :type blue_machine: SpawnBlueMachine()
 
@@ -99,15 +86,14 @@ class MachineCollision:
         """
 
         self._machine_player = machine_player
+        self._kinematics = kinematics
         self._blue_machine = blue_machine
         self._yellow_machine = yellow_machine
         self._red_machine = red_machine
         self._machine_boss = machine_boss
 
         self.laser_speed = 0
-        self.initial_distance = 0
-        self.enemy_center = 0
-        self.float_time_offset = 0
+        self._solver = IntersectionSolver(MachineKinematics.FLOAT_AMPLITUDE, MachineKinematics.FLOAT_PERIOD)
 
     def __del__(self):
         """
@@ -117,23 +103,45 @@ class MachineCollision:
         """
 
         del self._machine_player
+        del self._kinematics
         del self._blue_machine
         del self._yellow_machine
         del self._red_machine
         del self._machine_boss
         del self.laser_speed
-        del self.initial_distance
-        del self.float_time_offset
+        del self._solver
+
+    def rescale(self, ratio_x, ratio_y):
+        """
+            Rescales the hitboxes and rebuilds the intersection solver for the new float amplitude when the resolution
+                is changed while the game is running (Called after MachineKinematics.rescale()).
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        MachineCollision.BLUE_MACHINE_DISTANCE = MachineCollision.BLUE_MACHINE_DISTANCE * ratio_x
+        MachineCollision.YELLOW_MACHINE_DISTANCE = MachineCollision.YELLOW_MACHINE_DISTANCE * ratio_x
+        MachineCollision.RED_MACHINE_DISTANCE = MachineCollision.RED_MACHINE_DISTANCE * ratio_x
+        MachineCollision.BOSS_DISTANCE = MachineCollision.BOSS_DISTANCE * ratio_x
+
+        self._solver = IntersectionSolver(MachineKinematics.FLOAT_AMPLITUDE, MachineKinematics.FLOAT_PERIOD)
 
     def calculate_collisions(self, yellow_power_up, index):
         """
-            Calculates the hitboxes for Machine Mode based off of the laser that was just fired.
+            Calculates the hitboxes for Machine Mode based off of the laser(s) that were just fired. Every machine and
+            every requested laser is solved together in a single batched pass.
 
             :param yellow_power_up: Determines whether the yellow power up is currently on or off
             :type yellow_power_up: int
 
-            :param index: The index of the current laser being analyzed
-            :type index: int
+            :param index: The index of the current laser being analyzed, or a list of laser indices
+            :type index: int or list
 
             :return: None
         """
@@ -145,176 +153,56 @@ class MachineCollision:
             self.laser_speed = machine_mode_setup.laser_speed
         self.laser_speed = self.laser_speed/0.015
 
-        # Calculate the hit boxes for the Blue Machine
+        indices = [index] if isinstance(index, int) else list(index)
+
+        # Gather every machine on screen along with its hitbox width
+        machines = []
         for bm in self._blue_machine.blue_machines:
-            # Find the time it will take for the laser and the machine to intersect through a physics wave equation
-            # This wave equation is inseparable and requires a powerful library to solve.
-            self.enemy_center = bm.enemy_center
-            current_time = time.time()
-            self.float_time_offset = current_time - bm.float_time_offset
-            self.initial_distance = self.enemy_center - self.BLUE_MACHINE_DISTANCE - self._machine_player.current_player[0].laser_list[index].laser.ycor()
-            intersection_time = self.calculate_time()
-
-            # Based off the intersection time, calculate the amount that the machine will move along the x-axis during
-            #   that time.
-            x_offset = 0
-            if 4 <= bm.death_count < 7:
-                x_offset = intersection_time[0] * self.MACHINE_0_2_MOVEMENT_SPEED * -1
-            elif 7 <= bm.death_count < 10:
-                x_offset = intersection_time[0] * self.MACHINE_2_4_MOVEMENT_SPEED * -1
-            elif 10 <= bm.death_count < 13:
-                x_offset = intersection_time[0] * self.MACHINE_4_6_MOVEMENT_SPEED * -1
-            elif 13 <= bm.death_count < 16:
-                x_offset = intersection_time[0] * self.MACHINE_6_8_MOVEMENT_SPEED * -1
-            elif 16 <= bm.death_count:
-                x_offset = intersection_time[0] * self.MACHINE_8_10_MOVEMENT_SPEED * -1
-
-            # Check for cases where the machine hits the edge of the screen and turns around.
-            if x_offset != 0:
-                if bm.movement == -1:
-                    x_offset = x_offset * -1
-                    edge = -640 * scale_factor_X
-                    distance_from_edge = edge - (bm.blue_machine.xcor() + x_offset)
-                    if distance_from_edge > 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-                else:
-                    edge = 640 * scale_factor_X
-                    distance_from_edge = edge - (bm.blue_machine.xcor() + x_offset)
-                    if distance_from_edge < 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-
-            # Find the width of the hit box
-            bm.x_range_list[index] = (bm.blue_machine.xcor() + x_offset - self.BLUE_MACHINE_DISTANCE, bm.blue_machine.xcor() + x_offset + self.BLUE_MACHINE_DISTANCE)
-
-            # Find the y-coordinate the laser must reach in order to hit the enemy based on the sine wave
-            collision_y_coordinate = self.FLOAT_AMPLITUDE * math.sin((2 * math.pi * (intersection_time[0] * -1 + self.float_time_offset)) / self.PERIOD) + \
-                self.initial_distance + \
-                self._machine_player.current_player[0].laser_list[index].laser.ycor()
-
-            bm.collision_y_coordinate_list[index] = collision_y_coordinate
-
-        # Calculate the hit boxes for the Yellow Machine
+            machines.append((bm, self.BLUE_MACHINE_DISTANCE))
         for ym in self._yellow_machine.yellow_machines:
-            self.enemy_center = ym.enemy_center
-            current_time = time.time()
-            self.float_time_offset = current_time - ym.float_time_offset
-            self.initial_distance = self.enemy_center - self.YELLOW_MACHINE_DISTANCE - self._machine_player.current_player[0].laser_list[index].laser.ycor()
-            intersection_time = self.calculate_time()
-
-            x_offset = 0
-            if 4 <= ym.death_count < 7:
-                x_offset = intersection_time[0] * self.MACHINE_0_2_MOVEMENT_SPEED * -1
-            elif 7 <= ym.death_count < 10:
-                x_offset = intersection_time[0] * self.MACHINE_2_4_MOVEMENT_SPEED * -1
-            elif 10 <= ym.death_count < 13:
-                x_offset = intersection_time[0] * self.MACHINE_4_6_MOVEMENT_SPEED * -1
-            elif 13 <= ym.death_count < 16:
-                x_offset = intersection_time[0] * self.MACHINE_6_8_MOVEMENT_SPEED * -1
-            elif 16 <= ym.death_count:
-                x_offset = intersection_time[0] * self.MACHINE_8_10_MOVEMENT_SPEED * -1
-
-            if x_offset != 0:
-                if ym.movement == -1:
-                    x_offset = x_offset * -1
-                    edge = -640 * scale_factor_X
-                    distance_from_edge = edge - (ym.yellow_machine.xcor() + x_offset)
-                    if distance_from_edge > 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-                else:
-                    edge = 640 * scale_factor_X
-                    distance_from_edge = edge - (ym.yellow_machine.xcor() + x_offset)
-                    if distance_from_edge < 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-
-            ym.x_range_list[index] = (ym.yellow_machine.xcor() + x_offset - self.YELLOW_MACHINE_DISTANCE, ym.yellow_machine.xcor() + x_offset + self.YELLOW_MACHINE_DISTANCE)
-
-            collision_y_coordinate = self.FLOAT_AMPLITUDE * math.sin((2 * math.pi * (intersection_time[0] * -1 + self.float_time_offset)) / self.PERIOD) + \
-                self.initial_distance + \
-                self._machine_player.current_player[0].laser_list[index].laser.ycor()
-
-            ym.collision_y_coordinate_list[index] = collision_y_coordinate
-
-        # Calculate the hit boxes for the Red Machine
+            machines.append((ym, self.YELLOW_MACHINE_DISTANCE))
         for rm in self._red_machine.red_machines:
-            self.enemy_center = rm.enemy_center
-            current_time = time.time()
-            self.float_time_offset = current_time - rm.float_time_offset
-            self.initial_distance = self.enemy_center - self.RED_MACHINE_DISTANCE - self._machine_player.current_player[0].laser_list[index].laser.ycor()
-            intersection_time = self.calculate_time()
-
-            x_offset = 0
-            if 4 <= rm.death_count < 7:
-                x_offset = intersection_time[0] * self.MACHINE_0_2_MOVEMENT_SPEED * -1
-            elif 7 <= rm.death_count < 10:
-                x_offset = intersection_time[0] * self.MACHINE_2_4_MOVEMENT_SPEED * -1
-            elif 10 <= rm.death_count < 13:
-                x_offset = intersection_time[0] * self.MACHINE_4_6_MOVEMENT_SPEED * -1
-            elif 13 <= rm.death_count < 16:
-                x_offset = intersection_time[0] * self.MACHINE_6_8_MOVEMENT_SPEED * -1
-            elif 16 <= rm.death_count:
-                x_offset = intersection_time[0] * self.MACHINE_8_10_MOVEMENT_SPEED * -1
-
-            if x_offset != 0:
-                if rm.movement == -1:
-                    x_offset = x_offset * -1
-                    edge = -640 * scale_factor_X
-                    distance_from_edge = edge - (rm.red_machine.xcor() + x_offset)
-                    if distance_from_edge > 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-                else:
-                    edge = 640 * scale_factor_X
-                    distance_from_edge = edge - (rm.red_machine.xcor() + x_offset)
-                    if distance_from_edge < 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-
-            rm.x_range_list[index] = (rm.red_machine.xcor() + x_offset - self.RED_MACHINE_DISTANCE, rm.red_machine.xcor() + x_offset + self.RED_MACHINE_DISTANCE)
-
-            collision_y_coordinate = self.FLOAT_AMPLITUDE * math.sin((2 * math.pi * (intersection_time[0] * -1 + self.float_time_offset)) / self.PERIOD) + \
-                self.initial_distance + \
-                self._machine_player.current_player[0].laser_list[index].laser.ycor()
-
-            rm.collision_y_coordinate_list[index] = collision_y_coordinate
-
-        # Calculate the hit boxes for the Machine Boss
+            machines.append((rm, self.RED_MACHINE_DISTANCE))
         for b in self._machine_boss.boss:
-            self.enemy_center = b.enemy_center
-            current_time = time.time()
-            self.float_time_offset = current_time - b.float_time_offset
-            self.initial_distance = self.enemy_center - self.BOSS_DISTANCE - self._machine_player.current_player[0].laser_list[index].laser.ycor()
-            intersection_time = self.calculate_time()
-
-            x_offset = 0
-            if 4 <= b.death_count < 7:
-                x_offset = intersection_time[0] * self.MACHINE_0_2_MOVEMENT_SPEED * -1
-            elif 7 <= b.death_count < 10:
-                x_offset = intersection_time[0] * self.MACHINE_2_4_MOVEMENT_SPEED * -1
-            elif 10 <= b.death_count < 13:
-                x_offset = intersection_time[0] * self.MACHINE_4_6_MOVEMENT_SPEED * -1
-            elif 13 <= b.death_count < 16:
-                x_offset = intersection_time[0] * self.MACHINE_6_8_MOVEMENT_SPEED * -1
-            elif 16 <= b.death_count:
-                x_offset = intersection_time[0] * self.MACHINE_8_10_MOVEMENT_SPEED * -1
-
-            if x_offset != 0:
-                if b.movement == -1:
-                    x_offset = x_offset * -1
-                    edge = -640 * scale_factor_X
-                    distance_from_edge = edge - (b.boss.xcor() + x_offset)
-                    if distance_from_edge > 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-                else:
-                    edge = 640 * scale_factor_X
-                    distance_from_edge = edge - (b.boss.xcor() + x_offset)
-                    if distance_from_edge < 0:
-                        x_offset = x_offset + (2 * distance_from_edge)
-
-            b.x_range_list[index] = (b.boss.xcor() + x_offset - self.BOSS_DISTANCE, b.boss.xcor() + x_offset + self.BOSS_DISTANCE)
-
-            collision_y_coordinate = self.FLOAT_AMPLITUDE * math.sin((2 * math.pi * (intersection_time[0] * -1 + self.float_time_offset)) / self.PERIOD) + \
-                self.initial_distance + \
-                self._machine_player.current_player[0].laser_list[index].laser.ycor()
-
-            b.collision_y_coordinate_list[index] = collision_y_coordinate
+            machines.append((b, self.BOSS_DISTANCE))
+
+        if not machines or not indices:
+            return
+
+        laser_list = self._machine_player.current_player[0].laser_list
+        laser_y = np.array([laser_list[i].laser.ycor() for i in indices])
+
+        # The movement state of every machine comes straight from the kinematics
+        x_position, enemy_center, float_start, movement, movement_speed = \
+            self._kinematics.get_state([m for m, _ in machines])
+        float_time_offset = game_clock.now - float_start
+        hitbox = np.array([d for _, d in machines])
+        moving_left = movement == -1
+
+        # Rows are machines and columns are lasers
+        initial_distance = (enemy_center - hitbox)[:, None] - laser_y[None, :]
+        intersection_time = self._solver.solve(float_time_offset[:, None], self.laser_speed, initial_distance)
+
+        # Based off the intersection time, calculate the amount that the machine will move along the x-axis during
+        #   that time.
+        x_offset = intersection_time * movement_speed[:, None] * -1
+
+        # Check for cases where the machine hits the edge of the screen and turns around.
+        x_offset = np.where(moving_left[:, None], x_offset * -1, x_offset)
+        distance_from_edge = np.where(moving_left, -640 * scale_factor_X, 640 * scale_factor_X)[:, None] - (x_position[:, None] + x_offset)
+        bounced = np.where(moving_left[:, None], distance_from_edge > 0, distance_from_edge < 0) & (x_offset != 0)
+        x_offset = np.where(bounced, x_offset + (2 * distance_from_edge), x_offset)
+
+        # Find the y-coordinate the laser must reach in order to hit the enemy based on the same float effect that
+        #   moves the machines
+        collision_y_coordinate = MachineKinematics.get_float_offset(intersection_time * -1 + float_time_offset[:, None]) + \
+            initial_distance + laser_y[None, :]
+
+        center = x_position[:, None] + x_offset
+        for row, (m, distance) in enumerate(machines):
+            for column, i in enumerate(indices):
+                m.x_range_list[i] = (float(center[row, column] - distance), float(center[row, column] + distance))
+                m.collision_y_coordinate_list[i] = float(collision_y_coordinate[row, column])
 
     def remove_collisions(self):
         """
@@ -334,26 +222,3 @@ class MachineCollision:
 
         for b in self._machine_boss.boss:
             b.remove_collisions()
-
-    def time_equation(self, t):
-        """
-            Used to create the equation to calculate the intersection time
-
-            :param t: The parameter we are trying to solve for
-            :type t: float
-
-            :return: The equation to solve
-        """
-
-        return (self.FLOAT_AMPLITUDE * math.sin((2 * math.pi * (t + self.float_time_offset)) / self.PERIOD)) - (self.laser_speed * t + self.initial_distance)
-
-    def calculate_time(self):
-        """
-            Calculates the laser and machine intersection time with an initial guess of 1.
-
-            :return: The intersection time
-            :type: list
-        """
-
-        initial_guess = 1
-        return fsolve(self.time_equation, initial_guess)
@@ -0,0 +1,315 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: MachineKinematics.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains the movement logic shared by every machine in Machine Mode.
+    Every machine floats up and down to simulate flying through outer space, and moves side to side once it has been
+        killed enough times. The movement state of every machine (Its x-coordinate, the center and start time of its
+        float effect, its direction and its speed) is kept in NumPy arrays owned by this class. The machines register
+        themselves when they spawn or respawn and unregister when they are removed, so every frame the machines are
+        moved forward together in one step and the sprites are only touched to move them.
+    The float effect is a sine wave of the time since the float effect started. The same wave is used by
+        MachineCollision to predict where the machines will be, so the sprites and the hitboxes never drift apart.
+"""
+
+import numpy as np
+from setup.WindowSetup import scale_factor_X
+from setup.WindowSetup import scale_factor_Y
+from setup.WindowSetup import game_clock
+from setup.ModeSetupMaster import machine_mode_setup
+
+
+class MachineKinematics:
+    """
+        Represents the movement of all machines in Machine Mode.
+
+        Class Variables:
+            FLOAT_AMPLITUDE (float): How far a machine floats above or below the center of its float effect
+            FLOAT_PERIOD (float): The amount of game time it takes to float up and down once
+            MOVE_STEP_TIME (float): The amount of game time it takes to move one step side to side
+            SCREEN_EDGE (float): The x-coordinate where a machine turns around
+
+            TIER_DEATH_COUNTS (numpy.ndarray): The death counts where a machine starts moving faster
+            TIER_MOVES (numpy.ndarray): The distance a machine moves side to side every step for each speed tier (The
+                first tier is 0 because the machine does not move until it has died 4 times)
+
+        Attributes:
+            _machines (list): Every registered machine (Each one is a row in the arrays below)
+            _sprites (list): The sprite of each machine
+            _health_bars (list): The health bar of each machine (None if it does not have one)
+            _health_bar_offset (numpy.ndarray): The distance from each machine to its health bar
+            _x (numpy.ndarray): The x-coordinate of each machine
+            _enemy_center (numpy.ndarray): The y-axis center of the float effect of each machine
+            _float_time_offset (numpy.ndarray): The timestamp when the float effect of each machine began
+            _movement (numpy.ndarray): The direction each machine moves on the x-axis (1 = right and -1 = left)
+            _speed (numpy.ndarray): How fast each machine moves side to side based on its death count (0 if it does
+                not move yet)
+            _moving (numpy.ndarray): 0 while the machine is in its death animation (It only floats), 1 otherwise
+
+            machine_count (int): The number of machines moved in the last step
+    """
+
+    FLOAT_AMPLITUDE = 50 * scale_factor_Y
+    FLOAT_PERIOD = 10
+    MOVE_STEP_TIME = 0.02
+    SCREEN_EDGE = 640 * scale_factor_X
+
+    TIER_DEATH_COUNTS = np.array([4, 7, 10, 13, 16])
+    TIER_MOVES = np.array([0, machine_mode_setup.MACHINE_MOVE_2, machine_mode_setup.MACHINE_MOVE_4,
+                           machine_mode_setup.MACHINE_MOVE_6, machine_mode_setup.MACHINE_MOVE_8,
+                           machine_mode_setup.MACHINE_MOVE_10])
+
+    def __init__(self):
+        """
+            Creates the movement logic for all machines in Machine Mode (With no machines registered yet).
+        """
+
+        self._machines = []
+        self._sprites = []
+        self._health_bars = []
+        self._health_bar_offset = np.zeros(0)
+        self._x = np.zeros(0)
+        self._enemy_center = np.zeros(0)
+        self._float_time_offset = np.zeros(0)
+        self._movement = np.zeros(0, int)
+        self._speed = np.zeros(0)
+        self._moving = np.zeros(0, int)
+
+        self.machine_count = 0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._machines
+        del self._sprites
+        del self._health_bars
+        del self._health_bar_offset
+        del self._x
+        del self._enemy_center
+        del self._float_time_offset
+        del self._movement
+        del self._speed
+        del self._moving
+        del self.machine_count
+
+    def rescale(self, ratio_x, ratio_y):
+        """
+            Rescales the movement and moves every registered machine to the same spot on the new screen when the
+                resolution is changed while the game is running.
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        MachineKinematics.FLOAT_AMPLITUDE = MachineKinematics.FLOAT_AMPLITUDE * ratio_y
+        MachineKinematics.SCREEN_EDGE = MachineKinematics.SCREEN_EDGE * ratio_x
+        MachineKinematics.TIER_MOVES = MachineKinematics.TIER_MOVES * ratio_x
+
+        self._x = self._x * ratio_x
+        self._enemy_center = self._enemy_center * ratio_y
+        self._health_bar_offset = self._health_bar_offset * ratio_y
+        self._speed = self._speed * ratio_x
+
+    def register(self, machine, sprite, health_bar=None, health_bar_offset=0):
+        """
+            Starts moving a machine from where its sprite currently is, and restarts its float effect. Called when the
+                machine spawns, and again when it respawns in a new location after its death animation (The
+                direction, speed and death animation state of a machine that is already registered are kept).
+
+            :param machine: The machine to move
+            :type machine: BlueMachine() or YellowMachine() or RedMachine() or Boss()
+
+            :param sprite: The sprite of the machine
+            :type sprite: CachedTurtle()
+
+            :param health_bar: The health bar of the machine (None if it does not have one)
+            :type health_bar: CachedTurtle()
+
+            :param health_bar_offset: The distance from the machine to its health bar
+            :type health_bar_offset: float
+
+            :return: None
+        """
+
+        if machine not in self._machines:
+            self._machines.append(machine)
+            self._sprites.append(sprite)
+            self._health_bars.append(health_bar)
+            self._health_bar_offset = np.append(self._health_bar_offset, health_bar_offset)
+            self._x = np.append(self._x, 0)
+            self._enemy_center = np.append(self._enemy_center, 0)
+            self._float_time_offset = np.append(self._float_time_offset, 0)
+            self._movement = np.append(self._movement, 1)
+            self._speed = np.append(self._speed, 0)
+            self._moving = np.append(self._moving, 1)
+
+        index = self._machines.index(machine)
+        self._x[index] = sprite.xcor()
+        self._enemy_center[index] = sprite.ycor()
+        self._float_time_offset[index] = game_clock.now
+
+    def unregister(self, machine):
+        """
+            Stops moving a machine (Called when the machine is removed from the screen).
+
+            :param machine: The machine to stop moving
+            :type machine: BlueMachine() or YellowMachine() or RedMachine() or Boss()
+
+            :return: None
+        """
+
+        if machine not in self._machines:
+            return
+
+        index = self._machines.index(machine)
+        self._machines.pop(index)
+        self._sprites.pop(index)
+        self._health_bars.pop(index)
+        self._health_bar_offset = np.delete(self._health_bar_offset, index)
+        self._x = np.delete(self._x, index)
+        self._enemy_center = np.delete(self._enemy_center, index)
+        self._float_time_offset = np.delete(self._float_time_offset, index)
+        self._movement = np.delete(self._movement, index)
+        self._speed = np.delete(self._speed, index)
+        self._moving = np.delete(self._moving, index)
+
+    def set_death_count(self, machine, death_count):
+        """
+            Sets how fast a machine moves side to side from the number of times it has been killed (Called whenever
+                its death count changes).
+
+            :param machine: The machine
+            :type machine: BlueMachine() or YellowMachine() or RedMachine() or Boss()
+
+            :param death_count: The death count of the machine
+            :type death_count: int
+
+            :return: None
+        """
+
+        if machine in self._machines:
+            self._speed[self._machines.index(machine)] = self.get_movement_speed(death_count)
+
+    def set_moving(self, machine, moving):
+        """
+            Stops a machine from moving side to side while it is in its death animation (It keeps floating), or lets
+                it move again once the animation is finished.
+
+            :param machine: The machine
+            :type machine: BlueMachine() or YellowMachine() or RedMachine() or Boss()
+
+            :param moving: 0 when the death animation starts, 1 when it is finished
+            :type moving: int
+
+            :return: None
+        """
+
+        if machine in self._machines:
+            self._moving[self._machines.index(machine)] = moving
+
+    def get_state(self, machines):
+        """
+            Returns the movement state of the given machines (Used by MachineCollision to predict where they will be).
+
+            :param machines: The machines (Every one of them has to be registered)
+            :type machines: list
+
+            :return: The x-coordinate, the center of the float effect, the timestamp when the float effect began, the
+                direction and the side to side speed of each machine
+            :type: tuple
+        """
+
+        rows = np.array([self._machines.index(m) for m in machines], int)
+        return (self._x[rows], self._enemy_center[rows], self._float_time_offset[rows], self._movement[rows],
+                self._speed[rows])
+
+    @classmethod
+    def get_float_offset(cls, float_time):
+        """
+            Finds how far above (positive) or below (negative) the center of its float effect a machine is.
+
+            :param float_time: The game time since the float effect of the machine started
+            :type float_time: float or numpy.ndarray
+
+            :return: The distance from the center of the float effect
+            :type: float or numpy.ndarray
+        """
+
+        return cls.FLOAT_AMPLITUDE * np.sin((2 * np.pi * float_time) / cls.FLOAT_PERIOD)
+
+    @classmethod
+    def get_movement_speed(cls, death_count):
+        """
+            Finds how fast each machine moves side to side (Units per second) based on how many times it has been
+                killed.
+
+            :param death_count: The death count of each machine
+            :type death_count: int or numpy.ndarray
+
+            :return: The movement speed of each machine (0 if it does not move yet)
+            :type: float or numpy.ndarray
+        """
+
+        return cls.TIER_MOVES[np.searchsorted(cls.TIER_DEATH_COUNTS, death_count, side="right")] / cls.MOVE_STEP_TIME
+
+    def step(self, death, dt):
+        """
+            Moves every registered machine forward by the game time that passed this frame.
+
+            :param death: Determines whether the death animation for the player is active or not (The machines only
+                move side to side when it is not)
+            :type death: int
+
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
+            :return: None
+        """
+
+        self.machine_count = len(self._machines)
+        if dt <= 0 or not self._machines:
+            return
+
+        # Float effect:
+        # Found straight from the time since the float effect started
+        y = self._enemy_center + self.get_float_offset(game_clock.now - self._float_time_offset)
+
+        # Side to side movement:
+        # Only machines that have died enough times and are not in their death animation move
+        if death == 0:
+            moving = (self._moving == 1) & (self._speed != 0)
+            self._movement = np.where(moving & (self._x > self.SCREEN_EDGE), -1, self._movement)
+            self._movement = np.where(moving & (self._x < -self.SCREEN_EDGE), 1, self._movement)
+            self._x = np.where(moving, self._x + self._movement * self._speed * dt, self._x)
+
+        # Move the sprites to their new positions
+        health_bar_y = y + self._health_bar_offset
+        for i, sprite in enumerate(self._sprites):
+            sprite.goto(float(self._x[i]), float(y[i]))
+            if self._health_bars[i] is not None:
+                self._health_bars[i].goto(float(self._x[i]), float(health_bar_y[i]))
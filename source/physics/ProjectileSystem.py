@@ -0,0 +1,445 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: ProjectileSystem.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains the logic for the lasers fired by the enemies (The machines in Machine Mode and the UFO in Alien
+        Mode).
+    The position, visibility and state of every enemy laser are kept in NumPy arrays. Every frame, all the lasers are
+        moved forward together in one step, and only the sprites that actually moved or changed visibility are updated.
+    The lasers are then checked against the player with one query: the lasers are kept sorted by their x-coordinate,
+        so only the lasers in the columns around the player are checked. Every laser that hit the player is reported
+        in "hits", which the player killer then uses to kill or hit the player. The lasers that hit the player only
+        disappear once the player killer has consumed the hits (So the lasers pass through the player during its
+        death animation and hit delay, like before).
+    The values that come from the type of each laser (Ex: its speed) are gathered into arrays once, when the lasers on
+        the screen change, and are reused every frame after that.
+"""
+
+import numpy as np
+from setup.WindowSetup import scale_factor
+from setup.WindowSetup import scale_factor_X
+from setup.WindowSetup import scale_factor_Y
+from setup.WindowSetup import sound_bank
+
+
+class ProjectileSystem:
+    """
+        Represents every laser fired by the enemies.
+
+        Class Variables:
+            LASER_TYPES (dict): The behaviour of each type of enemy laser (Before scaling):
+                speed: The distance the laser moves down every step_time seconds
+                step_time: The amount of game time it takes to move the laser down by speed
+                reload_y: The y-coordinate where the laser is fired again
+                hide_y: The y-coordinate where the laser disappears
+                hit_radius: The distance from the player that the laser has to be within to hit them
+                hit_width: The x-axis distance from the player that the laser has to be within to hit them
+                pierces: 1 if the laser keeps going after it hits the player (0 if it disappears)
+
+        Pointers:
+            _blue_machine (SpawnBlueMachine()): A pointer to the blue machine object
+            _yellow_machine (SpawnYellowMachine()): A pointer to the yellow machine object
+            _red_machine (SpawnRedMachine()): A pointer to the red machine object
+            _machine_boss (SpawnMachineBoss()): A pointer to the machine boss object
+            _ufo (SpawnUFO()): A pointer to the UFO object
+
+        Attributes:
+            _owners (list): The enemy that fired each laser
+            _sprites (list): The sprite of each laser
+            _types (list): The type of each laser (A key of LASER_TYPES)
+            _x (numpy.ndarray): The x-coordinate of each laser
+            _y (numpy.ndarray): The y-coordinate of each laser
+            _visible (numpy.ndarray): 1 if the laser is shown on the screen
+            _attacked (numpy.ndarray): 1 if the laser has hit the player since it was last fired
+            _order (numpy.ndarray): The index of every laser sorted by x-coordinate (None when it needs to be sorted
+                again)
+            _speed (numpy.ndarray): The scaled distance each laser moves down every step_time seconds
+            _step_time (numpy.ndarray): The step_time of each laser
+            _reload_y (numpy.ndarray): The scaled y-coordinate where each laser is fired again
+            _hide_y (numpy.ndarray): The scaled y-coordinate where each laser disappears
+            _hit_radius (numpy.ndarray): The scaled hit_radius of each laser
+            _hit_width (numpy.ndarray): The scaled hit_width of each laser
+            _pierces (numpy.ndarray): 1 if the laser keeps going after it hits the player
+            _bosses (numpy.ndarray): The index of every boss laser (Their speed is read from the boss every step)
+            _reach (float): The largest distance along the x-axis that any laser can hit the player from
+            _hit_indices (numpy.ndarray): The index of every laser that hit the player during the last call to
+                check_player()
+
+            hits (list): The enemies whose lasers hit the player during the last call to check_player()
+            projectile_count (int): The number of lasers moved in the last step
+    """
+
+    LASER_TYPES = {
+        "blue": {"speed": 4.8, "step_time": 0.015, "reload_y": -360, "hide_y": -360,
+                 "hit_radius": 125, "hit_width": 30, "pierces": 0},
+        "yellow": {"speed": 8.7, "step_time": 0.015, "reload_y": -360, "hide_y": -360,
+                   "hit_radius": 125, "hit_width": 30, "pierces": 0},
+        "red": {"speed": 11, "step_time": 0.015, "reload_y": -360, "hide_y": -360,
+                "hit_radius": 125, "hit_width": 30, "pierces": 0},
+        # The boss laser speed depends on the bosses health (Boss.get_laser_speed())
+        "boss": {"speed": 9.5, "step_time": 0.015, "reload_y": -360, "hide_y": -360,
+                 "hit_radius": 125, "hit_width": 30, "pierces": 0},
+        "ufo": {"speed": 3.2, "step_time": 0.0075, "reload_y": -600, "hide_y": -170,
+                "hit_radius": 25, "hit_width": 25, "pierces": 1},
+    }
+
+    def __init__(self, blue_machine, yellow_machine, red_machine, machine_boss, ufo):
+        """
+            Creates the enemy laser system.
+
+            :param blue_machine: A pointer to the blue machine object
+            :type blue_machine: SpawnBlueMachine()
+
+            :param yellow_machine: A pointer to the yellow machine object
+            :type yellow_machine: SpawnYellowMachine()
+
+            :param red_machine: A pointer to the red machine object
+            :type red_machine: SpawnRedMachine()
+
+            :param machine_boss: A pointer to the machine boss object
+            :type machine_boss: SpawnMachineBoss()
+
+            :param ufo: A pointer to the UFO object
+            :type ufo: SpawnUFO()
+        """
+
+        self._blue_machine = blue_machine
+        self._yellow_machine = yellow_machine
+        self._red_machine = red_machine
+        self._machine_boss = machine_boss
+        self._ufo = ufo
+
+        self._owners = []
+        self._sprites = []
+        self._types = []
+        self._x = np.zeros(0)
+        self._y = np.zeros(0)
+        self._visible = np.zeros(0, int)
+        self._attacked = np.zeros(0, int)
+        self._order = None
+        self._speed = np.zeros(0)
+        self._step_time = np.zeros(0)
+        self._reload_y = np.zeros(0)
+        self._hide_y = np.zeros(0)
+        self._hit_radius = np.zeros(0)
+        self._hit_width = np.zeros(0)
+        self._pierces = np.zeros(0, int)
+        self._bosses = np.zeros(0, int)
+        self._reach = self.get_reach()
+        self._hit_indices = np.zeros(0, int)
+
+        self.hits = []
+        self.projectile_count = 0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._blue_machine
+        del self._yellow_machine
+        del self._red_machine
+        del self._machine_boss
+        del self._ufo
+        del self._owners
+        del self._sprites
+        del self._types
+        del self._x
+        del self._y
+        del self._visible
+        del self._attacked
+        del self._order
+        del self._speed
+        del self._step_time
+        del self._reload_y
+        del self._hide_y
+        del self._hit_radius
+        del self._hit_width
+        del self._pierces
+        del self._bosses
+        del self._reach
+        del self._hit_indices
+        del self.hits
+        del self.projectile_count
+
+    def rescale(self, ratio_x, ratio_y):
+        """
+            Recalculates the scaled values of every laser when the resolution is changed while the game is running
+                (Called after the scale factors are updated).
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        self._reach = self.get_reach()
+        self.scale_type_values()
+        # The sprites are moved to the same spot on the new screen, so move the stored coordinates with them
+        self._x = self._x * ratio_x
+        self._y = self._y * ratio_y
+
+    def get_reach(self):
+        """
+            Finds the largest distance along the x-axis that any laser can hit the player from.
+
+            :return: The scaled distance
+            :type: float
+        """
+
+        return max(max(t["hit_radius"] * scale_factor, t["hit_width"] * scale_factor_X)
+                   for t in self.LASER_TYPES.values())
+
+    def get_lasers(self, mode):
+        """
+            Gathers the laser of every enemy on the screen in the given game mode.
+
+            :param mode: The current game mode ("Machine_Mode" or "Alien_Mode")
+            :type mode: string
+
+            :return: The enemy, its laser sprite and the type of laser for every enemy on the screen
+            :type: list
+        """
+
+        lasers = []
+        if mode == "Machine_Mode":
+            for bm in self._blue_machine.blue_machines:
+                lasers.append((bm, bm.blue_machine_laser, "blue"))
+            for ym in self._yellow_machine.yellow_machines:
+                lasers.append((ym, ym.yellow_machine_laser, "yellow"))
+            for rm in self._red_machine.red_machines:
+                lasers.append((rm, rm.red_machine_laser, "red"))
+            for b in self._machine_boss.boss:
+                lasers.append((b, b.boss_laser, "boss"))
+        elif mode == "Alien_Mode":
+            for u in self._ufo.ufos:
+                lasers.append((u, u.ufo_laser, "ufo"))
+        return lasers
+
+    def get_type_values(self, name):
+        """
+            Gathers one value from the type of every laser (Only called when the lasers on the screen change).
+
+            :param name: The name of the value (Ex: "speed")
+            :type name: string
+
+            :return: The value for every laser
+            :type: numpy.ndarray
+        """
+
+        return np.fromiter((self.LASER_TYPES[t][name] for t in self._types), float, len(self._types))
+
+    def scale_type_values(self):
+        """
+            Gathers the scaled values from the type of every laser (Only called when the lasers on the screen or the
+                scale factors change).
+
+            :return: None
+        """
+
+        self._speed = self.get_type_values("speed") * scale_factor_Y
+        self._step_time = self.get_type_values("step_time")
+        self._reload_y = self.get_type_values("reload_y") * scale_factor_Y
+        self._hide_y = self.get_type_values("hide_y") * scale_factor_Y
+        self._hit_radius = self.get_type_values("hit_radius") * scale_factor
+        self._hit_width = self.get_type_values("hit_width") * scale_factor_X
+        self._pierces = self.get_type_values("pierces").astype(int)
+        self._bosses = np.array([i for i, laser_type in enumerate(self._types) if laser_type == "boss"], int)
+
+    def sync(self, lasers):
+        """
+            Matches the arrays to the lasers currently on the screen. Lasers of enemies that were just spawned, and
+                lasers that were moved from outside this class (Ex: when an enemy is respawned), are read from their
+                sprites.
+
+            :param lasers: The enemy, its laser sprite and the type of laser for every enemy on the screen
+            :type lasers: list
+
+            :return: None
+        """
+
+        owners = [owner for owner, _, _ in lasers]
+        if owners != self._owners:
+            previous = {id(owner): i for i, owner in enumerate(self._owners)}
+            count = len(lasers)
+            x = np.zeros(count)
+            y = np.zeros(count)
+            visible = np.zeros(count, int)
+            attacked = np.zeros(count, int)
+            for i, (owner, sprite, _) in enumerate(lasers):
+                j = previous.get(id(owner))
+                if j is not None:
+                    x[i], y[i], visible[i], attacked[i] = self._x[j], self._y[j], self._visible[j], self._attacked[j]
+                else:
+                    x[i], y[i], visible[i] = sprite.xcor(), sprite.ycor(), int(sprite.isvisible())
+            self._owners = owners
+            self._sprites = [sprite for _, sprite, _ in lasers]
+            self._types = [laser_type for _, _, laser_type in lasers]
+            self._x, self._y, self._visible, self._attacked = x, y, visible, attacked
+            self._order = None
+            self.scale_type_values()
+
+        for i, sprite in enumerate(self._sprites):
+            if sprite.xcor() != self._x[i] or sprite.ycor() != self._y[i] or \
+                    int(sprite.isvisible()) != self._visible[i]:
+                self._x[i], self._y[i] = sprite.xcor(), sprite.ycor()
+                self._visible[i] = int(sprite.isvisible())
+                self._attacked[i] = 0
+                self._order = None
+
+    def get_states(self, green_power_up):
+        """
+            Finds what every laser should do this frame.
+
+            :param green_power_up: Determines if the green power up is active (The machines do not fire while it is)
+            :type green_power_up: int
+
+            :return: For every laser: 0 if it is held below its enemy and hidden, 1 if it is moving and fired again
+                once it reaches the bottom, or 2 if it is moving and not fired again (The UFO during its death
+                animation)
+            :type: numpy.ndarray
+        """
+
+        states = np.zeros(len(self._owners), int)
+        for i, (owner, laser_type) in enumerate(zip(self._owners, self._types)):
+            if laser_type == "ufo":
+                if owner.death_animation != 0:
+                    states[i] = 2
+                elif owner.ufo.isvisible():
+                    states[i] = 1
+            elif green_power_up == 0:
+                states[i] = 1
+        return states
+
+    def step(self, mode, green_power_up, shooting_sound, dt):
+        """
+            Moves every enemy laser on the screen forward by the game time that passed this frame, and fires the
+                lasers that reached the bottom of the screen again.
+
+            :param mode: The current game mode ("Machine_Mode" or "Alien_Mode")
+            :type mode: string
+
+            :param green_power_up: Determines if the green power up is active (The machines do not fire while it is)
+            :type green_power_up: int
+
+            :param shooting_sound: Determines whether the toggle for the enemy lasers shooting sound is on. If it is,
+                the shooting sound will play when an enemy laser is fired.
+            :type shooting_sound: int
+
+            :param dt: The amount of game time that passed this frame (From the game clock)
+            :type dt: float
+
+            :return: None
+        """
+
+        self.sync(self.get_lasers(mode))
+        self.projectile_count = len(self._owners)
+        if not self._owners:
+            return
+
+        states = self.get_states(green_power_up)
+        speeds = self._speed
+        if len(self._bosses) != 0:
+            speeds = speeds.copy()
+            for i in self._bosses:
+                speeds[i] = self._owners[i].get_laser_speed() * scale_factor_Y
+        x = self._x.copy()
+        y = self._y.copy()
+
+        # Move the lasers that are still on the screen down
+        moving = (states != 0) & (y > self._reload_y)
+        y = np.where(moving, y - speeds * (dt / self._step_time), y)
+
+        # Lasers that reached the bottom are fired again, and held lasers are kept below their enemy
+        fired = (states == 1) & ~moving
+        respawned = fired | (states == 0)
+        for i in np.flatnonzero(respawned):
+            x[i], y[i] = self._owners[i].get_laser_spawn()
+        self._attacked[respawned] = 0
+        if shooting_sound == 1:
+            for _ in np.flatnonzero(fired):
+                sound_bank.play("enemy_laser")
+
+        visible = ((states != 0) & (self._attacked == 0) & (y >= self._hide_y)).astype(int)
+
+        # Only the sprites that changed are updated
+        for i in np.flatnonzero((x != self._x) | (y != self._y)):
+            self._sprites[i].goto(float(x[i]), float(y[i]))
+        for i in np.flatnonzero(visible != self._visible):
+            if visible[i] == 1:
+                self._sprites[i].showturtle()
+            else:
+                self._sprites[i].hideturtle()
+
+        if respawned.any():
+            self._order = None
+        self._x, self._y, self._visible = x, y, visible
+
+    def check_player(self, player):
+        """
+            Finds every enemy laser that has hit the player. The results are stored in "hits". The lasers are not
+                used up until consume_hits() is called.
+
+            :param player: The player sprite
+            :type player: turtle.Turtle()
+
+            :return: None
+        """
+
+        self.hits = []
+        self._hit_indices = np.zeros(0, int)
+        if not self._owners:
+            return
+
+        # Broadphase: only the lasers in the columns around the player are checked
+        if self._order is None:
+            self._order = np.argsort(self._x, kind="stable")
+        player_x = player.xcor()
+        player_y = player.ycor()
+        sorted_x = self._x[self._order]
+        start = np.searchsorted(sorted_x, player_x - self._reach, side="left")
+        end = np.searchsorted(sorted_x, player_x + self._reach, side="right")
+        candidates = self._order[start:end]
+        if len(candidates) == 0:
+            return
+
+        dx = self._x[candidates] - player_x
+        dy = self._y[candidates] - player_y
+        hit = (self._visible[candidates] == 1) & (np.hypot(dx, dy) < self._hit_radius[candidates]) & \
+            (np.abs(dx) < self._hit_width[candidates])
+
+        self._hit_indices = candidates[hit]
+        self.hits = [self._owners[i] for i in self._hit_indices]
+
+    def consume_hits(self):
+        """
+            Uses up the lasers found by the last call to check_player(). Lasers that do not pierce disappear on the next
+                step. This is only called while the player can be killed or hit, so the lasers pass through the player
+                during its death animation and hit delay.
+
+            :return: None
+        """
+
+        consumed = self._hit_indices[self._pierces[self._hit_indices] == 0]
+        self._attacked[consumed] = 1
@@ -0,0 +1,46 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: BackendSetup.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file selects the graphics backend for the game. It must be imported before anything imports turtle.
+    Headless mode is turned on by setting the LASER_FIGHTER_HEADLESS environment variable to 1, or by starting the
+        game with the --headless flag. In headless mode, the turtle module is replaced with utils/HeadlessBackend.py,
+        so no window is opened and Tk, Win32 and PyGame are never used.
+    Headless mode starts in the default window, unless the LASER_FIGHTER_SCREEN_SIZE environment variable is set to a
+        monitor size (Ex: 1920x1080). The game then starts in fullscreen mode at that size.
+"""
+
+import os
+import sys
+import time
+
+# The time the game was launched (Used to measure the time to the first frame)
+LAUNCH_TIME = time.perf_counter()
+
+HEADLESS = os.environ.get("LASER_FIGHTER_HEADLESS", "0") not in ("", "0") or "--headless" in sys.argv
+
+# The monitor size used in headless mode (None for the default window)
+HEADLESS_SCREEN_SIZE = None
+if HEADLESS and os.environ.get("LASER_FIGHTER_SCREEN_SIZE", ""):
+    HEADLESS_SCREEN_SIZE = tuple(int(size) for size in os.environ["LASER_FIGHTER_SCREEN_SIZE"].lower().split("x"))
+
+if HEADLESS:
+    from utils import HeadlessBackend
+    # Every "import turtle" from here on will receive the headless backend
+    sys.modules["turtle"] = HeadlessBackend
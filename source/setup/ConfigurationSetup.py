@@ -21,8 +21,10 @@
     This file initializes the containers for the current configuration settings and user progress in Laser Fighter.
 """
 
-import subprocess
-import os
+import atexit
+from utils.ConfigBackup import ConfigBackup
+from utils.ConfigManager import ConfigManager
+from utils.PlayerDataManager import PlayerDataManager
 from utils.Refresh import Refresh
 from utils.UpdateSettingsData import Settings
 from utils.UpdateControls import ControlsConfig
@@ -30,6 +32,11 @@ from utils.UpdateMilestones import MilestoneConfig
 from utils.UpdateStatsData import Stats
 from utils.UpdateShopData import ShopConfig
 
+# The parsers for the config and player data files (Shared by every container below)
+# Changes are held in memory and written to the disk in batches by the game loop
+config_manager = ConfigManager()
+player_data_manager = PlayerDataManager()
+
 # Initialize the refresh variables
 refresh_variables = Refresh()
 
@@ -48,17 +55,13 @@ statistics = Stats(settings.god_mode)
 # Current Shop Configuration
 shop_config = ShopConfig()
 
-# Backup the player data and config files on launch through a batch file (Made so that the user can run the
-#   script whenever they want
-# For Windows
-if os.name == 'nt':
-    batch_file_path = './config/bckp.bat'
-    target_directory = os.path.abspath('./config')
-    absolute_batch_file_path = os.path.abspath(batch_file_path)
-    subprocess.run([absolute_batch_file_path], cwd=target_directory)
-# For Linux
-elif os.name == 'posix':
-    shell_script_path = './config/bckp.sh'
-    target_directory = os.path.abspath('./config')
-    absolute_shell_script_path = os.path.abspath(shell_script_path)
-    subprocess.run(['bash', absolute_shell_script_path], cwd=target_directory)
+# Backup the player data and config files on launch (on a background thread so the game does not wait for it)
+# The number of backups kept for each file can be changed with "retention" under [Backup] in config.ini
+config_backup = ConfigBackup('config', config_manager.getint("Backup", "retention") or ConfigBackup.RETENTION)
+config_backup.start()
+
+# Write any unsaved changes to the disk when the program terminates (After the backup has finished, so that the backup
+#   is of the files from before the game was launched)
+atexit.register(config_manager.flush)
+atexit.register(player_data_manager.flush)
+atexit.register(config_backup.wait)
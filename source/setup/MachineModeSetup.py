@@ -23,7 +23,6 @@
 """
 
 from setup.WindowSetup import scale_factor_X
-from setup.WindowSetup import scale_factor_Y
 from setup.TextureSetup import MACHINE_PLAYER_TEXTURE
 from setup.TextureSetup import MACHINE_PLAYER_LASER_TEXTURE
 from setup.TextureSetup import MACHINE_WASHER_TEXTURE
@@ -43,7 +42,6 @@ class MachineModeSetup:
         Class Variables:
             MACHINE_MOVE_(Num) (float): Stores the speed at which the machine will move side to side depending on how
                 many times it has been killed.
-            MACHINE_FLOAT (float): Stores the speed at which the machine will float up and down.
 
         Pointers:
             _shop_config (ShopConfig()): A pointer to the Shop Configuration.
@@ -84,8 +82,6 @@ class MachineModeSetup:
     MACHINE_MOVE_8 = 8 * scale_factor_X
     MACHINE_MOVE_10 = 10 * scale_factor_X
 
-    MACHINE_FLOAT = 0.15 * scale_factor_Y
-
     # Set the instance to "None" at the beginning
     _instance = None
 
@@ -175,6 +171,28 @@ class MachineModeSetup:
         del self.power_up_spawn_rate
         del self.health
 
+    def rescale(self, ratio_x, ratio_y):
+        """
+            Rescales the machine movements and recalculates the shop dependent values (Ex: laser speeds) when the
+                resolution is changed while the game is running (Called after the scale factors are updated).
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        MachineModeSetup.MACHINE_MOVE_2 = MachineModeSetup.MACHINE_MOVE_2 * ratio_x
+        MachineModeSetup.MACHINE_MOVE_4 = MachineModeSetup.MACHINE_MOVE_4 * ratio_x
+        MachineModeSetup.MACHINE_MOVE_6 = MachineModeSetup.MACHINE_MOVE_6 * ratio_x
+        MachineModeSetup.MACHINE_MOVE_8 = MachineModeSetup.MACHINE_MOVE_8 * ratio_x
+        MachineModeSetup.MACHINE_MOVE_10 = MachineModeSetup.MACHINE_MOVE_10 * ratio_x
+
+        self.setup_machine_mode()
+
     def setup_machine_mode(self):
         """
             Sets up the Machine Mode variables.
@@ -48,6 +48,9 @@ class PowerUpSetup:
             silver_coin_value (int): The default value of the silver coin
             gold_coin_value (int): The default value of the gold coin
             platinum_coin_value (int): The default value of the platinum coin
+
+            coin_values (dict): The value of each type of coin, with (1) and without (0) the blue power up
+                (Ex: coin_values[("gold", 1)])
     """
 
     # Set the instance to "None" at the beginning
@@ -98,6 +101,8 @@ class PowerUpSetup:
         self.gold_coin_blue_value = 10
         self.platinum_coin_blue_value = 25
 
+        self.coin_values = {}
+
         # Run the setup
         self.setup_power_ups()
 
@@ -125,6 +130,7 @@ class PowerUpSetup:
         del self.silver_coin_blue_value
         del self.gold_coin_blue_value
         del self.platinum_coin_blue_value
+        del self.coin_values
 
     def setup_power_ups(self):
         # Setup the yellow power up based on its level
@@ -200,3 +206,11 @@ class PowerUpSetup:
         self.silver_coin_blue_value = self.silver_coin_value * self.blue_power_up_coin_multiplier
         self.gold_coin_blue_value = self.gold_coin_value * self.blue_power_up_coin_multiplier
         self.platinum_coin_blue_value = self.platinum_coin_value * self.blue_power_up_coin_multiplier
+
+        # Lookup table for the coin values, so that picking up a coin does not need to check its type
+        self.coin_values = {
+            ("copper", 0): self.copper_coin_value, ("copper", 1): self.copper_coin_blue_value,
+            ("silver", 0): self.silver_coin_value, ("silver", 1): self.silver_coin_blue_value,
+            ("gold", 0): self.gold_coin_value, ("gold", 1): self.gold_coin_blue_value,
+            ("platinum", 0): self.platinum_coin_value, ("platinum", 1): self.platinum_coin_blue_value
+        }
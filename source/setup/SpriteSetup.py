@@ -49,6 +49,7 @@ from components.spawn.SpawnAlien import SpawnMediumAlien
 from components.spawn.SpawnAlien import SpawnLargeAlien
 from components.spawn.SpawnAlien import SpawnUFO
 from components.ItemGadget import Gadget
+from physics.MachineKinematics import MachineKinematics
 
 
 # Stores Button Objects
@@ -99,17 +100,20 @@ machine_player = SpawnMachinePlayer(scale_factor_X, scale_factor_Y)
 # Stores the Human Player
 human_player = SpawnHumanPlayer(scale_factor_X, scale_factor_Y)
 
+# Machine Movement (Float effect and side to side movement of every machine)
+machine_kinematics = MachineKinematics()
+
 # Stores the Blue Machines
-blue_machine = SpawnBlueMachine(scale_factor_X, scale_factor_Y)
+blue_machine = SpawnBlueMachine(machine_kinematics, scale_factor_X, scale_factor_Y)
 
 # Stores the Yellow Machines
-yellow_machine = SpawnYellowMachine(scale_factor_X, scale_factor_Y)
+yellow_machine = SpawnYellowMachine(machine_kinematics, scale_factor_X, scale_factor_Y)
 
 # Stores the Red Machines
-red_machine = SpawnRedMachine(scale_factor_X, scale_factor_Y)
+red_machine = SpawnRedMachine(machine_kinematics, scale_factor_X, scale_factor_Y)
 
 # Stores the Machine Boss
-machine_boss = SpawnMachineBoss(scale_factor_X, scale_factor_Y)
+machine_boss = SpawnMachineBoss(machine_kinematics, scale_factor_X, scale_factor_Y)
 
 # Stores the Small Aliens
 small_alien = SpawnSmallAlien(scale_factor_X, scale_factor_Y)
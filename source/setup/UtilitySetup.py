@@ -22,6 +22,8 @@
 """
 
 from setup.WindowSetup import window
+from setup.WindowSetup import game_clock
+from setup.TextureSetup import texture_registry
 from setup.SpriteSetup import button
 from setup.SpriteSetup import textbox
 from setup.SpriteSetup import panel
@@ -31,23 +33,33 @@ from setup.SpriteSetup import blue_power_up_indicator
 from setup.SpriteSetup import extra_power_up_indicator
 from setup.SpriteSetup import machine_player
 from setup.SpriteSetup import human_player
+from setup.SpriteSetup import machine_kinematics
 from setup.ModeSetupMaster import power_up_setup
 from setup.ModeSetupMaster import machine_mode_setup
 from setup.ModeSetupMaster import alien_mode_setup
+from physics.CollisionMaster import machine_collision
+from physics.CollisionMaster import alien_collision
+from physics.CollisionMaster import projectile_system
 from setup.ConfigurationSetup import shop_config
 from setup.ConfigurationSetup import settings
 from setup.ConfigurationSetup import controls_toggle
 from setup.ConfigurationSetup import statistics
 from setup.ConfigurationSetup import refresh_variables
+from setup.WindowSetup import fullscreen
+from setup.WindowSetup import scale_factor
 from setup.WindowSetup import scale_factor_X
 from setup.WindowSetup import scale_factor_Y
 from utils.ScreenManager import ScreenUpdate
 from utils.MovementManager import Movement
 from utils.HoverManager import Hover
+from utils.ClickManager import Click
 from utils.ShopManager import Shop
 from utils.SettingsManager import SettingsToggle
+from utils.DisplayManager import DisplayManager
 from utils.ControlsManager import Controls
 from utils.UpdateText import TextRefresh
+from utils.FrameProfiler import FrameProfiler
+from utils.InputRecorder import InputRecorder
 
 # Screen Updater
 screen = ScreenUpdate(window, button, settings, shop_config, refresh_variables,
@@ -59,6 +71,9 @@ movement = Movement(screen, machine_player, human_player,
                     yellow_power_up_indicator, settings, statistics,
                     scale_factor_Y)
 
+# Input Recorder (Off unless a recording or a replay is started)
+input_recorder = InputRecorder(game_clock)
+
 # Hover Detection
 hover = Hover(screen, button)
 
@@ -68,15 +83,27 @@ shop = Shop(window, screen, button,
             settings, refresh_variables, shop_config,
             scale_factor_X, scale_factor_Y)
 
+# Display Manager (Switches fullscreen on and off while the game is running)
+display_manager = DisplayManager(window, texture_registry, screen,
+                                 machine_mode_setup, alien_mode_setup, machine_kinematics,
+                                 machine_collision, alien_collision, projectile_system,
+                                 human_player, fullscreen, scale_factor,
+                                 scale_factor_X, scale_factor_Y)
+
 # Settings Updater
 settings_toggle = SettingsToggle(window, screen, button,
-                                 settings, refresh_variables, scale_factor_X,
-                                 scale_factor_Y)
+                                 settings, refresh_variables, display_manager,
+                                 input_recorder, scale_factor_X, scale_factor_Y)
 
 # Keybind Updater
 controls = Controls(window, screen, settings,
-                    controls_toggle, refresh_variables, scale_factor_X,
-                    scale_factor_Y)
+                    controls_toggle, refresh_variables, input_recorder,
+                    scale_factor_X, scale_factor_Y)
+
+# Click Detection
+click = Click(screen, button, hover, shop,
+              settings_toggle, controls, scale_factor_X,
+              scale_factor_Y)
 
 # Text Refresher
 text_refresh = TextRefresh(screen, button, panel,
@@ -86,13 +113,18 @@ text_refresh = TextRefresh(screen, button, panel,
                            shop_config, controls, controls_toggle,
                            refresh_variables)
 
+# Frame time profiler for the game loop (Off unless requested)
+frame_profiler = FrameProfiler()
+
 # Sets the keybinds for the turtle graphics window:
-# Bind the current keybinds to their appropriate functions
+# Bind the current keybinds to their appropriate functions (Through the input recorder, so they can be recorded)
 window.listen()
-window.onkeypress(movement.go_left, controls_toggle.go_left_key)
-window.onkeypress(movement.go_right, controls_toggle.go_right_key)
-window.onkeypress(movement.shoot, controls_toggle.shoot_key)
-window.onkeypress(movement.jump, controls_toggle.jump_key)
+window.onkeypress(input_recorder.bind("Go_Left", movement.go_left), controls_toggle.go_left_key)
+window.onkeypress(input_recorder.bind("Go_Right", movement.go_right), controls_toggle.go_right_key)
+window.onkeypress(input_recorder.bind("Shoot", movement.shoot), controls_toggle.shoot_key)
+window.onkeypress(input_recorder.bind("Jump", movement.jump), controls_toggle.jump_key)
+# Clicks on every screen go through the one click handler, which finds the button that was clicked
+window.onscreenclick(input_recorder.bind("Click", click.click))
 
 # Detect when the user wants to close the window and terminate the game loop.
 # "WM_DELETE_WINDOW" is the parameter used to determine if the user has clicked the red x in the corner of the window
@@ -101,4 +133,5 @@ window._root.protocol("WM_DELETE_WINDOW", screen.on_quit)
 
 # The two lines of code below are used to collect the position of the users cursor on the canvas
 mouse_position = window.getcanvas()
-mouse_position.bind('<Motion>', hover.hover)
+move_cursor = input_recorder.bind("Motion", hover.move_cursor)
+mouse_position.bind('<Motion>', lambda event: move_cursor(event.x, event.y))
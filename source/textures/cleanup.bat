@@ -14,7 +14,9 @@
 :: along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 rem Clean Up File:
-rem Purpose: Clean up all of the duplicate scaled texture files from the texture folder.
+rem Purpose: Prune the scaled texture cache in the texture folder.
+rem By default, only cached textures that are no longer used are removed.
+rem Pass --all to remove the whole cache and every scaled texture file.
 
 @echo off
 setlocal
@@ -34,16 +36,9 @@ for %%x in ("%~dp0.") do (
     )
 )
 
-rem Create Deletion Log File
-set "logfile=deletion_log.txt"
-echo Deletion Log - %date% %time% > "%logfile%"
-
-rem Loop through the current directory and all subdirectories
-for /r %%i in (*_Scaled*) do (
-    echo Deleting: %%i
-    echo %%i >> "%logfile%"
-    del "%%i"
-)
+rem Prune the cache from the source folder (The deletion log is written to textures\deletion_log.txt)
+cd ..
+python -m utils.TextureCache prune %*
 
 endlocal
 pause
\ No newline at end of file
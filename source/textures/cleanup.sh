@@ -1,6 +1,8 @@
 #!/bin/bash
 
-# cleanup.sh: Clean up all of the duplicate scaled texture files from the texture folder.
+# cleanup.sh: Prune the scaled texture cache in the texture folder.
+# By default, only cached textures that are no longer used are removed.
+# Pass --all to remove the whole cache and every scaled texture file.
 # This is a port of cleanup.bat to Bash.
 #
 # Copyright (C) [2024] [Christian Marinkovich]
@@ -35,16 +37,15 @@ if [ ! -r . ] || [ ! -w . ]; then
     echo "cleanup.sh: FATAL: no permission to read and/or write to textures dir"
 fi
 
-# Create deletion log file.
-logfile="deletion_log.txt"
-echo "Deletion Log - $(date +"%Y-%m-%d %H:%M:%S")" > $logfile
-
-# Find all scaled textures and erase them.
-find -type f -iname "*_Scaled*" | while read -r line; do
-    echo "Deleting: ${line}"
-    echo $line >> $logfile
-    rm $line
-done
-
-exit 0
+# Prune the cache from the source folder (The deletion log is written to textures/deletion_log.txt)
+cd ..
+if command -v python3 > /dev/null 2>&1; then
+    python3 -m utils.TextureCache prune "$@"
+elif command -v python > /dev/null 2>&1; then
+    python -m utils.TextureCache prune "$@"
+else
+    echo "cleanup.sh: FATAL: python is required to prune the texture cache"
+    exit 1
+fi
 
+exit $?
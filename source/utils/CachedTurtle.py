@@ -0,0 +1,185 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+    File: CachedTurtle.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        A turtle sprite that remembers the last shape, colour and visibility that were set on it, and skips any write
+            that would not change them. Most animations set the same texture or visibility every frame, and every one
+            of those writes would otherwise be sent to the Tk canvas.
+
+        The number of skipped writes is counted so that it can be shown in the frame profiler.
+"""
+
+import turtle
+
+
+class CachedTurtle(turtle.Turtle):
+    """
+        Represents a turtle sprite that skips writes that would not change it.
+
+        Class Variables:
+            suppressed_writes (int): The number of writes skipped by every sprite since take_suppressed_writes() was
+                last called
+
+        Attributes:
+            _applied_shape (string): The last shape set on the sprite (None if it has not been set yet)
+            _applied_color (tuple): The last colours set on the sprite with color() (None if they have not been set
+                yet, or if they were changed with pencolor() or fillcolor())
+            _applied_visible (bool): Determines if the sprite was last shown or hidden (None if it has not been set
+                yet)
+    """
+
+    suppressed_writes = 0
+
+    def __init__(self, *args, **kwargs):
+        """
+            Creates the sprite. Takes the same arguments as turtle.Turtle().
+        """
+
+        self._applied_shape = None
+        self._applied_color = None
+        self._applied_visible = None
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def take_suppressed_writes(cls):
+        """
+            Returns the number of writes skipped since the last call, and starts counting again from 0.
+
+            :return: The number of skipped writes
+            :type: int
+        """
+
+        suppressed_writes = cls.suppressed_writes
+        cls.suppressed_writes = 0
+        return suppressed_writes
+
+    def shape(self, name=None):
+        """
+            Sets the shape of the sprite if it is different from the last one, or returns the current shape.
+
+            :param name: The name of the shape
+            :type name: string
+
+            :return: The current shape if no name was given, otherwise None
+            :type: string
+        """
+
+        if name is None:
+            return super().shape()
+        if name == self._applied_shape:
+            CachedTurtle.suppressed_writes = CachedTurtle.suppressed_writes + 1
+            return None
+        super().shape(name)
+        self._applied_shape = name
+        return None
+
+    def color(self, *args):
+        """
+            Sets the pen and fill colours of the sprite if they are different from the last ones, or returns the
+                current colours.
+
+            :param args: The colours (Same as turtle.Turtle().color())
+            :type args: tuple
+
+            :return: The current colours if none were given, otherwise None
+            :type: tuple
+        """
+
+        if not args:
+            return super().color()
+        if args == self._applied_color:
+            CachedTurtle.suppressed_writes = CachedTurtle.suppressed_writes + 1
+            return None
+        super().color(*args)
+        self._applied_color = args
+        return None
+
+    def pencolor(self, *args):
+        """
+            Sets or returns the pen colour of the sprite (The colours set with color() are no longer known).
+
+            :param args: The colour (Same as turtle.Turtle().pencolor())
+            :type args: tuple
+
+            :return: The current pen colour if none was given, otherwise None
+            :type: string
+        """
+
+        if args:
+            self._applied_color = None
+        return super().pencolor(*args)
+
+    def fillcolor(self, *args):
+        """
+            Sets or returns the fill colour of the sprite (The colours set with color() are no longer known).
+
+            :param args: The colour (Same as turtle.Turtle().fillcolor())
+            :type args: tuple
+
+            :return: The current fill colour if none was given, otherwise None
+            :type: string
+        """
+
+        if args:
+            self._applied_color = None
+        return super().fillcolor(*args)
+
+    def showturtle(self):
+        """
+            Shows the sprite if it is hidden.
+
+            :return: None
+        """
+
+        if self._applied_visible is True:
+            CachedTurtle.suppressed_writes = CachedTurtle.suppressed_writes + 1
+            return
+        super().showturtle()
+        self._applied_visible = True
+
+    st = showturtle
+
+    def hideturtle(self):
+        """
+            Hides the sprite if it is shown.
+
+            :return: None
+        """
+
+        if self._applied_visible is False:
+            CachedTurtle.suppressed_writes = CachedTurtle.suppressed_writes + 1
+            return
+        super().hideturtle()
+        self._applied_visible = False
+
+    ht = hideturtle
+
+    def reset(self):
+        """
+            Resets the sprite the same way as turtle.Turtle().reset() and forgets the last shape, colours and
+                visibility.
+
+            :return: None
+        """
+
+        self._applied_shape = None
+        self._applied_color = None
+        self._applied_visible = None
+        super().reset()
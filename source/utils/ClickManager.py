@@ -0,0 +1,203 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: ClickManager.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains the logic for clicking on buttons.
+    One click handler is registered with the window for the whole game. When the user clicks, the button under the
+        cursor is found with the hover hit-test index, and the function for that button is run from an action table.
+        The action table is only rebuilt when the screen or the shop page changes.
+"""
+
+
+class Click:
+    """
+        Represents the click detection on buttons in Laser Fighter.
+
+        Pointers:
+            _screen (ScreenUpdate()): A pointer to the screen updater.
+            _button (SpawnButton()): A pointer to the button container.
+            _hover (Hover()): A pointer to the hover detection (Holds the hit-test index for the buttons)
+            _shop (Shop()): A pointer to the shop functions
+            _settings_toggle (SettingsToggle()): A pointer to the settings functions
+            _controls (Controls()): A pointer to the controls functions
+
+        Attributes:
+            _actions (dict): Stores the function to run for each button type and id on the current screen
+            _actions_mode (string): The screen the action table was built for
+            _actions_page (string): The shop page the action table was built for
+
+            _scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
+            _scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
+    """
+
+    def __init__(self, screen, button, hover, shop, settings_toggle, controls, scale_factor_x, scale_factor_y):
+        """
+            Holds the function for clicking on buttons in Laser Fighter.
+
+            :param screen: A pointer to the screen updater
+            :type screen: ScreenUpdate()
+
+            :param button: A pointer to the button container
+            :type button: SpawnButton()
+
+            :param hover: A pointer to the hover detection
+            :type hover: Hover()
+
+            :param shop: A pointer to the shop functions
+            :type shop: Shop()
+
+            :param settings_toggle: A pointer to the settings functions
+            :type settings_toggle: SettingsToggle()
+
+            :param controls: A pointer to the controls functions
+            :type controls: Controls()
+
+            :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The scale factor for the y-axis used in fullscreen mode
+            :type scale_factor_y: float
+        """
+
+        self._screen = screen
+        self._button = button
+        self._hover = hover
+        self._shop = shop
+        self._settings_toggle = settings_toggle
+        self._controls = controls
+
+        self._actions = {}
+        self._actions_mode = None
+        self._actions_page = None
+
+        self._scale_factor_x = scale_factor_x
+        self._scale_factor_y = scale_factor_y
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._screen
+        del self._button
+        del self._hover
+        del self._shop
+        del self._settings_toggle
+        del self._controls
+        del self._actions
+        del self._actions_mode
+        del self._actions_page
+        del self._scale_factor_x
+        del self._scale_factor_y
+
+    def build_actions(self):
+        """
+            Builds the action table for the current screen (and shop page).
+
+            :return: None
+        """
+
+        mode = self._screen.mode
+        page = self._screen.page
+        actions = {}
+        if mode == "Title_Mode":
+            actions[("Title", 1)] = self._screen.launch_machine_mode
+            actions[("Title", 2)] = self._screen.launch_shop_mode
+            actions[("Title", 3)] = self._screen.exit_game
+            actions[("Title_Locked", 1)] = self._screen.launch_alien_mode
+            actions[("Title_Small", 1)] = self._screen.launch_settings_mode
+            actions[("Title_Small", 2)] = self._screen.launch_stats_mode
+        elif mode == "Machine_Mode" or mode == "Alien_Mode" or mode == "Stats":
+            actions[("Game", 1)] = self._screen.launch_title_mode
+        elif mode == "Shop":
+            actions[("Game", 1)] = self._screen.launch_title_mode
+            actions[("Tab", 1)] = self._screen.display_machine_mode_page
+            actions[("Tab", 2)] = self._screen.display_alien_mode_page
+            actions[("Tab", 3)] = self._screen.display_power_up_page
+            actions[("Tab", 4)] = self._screen.display_gadgets_page
+            slot_functions = [self._shop.slot_1_select, self._shop.slot_2_select, self._shop.slot_3_select,
+                              self._shop.slot_4_select, self._shop.slot_5_select]
+            if page == "Machine_Mode" or page == "Alien_Mode":
+                for i in range(5):
+                    actions[("Shop_Slot", i + 1)] = slot_functions[i]
+            elif page == "Power_Ups":
+                for i in range(4):
+                    actions[("Power_Up_Slot", i + 1)] = slot_functions[i]
+            elif page == "Gadgets":
+                for i in range(4):
+                    actions[("Gadget_Slot", i + 1)] = slot_functions[i]
+                actions[("Enable", 1)] = self._shop.execute_enable_button
+            actions[("Buy", 1)] = self._shop.execute_buy_button
+        elif mode == "Settings":
+            actions[("Regular_Settings_And_Controls", 1)] = self._screen.launch_title_mode
+            actions[("Regular_Settings_And_Controls", 2)] = self._screen.launch_controls_mode
+            settings_functions = [self._settings_toggle.toggle_button_sound,
+                                  self._settings_toggle.toggle_player_shooting_sound,
+                                  self._settings_toggle.toggle_enemy_shooting_sound,
+                                  self._settings_toggle.toggle_player_death_sound,
+                                  self._settings_toggle.toggle_enemy_death_sound,
+                                  self._settings_toggle.toggle_player_hit_sound,
+                                  self._settings_toggle.toggle_enemy_hit_sound,
+                                  self._settings_toggle.toggle_power_up_pickup_sound,
+                                  self._settings_toggle.toggle_power_up_spawn_sound,
+                                  self._settings_toggle.toggle_coin_pick_up_sound,
+                                  self._settings_toggle.toggle_fullscreen,
+                                  self._settings_toggle.toggle_vsync]
+            for i in range(12):
+                actions[("Settings_Toggle", i + 1)] = settings_functions[i]
+        elif mode == "Controls":
+            actions[("Regular_Settings_And_Controls", 1)] = self._screen.launch_title_mode
+            actions[("Regular_Settings_And_Controls", 3)] = self._screen.launch_settings_mode
+            controls_functions = [self._controls.change_go_right_key, self._controls.change_go_left_key,
+                                  self._controls.change_shoot_key, self._controls.change_jump_key]
+            for i in range(4):
+                actions[("Controls_Toggle", i + 1)] = controls_functions[i]
+
+        self._actions = actions
+        self._actions_mode = mode
+        self._actions_page = page
+
+    def click(self, x, y):
+        """
+            Runs the function of the button that was clicked on (If there is one).
+
+            :param x: The x-coordinate of the click (Origin at the center of the screen)
+            :type x: float
+
+            :param y: The y-coordinate of the click
+            :type y: float
+
+            :return: None
+        """
+
+        if self._screen.mode != self._actions_mode or self._screen.page != self._actions_page:
+            self.build_actions()
+        # Make sure the hit-test index has the buttons that were spawned this frame
+        if self._button.hitbox_update == 1:
+            self._hover.update()
+
+        # The hitboxes use the canvas coordinates (Origin at the top left of the screen)
+        clicked_button = self._hover.get_button_at(x + 640 * self._scale_factor_x, 360 * self._scale_factor_y - y)
+        if clicked_button is None:
+            return
+        action = self._actions.get((clicked_button.type, clicked_button.id))
+        if action is not None:
+            action(x, y)
@@ -0,0 +1,352 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: ConfigBackup.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        Backs up the player data and config files on launch, on a background thread so that the game does not wait
+            for it.
+
+        The latest backup of every .ini file is kept in the "bak" folder under the same name (The same place the
+            bckp.bat and bckp.sh scripts put them). Older backups are rotated to "<name>.1", "<name>.2" and so on, and
+            only the newest RETENTION backups of each file are kept.
+
+        The SHA-256 checksum of every backup is stored in "checksums.json". A file is only backed up again if it has
+            changed since its latest backup, and every new backup is checked against the checksum of the original
+            before it replaces the old one.
+
+        Any errors are kept until the backup has finished, and are then shown in a message box by the game loop (Since
+            tkinter can only be used from the main thread).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from tkinter import messagebox
+from setup.BackendSetup import HEADLESS
+
+
+class ConfigBackup:
+    """
+        Represents the backup of the files in the config folder.
+
+        Class Variables:
+            RETENTION (int): The default number of backups kept for each file
+            BACKUP_FOLDER (string): The name of the folder the backups are stored in
+            CHECKSUM_FILE (string): The name of the file the checksums of the backups are stored in
+
+        Attributes:
+            _config_directory (string): The path to the config folder
+            _backup_directory (string): The path to the backup folder
+            _retention (int): The number of backups kept for each file
+            _thread (threading.Thread()): The thread running the backup (None until start() is called)
+            _reported (int): Determines if the errors have already been reported
+            backed_up (list): The names of the files that were backed up
+            skipped (list): The names of the files that had not changed since their latest backup
+            errors (list): The error messages from files that could not be backed up
+    """
+
+    RETENTION = 5
+    BACKUP_FOLDER = "bak"
+    CHECKSUM_FILE = "checksums.json"
+
+    def __init__(self, config_directory='config', retention=RETENTION):
+        """
+            Creates the config backup (Nothing is backed up until start() is called).
+
+            :param config_directory: The path to the config folder
+            :type config_directory: string
+
+            :param retention: The number of backups kept for each file (At least 1)
+            :type retention: int
+        """
+
+        self._config_directory = config_directory
+        self._backup_directory = os.path.join(config_directory, self.BACKUP_FOLDER)
+        self._retention = max(1, retention)
+        self._thread = None
+        self._reported = 0
+        self.backed_up = []
+        self.skipped = []
+        self.errors = []
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._config_directory
+        del self._backup_directory
+        del self._retention
+        del self._thread
+        del self._reported
+        del self.backed_up
+        del self.skipped
+        del self.errors
+
+    @staticmethod
+    def get_checksum(data):
+        """
+            Finds the checksum of the contents of a file.
+
+            :param data: The contents of the file
+            :type data: bytes
+
+            :return: The SHA-256 checksum as a hex string
+            :type: string
+        """
+
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def read_file(path):
+        """
+            Reads the contents of a file.
+
+            :param path: The path to the file
+            :type path: string
+
+            :return: The contents of the file (None if it does not exist)
+            :type: bytes
+        """
+
+        try:
+            with open(path, 'rb') as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def start(self):
+        """
+            Starts backing up the config folder on a background thread.
+
+            :return: None
+        """
+
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout=None):
+        """
+            Waits for the backup to finish (Called before the files are written to when the game closes).
+
+            :param timeout: The maximum number of seconds to wait (None to wait until it is done)
+            :type timeout: float
+
+            :return: None
+        """
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_running(self):
+        """
+            Checks if the backup is still running.
+
+            :return: True if the backup thread is still running
+            :type: bool
+        """
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def report_errors(self):
+        """
+            Shows the errors from the backup in a message box once the backup has finished (Only once, and never in
+                headless mode where they are left in "errors").
+
+            :return: None
+        """
+
+        if self._reported == 1 or self._thread is None or self._thread.is_alive():
+            return
+        self._reported = 1
+        if self.errors and not HEADLESS:
+            messagebox.showerror("Error", "Error backing up config files:\n" + "\n".join(self.errors))
+
+    def run(self):
+        """
+            Backs up every .ini file in the config folder that has changed since its latest backup.
+
+            :return: None
+        """
+
+        try:
+            os.makedirs(self._backup_directory, exist_ok=True)
+        except OSError as e:
+            self.errors.append(f"Failed to create the backup folder: {e}")
+            return
+
+        checksums = self.load_checksums()
+        for name in sorted(os.listdir(self._config_directory)):
+            if not name.endswith('.ini'):
+                continue
+            try:
+                self.backup_file(name, checksums)
+            except OSError as e:
+                self.errors.append(f"Couldn't back up {name}: {e}")
+        self.save_checksums(checksums)
+
+    def backup_file(self, name, checksums):
+        """
+            Backs up a single file if it has changed since its latest backup, and rotates the older backups.
+
+            :param name: The name of the file in the config folder
+            :type name: string
+
+            :param checksums: The checksum of every backup (Updated with the new backup)
+            :type checksums: dict
+
+            :return: None
+        """
+
+        data = self.read_file(os.path.join(self._config_directory, name))
+        if data is None:
+            return
+        checksum = self.get_checksum(data)
+        # Remove any extra backups (In case the retention count was lowered)
+        self.prune(name, checksums, self._retention)
+        latest_path = os.path.join(self._backup_directory, name)
+
+        # Skip the file if the latest backup is the same as the file and has not been damaged
+        if checksums.get(name) == checksum:
+            latest_data = self.read_file(latest_path)
+            if latest_data is not None and self.get_checksum(latest_data) == checksum:
+                self.skipped.append(name)
+                return
+
+        # Write the new backup next to the old one and check it before rotating anything
+        temp_path = latest_path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        if self.get_checksum(self.read_file(temp_path)) != checksum:
+            os.remove(temp_path)
+            self.errors.append(f"The backup of {name} did not match the original")
+            return
+
+        # Damaged backups are replaced instead of being kept as an older backup
+        if os.path.exists(latest_path) and (name not in checksums or
+                                            self.get_checksum(self.read_file(latest_path)) == checksums[name]):
+            self.rotate(name, checksums)
+        os.replace(temp_path, latest_path)
+        checksums[name] = checksum
+        self.backed_up.append(name)
+
+    def get_backup_name(self, name, index):
+        """
+            Gets the name of one of the backups of a file.
+
+            :param name: The name of the file in the config folder
+            :type name: string
+
+            :param index: The age of the backup (0 for the latest backup)
+            :type index: int
+
+            :return: The name of the backup file
+            :type: string
+        """
+
+        return name if index == 0 else f"{name}.{index}"
+
+    def prune(self, name, checksums, keep):
+        """
+            Removes the backups of a file that are past the given number of backups.
+
+            :param name: The name of the file in the config folder
+            :type name: string
+
+            :param checksums: The checksum of every backup (The removed backups are removed from it)
+            :type checksums: dict
+
+            :param keep: The number of backups to keep (At least 1)
+            :type keep: int
+
+            :return: None
+        """
+
+        index = keep
+        while True:
+            backup_name = self.get_backup_name(name, index)
+            backup_path = os.path.join(self._backup_directory, backup_name)
+            if not os.path.exists(backup_path) and backup_name not in checksums:
+                break
+            if os.path.exists(backup_path):
+                os.remove(backup_path)
+            checksums.pop(backup_name, None)
+            index = index + 1
+
+    def rotate(self, name, checksums):
+        """
+            Moves every backup of a file back by one ("<name>" to "<name>.1", "<name>.1" to "<name>.2" and so on),
+                removing the oldest one if there are already RETENTION backups.
+
+            :param name: The name of the file in the config folder
+            :type name: string
+
+            :param checksums: The checksum of every backup (Updated with the new names)
+            :type checksums: dict
+
+            :return: None
+        """
+
+        self.prune(name, checksums, max(1, self._retention - 1))
+        for index in range(self._retention - 2, -1, -1):
+            old_name = self.get_backup_name(name, index)
+            old_path = os.path.join(self._backup_directory, old_name)
+            if os.path.exists(old_path):
+                os.replace(old_path, os.path.join(self._backup_directory, self.get_backup_name(name, index + 1)))
+                if old_name in checksums:
+                    checksums[self.get_backup_name(name, index + 1)] = checksums.pop(old_name)
+
+    def load_checksums(self):
+        """
+            Reads the checksums of the backups from the checksum file.
+
+            :return: The checksum of every backup (Empty if the file is missing or damaged)
+            :type: dict
+        """
+
+        data = self.read_file(os.path.join(self._backup_directory, self.CHECKSUM_FILE))
+        if data is None:
+            return {}
+        try:
+            checksums = json.loads(data.decode('utf-8'))
+        except ValueError:
+            return {}
+        return checksums if isinstance(checksums, dict) else {}
+
+    def save_checksums(self, checksums):
+        """
+            Writes the checksums of the backups to the checksum file.
+
+            :param checksums: The checksum of every backup
+            :type checksums: dict
+
+            :return: None
+        """
+
+        path = os.path.join(self._backup_directory, self.CHECKSUM_FILE)
+        try:
+            with open(path + '.tmp', 'w') as file:
+                json.dump(checksums, file, indent=4, sort_keys=True)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            self.errors.append(f"Couldn't save the backup checksums: {e}")
@@ -21,8 +21,8 @@
     This file contains the logic for changing and toggling the keybinds while in game.
 """
 
-import pygame
 from tkinter import messagebox
+from setup.WindowSetup import sound_bank
 
 
 class Controls:
@@ -35,6 +35,7 @@ class Controls:
             _settings (Settings()): Pointer to the current game settings.
             _controls_toggle (ControlsToggle()): Pointer to the current keybinds.
             _refresh (Refresh()): Pointer to the game refresh variables.
+            _input_recorder (InputRecorder()): Pointer to the input recorder (Records and replays the dialog answers).
 
         Attributes:
             _scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
@@ -46,7 +47,7 @@ class Controls:
             _jump_key_alert (int): Determines if the jump keybind conflicts with any other keybind.
     """
 
-    def __init__(self, window, screen, settings, controls_toggle, refresh, scale_factor_x, scale_factor_y):
+    def __init__(self, window, screen, settings, controls_toggle, refresh, input_recorder, scale_factor_x, scale_factor_y):
         """
             Initializes all of the pointers necessary for the Controls Manager.
 
@@ -65,6 +66,9 @@ class Controls:
             :param refresh: Pointer to the game refresh variables.
             :type refresh: Refresh()
 
+            :param input_recorder: Pointer to the input recorder.
+            :type input_recorder: InputRecorder()
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode.
             :type scale_factor_x: float
 
@@ -77,6 +81,7 @@ class Controls:
         self._settings = settings
         self._controls_toggle = controls_toggle
         self._refresh = refresh
+        self._input_recorder = input_recorder
 
         self._scale_factor_x = scale_factor_x
         self._scale_factor_y = scale_factor_y
@@ -98,6 +103,7 @@ class Controls:
         del self._settings
         del self._controls_toggle
         del self._refresh
+        del self._input_recorder
         del self._scale_factor_x
         del self._scale_factor_y
         del self._go_right_key_alert
@@ -174,7 +180,6 @@ class Controls:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > 165 * self._scale_factor_y) and (y < 226 * self._scale_factor_y):
             self.execute_control_setting(0)
@@ -192,7 +197,6 @@ class Controls:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > 85 * self._scale_factor_y) and (y < 146 * self._scale_factor_y):
             self.execute_control_setting(1)
@@ -210,7 +214,6 @@ class Controls:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > 5 * self._scale_factor_y) and (y < 66 * self._scale_factor_y):
             self.execute_control_setting(2)
@@ -228,7 +231,6 @@ class Controls:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > -75 * self._scale_factor_y) and (y < -14 * self._scale_factor_y):
             self.execute_control_setting(3)
@@ -264,12 +266,11 @@ class Controls:
             type_string = "Jump"
         # Play the button click sound
         if self._settings.button_sound == 1:
-            sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-            sound.play()
+            sound_bank.play("button")
         # Backup the original keybind
         key_backup = key_1
         # Set "key_2" to whatever the user inputted into the textbox
-        key_2 = self._window.textinput("{}".format(type_string), "Insert new key here:")
+        key_2 = self._input_recorder.prompt("Key_Input", self._window.textinput, "{}".format(type_string), "Insert new key here:")
         # If the user inputted a space, display "space"
         if key_2 == " ":
             key_2 = "space"
@@ -280,7 +281,7 @@ class Controls:
             # If the new keybind input is invalid (enter key or multiple charecters)
             if (len(key_2) > 1 and key_2 != "space") or key_2 == "":
                 # Let the user know through an error
-                messagebox.showerror("Invalid Input!", "That is an invalid input!")
+                self._input_recorder.prompt("Invalid_Input", messagebox.showerror, "Invalid Input!", "That is an invalid input!")
             # if it is valid
             else:
                 # Update the keybind in the backup ini file.
@@ -327,7 +328,7 @@ class Controls:
                 # If there is a conflict
                 if key_alert == 1:
                     # Alert the user about the conflict
-                    message_output = messagebox.askyesno("Conflict!", "Your current configuration may cause conflicts with other controls!\nAre you sure you want to keep it?", icon='warning')
+                    message_output = self._input_recorder.prompt("Conflict", messagebox.askyesno, "Conflict!", "Your current configuration may cause conflicts with other controls!\nAre you sure you want to keep it?", icon='warning')
                     # If the user wants to go back
                     if not message_output:
                         # Reinstate the old keybinds and update the backup keybind file
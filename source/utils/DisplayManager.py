@@ -0,0 +1,443 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: DisplayManager.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains the logic for switching fullscreen on and off (or changing the resolution) while the game is
+        running, instead of restarting the game.
+    When a switch is requested, every texture is scaled to the new resolution through the texture cache on a
+        background thread while the game keeps running. Once that is done, the switch is applied in one pass on the main
+        thread:
+        - The window is resized and every registered texture is swapped to its new image at once
+        - The scale factors are updated in every module and object that stores them
+        - Every subsystem that calculates values from the scale factors (Ex: the hitbox sizes in the collision classes)
+            is rescaled through its rescale() function
+        - Every sprite is moved to the same spot on the new screen
+        - The current screen is set up again, so its buttons and text are recreated at the new size
+"""
+
+import os
+import sys
+import threading
+import time
+import turtle
+from setup.BackendSetup import HEADLESS
+from components.ItemCoin import Coin
+from setup.WindowSetup import BACKGROUND_TEXTURE
+from setup.WindowSetup import texture_cache
+from setup.WindowSetup import get_scale_factors
+from setup.WindowSetup import get_screen_size
+
+
+class DisplayManager:
+    """
+        Represents the switching of the resolution while the game is running.
+
+        Class Variables:
+            SCALE_ATTRIBUTES (tuple): The names of the attributes that store the scale factors in the game objects
+            SOURCE_DIRECTORY (string): The folder holding the game modules (Only their scale factors are updated)
+
+        Pointers:
+            _window (turtle.Screen()): Pointer to the application window
+            _texture_registry (TextureRegistry()): Pointer to the registry of every texture
+            _screen (ScreenUpdate()): Pointer to the current displayed screen
+            _machine_mode_setup (MachineModeSetup()): Pointer to the Machine Mode configuration
+            _alien_mode_setup (AlienModeSetup()): Pointer to the Alien Mode configuration
+            _machine_kinematics (MachineKinematics()): Pointer to the movement logic of every machine
+            _machine_collision (MachineCollision()): Pointer to the Machine Mode hitboxes
+            _alien_collision (AlienCollision()): Pointer to the Alien Mode hitboxes
+            _projectile_system (ProjectileSystem()): Pointer to the enemy lasers
+            _human_player (SpawnHumanPlayer()): Pointer to the human player object
+
+        Attributes:
+            _thread (threading.Thread()): The thread scaling the textures for the requested resolution (None if there
+                is no switch in progress)
+            _target (tuple): The requested fullscreen setting, width, height and scale factors
+            _request_time (float): The time the last switch was requested (From time.perf_counter())
+
+            fullscreen (int): Determines if the game is currently in fullscreen mode
+            scale_factor (float): The general scale factor based off of the shortest axis
+            scale_factor_x (float): The scale factor for the x-axis
+            scale_factor_y (float): The scale factor for the y-axis
+            failed (int): Determines if the last switch could not be done (A restart is needed instead)
+            last_switch_time (float): The number of seconds the last switch took from being requested to being applied
+            last_apply_time (float): The number of seconds the main thread was blocked applying the last switch
+    """
+
+    SCALE_ATTRIBUTES = ("scale_factor", "_scale_factor", "scale_factor_x", "_scale_factor_x",
+                        "scale_factor_y", "_scale_factor_y")
+    SOURCE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def __init__(self, window, texture_registry, screen, machine_mode_setup, alien_mode_setup, machine_kinematics,
+                 machine_collision, alien_collision, projectile_system, human_player, fullscreen, scale_factor,
+                 scale_factor_x, scale_factor_y):
+        """
+            Creates the display manager.
+
+            :param window: Pointer to the application window
+            :type window: turtle.Screen()
+
+            :param texture_registry: Pointer to the registry of every texture
+            :type texture_registry: TextureRegistry()
+
+            :param screen: Pointer to the current displayed screen
+            :type screen: ScreenUpdate()
+
+            :param machine_mode_setup: Pointer to the Machine Mode configuration
+            :type machine_mode_setup: MachineModeSetup()
+
+            :param alien_mode_setup: Pointer to the Alien Mode configuration
+            :type alien_mode_setup: AlienModeSetup()
+
+            :param machine_kinematics: Pointer to the movement logic of every machine
+            :type machine_kinematics: MachineKinematics()
+
+            :param machine_collision: Pointer to the Machine Mode hitboxes
+            :type machine_collision: MachineCollision()
+
+            :param alien_collision: Pointer to the Alien Mode hitboxes
+            :type alien_collision: AlienCollision()
+
+            :param projectile_system: Pointer to the enemy lasers
+            :type projectile_system: ProjectileSystem()
+
+            :param human_player: Pointer to the human player object
+            :type human_player: SpawnHumanPlayer()
+
+            :param fullscreen: Determines if the game was launched in fullscreen mode
+            :type fullscreen: int
+
+            :param scale_factor: The general scale factor used in fullscreen mode based off of the shortest axis
+            :type scale_factor: float
+
+            :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The scale factor for the y-axis used in fullscreen mode
+            :type scale_factor_y: float
+        """
+
+        self._window = window
+        self._texture_registry = texture_registry
+        self._screen = screen
+        self._machine_mode_setup = machine_mode_setup
+        self._alien_mode_setup = alien_mode_setup
+        self._machine_kinematics = machine_kinematics
+        self._machine_collision = machine_collision
+        self._alien_collision = alien_collision
+        self._projectile_system = projectile_system
+        self._human_player = human_player
+
+        self._thread = None
+        self._target = None
+        self._request_time = 0.0
+
+        self.fullscreen = fullscreen
+        self.scale_factor = scale_factor
+        self.scale_factor_x = scale_factor_x
+        self.scale_factor_y = scale_factor_y
+        self.failed = 0
+        self.last_switch_time = 0.0
+        self.last_apply_time = 0.0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._window
+        del self._texture_registry
+        del self._screen
+        del self._machine_mode_setup
+        del self._alien_mode_setup
+        del self._machine_kinematics
+        del self._machine_collision
+        del self._alien_collision
+        del self._projectile_system
+        del self._human_player
+        del self._thread
+        del self._target
+        del self._request_time
+        del self.fullscreen
+        del self.scale_factor
+        del self.scale_factor_x
+        del self.scale_factor_y
+        del self.failed
+        del self.last_switch_time
+        del self.last_apply_time
+
+    def is_switching(self):
+        """
+            Checks if a switch has been requested and not applied yet.
+
+            :return: True if a switch is in progress
+            :type: bool
+        """
+
+        return self._thread is not None
+
+    def request(self, fullscreen, width=None, height=None):
+        """
+            Starts switching to a new resolution. The textures are scaled on a background thread, and the switch is
+                applied by update() once they are ready.
+
+            :param fullscreen: 1 to switch to fullscreen mode, 0 to switch to the default window
+            :type fullscreen: int
+
+            :param width: The width of the screen in fullscreen mode (Defaults to the width of the monitor)
+            :type width: int
+
+            :param height: The height of the screen in fullscreen mode (Defaults to the height of the monitor)
+            :type height: int
+
+            :return: None
+        """
+
+        if self._thread is not None:
+            return
+        if fullscreen == 1:
+            if width is None or height is None:
+                width, height = get_screen_size()
+        else:
+            width, height = 1280, 720
+        scale_factor, scale_factor_x, scale_factor_y = get_scale_factors(width, height)
+
+        self._target = (fullscreen, width, height, scale_factor, scale_factor_x, scale_factor_y)
+        self._request_time = time.perf_counter()
+        self.failed = 0
+        self._thread = threading.Thread(target=self.prepare, args=(scale_factor_x, scale_factor_y), daemon=True)
+        self._thread.start()
+
+    def prepare(self, scale_factor_x, scale_factor_y):
+        """
+            Scales every texture (and the background) to the new resolution. Runs on the background thread.
+
+            :param scale_factor_x: The new scale factor for the x-axis
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The new scale factor for the y-axis
+            :type scale_factor_y: float
+
+            :return: None
+        """
+
+        try:
+            if texture_cache is None:
+                # Headless mode has no images to scale
+                self._texture_registry.prepare_rescale(None, 1, 1)
+            else:
+                self._texture_registry.prepare_rescale(texture_cache, scale_factor_x, scale_factor_y,
+                                                       [BACKGROUND_TEXTURE])
+        except Exception as e:
+            print(f"DisplayManager: WARNING: Couldn't scale the textures for the new resolution: {e}")
+            self.failed = 1
+
+    def update(self):
+        """
+            Applies the requested switch once its textures are ready. Called once per frame.
+
+            :return: None
+        """
+
+        if self._thread is None or self._thread.is_alive():
+            return
+        self._thread = None
+        if self.failed == 1:
+            # Keep the current resolution (The setting is still saved, so it is used the next time the game starts)
+            self._texture_registry.cancel_rescale()
+            # Show the "RST" indicator and ask for a restart when leaving the settings, like before
+            self._screen.updated_controls = 1
+            self._screen.screen_update = 1
+            return
+
+        apply_start_time = time.perf_counter()
+        fullscreen, width, height, scale_factor, scale_factor_x, scale_factor_y = self._target
+        ratio_x = scale_factor_x / self.scale_factor_x
+        ratio_y = scale_factor_y / self.scale_factor_y
+
+        self.resize_window(fullscreen, width, height, scale_factor_x, scale_factor_y)
+        self._texture_registry.apply_rescale(texture_cache, scale_factor_x, scale_factor_y)
+        self.update_scale_factors(scale_factor, scale_factor_x, scale_factor_y)
+        self.rescale_subsystems(ratio_x, ratio_y)
+        self.rescale_sprites(ratio_x, ratio_y)
+
+        # Recalculate the shop dependent values (Ex: laser speeds) with the new scale factors
+        self._alien_mode_setup.setup_alien_mode()
+        # Set the current screen up again so that its buttons and text are recreated at the new size
+        self._screen.screen_update = 1
+
+        self.fullscreen = fullscreen
+        self.scale_factor = scale_factor
+        self.scale_factor_x = scale_factor_x
+        self.scale_factor_y = scale_factor_y
+        self.last_apply_time = time.perf_counter() - apply_start_time
+        self.last_switch_time = time.perf_counter() - self._request_time
+
+    def resize_window(self, fullscreen, width, height, scale_factor_x, scale_factor_y):
+        """
+            Resizes the window and changes the background for the new resolution.
+
+            :param fullscreen: 1 for fullscreen mode, 0 for the default window
+            :type fullscreen: int
+
+            :param width: The new width of the screen
+            :type width: int
+
+            :param height: The new height of the screen
+            :type height: int
+
+            :param scale_factor_x: The new scale factor for the x-axis
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The new scale factor for the y-axis
+            :type scale_factor_y: float
+
+            :return: None
+        """
+
+        if HEADLESS:
+            self._window.setup(width=width, height=height)
+            return
+        if fullscreen == 1:
+            self._window.setup(width=width, height=height)
+            self._window.cv._rootwindow.attributes("-fullscreen", True)
+            # Already scaled on the background thread, so this only copies from the cache
+            self._window.bgpic(texture_cache.scale_textures([BACKGROUND_TEXTURE], scale_factor_x, scale_factor_y)[0])
+        else:
+            self._window.cv._rootwindow.attributes("-fullscreen", False)
+            self._window.setup(width=width, height=height)
+            self._window.bgpic(BACKGROUND_TEXTURE)
+
+    def get_game_modules(self):
+        """
+            Finds every loaded module that is part of the game.
+
+            :return: The game modules
+            :type: list
+        """
+
+        modules = []
+        for module in list(sys.modules.values()):
+            module_path = getattr(module, "__file__", None)
+            if module_path is not None and os.path.abspath(module_path).startswith(self.SOURCE_DIRECTORY):
+                modules.append(module)
+        return modules
+
+    def update_scale_factors(self, scale_factor, scale_factor_x, scale_factor_y):
+        """
+            Updates the scale factors in every game module, and in every game object reachable from them. Only the
+                scale factors themselves are replaced, the values calculated from them are rescaled by
+                rescale_subsystems().
+
+            :param scale_factor: The new general scale factor
+            :type scale_factor: float
+
+            :param scale_factor_x: The new scale factor for the x-axis
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The new scale factor for the y-axis
+            :type scale_factor_y: float
+
+            :return: None
+        """
+
+        module_values = {"scale_factor": scale_factor, "scale_factor_X": scale_factor_x,
+                         "scale_factor_Y": scale_factor_y}
+        object_values = {"scale_factor": scale_factor, "_scale_factor": scale_factor,
+                         "scale_factor_x": scale_factor_x, "_scale_factor_x": scale_factor_x,
+                         "scale_factor_y": scale_factor_y, "_scale_factor_y": scale_factor_y}
+
+        modules = self.get_game_modules()
+        module_names = set(module.__name__ for module in modules)
+        # The sprites and the window are rescaled by rescale_sprites()
+        skipped_types = (turtle.Turtle, type(self._window))
+
+        # Every module that imported the scale factors from the window setup has its own copy of them
+        pending = []
+        for module in modules:
+            for name, value in module_values.items():
+                if name in vars(module):
+                    setattr(module, name, value)
+            pending.extend(vars(module).values())
+
+        visited = set()
+        while pending:
+            item = pending.pop()
+            if id(item) in visited:
+                continue
+            visited.add(id(item))
+            if isinstance(item, (list, tuple, set)):
+                pending.extend(item)
+            elif isinstance(item, dict):
+                pending.extend(item.values())
+            elif type(item).__module__ in module_names and not isinstance(item, type) and \
+                    not isinstance(item, skipped_types) and hasattr(item, "__dict__"):
+                for name in self.SCALE_ATTRIBUTES:
+                    if name in vars(item) or hasattr(type(item), name):
+                        setattr(item, name, object_values[name])
+                pending.extend(vars(item).values())
+
+    def rescale_subsystems(self, ratio_x, ratio_y):
+        """
+            Rescales every subsystem that calculates values from the scale factors (Called after the scale factors are
+                updated).
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        # The machine hitboxes are solved with the float amplitude of the machines, so they are rescaled after them
+        self._machine_kinematics.rescale(ratio_x, ratio_y)
+        self._machine_collision.rescale(ratio_x, ratio_y)
+        self._alien_collision.rescale(ratio_x, ratio_y)
+        self._projectile_system.rescale(ratio_x, ratio_y)
+        self._machine_mode_setup.rescale(ratio_x, ratio_y)
+        Coin.rescale(ratio_x, ratio_y)
+        self._human_player.rescale(ratio_x, ratio_y)
+
+    def rescale_sprites(self, ratio_x, ratio_y):
+        """
+            Moves every sprite to the same spot on the new screen, and resizes the sprites that are drawn as shapes
+                instead of textures.
+
+            :param ratio_x: The new scale factor for the x-axis divided by the old one
+            :type ratio_x: float
+
+            :param ratio_y: The new scale factor for the y-axis divided by the old one
+            :type ratio_y: float
+
+            :return: None
+        """
+
+        for t in self._window.turtles():
+            pen_down = t.isdown()
+            t.penup()
+            t.goto(t.xcor() * ratio_x, t.ycor() * ratio_y)
+            if pen_down:
+                t.pendown()
+            # Textures are swapped by the texture registry, but shapes like the button frames are stretched instead
+            if not self._texture_registry.is_texture(t.shape()):
+                stretch_wid, stretch_len, outline = t.shapesize()
+                t.shapesize(stretch_wid * ratio_y, stretch_len * ratio_x, outline)
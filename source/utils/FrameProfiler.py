@@ -0,0 +1,282 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: FrameProfiler.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        Measures how long each section of the game loop takes. Every section is timed between a start() and a
+            stop() call with the same name. The times are kept for a rolling window of frames so that the p50, p95
+            and p99 of each section can be shown in an on-screen overlay and written to CSV and JSON files on exit.
+
+        Profiling is turned on with the --profile flag or by setting the LASER_FIGHTER_PROFILE environment variable
+            to 1. When it is off, start() and stop() return right away.
+
+        Counters (Ex: the number of text redraws per second) can also be recorded with set_counter(). They are shown
+            in the overlay and written to the JSON file.
+"""
+
+import csv
+import json
+import math
+import os
+import time
+import turtle
+from collections import deque
+
+
+class FrameProfiler:
+    """
+        Represents the frame time profiler for the game loop.
+
+        Class Variables:
+            WINDOW_SIZE (int): The number of samples kept for each section to calculate the percentiles
+            OVERLAY_INTERVAL (float): The number of seconds between overlay redraws
+            OVERLAY_LINES (int): The number of sections shown in the overlay
+
+        Attributes:
+            enabled (bool): Determines if the sections are being timed
+            export_path (string): The path to write the results to, without the file extension
+            frame_count (int): The number of frames profiled
+            _start_times (dict): Stores the start time of every section that is currently being timed
+            _samples (dict): Stores the most recent times for each section in seconds
+            _totals (dict): Stores the number of samples, total time and longest time of each section since the
+                profiler was turned on
+            counters (dict): Stores the latest value of every counter
+            _overlay (turtle.Turtle()): The turtle used to write the overlay (None if the overlay is off)
+            _overlay_time (float): The last time the overlay was redrawn
+    """
+
+    WINDOW_SIZE = 600
+    OVERLAY_INTERVAL = 0.5
+    OVERLAY_LINES = 10
+
+    def __init__(self, enabled=None, export_path="frame_profile"):
+        """
+            Creates the profiler.
+
+            :param enabled: Determines if the sections are timed (Reads LASER_FIGHTER_PROFILE if None)
+            :type enabled: bool
+
+            :param export_path: The path to write the results to, without the file extension
+            :type export_path: string
+        """
+
+        if enabled is None:
+            enabled = os.environ.get("LASER_FIGHTER_PROFILE", "0") not in ("", "0")
+        self.enabled = enabled
+        self.export_path = export_path
+        self.frame_count = 0
+        self._start_times = {}
+        self._samples = {}
+        self._totals = {}
+        self.counters = {}
+        self._overlay = None
+        self._overlay_time = 0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self.enabled
+        del self.export_path
+        del self.frame_count
+        del self._start_times
+        del self._samples
+        del self._totals
+        del self.counters
+        del self._overlay
+        del self._overlay_time
+
+    def start(self, name):
+        """
+            Starts timing a section.
+
+            :param name: The name of the section
+            :type name: string
+
+            :return: None
+        """
+
+        if self.enabled:
+            self._start_times[name] = time.perf_counter()
+
+    def stop(self, name):
+        """
+            Stops timing a section and records how long it took.
+
+            :param name: The name of the section
+            :type name: string
+
+            :return: None
+        """
+
+        if self.enabled:
+            start_time = self._start_times.pop(name, None)
+            if start_time is not None:
+                self.record(name, time.perf_counter() - start_time)
+
+    def begin_frame(self):
+        """
+            Starts timing a whole frame.
+
+            :return: None
+        """
+
+        if self.enabled:
+            self._start_times["Frame"] = time.perf_counter()
+
+    def end_frame(self):
+        """
+            Stops timing the whole frame and redraws the overlay if it is on.
+
+            :return: None
+        """
+
+        if self.enabled:
+            self.stop("Frame")
+            self.frame_count = self.frame_count + 1
+            if self._overlay is not None and time.perf_counter() - self._overlay_time >= self.OVERLAY_INTERVAL:
+                self.draw_overlay()
+
+    def record(self, name, duration):
+        """
+            Records a single time for a section.
+
+            :param name: The name of the section
+            :type name: string
+
+            :param duration: How long the section took in seconds
+            :type duration: float
+
+            :return: None
+        """
+
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.WINDOW_SIZE)
+            self._totals[name] = [0, 0.0, 0.0]
+        samples.append(duration)
+        totals = self._totals[name]
+        totals[0] = totals[0] + 1
+        totals[1] = totals[1] + duration
+        if duration > totals[2]:
+            totals[2] = duration
+
+    def set_counter(self, name, value):
+        """
+            Records the latest value of a counter.
+
+            :param name: The name of the counter
+            :type name: string
+
+            :param value: The value of the counter
+            :type value: float
+
+            :return: None
+        """
+
+        if self.enabled:
+            self.counters[name] = value
+
+    def get_percentiles(self, name):
+        """
+            Finds the p50, p95 and p99 of a section over the rolling window.
+
+            :param name: The name of the section
+            :type name: string
+
+            :return: The p50, p95 and p99 in milliseconds
+            :type: tuple
+        """
+
+        samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return 0.0, 0.0, 0.0
+        return tuple(samples[max(0, math.ceil(p / 100 * len(samples)) - 1)] * 1000 for p in (50, 95, 99))
+
+    def get_summary(self):
+        """
+            Creates a summary of every section, sorted from the slowest p95 to the fastest.
+
+            :return: A dictionary for every section with its name, count, mean, p50, p95, p99 and max (in ms)
+            :type: list
+        """
+
+        summary = []
+        for name, (count, total, longest) in self._totals.items():
+            p50, p95, p99 = self.get_percentiles(name)
+            summary.append({"section": name, "count": count, "mean_ms": round(total / count * 1000, 4),
+                            "p50_ms": round(p50, 4), "p95_ms": round(p95, 4), "p99_ms": round(p99, 4),
+                            "max_ms": round(longest * 1000, 4)})
+        summary.sort(key=lambda s: s["p95_ms"], reverse=True)
+        return summary
+
+    def export(self):
+        """
+            Writes the summary of every section to a CSV file and a JSON file.
+
+            :return: None
+        """
+
+        summary = self.get_summary()
+        with open(self.export_path + ".csv", 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=["section", "count", "mean_ms", "p50_ms", "p95_ms",
+                                                          "p99_ms", "max_ms"])
+            writer.writeheader()
+            writer.writerows(summary)
+        with open(self.export_path + ".json", 'w') as json_file:
+            json.dump({"frames": self.frame_count, "window_size": self.WINDOW_SIZE, "sections": summary,
+                       "counters": self.counters}, json_file, indent=4)
+
+    def enable_overlay(self, x, y):
+        """
+            Turns on the on-screen overlay which lists the slowest sections.
+
+            :param x: The x-coordinate of the bottom left corner of the overlay
+            :type x: float
+
+            :param y: The y-coordinate of the bottom left corner of the overlay
+            :type y: float
+
+            :return: None
+        """
+
+        if self._overlay is None:
+            self._overlay = turtle.Turtle()
+            self._overlay.hideturtle()
+            self._overlay.penup()
+            self._overlay.color("white")
+        self._overlay.goto(x, y)
+
+    def draw_overlay(self):
+        """
+            Redraws the overlay with the p50, p95 and p99 of the slowest sections.
+
+            :return: None
+        """
+
+        lines = [f"{'Section':<22}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for s in self.get_summary()[:self.OVERLAY_LINES]:
+            lines.append(f"{s['section']:<22}{s['p50_ms']:>7.2f}{s['p95_ms']:>7.2f}{s['p99_ms']:>7.2f}")
+        for name, value in self.counters.items():
+            lines.append(f"{name:<29}{value:>14.1f}")
+        self._overlay.clear()
+        self._overlay.write("\n".join(lines), align="left", font=("Courier", 9, "normal"))
+        self._overlay_time = time.perf_counter()
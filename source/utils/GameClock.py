@@ -0,0 +1,129 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: GameClock.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        The single clock for the game loop. The time is sampled once at the start of every frame, and the game is
+            moved forward in fixed ticks of TICK_LENGTH seconds. Time that is left over at the end of a frame is kept
+            in an accumulator and used in the next frame, so the game moves at the same speed at any refresh rate.
+
+        Components read the frame time from "now" instead of calling time.time() themselves, and components that
+            move are given "dt" (The amount of game time that passed this frame).
+"""
+
+import time
+
+
+class GameClock:
+    """
+        Represents the clock that every component in the game loop shares.
+
+        Class Variables:
+            TICK_LENGTH (float): The length of a single fixed tick in seconds (0.0075, 0.015 and 0.02 second movement
+                steps are all a whole number of ticks)
+            MAX_FRAME_TIME (float): The longest amount of time that a single frame can move the game forward (So that
+                a long pause, like loading a screen, does not make everything jump forward)
+
+        Attributes:
+            start_time (float): The wall clock time that the clock was created
+            now (float): The game time at the start of the current frame (Counts up from start_time in whole ticks)
+            dt (float): The amount of game time that passed in the current frame (Always a whole number of ticks)
+            ticks (int): The number of fixed ticks that were run in the current frame
+            tick_count (int): The number of fixed ticks that have been run since the clock was created
+            frame_time (float): The real amount of time between the start of the last frame and the current frame
+            fixed_frame_time (float): The length to use for every frame instead of the measured time (None to measure
+                it, used by the benchmarks so that every run moves the game forward the same way)
+            _last_time (float): The time the last frame started (From time.perf_counter())
+            _accumulator (float): The time that has not been used up by a whole tick yet
+    """
+
+    TICK_LENGTH = 0.0025
+    MAX_FRAME_TIME = 0.25
+
+    def __init__(self):
+        """
+            Creates the clock and starts it at the current time.
+        """
+
+        self.start_time = time.time()
+        self.now = self.start_time
+        self.dt = 0.0
+        self.ticks = 0
+        self.tick_count = 0
+        self.frame_time = 0.0
+        self.fixed_frame_time = None
+        self._last_time = time.perf_counter()
+        self._accumulator = 0.0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self.start_time
+        del self.now
+        del self.dt
+        del self.ticks
+        del self.tick_count
+        del self.frame_time
+        del self.fixed_frame_time
+        del self._last_time
+        del self._accumulator
+
+    def tick(self, frame_time=None):
+        """
+            Samples the time for the new frame and finds how many fixed ticks the game should move forward by.
+            Called once at the start of every frame.
+
+            :param frame_time: The length of the frame to use instead of the measured time (Used to replay a recording)
+            :type frame_time: float
+
+            :return: The number of ticks to run this frame
+            :type: int
+        """
+
+        current_time = time.perf_counter()
+        if frame_time is None:
+            frame_time = self.fixed_frame_time
+        if frame_time is None:
+            frame_time = current_time - self._last_time
+        self.frame_time = frame_time
+        self._last_time = current_time
+
+        # Add the time since the last frame to the accumulator and use up as many whole ticks as possible
+        self._accumulator = self._accumulator + min(self.frame_time, self.MAX_FRAME_TIME)
+        self.ticks = int(self._accumulator / self.TICK_LENGTH)
+        self._accumulator = self._accumulator - self.ticks * self.TICK_LENGTH
+
+        self.tick_count = self.tick_count + self.ticks
+        self.dt = self.ticks * self.TICK_LENGTH
+        self.now = self.start_time + self.tick_count * self.TICK_LENGTH
+        return self.ticks
+
+    def reset(self):
+        """
+            Drops the time since the last frame (Used after something that blocks the game loop, like changing
+                screens, so that the game does not move forward by the time it took).
+
+            :return: None
+        """
+
+        self._last_time = time.perf_counter()
+        self._accumulator = 0.0
@@ -0,0 +1,528 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: HeadlessBackend.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        A stand-in for the turtle module that keeps track of every sprite in plain Python objects instead of drawing
+            them in a Tk window. It is used when the game is started in headless mode (See setup/BackendSetup.py), so
+            that the game loop can run on machines without a display, Tk, Win32 or PyGame.
+
+        Only the parts of the turtle module that Laser Fighter uses are provided.
+"""
+
+import math
+import os
+import time
+
+# The shapes that turtle provides without needing to be registered
+BUILT_IN_SHAPES = ["arrow", "blank", "circle", "classic", "square", "triangle", "turtle"]
+
+
+def _texture_exists(path):
+    """
+        Checks if a texture exists, ignoring upper and lower case in the file name the same way Windows does.
+
+        :param path: The path to the texture
+        :type path: string
+
+        :return: True if the texture exists
+        :type: bool
+    """
+
+    if os.path.exists(path):
+        return True
+    directory, file_name = os.path.split(path)
+    try:
+        return file_name.lower() in (f.lower() for f in os.listdir(directory or "."))
+    except OSError:
+        return False
+
+
+class TurtleGraphicsError(Exception):
+    """
+        Raised in the same situations that the real turtle module raises it (Ex: using a shape that was never added).
+    """
+
+
+class Vec2D(tuple):
+    """
+        Represents a 2D position, the same way the turtle module does.
+    """
+
+    def __new__(cls, x, y):
+        return tuple.__new__(cls, (x, y))
+
+    def __add__(self, other):
+        return Vec2D(self[0] + other[0], self[1] + other[1])
+
+    def __sub__(self, other):
+        return Vec2D(self[0] - other[0], self[1] - other[1])
+
+    def __abs__(self):
+        return math.hypot(self[0], self[1])
+
+
+class _Root:
+    """
+        Represents the Tk root window. Callbacks scheduled with after() are run by the screen's update().
+
+        Attributes:
+            _after_callbacks (list): Stores the (time, function, arguments) of every scheduled callback
+            _protocols (dict): Stores the window manager callbacks (Ex: WM_DELETE_WINDOW)
+            destroyed (int): Determines if the window has been destroyed
+    """
+
+    def __init__(self):
+        self._after_callbacks = []
+        self._protocols = {}
+        self.destroyed = 0
+
+    def after(self, ms, func=None, *args):
+        if func is not None:
+            self._after_callbacks.append((time.perf_counter() + ms / 1000, func, args))
+
+    def run_due_callbacks(self):
+        """
+            Runs every scheduled callback whose time has passed.
+
+            :return: None
+        """
+
+        if not self._after_callbacks:
+            return
+        now = time.perf_counter()
+        due = [c for c in self._after_callbacks if c[0] <= now]
+        self._after_callbacks = [c for c in self._after_callbacks if c[0] > now]
+        for _, func, args in due:
+            func(*args)
+
+    def protocol(self, name, func=None):
+        self._protocols[name] = func
+
+    def destroy(self):
+        self.destroyed = 1
+
+    def winfo_toplevel(self):
+        return self
+
+    def title(self, *args):
+        pass
+
+    def iconphoto(self, *args):
+        pass
+
+    def iconbitmap(self, *args):
+        pass
+
+    def resizable(self, *args):
+        pass
+
+    def attributes(self, *args):
+        pass
+
+
+class _Canvas:
+    """
+        Represents the Tk canvas the game is drawn on. Bound event handlers can be fired with Screen.move_mouse().
+
+        Attributes:
+            _rootwindow (_Root()): The root window the canvas belongs to
+            bindings (dict): Stores the event handler bound to each event sequence (Ex: "<Motion>")
+    """
+
+    def __init__(self, root):
+        self._rootwindow = root
+        self.bindings = {}
+
+    def bind(self, sequence, func=None, add=None):
+        self.bindings[sequence] = func
+
+    def config(self, **kwargs):
+        pass
+
+    configure = config
+
+    def winfo_toplevel(self):
+        return self._rootwindow
+
+
+class _Event:
+    """
+        Represents a Tk event with the position of the cursor on the canvas.
+    """
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _Screen:
+    """
+        Represents the turtle screen.
+
+        Attributes:
+            _root (_Root()): The root window
+            cv (_Canvas()): The canvas the game is drawn on
+            _shapes (set): Stores the name of every shape that can be used
+            _turtles (list): Stores every turtle that has been created
+            _key_handlers (dict): Stores the function bound to each key
+            _click_handler (function): Stores the function bound to a click on the screen
+            width (int): The width of the screen
+            height (int): The height of the screen
+            background (string): The current background picture
+            update_count (int): The number of times the screen has been updated
+    """
+
+    def __init__(self):
+        self._root = _Root()
+        self.cv = _Canvas(self._root)
+        self._shapes = set(BUILT_IN_SHAPES)
+        self._turtles = []
+        self._key_handlers = {}
+        self._click_handler = None
+        self.width = 1280
+        self.height = 720
+        self.background = "nopic"
+        self.update_count = 0
+
+    def title(self, titlestring):
+        pass
+
+    def bgcolor(self, *args):
+        pass
+
+    def bgpic(self, picname=None):
+        if picname is None:
+            return self.background
+        self.background = picname
+
+    def setup(self, width=1280, height=720, startx=None, starty=None):
+        self.width = width
+        self.height = height
+
+    def window_width(self):
+        return self.width
+
+    def window_height(self):
+        return self.height
+
+    def tracer(self, n=None, delay=None):
+        pass
+
+    def update(self):
+        self.update_count = self.update_count + 1
+        self._root.run_due_callbacks()
+
+    def addshape(self, name, shape=None):
+        # The real turtle module reads the image here, so a missing texture fails in the same place
+        if shape is None and name.lower().endswith(".gif") and not _texture_exists(name):
+            raise TurtleGraphicsError(f"Bad arguments for register_shape: {name}")
+        self._shapes.add(name)
+
+    register_shape = addshape
+
+    def getshapes(self):
+        return sorted(self._shapes)
+
+    def turtles(self):
+        return self._turtles
+
+    def getcanvas(self):
+        return self.cv
+
+    def listen(self, xdummy=None, ydummy=None):
+        pass
+
+    def onkeypress(self, fun, key=None):
+        self._key_handlers[key] = fun
+
+    onkey = onkeypress
+
+    def onscreenclick(self, fun, btn=1, add=None):
+        self._click_handler = fun
+
+    def textinput(self, title, prompt):
+        return None
+
+    def numinput(self, title, prompt, default=None, minval=None, maxval=None):
+        return None
+
+    def press(self, key):
+        """
+            Fires the function bound to a key, as if the key was pressed.
+
+            :param key: The key to press
+            :type key: string
+
+            :return: None
+        """
+
+        handler = self._key_handlers.get(key)
+        if handler is not None:
+            handler()
+
+    def click(self, x, y):
+        """
+            Fires the function bound to a click on the screen, as if the screen was clicked at (x, y).
+
+            :param x: The x-coordinate of the click
+            :type x: float
+
+            :param y: The y-coordinate of the click
+            :type y: float
+
+            :return: None
+        """
+
+        if self._click_handler is not None:
+            self._click_handler(x, y)
+
+    def move_mouse(self, x, y):
+        """
+            Fires the function bound to "<Motion>" on the canvas, as if the cursor moved to (x, y).
+
+            :param x: The x-coordinate of the cursor on the canvas
+            :type x: int
+
+            :param y: The y-coordinate of the cursor on the canvas
+            :type y: int
+
+            :return: None
+        """
+
+        handler = self.cv.bindings.get("<Motion>")
+        if handler is not None:
+            handler(_Event(x, y))
+
+
+_screen = None
+
+
+def Screen():
+    """
+        Returns the one and only screen, creating it on first use (The same as the turtle module).
+
+        :return: The screen
+        :type: _Screen()
+    """
+
+    global _screen
+    if _screen is None:
+        _screen = _Screen()
+    return _screen
+
+
+class Turtle:
+    """
+        Represents a turtle sprite. The position, heading, shape, colour, size, visibility and written text are kept
+            in plain attributes instead of being drawn.
+    """
+
+    def __init__(self, shape="classic", undobuffersize=1000, visible=True):
+        self.screen = Screen()
+        self.screen.turtles().append(self)
+        self._x = 0.0
+        self._y = 0.0
+        self._heading = 0.0
+        self._shape = shape
+        self._visible = visible
+        self._pen_down = True
+        self._pen_color = "black"
+        self._fill_color = "black"
+        self._stretch = (1, 1, 1)
+        self._speed = 3
+        self.text = None
+        self.write_count = 0
+
+    def getscreen(self):
+        return self.screen
+
+    def shape(self, name=None):
+        if name is None:
+            return self._shape
+        # Checked against getshapes() the same way the turtle module does (The texture registry registers textures
+        #   on first use there)
+        if name not in self.screen._shapes and name not in self.screen.getshapes():
+            raise TurtleGraphicsError(f"There is no shape named {name}")
+        self._shape = name
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
+        if stretch_wid is None and stretch_len is None and outline is None:
+            return self._stretch
+        wid = stretch_wid if stretch_wid is not None else self._stretch[0]
+        length = stretch_len if stretch_len is not None else (stretch_wid if stretch_wid is not None else self._stretch[1])
+        self._stretch = (wid, length, outline if outline is not None else self._stretch[2])
+
+    turtlesize = shapesize
+
+    def speed(self, speed=None):
+        if speed is None:
+            return self._speed
+        self._speed = speed
+
+    def penup(self):
+        self._pen_down = False
+
+    pu = up = penup
+
+    def pendown(self):
+        self._pen_down = True
+
+    pd = down = pendown
+
+    def isdown(self):
+        return self._pen_down
+
+    def hideturtle(self):
+        self._visible = False
+
+    ht = hideturtle
+
+    def showturtle(self):
+        self._visible = True
+
+    st = showturtle
+
+    def isvisible(self):
+        return self._visible
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        self._x = float(x)
+        self._y = float(y)
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        self._x = float(x)
+
+    def sety(self, y):
+        self._y = float(y)
+
+    def xcor(self):
+        return self._x
+
+    def ycor(self):
+        return self._y
+
+    def position(self):
+        return Vec2D(self._x, self._y)
+
+    pos = position
+
+    def setheading(self, to_angle):
+        self._heading = float(to_angle) % 360
+
+    seth = setheading
+
+    def heading(self):
+        return self._heading
+
+    def left(self, angle):
+        self.setheading(self._heading + angle)
+
+    lt = left
+
+    def right(self, angle):
+        self.setheading(self._heading - angle)
+
+    rt = right
+
+    def forward(self, distance):
+        radians = math.radians(self._heading)
+        self._x = self._x + distance * math.cos(radians)
+        self._y = self._y + distance * math.sin(radians)
+
+    fd = forward
+
+    def backward(self, distance):
+        self.forward(-distance)
+
+    bk = back = backward
+
+    def distance(self, x, y=None):
+        if y is None:
+            if isinstance(x, Turtle):
+                x, y = x.position()
+            else:
+                x, y = x
+        return math.hypot(x - self._x, y - self._y)
+
+    def towards(self, x, y=None):
+        if y is None:
+            if isinstance(x, Turtle):
+                x, y = x.position()
+            else:
+                x, y = x
+        return math.degrees(math.atan2(y - self._y, x - self._x)) % 360
+
+    def pencolor(self, *args):
+        if not args:
+            return self._pen_color
+        self._pen_color = args[0] if len(args) == 1 else args
+
+    def fillcolor(self, *args):
+        if not args:
+            return self._fill_color
+        self._fill_color = args[0] if len(args) == 1 else args
+
+    def color(self, *args):
+        if not args:
+            return self._pen_color, self._fill_color
+        if len(args) == 1:
+            self._pen_color = self._fill_color = args[0]
+        elif len(args) == 2:
+            self._pen_color, self._fill_color = args
+        else:
+            self._pen_color = self._fill_color = args
+
+    def write(self, arg, move=False, align="left", font=("Arial", 8, "normal")):
+        self.text = str(arg)
+        self.write_count = self.write_count + 1
+
+    def clear(self):
+        self.text = None
+
+    def reset(self):
+        self.clear()
+        self._x = 0.0
+        self._y = 0.0
+        self._heading = 0.0
+        self._pen_down = True
+        self._pen_color = "black"
+        self._fill_color = "black"
+        self._stretch = (1, 1, 1)
+
+
+class HeadlessSoundBank:
+    """
+        Takes the place of the SoundBank in headless mode. Sounds are counted instead of played.
+
+        Attributes:
+            play_count (int): The number of sounds played since the game started
+    """
+
+    def __init__(self):
+        self.play_count = 0
+
+    def get_sound(self, name):
+        return None
+
+    def play(self, name):
+        self.play_count = self.play_count + 1
@@ -20,8 +20,13 @@
     Description:
     This file contains the logic for the hover detection on buttons.
     Whenever the cursor is hovering over a specific button, a yellow highlight is created around the button frame.
+    The hitboxes of the buttons on the screen are put into an index sorted by their top edge, which is only rebuilt
+        when the buttons on the screen change. Cursor motion is only stored when it happens, and is checked against the
+        index once per frame, so that a button is only redrawn when the cursor enters or leaves it.
 """
 
+import bisect
+
 
 class Hover:
     """
@@ -30,6 +35,15 @@ class Hover:
         Pointers:
             _screen (ScreenUpdate()): A pointer to the screen updater.
             _button (SpawnButton()): A pointer to the button container.
+
+        Attributes:
+            _cursor_x (int): The latest x-coordinate of the cursor on the canvas (None before the cursor has moved)
+            _cursor_y (int): The latest y-coordinate of the cursor on the canvas
+            _cursor_update (int): Determines if the cursor has moved since the last frame
+
+            _hitbox_tops (list): The top edge of every hitbox in the index, sorted from top to bottom
+            _hitboxes (list): The left, right, top and bottom edges of every hitbox and its button, in the same order
+            hovered_button (Button()): The button that the cursor is currently over (None if it is not over one)
     """
 
     def __init__(self, screen, button):
@@ -46,6 +60,14 @@ class Hover:
         self._screen = screen
         self._button = button
 
+        self._cursor_x = None
+        self._cursor_y = None
+        self._cursor_update = 0
+
+        self._hitbox_tops = []
+        self._hitboxes = []
+        self.hovered_button = None
+
     def __del__(self):
         """
             Clear the variables from memory once the program has terminated
@@ -55,12 +77,17 @@ class Hover:
 
         del self._screen
         del self._button
+        del self._cursor_x
+        del self._cursor_y
+        del self._cursor_update
+        del self._hitbox_tops
+        del self._hitboxes
+        del self.hovered_button
 
     def hover(self, event):
         """
-            Change the color of the button text to yellow when the mouse is hovering over it.
-            It also changes the colors to red/orange for the control buttons based on if there is a keybind conflict or
-                not.
+            Stores the position of the cursor whenever it moves. The highlights are updated in update() once per frame,
+                no matter how many times the cursor moved.
 
             :param event: Holds the current position of the cursor on the screen
             :type event: tkinter.Event()
@@ -69,29 +96,95 @@ class Hover:
         """
 
         # Extract x and y coordinate of the cursor
-        a, b = event.x, event.y
-        # Update button highlight as needed based on the cursors position
-        if self._screen.mode == "Title_Mode":
-            for bu in self._button.buttons_on_screen_list:
-                bu.update_highlight(a, b)
-        if self._screen.mode == "Machine_Mode" or self._screen.mode == "Alien_Mode" or self._screen.mode == "Stats" or self._screen.mode == "Shop":
-            for bu in self._button.buttons_on_screen_list:
-                self._button.button_update = bu.update_highlight(a, b)
-        if self._screen.mode == "Settings":
-            for bu in self._button.buttons_on_screen_list:
-                if bu.type == "Regular_Settings_And_Controls":
-                    if bu.id == 1:
-                        self._button.button_update = bu.update_highlight(a, b)
-                    else:
-                        bu.update_highlight(a, b)
-                else:
-                    bu.update_highlight(a, b)
-        if self._screen.mode == "Controls":
-            for bu in self._button.buttons_on_screen_list:
-                if bu.type == "Regular_Settings_And_Controls":
-                    if bu.id == 1:
-                        self._button.button_update = bu.update_highlight(a, b)
-                    else:
-                        bu.update_highlight(a, b)
-                elif bu.type == "Controls_Toggle":
-                    bu.update_highlight(a, b)
+        self.move_cursor(event.x, event.y)
+
+    def move_cursor(self, x, y):
+        """
+            Stores the position of the cursor on the canvas.
+
+            :param x: The x-coordinate of the cursor on the canvas
+            :type x: int
+
+            :param y: The y-coordinate of the cursor on the canvas
+            :type y: int
+
+            :return: None
+        """
+
+        self._cursor_x, self._cursor_y = x, y
+        self._cursor_update = 1
+
+    def build_index(self):
+        """
+            Builds the hit-test index from the hitboxes of the buttons currently on the screen.
+
+            :return: None
+        """
+
+        hitboxes = []
+        for bu in self._button.buttons_on_screen_list:
+            hitbox = bu.get_hitbox()
+            if hitbox is not None:
+                hitboxes.append(hitbox + (bu,))
+        hitboxes.sort(key=lambda h: h[2])
+        self._hitbox_tops = [h[2] for h in hitboxes]
+        self._hitboxes = hitboxes
+
+    def get_button_at(self, x, y):
+        """
+            Finds the button under a point on the canvas using the hit-test index.
+
+            :param x: The x-coordinate of the point (Origin at the top left of the canvas)
+            :type x: float
+
+            :param y: The y-coordinate of the point
+            :type y: float
+
+            :return: The button under the point (None if there is no button there)
+            :type: Button()
+        """
+
+        # Only the hitboxes that start above the point can contain it
+        for i in range(bisect.bisect_left(self._hitbox_tops, y) - 1, -1, -1):
+            left, right, top, bottom, bu = self._hitboxes[i]
+            if left < x < right and top < y < bottom:
+                return bu
+        return None
+
+    def update(self):
+        """
+            Change the color of the button to yellow when the mouse is hovering over it, and back to white when it
+                leaves.
+
+            :return: None
+        """
+
+        # When the buttons on the screen have changed, rebuild the index and redraw every button once, since reused
+        #   button sprites can still have the highlight from the screen they were last used on
+        if self._button.hitbox_update == 1:
+            self.build_index()
+            self._button.hitbox_update = 0
+            self.hovered_button = None
+            for left, right, top, bottom, bu in self._hitboxes:
+                bu.highlighted = None
+                bu.set_highlight(False)
+            self._cursor_update = 1
+
+        if self._cursor_update == 0 or self._cursor_x is None:
+            return
+        self._cursor_update = 0
+
+        # Only the buttons the cursor has entered or left are changed
+        hovered_button = self.get_button_at(self._cursor_x, self._cursor_y)
+        if hovered_button is not self.hovered_button:
+            if self.hovered_button is not None:
+                self.hovered_button.set_highlight(False)
+            if hovered_button is not None:
+                hovered_button.set_highlight(True)
+            self.hovered_button = hovered_button
+
+        # The main menu button can be in different locations depending on the screen
+        if hovered_button is not None and hovered_button.is_main_menu_button():
+            self._button.button_update = 1
+        else:
+            self._button.button_update = 0
@@ -0,0 +1,300 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: InputRecorder.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains the input recorder, which is used to record a session of the game and replay it exactly.
+    A recording holds the seed given to the random module, the length of every frame, every key press, click and
+        cursor movement (With the frame it happened on) and the answers given to the keybind dialogs.
+    When a recording is replayed, the frame lengths are fed to the game clock and the inputs are run on the same frames
+        they happened on, so the game runs the same way it did when it was recorded. Live input is ignored while
+        replaying. The replay can either wait for the recorded frame lengths or run as fast as possible.
+    Recordings are stored as gzip compressed JSON.
+"""
+
+import gzip
+import json
+import random
+import time
+
+
+class InputRecorder:
+    """
+        Represents the recording and replaying of the player inputs in Laser Fighter.
+
+        Class Variables:
+            VERSION (int): The version of the recording file format
+
+        Pointers:
+            _game_clock (GameClock()): Pointer to the game clock.
+
+        Attributes:
+            mode (string): Whether the recorder is "Off", recording ("Record") or replaying ("Replay")
+            fast (int): Determines if the replay runs as fast as possible instead of waiting for the recorded frames
+            path (string): The path of the recording file
+            seed (int): The seed given to the random module at the start of the session
+            start_mode (string): The screen the session started on (None for the title screen)
+            frame (int): The index of the current frame (-1 before the first frame)
+
+            _handlers (dict): Stores the input function for each input name
+            _frame_times (list): The length of every frame in seconds
+            _events (list): Every input as [frame, name, arguments], in the order they happened
+            _prompts (list): Every dialog answer as [name, answer], in the order they were given
+            _event_index (int): The index of the next input to replay
+            _prompt_index (int): The index of the next dialog answer to replay
+            _last_frame_time (float): The time the last replayed frame started (From time.perf_counter())
+    """
+
+    VERSION = 1
+
+    def __init__(self, game_clock):
+        """
+            Creates the input recorder (It is off until a recording or replay is started).
+
+            :param game_clock: Pointer to the game clock.
+            :type game_clock: GameClock()
+        """
+
+        self._game_clock = game_clock
+
+        self.mode = "Off"
+        self.fast = 0
+        self.path = None
+        self.seed = None
+        self.start_mode = None
+        self.frame = -1
+
+        self._handlers = {}
+        self._frame_times = []
+        self._events = []
+        self._prompts = []
+        self._event_index = 0
+        self._prompt_index = 0
+        self._last_frame_time = 0.0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._game_clock
+        del self.mode
+        del self.fast
+        del self.path
+        del self.seed
+        del self.start_mode
+        del self.frame
+        del self._handlers
+        del self._frame_times
+        del self._events
+        del self._prompts
+        del self._event_index
+        del self._prompt_index
+        del self._last_frame_time
+
+    def start_recording(self, path, start_mode=None, seed=None):
+        """
+            Starts recording the session. Must be called before the game loop starts.
+
+            :param path: The path to write the recording to when the game closes
+            :type path: string
+
+            :param start_mode: The screen the session starts on (None for the title screen)
+            :type start_mode: string
+
+            :param seed: The seed to give the random module (A new one is picked if None)
+            :type seed: int
+
+            :return: None
+        """
+
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.mode = "Record"
+        self.path = path
+        self.seed = seed
+        self.start_mode = start_mode
+        random.seed(seed)
+
+    def start_replay(self, path, fast=0):
+        """
+            Loads a recording and starts replaying it. Must be called before the game loop starts.
+
+            :param path: The path of the recording
+            :type path: string
+
+            :param fast: 1 to run the replay as fast as possible, 0 to wait for the recorded frame lengths
+            :type fast: int
+
+            :return: None
+        """
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            recording = json.load(file)
+        if recording["version"] != self.VERSION:
+            raise ValueError("Recording version {} is not supported.".format(recording["version"]))
+
+        self.mode = "Replay"
+        self.fast = fast
+        self.path = path
+        self.seed = recording["seed"]
+        self.start_mode = recording["start_mode"]
+        self._frame_times = recording["frame_times"]
+        self._events = recording["events"]
+        self._prompts = recording["prompts"]
+        self._game_clock.start_time = recording["start_time"]
+        self._game_clock.now = recording["start_time"]
+        random.seed(self.seed)
+        self._last_frame_time = time.perf_counter()
+
+    def save(self):
+        """
+            Writes the recording to the disk (Only when recording).
+
+            :return: None
+        """
+
+        if self.mode != "Record":
+            return
+        recording = {"version": self.VERSION,
+                     "seed": self.seed,
+                     "start_mode": self.start_mode,
+                     "start_time": self._game_clock.start_time,
+                     "frame_times": self._frame_times,
+                     "events": self._events,
+                     "prompts": self._prompts}
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            json.dump(recording, file, separators=(",", ":"))
+
+    def bind(self, name, function):
+        """
+            Registers an input function and returns the function that should be bound to the window instead.
+            The returned function records the input when recording, and ignores live input when replaying.
+
+            :param name: The name of the input stored in the recording (Ex: "Go_Left")
+            :type name: string
+
+            :param function: The function that the input runs
+            :type function: function
+
+            :return: The function to bind to the window
+            :type: function
+        """
+
+        self._handlers[name] = function
+
+        def recorded_function(*args):
+            if self.mode == "Replay":
+                return
+            if self.mode == "Record":
+                self._events.append([self.frame, name, list(args)])
+            function(*args)
+
+        return recorded_function
+
+    def prompt(self, name, function, *args, **kwargs):
+        """
+            Shows a dialog and returns the answer. The answer is recorded when recording, and the recorded answer is
+                returned without showing the dialog when replaying.
+
+            :param name: The name of the dialog stored in the recording (Ex: "Key_Input")
+            :type name: string
+
+            :param function: The function that shows the dialog
+            :type function: function
+
+            :param args: The arguments for the dialog function
+            :param kwargs: The keyword arguments for the dialog function
+
+            :return: The answer to the dialog
+        """
+
+        if self.mode == "Replay":
+            # Skip answers to other dialogs so that a mismatch does not shift every answer after it
+            while self._prompt_index < len(self._prompts):
+                prompt_name, answer = self._prompts[self._prompt_index]
+                self._prompt_index = self._prompt_index + 1
+                if prompt_name == name:
+                    return answer
+            return None
+
+        answer = function(*args, **kwargs)
+        if self.mode == "Record":
+            self._prompts.append([name, answer])
+        return answer
+
+    def next_frame_time(self):
+        """
+            Gets the recorded length of the next frame when replaying. Waits for the recorded length to pass first,
+                unless the replay is running as fast as possible.
+
+            :return: The length of the next frame in seconds (None when not replaying, or when the recording has run out)
+            :type: float
+        """
+
+        if self.mode != "Replay" or self.frame + 1 >= len(self._frame_times):
+            return None
+        frame_time = self._frame_times[self.frame + 1]
+        if self.fast == 0:
+            # Wait until the frame has taken as long as it did when it was recorded
+            remaining_time = frame_time - (time.perf_counter() - self._last_frame_time)
+            if remaining_time > 0:
+                time.sleep(remaining_time)
+            self._last_frame_time = time.perf_counter()
+        return frame_time
+
+    def begin_frame(self, frame_time):
+        """
+            Moves the recorder to the next frame. Called right after the game clock ticks.
+
+            :param frame_time: The length of the frame in seconds (From the game clock)
+            :type frame_time: float
+
+            :return: None
+        """
+
+        self.frame = self.frame + 1
+        if self.mode == "Record":
+            self._frame_times.append(frame_time)
+
+    def dispatch(self):
+        """
+            Runs the recorded inputs for the current frame when replaying. Called right after the window is updated,
+                which is where live input is run.
+
+            :return: None
+        """
+
+        if self.mode != "Replay":
+            return
+        while self._event_index < len(self._events) and self._events[self._event_index][0] <= self.frame:
+            event_frame, name, args = self._events[self._event_index]
+            self._event_index = self._event_index + 1
+            self._handlers[name](*args)
+
+    def is_replay_finished(self):
+        """
+            Checks if the current frame is the last frame of the recording.
+
+            :return: True if the replay has reached the last recorded frame, False otherwise
+            :type: bool
+        """
+
+        return self.mode == "Replay" and self.frame + 1 >= len(self._frame_times)
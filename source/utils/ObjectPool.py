@@ -0,0 +1,155 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: ObjectPool.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        A pool of reusable sprite objects for the Spawn containers. Objects that are removed from the screen are
+            released back to the pool and put on a free list, so spawning takes the last freed object right away
+            instead of going through every sprite ever created and asking Tk if it is visible.
+
+        Free objects can be sorted into groups with a key (Ex: buttons with and without a button indicator), so that
+            a spawn can ask for an object from a certain group first.
+"""
+
+
+class ObjectPool:
+    """
+        Represents a pool of reusable objects.
+
+        Class Variables:
+            all_pools (list): Contains every pool that has been created (Used to report the stats of every pool)
+
+        Attributes:
+            name (string): The name of the pool (Used in the stats)
+            objects (list): Contains every object created for the pool, even the ones removed from the screen
+            _free (dict): Stores a list of the free objects for each key
+            _free_ids (set): Stores the id of every free object (So that an object cannot be released twice)
+            live (int): The number of objects currently in use
+            high_water_mark (int): The most objects that have been in use at the same time
+    """
+
+    all_pools = []
+
+    def __init__(self, name):
+        """
+            Creates an empty pool.
+
+            :param name: The name of the pool
+            :type name: string
+        """
+
+        self.name = name
+        self.objects = []
+        self._free = {}
+        self._free_ids = set()
+        self.live = 0
+        self.high_water_mark = 0
+
+        ObjectPool.all_pools.append(self)
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self.name
+        del self.objects
+        del self._free
+        del self._free_ids
+        del self.live
+        del self.high_water_mark
+
+    def add(self, obj):
+        """
+            Adds a newly created object to the pool. The object starts out in use.
+
+            :param obj: The object that was created
+            :type obj: object
+
+            :return: None
+        """
+
+        self.objects.append(obj)
+        self.live = self.live + 1
+        self.high_water_mark = max(self.high_water_mark, self.live)
+
+    def acquire(self, key=None):
+        """
+            Takes a free object from the pool.
+
+            :param key: The group to take the object from (Takes from any group if None)
+            :type key: object
+
+            :return: A free object, or None if there are no free objects (A new object should be created and added)
+            :type: object
+        """
+
+        if key is None:
+            free = next((f for f in self._free.values() if f), None)
+        else:
+            free = self._free.get(key)
+        if not free:
+            return None
+
+        obj = free.pop()
+        self._free_ids.discard(id(obj))
+        self.live = self.live + 1
+        self.high_water_mark = max(self.high_water_mark, self.live)
+        return obj
+
+    def release(self, obj, key=None):
+        """
+            Puts an object that was removed from the screen back on the free list.
+
+            :param obj: The object that was removed
+            :type obj: object
+
+            :param key: The group to put the object in
+            :type key: object
+
+            :return: None
+        """
+
+        if id(obj) in self._free_ids:
+            return
+        self._free.setdefault(key, []).append(obj)
+        self._free_ids.add(id(obj))
+        self.live = self.live - 1
+
+    def get_free_count(self):
+        """
+            Finds the number of free objects in the pool.
+
+            :return: The number of free objects
+            :type: int
+        """
+
+        return len(self._free_ids)
+
+    def get_stats(self):
+        """
+            Creates the stats for the pool.
+
+            :return: The number of objects in use, free and created, and the most that were in use at once
+            :type: dict
+        """
+
+        return {"live": self.live, "free": self.get_free_count(), "total": len(self.objects),
+                "high_water_mark": self.high_water_mark}
@@ -24,6 +24,9 @@
 
 import configparser
 import threading
+import time
+import os
+from contextlib import contextmanager
 from tkinter import messagebox
 
 
@@ -34,8 +37,17 @@ class PlayerDataManager:
         Attributes:
             _file_path (string): The path to the playerData file
             config (configparser.ConfigParser()): The parser object for the file.
+
+            _dirty (int): Determines whether there are changes that have not been written to the file yet
+            _batch_depth (int): The number of batches that are currently open (Flushing waits until this is 0)
+            _last_flush_time (float): The time the file was last written to
+            _start_time (float): The time the parser was created
+            write_count (int): The number of times the file has been written to since the game started
     """
 
+    # The number of seconds between timed flushes of unsaved changes
+    FLUSH_INTERVAL = 5
+
     # Sets the instance to "None" at the beginning
     _instance = None
     # Ensure thread-safe access
@@ -58,6 +70,11 @@ class PlayerDataManager:
                 cls._instance = super(PlayerDataManager, cls).__new__(cls)
                 cls._instance._file_path = file_path
                 cls._instance.config = configparser.ConfigParser()
+                cls._instance._dirty = 0
+                cls._instance._batch_depth = 0
+                cls._instance._last_flush_time = time.time()
+                cls._instance._start_time = time.time()
+                cls._instance.write_count = 0
                 cls._instance.load()
         return cls._instance
 
@@ -72,17 +89,94 @@ class PlayerDataManager:
 
     def save(self):
         """
-            Saves the new data to the playerData file and updates it.
+            Writes the playerData file to the disk. The file is written to a temporary file first and then renamed over
+                the old one so that the file is never left half written.
+
+            :return: None
+        """
+
+        temp_path = self._file_path + '.tmp'
+        try:
+            with open(temp_path, 'w') as configfile:
+                self.config.write(configfile)
+            os.replace(temp_path, self._file_path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Error saving config file: {e}")
+            return
+        self._dirty = 0
+        self._last_flush_time = time.time()
+        self.write_count = self.write_count + 1
+
+    def begin(self):
+        """
+            Opens a batch of changes. The file will not be written to until every open batch has been committed.
+
+            :return: None
+        """
+
+        self._batch_depth = self._batch_depth + 1
+
+    def commit(self):
+        """
+            Closes the most recently opened batch of changes.
+
+            :return: None
+        """
+
+        if self._batch_depth > 0:
+            self._batch_depth = self._batch_depth - 1
+
+    @contextmanager
+    def batch(self):
+        """
+            Groups every set() call inside of a "with" block into a single batch.
 
             :return: None
         """
 
-        with open(self._file_path, 'w') as configfile:
-            self.config.write(configfile)
+        self.begin()
+        try:
+            yield self
+        finally:
+            self.commit()
+
+    def flush(self):
+        """
+            Writes any unsaved changes to the playerData file, unless a batch is still open.
+
+            :return: None
+        """
+
+        if self._dirty == 1 and self._batch_depth == 0:
+            self.save()
+
+    def flush_if_due(self):
+        """
+            Writes any unsaved changes to the playerData file once FLUSH_INTERVAL seconds have passed since the last write.
+
+            :return: None
+        """
+
+        if self._dirty == 1 and time.time() - self._last_flush_time >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def get_writes_per_minute(self):
+        """
+            Finds the average number of times the playerData file has been written to per minute since the game started.
+
+            :return: The number of writes per minute
+            :type: float
+        """
+
+        elapsed_minutes = (time.time() - self._start_time) / 60
+        if elapsed_minutes <= 0:
+            return 0.0
+        return self.write_count / elapsed_minutes
 
     def set(self, section, key, value):
         """
-            Used to set values in the playerData file.
+            Used to set values in the playerData file. The change is kept in memory and written to the file on the next
+                flush.
 
             :param section: The name of the list in the playerData file to modify
             :type section: string
@@ -100,7 +194,7 @@ class PlayerDataManager:
             if not self.config.has_section(section):
                 self.config.add_section(section)
             self.config.set(section, key, value)
-            self.save()
+            self._dirty = 1
         except configparser.Error as e:
             messagebox.showerror("Error", f"Error saving config file: {e}")
 
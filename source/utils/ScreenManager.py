@@ -22,8 +22,8 @@
         refreshing specific aspects of the screen.
 """
 
-import pygame
 from tkinter import messagebox
+from setup.WindowSetup import sound_bank
 
 
 class ScreenUpdate:
@@ -231,13 +231,11 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         if self._mode == "Machine_Mode" or self._mode == "Alien_Mode" or self._mode == "Stats" or self._mode == "Shop":
             # Check to see if the cursor is in the bound of the button to be clicked
             if (x > -634 * self._scale_factor_x) and (x < -442 * self._scale_factor_x) and (y > 323 * self._scale_factor_y) and (y < 355 * self._scale_factor_y):
                 if self._settings.button_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                    sound.play()
+                    sound_bank.play("button")
                 # Set the mode to "Title_Mode" to change the screen
                 self._mode = "Title_Mode"
                 self._screen_update = 1
@@ -245,14 +243,12 @@ class ScreenUpdate:
                 self._power_up_setup.setup_power_ups()
                 self._machine_mode_setup.setup_machine_mode()
                 self._alien_mode_setup.setup_alien_mode()
-                self._screen.onscreenclick(None)
         # If coming from settings or controls, there may be a special procedure needed
         if self._mode == "Settings" or self._mode == "Controls":
             # Check to see if the cursor is in the bound of the button to be clicked
             if (x > 26 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -315 * self._scale_factor_y) and (y < -254 * self._scale_factor_y):
                 if self._settings.button_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                    sound.play()
+                    sound_bank.play("button")
                 # If certain settings were updated, a restart may be required.
                 # "updated_controls" checks if this is the case.
                 if self._updated_controls == 1:
@@ -270,7 +266,6 @@ class ScreenUpdate:
                         self._power_up_setup.setup_power_ups()
                         self._machine_mode_setup.setup_machine_mode()
                         self._alien_mode_setup.setup_alien_mode()
-                        self._screen.onscreenclick(None)
                         self._updated_controls = 0
                 else:
                     self._mode = "Title_Mode"
@@ -279,7 +274,6 @@ class ScreenUpdate:
                     self._power_up_setup.setup_power_ups()
                     self._machine_mode_setup.setup_machine_mode()
                     self._alien_mode_setup.setup_alien_mode()
-                    self._screen.onscreenclick(None)
 
     def launch_machine_mode(self, x, y):
         """
@@ -294,12 +288,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -252 * self._scale_factor_x) and (x < 250 * self._scale_factor_x) and (y > 49 * self._scale_factor_y) and (y < 121 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Enter Machine Mode
             self._mode = "Machine_Mode"
             self._screen_update = 1
@@ -317,12 +309,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -252 * self._scale_factor_x) and (x < 250 * self._scale_factor_x) and (y > -42 * self._scale_factor_y) and (y < 30 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # If Alien Mode has been unlocked
             if self._shop_config.alien_slot_selected != 0:
                 # Enter Alien Mode
@@ -342,12 +332,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -252 * self._scale_factor_x) and (x < 250 * self._scale_factor_x) and (y > -133 * self._scale_factor_y) and (y < -61 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Enter The Shop
             self._mode = "Shop"
             # Display the Machine Mode page by default
@@ -370,12 +358,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -641 * self._scale_factor_x) and (x < -566 * self._scale_factor_x) and (y > 99 * self._scale_factor_y) and (y < 201 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Enter the Machine Mode page
             self._page = "Machine_Mode"
             self._screen_update = 1
@@ -397,12 +383,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -641 * self._scale_factor_x) and (x < -566 * self._scale_factor_x) and (y > -21 * self._scale_factor_y) and (y < 81 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Enter the Alien Mode page
             self._page = "Alien_Mode"
             self._screen_update = 1
@@ -424,12 +408,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -641 * self._scale_factor_x) and (x < -566 * self._scale_factor_x) and (y > -141 * self._scale_factor_y) and (y < -39 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Enter the Power Ups page
             self._page = "Power_Ups"
             self._screen_update = 1
@@ -450,12 +432,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -641 * self._scale_factor_x) and (x < -566 * self._scale_factor_x) and (y > -261 * self._scale_factor_y) and (y < -159 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Enter the Gadgets page
             self._page = "Gadgets"
             self._screen_update = 1
@@ -476,12 +456,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 9 * self._scale_factor_x) and (x < 250 * self._scale_factor_x) and (y > -224 * self._scale_factor_y) and (y < -150 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Go to the statistics screen
             self._mode = "Stats"
             self._screen_update = 1
@@ -500,14 +478,12 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # If entering from the title screen
         if self._mode == "Title_Mode":
             # Check to see if the cursor is in the bound of the button to be clicked
             if (x > -252 * self._scale_factor_x) and (x < -10 * self._scale_factor_x) and (y > -224 * self._scale_factor_y) and (y < -150 * self._scale_factor_y):
                 if self._settings.button_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                    sound.play()
+                    sound_bank.play("button")
                 # Change to settings
                 self._mode = "Settings"
                 self._screen_update = 1
@@ -516,13 +492,10 @@ class ScreenUpdate:
             # Check to see if the cursor is in the bound of the button to be clicked
             if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -235 * self._scale_factor_y) and (y < -173 * self._scale_factor_y):
                 if self._settings.button_sound == 1:
-                    sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                    sound.play()
+                    sound_bank.play("button")
                 # Change to settings
                 self._mode = "Settings"
                 self._screen_update = 1
-                # Used so that there is no delay in clicking this button from the controls screen
-                self._button.clickable = 1
 
     def launch_controls_mode(self, x, y):
         """
@@ -540,13 +513,65 @@ class ScreenUpdate:
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -235 * self._scale_factor_y) and (y < -173 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Go to the controls screen
             self._mode = "Controls"
             self._screen_update = 1
-            # Used so that there is no delay in clicking this button from the settings screen
-            self._button.clickable = 2
+
+    def is_mode_available(self, mode):
+        """
+            Checks if a screen can be entered with the current save (Ex: Alien Mode must be unlocked first).
+
+            :param mode: The name of the screen (Ex: "Alien_Mode")
+            :type mode: string
+
+            :return: True if the screen can be entered
+            :type: bool
+        """
+
+        if mode == "Machine_Mode":
+            return self._shop_config.machine_slot_selected != 0 or 1 in self._shop_config.machine_slots_unlocked
+        if mode == "Alien_Mode":
+            return self._shop_config.alien_slot_selected != 0 or 1 in self._shop_config.alien_slots_unlocked
+        return mode in ("Title_Mode", "Shop", "Stats", "Settings", "Controls")
+
+    def start_in_mode(self, mode):
+        """
+            Enters a screen directly when the game is started on a screen other than the title screen. The same checks
+                and setup as the title screen buttons are done, and the first unlocked machine player or gun is used
+                if none is selected.
+
+            :param mode: The name of the screen (Ex: "Alien_Mode")
+            :type mode: string
+
+            :return: True if the screen was entered, False if it is not available with the current save
+            :type: bool
+        """
+
+        if not self.is_mode_available(mode):
+            return False
+
+        # Fall back to the first unlocked machine player or gun
+        if self._shop_config.machine_slot_selected == 0 and 1 in self._shop_config.machine_slots_unlocked:
+            self._shop_config.machine_slot_selected = self._shop_config.machine_slots_unlocked.index(1) + 1
+        if self._shop_config.alien_slot_selected == 0 and 1 in self._shop_config.alien_slots_unlocked:
+            self._shop_config.alien_slot_selected = self._shop_config.alien_slots_unlocked.index(1) + 1
+        # Setup the power ups and both Machine Mode and Alien Mode
+        self._power_up_setup.setup_power_ups()
+        self._machine_mode_setup.setup_machine_mode()
+        self._alien_mode_setup.setup_alien_mode()
+
+        self._mode = mode
+        self._screen_update = 1
+        if mode == "Shop":
+            # Display the Machine Mode page by default
+            self._page = "Machine_Mode"
+            self._refresh.refresh_panel = 1
+            self._refresh.refresh_text = 1
+            self._refresh.move_slot_selector = 1
+        elif mode == "Stats":
+            self._refresh.refresh_text = 1
+        return True
 
     def exit_game(self, x, y):
         """
@@ -561,12 +586,10 @@ class ScreenUpdate:
             :return: None
         """
 
-        self._screen.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -252 * self._scale_factor_x) and (x < 250 * self._scale_factor_x) and (y > -315 * self._scale_factor_y) and (y < -241 * self._scale_factor_y):
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # Quit the game and exit the application
             self.on_quit()
 
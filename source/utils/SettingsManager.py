@@ -22,8 +22,8 @@
     This includes all the execution functions for all the buttons on the settings page.
 """
 
-import pygame
 from tkinter import messagebox
+from setup.WindowSetup import sound_bank
 
 
 class SettingsToggle:
@@ -37,15 +37,16 @@ class SettingsToggle:
             _button (SpawnButton()): Pointer to all the button objects currently on the screen
             _settings (Settings()): Pointer to the current game settings
             _refresh (Refresh()): Pointer to the game refresh variables
+            _display_manager (DisplayManager()): Pointer to the display manager (Switches fullscreen on and off)
+            _input_recorder (InputRecorder()): Pointer to the input recorder (Records and replays the dialog answers).
 
         Attributes:
             _scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
             _scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
-
-            _fullscreen_toggled (int): Determines if the fullscreen settings has been toggled while in-game.
     """
 
-    def __init__(self, window, screen, button, settings, refresh, scale_factor_x, scale_factor_y):
+    def __init__(self, window, screen, button, settings, refresh, display_manager, input_recorder, scale_factor_x,
+                 scale_factor_y):
         """
             Initializes all the necessary pointers for the Settings Manager.
 
@@ -64,6 +65,12 @@ class SettingsToggle:
             :param refresh: Pointer to the game refresh variables.
             :type refresh: Refresh
 
+            :param display_manager: Pointer to the display manager.
+            :type display_manager: DisplayManager
+
+            :param input_recorder: Pointer to the input recorder.
+            :type input_recorder: InputRecorder
+
             :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode.
             :type scale_factor_x: float
 
@@ -77,12 +84,12 @@ class SettingsToggle:
         self._button = button
         self._settings = settings
         self._refresh = refresh
+        self._display_manager = display_manager
+        self._input_recorder = input_recorder
 
         self._scale_factor_x = scale_factor_x
         self._scale_factor_y = scale_factor_y
 
-        self._fullscreen_toggled = 0
-
     def __del__(self):
         """
             Clear the variables from memory once the program has terminated
@@ -95,22 +102,15 @@ class SettingsToggle:
         del self._button
         del self._settings
         del self._refresh
+        del self._display_manager
+        del self._input_recorder
         del self._scale_factor_x
         del self._scale_factor_y
-        del self._fullscreen_toggled
 
     @property
     def fullscreen_toggled(self) -> int:
-        """fullscreen_toggled getter"""
-        return self._fullscreen_toggled
-
-    @fullscreen_toggled.setter
-    def fullscreen_toggled(self, value: int) -> None:
-        """fullscreen_toggled setter"""
-        if isinstance(value, int):
-            self._fullscreen_toggled = value
-        else:
-            raise ValueError("fullscreen_toggled must be a integer")
+        """fullscreen_toggled getter (1 if the fullscreen setting could not be switched in-game and needs a restart)"""
+        return self._display_manager.failed
 
     def toggle_button_sound(self, x, y):
         """
@@ -125,7 +125,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > 165 * self._scale_factor_y) and (y < 226 * self._scale_factor_y):
             if self._settings.button_sound == 1:
@@ -147,7 +146,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > 85 * self._scale_factor_y) and (y < 146 * self._scale_factor_y):
             if self._settings.player_shooting_sound == 1:
@@ -169,7 +167,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > 5 * self._scale_factor_y) and (y < 66 * self._scale_factor_y):
             if self._settings.enemy_shooting_sound == 1:
@@ -191,7 +188,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > -75 * self._scale_factor_y) and (y < -14 * self._scale_factor_y):
             if self._settings.player_death_sound == 1:
@@ -213,7 +209,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > -155 * self._scale_factor_y) and (y < -94 * self._scale_factor_y):
             if self._settings.enemy_death_sound == 1:
@@ -235,7 +230,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > -235 * self._scale_factor_y) and (y < -174 * self._scale_factor_y):
             if self._settings.player_hit_sound == 1:
@@ -257,7 +251,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         if (x > -612 * self._scale_factor_x) and (x < -40 * self._scale_factor_x) and (y > -315 * self._scale_factor_y) and (y < -254 * self._scale_factor_y):
             if self._settings.enemy_hit_sound == 1:
                 self._settings.enemy_hit_sound = 0
@@ -278,7 +271,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > 165 * self._scale_factor_y) and (y < 226 * self._scale_factor_y):
             if self._settings.power_up_pickup_sound == 1:
@@ -300,7 +292,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > 85 * self._scale_factor_y) and (y < 146 * self._scale_factor_y):
             if self._settings.power_up_spawn_sound == 1:
@@ -322,7 +313,6 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > 5 * self._scale_factor_y) and (
                 y < 66 * self._scale_factor_y):
@@ -345,38 +335,24 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -75 * self._scale_factor_y) and (y < -14 * self._scale_factor_y):
+            # Ignore the click while the last switch is still being done
+            if self._display_manager.is_switching():
+                return
             # Button sound is played
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # If fullscreen was originally off
-            if self._settings.fullscreen == 0 and self._fullscreen_toggled == 0:
+            if self._settings.fullscreen == 0:
                 # Warn the player about the effects of performance
-                message_output = messagebox.askyesno("Warning!", "Enabling fullscreen may cause a performance drop and expose your game to bugs. Are you sure you want to enable fullscreen?", icon='warning')
-                # If the player says yes
-                if message_output:
-                    # Toggle fullscreen
-                    self._settings.toggle_fullscreen()
-                    # Alert the game of a needed restart
-                    if self._fullscreen_toggled == 0:
-                        self._fullscreen_toggled = 1
-                        self._screen.updated_controls = 1
-                    else:
-                        self._fullscreen_toggled = 0
-                        self._screen.updated_controls = 0
-            # If fullscreen was originally on
-            else:
-                # Turn it off like normal, but a restart is still required
-                self._settings.toggle_fullscreen()
-                if self._fullscreen_toggled == 0:
-                    self._fullscreen_toggled = 1
-                    self._screen.updated_controls = 1
-                else:
-                    self._fullscreen_toggled = 0
-                    self._screen.updated_controls = 0
+                message_output = self._input_recorder.prompt("Fullscreen_Warning", messagebox.askyesno, "Warning!", "Enabling fullscreen may cause a performance drop and expose your game to bugs. Are you sure you want to enable fullscreen?", icon='warning')
+                # If the player says no
+                if not message_output:
+                    return
+            # Toggle fullscreen and switch to it while the game keeps running (The textures are scaled in the background)
+            self._settings.toggle_fullscreen()
+            self._display_manager.request(self._settings.fullscreen)
             self._refresh.refresh_button = 1
             self._refresh.refresh_indicator = 1
 
@@ -393,14 +369,13 @@ class SettingsToggle:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 29 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -155 * self._scale_factor_y) and (
                 y < -94 * self._scale_factor_y):
             # If VSync was originally off
             if self._settings.vsync == 0:
                 # Warn the user about effects on performance
-                message_output = messagebox.askyesno("Warning!", "Turning on VSync may lower performance. Are you sure you want to enable VSync?", icon='warning')
+                message_output = self._input_recorder.prompt("VSync_Warning", messagebox.askyesno, "Warning!", "Turning on VSync may lower performance. Are you sure you want to enable VSync?", icon='warning')
                 # If the user selects yes
                 if message_output:
                     # Toggle VSync
@@ -427,8 +402,7 @@ class SettingsToggle:
 
         # Button sound is played
         if self._settings.button_sound == 1:
-            sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-            sound.play()
+            sound_bank.play("button")
         # The configuration file is updated
         self._settings.save()
         self._refresh.refresh_button = 1
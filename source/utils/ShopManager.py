@@ -22,12 +22,12 @@
     This includes all the execution functions for all the buttons in the shop.
 """
 
-import pygame
 from tkinter import messagebox
 from setup.data.ShopDescriptions import MACHINE_PRICES
 from setup.data.ShopDescriptions import ALIEN_PRICES
 from setup.data.ShopDescriptions import POWER_UP_PRICES
 from setup.data.ShopDescriptions import GADGET_PRICE
+from setup.WindowSetup import sound_bank
 
 
 class Shop:
@@ -154,7 +154,6 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -503 * self._scale_factor_x) and (x < -352 * self._scale_factor_x) and (y > 11 * self._scale_factor_y) and (y < 182 * self._scale_factor_y):
             # Which item is displayed depends on the current page that is being displayed in the shop
@@ -180,7 +179,6 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -333 * self._scale_factor_x) and (x < -182 * self._scale_factor_x) and (y > 11 * self._scale_factor_y) and (y < 182 * self._scale_factor_y):
             if self._screen.page == "Machine_Mode":
@@ -205,7 +203,6 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -163 * self._scale_factor_x) and (x < -12 * self._scale_factor_x) and (y > 11 * self._scale_factor_y) and (y < 182 * self._scale_factor_y):
             if self._screen.page == "Machine_Mode":
@@ -230,7 +227,6 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 7 * self._scale_factor_x) and (x < 158 * self._scale_factor_x) and (y > 11 * self._scale_factor_y) and (y < 182 * self._scale_factor_y):
             if self._screen.page == "Machine_Mode":
@@ -255,7 +251,6 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > -503 * self._scale_factor_x) and (x < -352 * self._scale_factor_x) and (y > -179 * self._scale_factor_y) and (y < -8 * self._scale_factor_y):
             if self._screen.page == "Machine_Mode":
@@ -278,8 +273,7 @@ class Shop:
 
         # Button sound is played
         if self._settings.button_sound == 1:
-            sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-            sound.play()
+            sound_bank.play("button")
         # If the page is not "Power_Ups" and "Gadgets", the item has to be bought in order for it to be selected
         if current_page != "Power_Ups" and current_page != "Gadgets":
             # Display the slot item on the side panel in the shop
@@ -293,17 +287,13 @@ class Shop:
                     self._shop_config.save()
                     self._refresh.move_slot_selector = 1
                     # Remove the buy button
-                    for bu in self._button.buttons_on_screen_list:
-                        if bu.get_type() == "Buy":
-                            bu.remove()
-                            self._button.buttons_on_screen_list.pop()
+                    for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy"]:
+                        self._button.remove_button(bu)
                 # If the item is not bought
                 else:
                     # Recreate the buy button to show the price for the selected item
-                    for bu in self._button.buttons_on_screen_list:
-                        if bu.get_type() == "Buy":
-                            bu.remove()
-                            self._button.buttons_on_screen_list.pop()
+                    for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy"]:
+                        self._button.remove_button(bu)
                     self._button.spawn_button("Buy", 1)
                     self._price_displayed = MACHINE_PRICES[slot_id - 1]
             elif current_page == "Alien_Mode":
@@ -314,19 +304,13 @@ class Shop:
                     self._shop_config.save()
                     self._refresh.move_slot_selector = 1
                     # Remove the buy button
-                    for bu in self._button.buttons_on_screen_list:
-                        if bu.get_type() == "Buy" or bu.get_type() == "Enable":
-                            bu.remove()
-                            self._button.buttons_on_screen_list.pop()
-                            self._button.current_button_index = self._button.current_button_index - 1
+                    for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy" or bu.get_type() == "Enable"]:
+                        self._button.remove_button(bu)
                 # If the item is not bought
                 else:
                     # Remove the current buy button being displayed
-                    for bu in self._button.buttons_on_screen_list:
-                        if bu.get_type() == "Buy" or bu.get_type() == "Enable":
-                            bu.remove()
-                            self._button.buttons_on_screen_list.pop()
-                            self._button.current_button_index = self._button.current_button_index - 1
+                    for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy" or bu.get_type() == "Enable"]:
+                        self._button.remove_button(bu)
                     # If Alien Mode is unlocked, recreate the buy button
                     #   and display the price and allow the user to buy the item
                     if self._shop_config.alien_slots_unlocked[slot_id -1] != -1:
@@ -405,18 +389,12 @@ class Shop:
             # If there is a price, create a buy button, if not, do not create a button at all
             #   and remove any existing one
             if self._price_displayed != 0:
-                for bu in self._button.buttons_on_screen_list:
-                    if bu.get_type() == "Buy" or bu.get_type() == "Enable":
-                        bu.remove()
-                        self._button.buttons_on_screen_list.pop()
-                        self._button.current_button_index = self._button.current_button_index - 1
+                for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy" or bu.get_type() == "Enable"]:
+                    self._button.remove_button(bu)
                 self._button.spawn_button("Buy", 1)
             else:
-                for bu in self._button.buttons_on_screen_list:
-                    if bu.get_type() == "Buy" or bu.get_type() == "Enable":
-                        bu.remove()
-                        self._button.buttons_on_screen_list.pop()
-                        self._button.current_button_index = self._button.current_button_index - 1
+                for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy" or bu.get_type() == "Enable"]:
+                    self._button.remove_button(bu)
             # If the item is a gadget, an "enable" button should replace the "buy" button when the item is bought
             if current_page == "Gadgets" and self._price_displayed == 0:
                 self._button.spawn_button("Enable", 1)
@@ -437,13 +415,11 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 299 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -328 * self._scale_factor_y) and (y < -212 * self._scale_factor_y):
             # Button sound is played
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             # If the player does not have enough coins, display an error message
             if self._price_displayed > self._shop_config.total_coins:
                 messagebox.showerror("Not Enough Coins!", "You do not have enough coins to purchase this item!")
@@ -456,8 +432,7 @@ class Shop:
                     max_level = 0
                     # Coin sound is played
                     if self._settings.button_sound == 1:
-                        sound = pygame.mixer.Sound("sound/Coin_Pickup_Sound.wav")
-                        sound.play()
+                        sound_bank.play("coin_pickup")
                     # Subtract from the total coins
                     self._shop_config.total_coins = self._shop_config.total_coins - self._price_displayed
                     self._shop_config.save()
@@ -523,11 +498,8 @@ class Shop:
                         self._shop_config.save()
                     # Remove the buy button is the page is not the power ups page or the max level as been reached
                     if self._screen.page != "Power_Ups" or max_level == 1:
-                        for bu in self._button.buttons_on_screen_list:
-                            if bu.get_type() == "Buy" or bu.get_type() == "Enable":
-                                bu.remove()
-                                self._button.buttons_on_screen_list.pop()
-                                self._button.current_button_index = self._button.current_button_index - 1
+                        for bu in [bu for bu in self._button.buttons_on_screen_list if bu.get_type() == "Buy" or bu.get_type() == "Enable"]:
+                            self._button.remove_button(bu)
                         for t in self._textbox.text_on_screen_list:
                             if t.get_id() == current_slot + 3:
                                 t.remove()
@@ -561,13 +533,11 @@ class Shop:
             :return: None
         """
 
-        self._window.onscreenclick(None)
         # Check to see if the cursor is in the bound of the button to be clicked
         if (x > 299 * self._scale_factor_x) and (x < 600 * self._scale_factor_x) and (y > -328 * self._scale_factor_y) and (y < -212 * self._scale_factor_y):
             # Button sound is played
             if self._settings.button_sound == 1:
-                sound = pygame.mixer.Sound("sound/Button_Sound.wav")
-                sound.play()
+                sound_bank.play("button")
             for pa in self._panel.panel_turtle:
                 # Check to see what gadgets is currently being displayed
                 if pa.category == "Gadget":
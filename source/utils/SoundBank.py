@@ -0,0 +1,138 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: SoundBank.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        Holds every sound effect in the game. Each sound file is decoded once and kept in memory so that playing a
+            sound never has to read from the disk. Sounds are played through a fixed pool of mixer channels.
+"""
+
+import pygame
+from tkinter import messagebox
+
+
+class SoundBank:
+    """
+        Represents the collection of decoded sound effects in Laser Fighter.
+
+        Class Variables:
+            SOUND_FILES (dict): Maps the logical name of every sound to its file in the sound folder
+            CHANNEL_COUNT (int): The number of mixer channels reserved for sound effects
+
+        Attributes:
+            _sounds (dict): Stores the decoded pygame.mixer.Sound() object for each logical name
+            _channels (list): Stores the pool of pygame.mixer.Channel() objects the sounds are played through
+            _next_channel (int): The index of the channel that will be taken over if every channel is busy
+            play_count (int): The number of sounds played since the game started
+    """
+
+    SOUND_FILES = {
+        "alien_death": "sound/Alien_Death_Sound.wav",
+        "alien_hit": "sound/Alien_Hit_Sound.wav",
+        "button": "sound/Button_Sound.wav",
+        "coin_pickup": "sound/Coin_Pickup_Sound.wav",
+        "explosion": "sound/Explosion.wav",
+        "explosion_2": "sound/Explosion2.wav",
+        "explosion_3": "sound/Explosion3.wav",
+        "explosion_4": "sound/Explosion4.wav",
+        "enemy_laser": "sound/Laser_Gun_Enemy.wav",
+        "player_laser": "sound/Laser_Gun_Player.wav",
+        "player_death": "sound/Player_Death_Sound.wav",
+        "player_hit": "sound/Player_Hit_Sound.wav",
+        "power_up_pickup": "sound/Power_Up_Pickup_Sound.wav",
+        "power_up_spawn": "sound/Power_Up_Spawn_Sound.wav",
+    }
+
+    CHANNEL_COUNT = 16
+
+    def __init__(self, preload=True):
+        """
+            Creates the channel pool and decodes every sound. The mixer must already be initialized.
+
+            :param preload: Decodes every sound right away when true, otherwise each sound is decoded on first use
+            :type preload: bool
+        """
+
+        self._sounds = {}
+        pygame.mixer.set_num_channels(self.CHANNEL_COUNT)
+        pygame.mixer.set_reserved(self.CHANNEL_COUNT)
+        self._channels = [pygame.mixer.Channel(i) for i in range(self.CHANNEL_COUNT)]
+        self._next_channel = 0
+        self.play_count = 0
+
+        if preload:
+            for name in self.SOUND_FILES:
+                self.get_sound(name)
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._sounds
+        del self._channels
+        del self._next_channel
+        del self.play_count
+
+    def get_sound(self, name):
+        """
+            Returns the decoded sound for the given logical name, decoding it first if it has not been used yet.
+
+            :param name: The logical name of the sound (A key of SOUND_FILES)
+            :type name: string
+
+            :return: The decoded sound, or None if the file could not be loaded
+            :type: pygame.mixer.Sound()
+        """
+
+        if name not in self._sounds:
+            try:
+                self._sounds[name] = pygame.mixer.Sound(self.SOUND_FILES[name])
+            except (pygame.error, FileNotFoundError) as e:
+                messagebox.showerror("Error", f"Error loading sound file: {e}")
+                self._sounds[name] = None
+        return self._sounds[name]
+
+    def play(self, name):
+        """
+            Plays a sound on the first free channel in the pool. If every channel is busy, the channel that was
+                taken over least recently is cut off and reused.
+
+            :param name: The logical name of the sound (A key of SOUND_FILES)
+            :type name: string
+
+            :return: None
+        """
+
+        sound = self.get_sound(name)
+        if sound is None:
+            return
+
+        channel = None
+        for c in self._channels:
+            if not c.get_busy():
+                channel = c
+                break
+        if channel is None:
+            channel = self._channels[self._next_channel]
+            self._next_channel = (self._next_channel + 1) % self.CHANNEL_COUNT
+
+        channel.play(sound)
+        self.play_count = self.play_count + 1
@@ -0,0 +1,446 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: TextureCache.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        Manages the cache of scaled textures used in fullscreen mode. Every scaled texture is stored under a key made
+            from the hash of the original file, the scaled width and height, and the resample filter. Textures that
+            have not changed since the last launch are copied from the cache instead of being scaled again. Textures
+            that are missing from the cache are scaled in parallel.
+
+        The cache can be pruned from the source folder with:
+            python -m utils.TextureCache prune          (Removes cached textures that are no longer used)
+            python -m utils.TextureCache prune --all    (Removes the whole cache and every "_Scaled" texture)
+        Textures scaled ahead of time by the batch mode of the image scaler (tools/imagescaler/BatchScaler.py) are
+            marked in the manifest, and are kept by a prune (Without --all) for as long as their original texture
+            exists. The manifest, cache key and scaling functions in this file are shared with the batch mode, so
+            both find the same cache entries.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+
+def new_manifest():
+    """
+        Creates an empty cache manifest.
+
+        :return: The manifest
+        :type: dict
+    """
+
+    return {"version": 1, "sources": {}, "entries": {}, "outputs": {}}
+
+
+def load_manifest(manifest_path):
+    """
+        Reads a cache manifest. A new manifest is created if it is missing or unreadable.
+
+        :param manifest_path: The path to the manifest
+        :type manifest_path: string
+
+        :return: The manifest
+        :type: dict
+    """
+
+    try:
+        with open(manifest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("version") == 1:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return new_manifest()
+
+
+def save_manifest(manifest, manifest_path):
+    """
+        Writes a cache manifest.
+
+        :param manifest: The manifest
+        :type manifest: dict
+
+        :param manifest_path: The path to the manifest
+        :type manifest_path: string
+
+        :return: None
+    """
+
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+
+def get_source_info(manifest, source_path, name=None):
+    """
+        Finds the hash and size of an original texture. The file is only read again if its modification time or file
+            size has changed since it was last read.
+
+        :param manifest: The cache manifest that stores the hash and size of every original texture
+        :type manifest: dict
+
+        :param source_path: The path to the original texture
+        :type source_path: string
+
+        :param name: The name of the texture in the manifest (Defaults to source_path)
+        :type name: string
+
+        :return: The hash, width and height of the texture
+        :type: dict
+    """
+
+    if name is None:
+        name = source_path
+    stat = os.stat(source_path)
+    info = manifest["sources"].get(name)
+    if info is not None and info["mtime"] == stat.st_mtime_ns and info["bytes"] == stat.st_size:
+        return info
+
+    with open(source_path, 'rb') as source_file:
+        source_hash = hashlib.sha1(source_file.read()).hexdigest()
+    with Image.open(source_path) as image:
+        width, height = image.size
+    info = {"mtime": stat.st_mtime_ns, "bytes": stat.st_size, "hash": source_hash, "width": width, "height": height}
+    manifest["sources"][name] = info
+    return info
+
+
+def get_scaled_size(info, scale_factor_x, scale_factor_y):
+    """
+        Finds the size of a scaled texture.
+
+        :param info: The hash, width and height of the original texture (From get_source_info())
+        :type info: dict
+
+        :param scale_factor_x: The amount to scale the width of the texture by
+        :type scale_factor_x: float
+
+        :param scale_factor_y: The amount to scale the height of the texture by
+        :type scale_factor_y: float
+
+        :return: The width and height of the scaled texture
+        :type: tuple
+    """
+
+    return int(info["width"] * scale_factor_x), int(info["height"] * scale_factor_y)
+
+
+def get_cache_key(info, width, height, resample_filter):
+    """
+        Finds the key of a scaled texture in the cache. The key changes if the texture, the target size or the filter
+            changes.
+
+        :param info: The hash, width and height of the original texture (From get_source_info())
+        :type info: dict
+
+        :param width: The width of the scaled texture
+        :type width: int
+
+        :param height: The height of the scaled texture
+        :type height: int
+
+        :param resample_filter: The name of the Pillow resample filter (Ex: "BICUBIC")
+        :type resample_filter: string
+
+        :return: The key
+        :type: string
+    """
+
+    return hashlib.sha1(f"{info['hash']}:{width}x{height}:{resample_filter}".encode()).hexdigest()
+
+
+def add_entry(manifest, key, cache_path, name, width, height, resample_filter, batch=0):
+    """
+        Adds a scaled texture to the cache manifest, or marks an existing one as used.
+
+        :param manifest: The cache manifest
+        :type manifest: dict
+
+        :param key: The key of the scaled texture (From get_cache_key())
+        :type key: string
+
+        :param cache_path: The path to the scaled texture in the cache (Relative to the source folder)
+        :type cache_path: string
+
+        :param name: The name of the original texture in the manifest
+        :type name: string
+
+        :param width: The width of the scaled texture
+        :type width: int
+
+        :param height: The height of the scaled texture
+        :type height: int
+
+        :param resample_filter: The name of the Pillow resample filter (Ex: "BICUBIC")
+        :type resample_filter: string
+
+        :param batch: 1 if the texture was scaled by the batch mode of the image scaler (Kept once it has been set)
+        :type batch: int
+
+        :return: None
+    """
+
+    if manifest["entries"].get(key, {}).get("batch", 0) == 1:
+        batch = 1
+    manifest["entries"][key] = {"file": cache_path, "source": name, "width": width, "height": height,
+                                "filter": resample_filter, "batch": batch, "last_used": time.time()}
+
+
+def scale_texture(source_path, cache_path, width, height, resample_filter):
+    """
+        Scales a single texture and saves it to the cache.
+        Pillow releases the GIL while decoding, resizing and encoding, so this can run on several threads at once.
+
+        :param source_path: The path to the original texture
+        :type source_path: string
+
+        :param cache_path: The path to save the scaled texture to
+        :type cache_path: string
+
+        :param width: The width of the scaled texture
+        :type width: int
+
+        :param height: The height of the scaled texture
+        :type height: int
+
+        :param resample_filter: The name of the Pillow resample filter to use (Ex: "BICUBIC")
+        :type resample_filter: string
+
+        :return: None
+    """
+
+    with Image.open(source_path) as image:
+        resized_image = image.resize((width, height), getattr(Image.Resampling, resample_filter))
+    # Save to a temporary file first so that a half written texture is never left in the cache
+    temp_path = cache_path + ".tmp"
+    resized_image.save(temp_path, format=os.path.splitext(source_path)[1][1:] or None)
+    os.replace(temp_path, cache_path)
+
+
+class TextureCache:
+    """
+        Represents the cache of scaled textures.
+
+        Class Variables:
+            CACHE_DIRECTORY (string): The folder that the scaled textures are stored in
+            MANIFEST_PATH (string): The path to the manifest that describes every texture in the cache
+            RESAMPLE_FILTER (string): The Pillow resample filter used to scale the textures (The Pillow default, which
+                Pillow replaces with "NEAREST" for palette based GIF textures)
+            SCALED_SUFFIX (string): The suffix added to the name of a scaled texture (Ex: Coin_Scaled.gif)
+
+        Attributes:
+            _manifest (dict): Stores the hash and size of every original texture, every entry in the cache and which
+                entry each "_Scaled" texture was copied from
+            _workers (int): The number of threads used to scale textures that are missing from the cache
+            hits (int): The number of textures that were found in the cache during the last call to scale_textures()
+            misses (int): The number of textures that had to be scaled during the last call to scale_textures()
+    """
+
+    CACHE_DIRECTORY = "textures/cache"
+    MANIFEST_PATH = "textures/cache/manifest.json"
+    RESAMPLE_FILTER = "BICUBIC"
+    SCALED_SUFFIX = "_Scaled"
+
+    def __init__(self, workers=None):
+        """
+            Loads the cache manifest.
+
+            :param workers: The number of threads used to scale textures (Defaults to the number of CPU cores)
+            :type workers: int
+        """
+
+        self._manifest = self.load_manifest()
+        self._workers = workers or os.cpu_count() or 1
+        self.hits = 0
+        self.misses = 0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._manifest
+        del self._workers
+        del self.hits
+        del self.misses
+
+    def load_manifest(self):
+        """
+            Reads the manifest from the cache folder. A new manifest is created if it is missing or unreadable.
+
+            :return: The manifest
+            :type: dict
+        """
+
+        return load_manifest(self.MANIFEST_PATH)
+
+    def save_manifest(self):
+        """
+            Writes the manifest to the cache folder.
+
+            :return: None
+        """
+
+        save_manifest(self._manifest, self.MANIFEST_PATH)
+
+    def get_source_info(self, source_path):
+        """
+            Finds the hash and size of an original texture. The file is only read again if its modification time or
+                file size has changed since the last launch.
+
+            :param source_path: The path to the original texture
+            :type source_path: string
+
+            :return: The hash, width and height of the texture
+            :type: dict
+        """
+
+        return get_source_info(self._manifest, source_path)
+
+    def scale_textures(self, source_paths, scale_factor_x, scale_factor_y):
+        """
+            Creates the "_Scaled" version of every given texture, scaling only the ones that are not in the cache.
+
+            :param source_paths: The paths to the original textures
+            :type source_paths: list
+
+            :param scale_factor_x: The amount to scale the width of each texture by
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The amount to scale the height of each texture by
+            :type scale_factor_y: float
+
+            :return: The paths to the scaled textures, in the same order as source_paths
+            :type: list
+        """
+
+        os.makedirs(self.CACHE_DIRECTORY, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        outputs = []
+        jobs = {}
+        for source_path in source_paths:
+            info = self.get_source_info(source_path)
+            width, height = get_scaled_size(info, scale_factor_x, scale_factor_y)
+            base, ext = os.path.splitext(source_path)
+
+            key = get_cache_key(info, width, height, self.RESAMPLE_FILTER)
+            cache_path = f"{self.CACHE_DIRECTORY}/{key}{ext}"
+            if key not in self._manifest["entries"] or not os.path.exists(cache_path):
+                jobs[key] = (source_path, cache_path, width, height, self.RESAMPLE_FILTER)
+            else:
+                self.hits = self.hits + 1
+            add_entry(self._manifest, key, cache_path, source_path, width, height, self.RESAMPLE_FILTER)
+            outputs.append((f"{base}{self.SCALED_SUFFIX}{ext}", key, cache_path))
+
+        # Scale every missing texture in parallel
+        self.misses = len(jobs)
+        if jobs:
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                for future in [executor.submit(scale_texture, *job) for job in jobs.values()]:
+                    future.result()
+
+        # Copy the cached textures to their "_Scaled" names, unless the right one is already there
+        for output_path, key, cache_path in outputs:
+            if self._manifest["outputs"].get(output_path) != key or not os.path.exists(output_path):
+                shutil.copyfile(cache_path, output_path)
+                self._manifest["outputs"][output_path] = key
+
+        self.save_manifest()
+        return [output_path for output_path, _, _ in outputs]
+
+    def prune(self, remove_all=False, log_path="textures/deletion_log.txt"):
+        """
+            Removes cached textures that are no longer used by any "_Scaled" texture, along with any files in the
+                cache folder that the manifest does not know about. Textures scaled by the batch mode of the image
+                scaler are kept until their original texture is deleted.
+
+            :param remove_all: Removes the whole cache and every "_Scaled" texture when true
+            :type remove_all: bool
+
+            :param log_path: The path to the log of every deleted file
+            :type log_path: string
+
+            :return: The paths of the deleted files
+            :type: list
+        """
+
+        deleted = []
+        if remove_all:
+            for root, _, files in os.walk("textures"):
+                for file in files:
+                    if self.SCALED_SUFFIX.lower() in file.lower():
+                        deleted.append(os.path.join(root, file))
+            if os.path.isdir(self.CACHE_DIRECTORY):
+                for file in os.listdir(self.CACHE_DIRECTORY):
+                    deleted.append(os.path.join(self.CACHE_DIRECTORY, file))
+            self._manifest = new_manifest()
+        else:
+            # Forget "_Scaled" textures and original textures that no longer exist
+            for output_path in list(self._manifest["outputs"]):
+                if not os.path.exists(output_path):
+                    del self._manifest["outputs"][output_path]
+            for source_path in list(self._manifest["sources"]):
+                if not os.path.exists(source_path):
+                    del self._manifest["sources"][source_path]
+
+            # Only entries that a "_Scaled" texture currently uses, and batch scaled entries, are kept
+            used_keys = set(self._manifest["outputs"].values())
+            for key, entry in list(self._manifest["entries"].items()):
+                if entry.get("batch", 0) == 1 and os.path.exists(entry["source"]):
+                    continue
+                if key not in used_keys:
+                    deleted.append(self._manifest["entries"][key]["file"])
+                    del self._manifest["entries"][key]
+            known_files = {os.path.normpath(entry["file"]) for entry in self._manifest["entries"].values()}
+            known_files.add(os.path.normpath(self.MANIFEST_PATH))
+            if os.path.isdir(self.CACHE_DIRECTORY):
+                for file in os.listdir(self.CACHE_DIRECTORY):
+                    path = os.path.join(self.CACHE_DIRECTORY, file)
+                    if os.path.normpath(path) not in known_files and path not in deleted:
+                        deleted.append(path)
+
+        deleted = [path for path in deleted if os.path.exists(path)]
+        with open(log_path, 'w') as log_file:
+            log_file.write(f"Deletion Log - {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            for path in deleted:
+                print(f"Deleting: {path}")
+                log_file.write(f"{path}\n")
+                os.remove(path)
+
+        if not remove_all:
+            self.save_manifest()
+        return deleted
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "prune":
+        print("Usage: python -m utils.TextureCache prune [--all]")
+        sys.exit(1)
+    TextureCache().prune(remove_all="--all" in sys.argv[2:])
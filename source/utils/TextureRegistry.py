@@ -0,0 +1,448 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: TextureRegistry.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+        Registers the textures with the window only when they are needed, instead of registering every texture
+            before the title screen appears.
+
+        Every texture belongs to one or more groups ("Title", "Machine", "Alien" and "Shop"). The title group is
+            registered when the window is created, and the group for each screen is registered when the game changes
+            to that screen. The group for the screen that is most likely to be opened next is prefetched a few
+            textures per frame. Any texture that is used before its group has been registered is registered on first
+            use.
+
+        In fullscreen mode, the textures are scaled through the texture cache when they are registered. The scaling
+            for a prefetched group is done on a background thread (The textures themselves must be registered on the
+            main thread, since Tk can only be used from the thread that created the window).
+
+        When the resolution is changed while the game is running, every texture is scaled to the new size on a
+            background thread first, and then every registered texture is swapped to its new image at once. The names
+            of the textures never change, so the sprites using them do not need to be updated.
+"""
+
+import os
+import threading
+import turtle
+
+
+class _ShapeNames:
+    """
+        Stands in for the list of shape names returned by the window's getshapes(). The turtle module checks if a shape
+            is in this list before using it, so checking here is where textures are registered on first use.
+
+        Pointers:
+            _registry (TextureRegistry()): Pointer to the texture registry.
+    """
+
+    def __init__(self, registry):
+        self._registry = registry
+
+    def __contains__(self, name):
+        return self._registry.is_registered(name) or self._registry.register(name)
+
+    def __iter__(self):
+        return iter(sorted(self._registry.get_registered_names()))
+
+    def __len__(self):
+        return len(self._registry.get_registered_names())
+
+
+class TextureRegistry:
+    """
+        Represents the registry of every texture in the game.
+
+        Class Variables:
+            SCALED_SUFFIX (string): Added to the end of the texture names in fullscreen mode
+            MODE_GROUPS (dict): The texture group needed by each screen
+            NEXT_GROUPS (dict): The texture group that is most likely needed after each screen
+            PREFETCH_PER_FRAME (int): The number of prefetched textures registered each frame
+
+        Pointers:
+            _window (turtle.Screen()): Pointer to the application window (None until attach() is called)
+            _texture_cache (TextureCache()): Pointer to the scaled texture cache (None if fullscreen is off)
+
+        Attributes:
+            _fullscreen (int): Determines if the scaled textures are used
+            _scale_factor_x (float): The scale factor for the x-axis used in fullscreen mode
+            _scale_factor_y (float): The scale factor for the y-axis used in fullscreen mode
+            _sources (dict): Stores the original texture path for every texture name
+            _groups (dict): Stores the list of texture names in each group
+            _registered (set): The names of the textures that have been registered with the window
+            _prefetch_queue (list): The names of the textures waiting to be prefetched
+            _prefetch_thread (threading.Thread()): The thread scaling the prefetched textures (None if there is none)
+            _scale_lock (threading.Lock()): Makes sure only one thread uses the texture cache at once
+            _rescaling (int): Determines if the textures are being scaled for a new resolution (Prefetching is paused)
+            registered_on_first_use (int): The number of textures that were used before their group was registered
+    """
+
+    SCALED_SUFFIX = "_Scaled"
+    MODE_GROUPS = {"Title_Mode": "Title", "Stats": "Title", "Settings": "Title", "Controls": "Title",
+                   "Machine_Mode": "Machine", "Alien_Mode": "Alien", "Shop": "Shop"}
+    NEXT_GROUPS = {"Title_Mode": "Machine", "Stats": "Machine", "Settings": "Machine", "Controls": "Machine",
+                   "Machine_Mode": "Shop", "Alien_Mode": "Shop", "Shop": "Machine"}
+    PREFETCH_PER_FRAME = 4
+
+    def __init__(self, fullscreen):
+        """
+            Creates the texture registry.
+
+            :param fullscreen: Determines if the scaled textures are used
+            :type fullscreen: int
+        """
+
+        self._window = None
+        self._texture_cache = None
+
+        self._fullscreen = fullscreen
+        self._scale_factor_x = 1
+        self._scale_factor_y = 1
+        self._sources = {}
+        self._groups = {}
+        self._registered = set()
+        self._prefetch_queue = []
+        self._prefetch_thread = None
+        self._scale_lock = threading.Lock()
+        self._rescaling = 0
+        self.registered_on_first_use = 0
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._window
+        del self._texture_cache
+        del self._fullscreen
+        del self._scale_factor_x
+        del self._scale_factor_y
+        del self._sources
+        del self._groups
+        del self._registered
+        del self._prefetch_queue
+        del self._prefetch_thread
+        del self._scale_lock
+        del self._rescaling
+        del self.registered_on_first_use
+
+    def add(self, path, *groups):
+        """
+            Adds a texture to the registry without registering it with the window.
+
+            :param path: The path to the original texture
+            :type path: string
+
+            :param groups: The groups the texture belongs to (Ex: "Machine", "Alien")
+
+            :return: The name to use for the texture (The "_Scaled" version in fullscreen mode)
+            :type: string
+        """
+
+        if self._fullscreen == 1:
+            base, ext = os.path.splitext(path)
+            name = f"{base}{self.SCALED_SUFFIX}{ext}"
+        else:
+            name = path
+        self._sources[name] = path
+        for group in groups:
+            self._groups.setdefault(group, []).append(name)
+        return name
+
+    def attach(self, window, texture_cache=None, scale_factor_x=1, scale_factor_y=1):
+        """
+            Connects the registry to the window and registers the title group. Textures used after this that have not
+                been registered yet are registered on first use.
+
+            :param window: Pointer to the application window
+            :type window: turtle.Screen()
+
+            :param texture_cache: Pointer to the scaled texture cache (None if fullscreen is off)
+            :type texture_cache: TextureCache()
+
+            :param scale_factor_x: The scale factor for the x-axis used in fullscreen mode
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The scale factor for the y-axis used in fullscreen mode
+            :type scale_factor_y: float
+
+            :return: None
+        """
+
+        self._window = window
+        self._texture_cache = texture_cache
+        self._scale_factor_x = scale_factor_x
+        self._scale_factor_y = scale_factor_y
+        shape_names = _ShapeNames(self)
+        # The turtles check the shape name against this before using it
+        window.getshapes = lambda: shape_names
+        self.load_group("Title")
+
+    def is_registered(self, name):
+        """
+            Checks if a texture (or built-in shape) has been registered with the window.
+
+            :param name: The name of the texture
+            :type name: string
+
+            :return: True if it has been registered
+            :type: bool
+        """
+
+        return name in self._registered or name in self._window._shapes
+
+    def get_registered_names(self):
+        """
+            Gets the name of every shape registered with the window.
+
+            :return: The names of the registered shapes
+            :type: list
+        """
+
+        return list(self._window._shapes)
+
+    def scale(self, names):
+        """
+            Creates the "_Scaled" version of the given textures through the texture cache (Only in fullscreen mode).
+
+            :param names: The names of the textures
+            :type names: list
+
+            :return: None
+        """
+
+        if self.is_scaled() and names:
+            with self._scale_lock:
+                self._texture_cache.scale_textures([self._sources[n] for n in names],
+                                                   self._scale_factor_x, self._scale_factor_y)
+
+    def is_texture(self, name):
+        """
+            Checks if a shape is one of the textures in the registry (Instead of a built-in shape like "square").
+
+            :param name: The name of the shape
+            :type name: string
+
+            :return: True if the shape is a texture
+            :type: bool
+        """
+
+        return name in self._sources
+
+    def is_scaled(self):
+        """
+            Checks if the textures are being scaled for the current resolution.
+
+            :return: True if the scaled textures are used
+            :type: bool
+        """
+
+        return self._texture_cache is not None and (self._scale_factor_x != 1 or self._scale_factor_y != 1)
+
+    def get_image_path(self, name):
+        """
+            Gets the path of the image file to load for a texture at the current resolution.
+
+            :param name: The name of the texture
+            :type name: string
+
+            :return: The path of the "_Scaled" texture if the textures are scaled, otherwise the original texture
+            :type: string
+        """
+
+        if self.is_scaled():
+            base, ext = os.path.splitext(self._sources[name])
+            return f"{base}{self.SCALED_SUFFIX}{ext}"
+        return self._sources[name]
+
+    def add_shape(self, name):
+        """
+            Registers a texture with the window, loaded from the image for the current resolution.
+
+            :param name: The name of the texture
+            :type name: string
+
+            :return: None
+        """
+
+        image_path = self.get_image_path(name)
+        if image_path == name:
+            self._window.addshape(name)
+        else:
+            # The texture keeps its name, but the image comes from a file for a different resolution
+            self._window.addshape(name, turtle.Shape("image", self._window._image(image_path)))
+
+    def prepare_rescale(self, texture_cache, scale_factor_x, scale_factor_y, extra_paths=()):
+        """
+            Scales every texture in the registry to a new resolution through the texture cache, without changing any
+                of the registered textures. Called from a background thread before apply_rescale().
+
+            :param texture_cache: Pointer to the scaled texture cache (None if the textures are never scaled)
+            :type texture_cache: TextureCache()
+
+            :param scale_factor_x: The new scale factor for the x-axis
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The new scale factor for the y-axis
+            :type scale_factor_y: float
+
+            :param extra_paths: The paths of other textures to scale that are not in the registry (Ex: the background)
+            :type extra_paths: list
+
+            :return: None
+        """
+
+        # Stop prefetching, since the "_Scaled" files are being replaced
+        self._rescaling = 1
+        if texture_cache is None or (scale_factor_x == 1 and scale_factor_y == 1):
+            return
+        with self._scale_lock:
+            texture_cache.scale_textures(sorted(set(self._sources.values())) + list(extra_paths),
+                                         scale_factor_x, scale_factor_y)
+
+    def cancel_rescale(self):
+        """
+            Starts prefetching again after a switch to a new resolution failed.
+
+            :return: None
+        """
+
+        self._rescaling = 0
+
+    def apply_rescale(self, texture_cache, scale_factor_x, scale_factor_y):
+        """
+            Switches every registered texture to its image for a new resolution. The new images are all loaded
+                first, and then swapped in at once. Must be called from the main thread.
+
+            :param texture_cache: Pointer to the scaled texture cache (None if the textures are never scaled)
+            :type texture_cache: TextureCache()
+
+            :param scale_factor_x: The new scale factor for the x-axis
+            :type scale_factor_x: float
+
+            :param scale_factor_y: The new scale factor for the y-axis
+            :type scale_factor_y: float
+
+            :return: None
+        """
+
+        self._texture_cache = texture_cache
+        self._scale_factor_x = scale_factor_x
+        self._scale_factor_y = scale_factor_y
+        self._rescaling = 0
+        if texture_cache is None:
+            return
+
+        names = sorted(self._registered)
+        # Mostly copies from the cache, since prepare_rescale() already scaled everything
+        self.scale(names)
+        shapes = {name: turtle.Shape("image", self._window._image(self.get_image_path(name))) for name in names}
+        self._window._shapes.update(shapes)
+
+    def register(self, name):
+        """
+            Registers a single texture with the window if it is in the registry.
+
+            :param name: The name of the texture
+            :type name: string
+
+            :return: True if the texture was registered
+            :type: bool
+        """
+
+        if name not in self._sources:
+            return False
+        if name not in self._registered:
+            self.scale([name])
+            self.add_shape(name)
+            self._registered.add(name)
+            self.registered_on_first_use = self.registered_on_first_use + 1
+        return True
+
+    def load_group(self, group):
+        """
+            Registers every texture in a group that has not been registered yet.
+
+            :param group: The name of the group
+            :type group: string
+
+            :return: None
+        """
+
+        names = [n for n in self._groups.get(group, []) if n not in self._registered]
+        self.scale(names)
+        for name in names:
+            self.add_shape(name)
+            self._registered.add(name)
+
+    def load_screen(self, mode):
+        """
+            Registers the textures for a screen and starts prefetching the textures for the screen most likely
+                opened after it. Called whenever the screen changes.
+
+            :param mode: The screen (Ex: "Machine_Mode")
+            :type mode: string
+
+            :return: None
+        """
+
+        self.load_group(self.MODE_GROUPS.get(mode, "Title"))
+        self.prefetch(self.NEXT_GROUPS.get(mode))
+
+    def prefetch(self, group):
+        """
+            Queues the textures in a group to be registered a few at a time over the next frames. In fullscreen mode,
+                they are scaled on a background thread first.
+
+            :param group: The name of the group (Nothing is prefetched if None)
+            :type group: string
+
+            :return: None
+        """
+
+        if group is None:
+            return
+        names = [n for n in self._groups.get(group, []) if n not in self._registered and n not in self._prefetch_queue]
+        if not names:
+            return
+        self._prefetch_queue.extend(names)
+        if self.is_scaled():
+            self._prefetch_thread = threading.Thread(target=self.scale, args=(names,), daemon=True)
+            self._prefetch_thread.start()
+
+    def prefetch_step(self):
+        """
+            Registers the next few prefetched textures. Called once per frame.
+
+            :return: None
+        """
+
+        if not self._prefetch_queue or self._rescaling == 1:
+            return
+        # Wait for the background scaling to finish before registering the scaled textures
+        if self._prefetch_thread is not None:
+            if self._prefetch_thread.is_alive():
+                return
+            self._prefetch_thread = None
+        names = self._prefetch_queue[:self.PREFETCH_PER_FRAME]
+        del self._prefetch_queue[:self.PREFETCH_PER_FRAME]
+        for name in names:
+            if name not in self._registered:
+                self.add_shape(name)
+                self._registered.add(name)
@@ -130,10 +130,12 @@ class ControlsConfig:
             :return: None
         """
 
-        self.config.set('Controls', 'Go_Right', self.go_right_key)
-        self.config.set('Controls', 'Go_Left', self.go_left_key)
-        self.config.set('Controls', 'Shoot', self.shoot_key)
-        self.config.set('Controls', 'Jump', self.jump_key)
+        # Group every change into one batch so the file is only written once
+        with self.config.batch():
+            self.config.set('Controls', 'Go_Right', self.go_right_key)
+            self.config.set('Controls', 'Go_Left', self.go_left_key)
+            self.config.set('Controls', 'Shoot', self.shoot_key)
+            self.config.set('Controls', 'Jump', self.jump_key)
 
     def save_check(self):
         """
@@ -105,10 +105,12 @@ class MilestoneConfig:
             :return: None
         """
 
-        self.player_data_manager.set('Machine_Mode_First_Time', 'Ran_First_Time', str(self.game_played))
-        self.player_data_manager.set('Machine_Mode_Beat', 'Machine_Mode_Beat', str(self.machine_mode_beaten))
-        self.player_data_manager.set('Alien_Mode_Played', 'Alien_Mode_Played', str(self.alien_mode_played))
-        self.player_data_manager.set('Alien_Mode_Beat', 'Alien_Mode_Beat', str(self.alien_mode_beaten))
+        # Group every change into one batch so the file is only written once
+        with self.player_data_manager.batch():
+            self.player_data_manager.set('Machine_Mode_First_Time', 'Ran_First_Time', str(self.game_played))
+            self.player_data_manager.set('Machine_Mode_Beat', 'Machine_Mode_Beat', str(self.machine_mode_beaten))
+            self.player_data_manager.set('Alien_Mode_Played', 'Alien_Mode_Played', str(self.alien_mode_played))
+            self.player_data_manager.set('Alien_Mode_Beat', 'Alien_Mode_Beat', str(self.alien_mode_beaten))
 
     def __repr__(self):
         """
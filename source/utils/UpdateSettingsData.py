@@ -110,24 +110,26 @@ class Settings:
             :return: None
         """
 
-        self.config.set('Settings', 'God_Mode', str(self.god_mode))
-        self.config.set('Settings', 'Button_Sound', str(self.button_sound))
-        self.config.set('Settings', 'Player_Shooting_Sound', str(self.player_shooting_sound))
-        self.config.set('Settings', 'Enemy_Shooting_Sound', str(self.enemy_shooting_sound))
-        self.config.set('Settings', 'Player_Death_Sound', str(self.player_death_sound))
-        self.config.set('Settings', 'Enemy_Death_Sound', str(self.enemy_death_sound))
-        self.config.set('Settings', 'Player_Hit_Sound', str(self.player_hit_sound))
-        self.config.set('Settings', 'Enemy_Hit_Sound', str(self.enemy_hit_sound))
-        self.config.set('Settings', 'Power_up_Pickup_Sound', str(self.power_up_pickup_sound))
-        self.config.set('Settings', 'Power_up_Spawn_Sound', str(self.power_up_spawn_sound))
-        self.config.set('Settings', 'Coin_Pick_Up_Sound', str(self.coin_pickup_sound))
-        self.config.set('Settings', 'VSync', str(self.vsync))
+        # Group every change into one batch so the file is only written once
+        with self.config.batch():
+            self.config.set('Settings', 'God_Mode', str(self.god_mode))
+            self.config.set('Settings', 'Button_Sound', str(self.button_sound))
+            self.config.set('Settings', 'Player_Shooting_Sound', str(self.player_shooting_sound))
+            self.config.set('Settings', 'Enemy_Shooting_Sound', str(self.enemy_shooting_sound))
+            self.config.set('Settings', 'Player_Death_Sound', str(self.player_death_sound))
+            self.config.set('Settings', 'Enemy_Death_Sound', str(self.enemy_death_sound))
+            self.config.set('Settings', 'Player_Hit_Sound', str(self.player_hit_sound))
+            self.config.set('Settings', 'Enemy_Hit_Sound', str(self.enemy_hit_sound))
+            self.config.set('Settings', 'Power_up_Pickup_Sound', str(self.power_up_pickup_sound))
+            self.config.set('Settings', 'Power_up_Spawn_Sound', str(self.power_up_spawn_sound))
+            self.config.set('Settings', 'Coin_Pick_Up_Sound', str(self.coin_pickup_sound))
+            self.config.set('Settings', 'VSync', str(self.vsync))
 
     def toggle_fullscreen(self):
         """
             Used to toggling only the fullscreen setting.
-            This settings needs a special procedure because any modifications to it cannot be immediately loaded into
-                the game and must be loaded on the next restart only.
+            This settings needs a special procedure because it is not saved with the rest of the settings. The switch
+                itself is done by the display manager.
 
             :return: None
         """
@@ -135,9 +137,10 @@ class Settings:
         current_fullscreen = self.config.getint('Settings', 'Fullscreen')
 
         if current_fullscreen == 1:
-            self.config.set('Settings', 'Fullscreen', str(0))
+            self.fullscreen = 0
         else:
-            self.config.set('Settings', 'Fullscreen', str(1))
+            self.fullscreen = 1
+        self.config.set('Settings', 'Fullscreen', str(self.fullscreen))
 
     def __repr__(self):
         """
@@ -140,29 +140,31 @@ class ShopConfig:
             :return: None
         """
 
-        self.player_data_manager.set('Coins', 'coins', str(self.total_coins))
-
-        self.player_data_manager.set('Machine_Player_Enabled', 'type_enabled', str(self.machine_slot_selected))
-        self.player_data_manager.set('Alien_Mode_Gun_Enabled', 'type_enabled', str(self.alien_slot_selected))
-
-        for i in range(5):
-            self.player_data_manager.set('Machine_Unlocked', f'slot_{i + 1}', str(self.machine_slots_unlocked[i]))
-            self.player_data_manager.set('Alien_Unlocked', f'slot_{i + 1}', str(self.alien_slots_unlocked[i]))
-
-        self.player_data_manager.set('Power_Up_Levels', 'Yellow_Power_Up', str(self.yellow_power_up_level))
-        self.player_data_manager.set('Power_Up_Levels', 'Blue_Power_Up', str(self.blue_power_up_level))
-        self.player_data_manager.set('Power_Up_Levels', 'Green_Power_Up', str(self.green_power_up_level))
-        self.player_data_manager.set('Power_Up_Levels', 'Red_Power_Up', str(self.red_power_up_level))
-
-        self.player_data_manager.set('Gadgets_Unlocked', 'Coin_Magnet_Unlocked', str(self.coin_magnet_unlocked))
-        self.player_data_manager.set('Gadgets_Unlocked', 'Armor_Unlocked', str(self.shield_unlocked))
-        self.player_data_manager.set('Gadgets_Unlocked', 'Thorns_Unlocked', str(self.thorns_unlocked))
-        self.player_data_manager.set('Gadgets_Unlocked', 'Hearts_Unlocked', str(self.hearts_unlocked))
-
-        self.player_data_manager.set('Gadgets_Enabled', 'Coin_Magnet_Enabled', str(self.coin_magnet_enabled))
-        self.player_data_manager.set('Gadgets_Enabled', 'Armor_Enabled', str(self.shield_enabled))
-        self.player_data_manager.set('Gadgets_Enabled', 'Thorns_Enabled', str(self.thorns_enabled))
-        self.player_data_manager.set('Gadgets_Enabled', 'Hearts_Enabled', str(self.hearts_enabled))
+        # Group every change into one batch so the file is only written once
+        with self.player_data_manager.batch():
+            self.player_data_manager.set('Coins', 'coins', str(self.total_coins))
+
+            self.player_data_manager.set('Machine_Player_Enabled', 'type_enabled', str(self.machine_slot_selected))
+            self.player_data_manager.set('Alien_Mode_Gun_Enabled', 'type_enabled', str(self.alien_slot_selected))
+
+            for i in range(5):
+                self.player_data_manager.set('Machine_Unlocked', f'slot_{i + 1}', str(self.machine_slots_unlocked[i]))
+                self.player_data_manager.set('Alien_Unlocked', f'slot_{i + 1}', str(self.alien_slots_unlocked[i]))
+
+            self.player_data_manager.set('Power_Up_Levels', 'Yellow_Power_Up', str(self.yellow_power_up_level))
+            self.player_data_manager.set('Power_Up_Levels', 'Blue_Power_Up', str(self.blue_power_up_level))
+            self.player_data_manager.set('Power_Up_Levels', 'Green_Power_Up', str(self.green_power_up_level))
+            self.player_data_manager.set('Power_Up_Levels', 'Red_Power_Up', str(self.red_power_up_level))
+
+            self.player_data_manager.set('Gadgets_Unlocked', 'Coin_Magnet_Unlocked', str(self.coin_magnet_unlocked))
+            self.player_data_manager.set('Gadgets_Unlocked', 'Armor_Unlocked', str(self.shield_unlocked))
+            self.player_data_manager.set('Gadgets_Unlocked', 'Thorns_Unlocked', str(self.thorns_unlocked))
+            self.player_data_manager.set('Gadgets_Unlocked', 'Hearts_Unlocked', str(self.hearts_unlocked))
+
+            self.player_data_manager.set('Gadgets_Enabled', 'Coin_Magnet_Enabled', str(self.coin_magnet_enabled))
+            self.player_data_manager.set('Gadgets_Enabled', 'Armor_Enabled', str(self.shield_enabled))
+            self.player_data_manager.set('Gadgets_Enabled', 'Thorns_Enabled', str(self.thorns_enabled))
+            self.player_data_manager.set('Gadgets_Enabled', 'Hearts_Enabled', str(self.hearts_enabled))
 
     def __repr__(self):
         """
@@ -159,33 +159,35 @@ class Stats:
             :return: None
         """
 
-        # High Scores
-        if self.god_mode != 1:
-            self.player_data_manager.set('High_Score', 'High_Score_Machine_War', str(self.high_score_machine_war))
-            self.player_data_manager.set('High_Score', 'High_Score_Alien_Mode', str(self.high_score_alien_mode))
-
-        # Machine Mode Statistics
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Bosses_Killed', str(self.bosses_killed))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Red_Bots_Killed', str(self.red_bots_killed))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Yellow_Bots_Killed', str(self.yellow_bots_killed))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Blue_Bots_Killed', str(self.blue_bots_killed))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Deaths', str(self.classic_deaths))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Damage_Taken', str(self.machine_damage_taken))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Lasers_Fired', str(self.classic_lasers_fired))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Power_Ups_Picked_Up', str(self.classic_power_ups_picked_up))
-        self.player_data_manager.set('Statistics_Machine_Mode', 'Coins_Collected', str(self.machine_coins_collected))
-
-        # Alien Mode Statistics
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Ufos_Killed', str(self.ufos_killed))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Big_Aliens_Killed', str(self.big_aliens_killed))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Medium_Aliens_Killed', str(self.medium_aliens_killed))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Small_Aliens_Killed', str(self.small_aliens_killed))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Deaths', str(self.alien_deaths))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Damage_Taken', str(self.damage_taken))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Lasers_Fired', str(self.alien_lasers_fired))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Jumps', str(self.jumps))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Power_Ups_Picked_Up', str(self.alien_power_ups_picked_up))
-        self.player_data_manager.set('Statistics_Alien_Mode', 'Coins_Collected', str(self.alien_coins_collected))
+        # Group every change into one batch so the file is only written once
+        with self.player_data_manager.batch():
+            # High Scores
+            if self.god_mode != 1:
+                self.player_data_manager.set('High_Score', 'High_Score_Machine_War', str(self.high_score_machine_war))
+                self.player_data_manager.set('High_Score', 'High_Score_Alien_Mode', str(self.high_score_alien_mode))
+
+            # Machine Mode Statistics
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Bosses_Killed', str(self.bosses_killed))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Red_Bots_Killed', str(self.red_bots_killed))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Yellow_Bots_Killed', str(self.yellow_bots_killed))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Blue_Bots_Killed', str(self.blue_bots_killed))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Deaths', str(self.classic_deaths))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Damage_Taken', str(self.machine_damage_taken))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Lasers_Fired', str(self.classic_lasers_fired))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Power_Ups_Picked_Up', str(self.classic_power_ups_picked_up))
+            self.player_data_manager.set('Statistics_Machine_Mode', 'Coins_Collected', str(self.machine_coins_collected))
+
+            # Alien Mode Statistics
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Ufos_Killed', str(self.ufos_killed))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Big_Aliens_Killed', str(self.big_aliens_killed))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Medium_Aliens_Killed', str(self.medium_aliens_killed))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Small_Aliens_Killed', str(self.small_aliens_killed))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Deaths', str(self.alien_deaths))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Damage_Taken', str(self.damage_taken))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Lasers_Fired', str(self.alien_lasers_fired))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Jumps', str(self.jumps))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Power_Ups_Picked_Up', str(self.alien_power_ups_picked_up))
+            self.player_data_manager.set('Statistics_Alien_Mode', 'Coins_Collected', str(self.alien_coins_collected))
 
     def __repr__(self):
         """
@@ -20,8 +20,13 @@
     Description:
     This file contains the logic for the refreshing of all text on the screen.
     It also contains the logic for initiating the printing of text on the screen.
+    The in-game text boxes and the statistics are bound to the values they show, so they are only redrawn when
+        those values change.
 """
 
+from components.gui.InterfaceTextBox import Text
+from setup.WindowSetup import game_clock
+
 
 class TextRefresh:
     """
@@ -43,8 +48,40 @@ class TextRefresh:
             _controls (Controls()): Pointer to the controls manager and updater
             _controls_toggle (ControlsToggle()): Pointer to the current keybinds
             _refresh (Refresh()): Pointer to the game refresh variables
+
+        Class Variables:
+            STATS_TEXT (dict): Maps the id of each statistics text box to its label and the Stats() attribute it shows
+
+        Attributes:
+            redraws_per_second (float): The number of text boxes redrawn per second, measured over the last second
+            _redraw_time (float): The game time that redraws_per_second was last measured
+            _redraw_count (int): The total number of text box redraws when redraws_per_second was last measured
     """
 
+    STATS_TEXT = {
+        4: ("High Score: {}", "high_score_machine_war"),
+        5: ("Bosses Killed: {}", "bosses_killed"),
+        6: ("Red Bots Killed: {}", "red_bots_killed"),
+        7: ("Yellow Bots Killed: {}", "yellow_bots_killed"),
+        8: ("Blue Bots Killed: {}", "blue_bots_killed"),
+        9: ("Deaths: {}", "classic_deaths"),
+        10: ("Damage Taken: {}", "machine_damage_taken"),
+        11: ("Lasers Fired: {}", "classic_lasers_fired"),
+        12: ("Power Ups Picked Up: {}", "classic_power_ups_picked_up"),
+        13: ("Coins Collected: {}", "machine_coins_collected"),
+        14: ("High Score: {}", "high_score_alien_mode"),
+        15: ("UFOs Killed: {}", "ufos_killed"),
+        16: ("Big Aliens Killed: {}", "big_aliens_killed"),
+        17: ("Medium Aliens Killed: {}", "medium_aliens_killed"),
+        18: ("Small Aliens Killed: {}", "small_aliens_killed"),
+        19: ("Deaths: {}", "alien_deaths"),
+        20: ("Damage Taken: {}", "damage_taken"),
+        21: ("Lasers Fired: {}", "alien_lasers_fired"),
+        22: ("Jumps: {}", "jumps"),
+        23: ("Power Ups Picked Up: {}", "alien_power_ups_picked_up"),
+        24: ("Coins Collected: {}", "alien_coins_collected"),
+    }
+
     def __init__(self, screen,
                  button, panel,
                  textbox, yellow_power_up_indicator,
@@ -119,6 +156,10 @@ class TextRefresh:
         self._controls_toggle = controls_toggle
         self._refresh = refresh
 
+        self.redraws_per_second = 0
+        self._redraw_time = game_clock.now
+        self._redraw_count = Text.redraw_count
+
     def __del__(self):
         """
             Clear the variables from memory once the program has terminated
@@ -141,6 +182,9 @@ class TextRefresh:
         del self._controls
         del self._controls_toggle
         del self._refresh
+        del self.redraws_per_second
+        del self._redraw_time
+        del self._redraw_count
 
     def update_text(self):
         """
@@ -187,31 +231,11 @@ class TextRefresh:
                 for pa in self._panel.panel_turtle:
                     pa.write_text()
                 self._refresh.refresh_panel = 0
+            # Text boxes are bound to their values the first time they are seen and only redrawn when they change
             for t in self._textbox.text_on_screen_list:
-                if t.id == 1:
-                    t.write("Score: {}  High Score: {}".format(self._statistics.score, self._statistics.high_score_machine_war), 24, "normal")
-                elif t.id == 2:
-                    for yi in self._yellow_power_up_indicator.yellow_power_up_indicator_turtle:
-                        if yi.get_power_up_active() == 1:
-                            t.write("{}".format(yi.get_power_up_timer()), 24, "normal")
-                        else:
-                            t.write("0", 24, "normal")
-                elif t.id == 3:
-                    for bi in self._blue_power_up_indicator.blue_power_up_indicator_turtle:
-                        if bi.get_power_up_active() == 1:
-                            t.write("{}".format(bi.get_power_up_timer()), 24, "normal")
-                        else:
-                            t.write("0", 24, "normal")
-                elif t.id == 4:
-                    for ei in self._extra_power_up_indicator.extra_power_up_indicator_turtle:
-                        if ei.get_power_up_active() == 1:
-                            t.write("{}".format(ei.get_power_up_timer()), 24, "normal")
-                        else:
-                            t.write("0", 24, "normal")
-                elif t.id == 5:
-                    t.write_left("{}".format(self._shop_config.total_coins), 24, "normal")
-                elif t.id == 6:
-                    t.write("God Mode Is On!", 24, "normal")
+                if t.source is None:
+                    self.bind_game_text(t)
+                t.refresh()
         elif self._screen.mode == "Alien_Mode":
             if self._refresh.refresh_button == 1:
                 for bu in self._button.buttons_on_screen_list:
@@ -223,31 +247,11 @@ class TextRefresh:
                 for pa in self._panel.panel_turtle:
                     pa.write_text()
                 self._refresh.refresh_panel = 0
+            # Text boxes are bound to their values the first time they are seen and only redrawn when they change
             for t in self._textbox.text_on_screen_list:
-                if t.id == 1:
-                    t.write("Score: {}  High Score: {}".format(self._statistics.score, self._statistics.high_score_alien_mode), 24, "normal")
-                elif t.id == 2:
-                    for yi in self._yellow_power_up_indicator.yellow_power_up_indicator_turtle:
-                        if yi.get_power_up_active() == 1:
-                            t.write("{}".format(yi.get_power_up_timer()), 24, "normal")
-                        else:
-                            t.write("0", 24, "normal")
-                elif t.id == 3:
-                    for bi in self._blue_power_up_indicator.blue_power_up_indicator_turtle:
-                        if bi.get_power_up_active() == 1:
-                            t.write("{}".format(bi.get_power_up_timer()), 24, "normal")
-                        else:
-                            t.write("0", 24, "normal")
-                elif t.id == 4:
-                    for ei in self._extra_power_up_indicator.extra_power_up_indicator_turtle:
-                        if ei.get_power_up_active() == 1:
-                            t.write("{}".format(ei.get_power_up_timer()), 24, "normal")
-                        else:
-                            t.write("0", 24, "normal")
-                elif t.id == 5:
-                    t.write_left("{}".format(self._shop_config.total_coins), 24, "normal")
-                elif t.id == 6:
-                    t.write("God Mode Is On!", 24, "normal")
+                if t.source is None:
+                    self.bind_game_text(t)
+                t.refresh()
         elif self._screen.mode == "Shop":
             if self._refresh.refresh_button == 1:
                 for bu in self._button.buttons_on_screen_list:
@@ -381,56 +385,17 @@ class TextRefresh:
             for t in self._textbox.text_on_screen_list:
                 if t.id == 1:
                     t.write("Statistics", 72, "bold")
-                if self._refresh.refresh_text == 1:
-                    if t.id == 2:
-                        t.write("Machine Mode", 48, "bold")
-                    elif t.id == 3:
-                        t.write("Alien Mode", 48, "bold")
-                    elif t.id == 4:
-                        t.write("High Score: {}".format(self._statistics.high_score_machine_war), 24, "normal")
-                    elif t.id == 5:
-                        t.write("Bosses Killed: {}".format(self._statistics.bosses_killed), 24, "normal")
-                    elif t.id == 6:
-                        t.write("Red Bots Killed: {}".format(self._statistics.red_bots_killed), 24, "normal")
-                    elif t.id == 7:
-                        t.write("Yellow Bots Killed: {}".format(self._statistics.yellow_bots_killed), 24, "normal")
-                    elif t.id == 8:
-                        t.write("Blue Bots Killed: {}".format(self._statistics.blue_bots_killed), 24, "normal")
-                    elif t.id == 9:
-                        t.write("Deaths: {}".format(self._statistics.classic_deaths), 24, "normal")
-                    elif t.id == 10:
-                        t.write("Damage Taken: {}".format(self._statistics.machine_damage_taken), 24, "normal")
-                    elif t.id == 11:
-                        t.write("Lasers Fired: {}".format(self._statistics.classic_lasers_fired), 24, "normal")
-                    elif t.id == 12:
-                        t.write("Power Ups Picked Up: {}".format(self._statistics.classic_power_ups_picked_up), 24, "normal")
-                    elif t.id == 13:
-                        t.write("Coins Collected: {}".format(self._statistics.machine_coins_collected), 24, "normal")
-                    elif t.id == 14:
-                        t.write("High Score: {}".format(self._statistics.high_score_alien_mode), 24, "normal")
-                    elif t.id == 15:
-                        t.write("UFOs Killed: {}".format(self._statistics.ufos_killed), 24, "normal")
-                    elif t.id == 16:
-                        t.write("Big Aliens Killed: {}".format(self._statistics.big_aliens_killed), 24, "normal")
-                    elif t.id == 17:
-                        t.write("Medium Aliens Killed: {}".format(self._statistics.medium_aliens_killed), 24, "normal")
-                    elif t.id == 18:
-                        t.write("Small Aliens Killed: {}".format(self._statistics.small_aliens_killed), 24, "normal")
-                    elif t.id == 19:
-                        t.write("Deaths: {}".format(self._statistics.alien_deaths), 24, "normal")
-                    elif t.id == 20:
-                        t.write("Damage Taken: {}".format(self._statistics.damage_taken), 24, "normal")
-                    elif t.id == 21:
-                        t.write("Lasers Fired: {}".format(self._statistics.alien_lasers_fired), 24, "normal")
-                    elif t.id == 22:
-                        t.write("Jumps: {}".format(self._statistics.jumps), 24, "normal")
-                    elif t.id == 23:
-                        t.write("Power Ups Picked Up: {}".format(self._statistics.alien_power_ups_picked_up), 24, "normal")
-                    elif t.id == 24:
-                        t.write("Coins Collected: {}".format(self._statistics.alien_coins_collected), 24, "normal")
-                        self._refresh.refresh_text = 0
+                elif t.id == 2:
+                    t.write("Machine Mode", 48, "bold")
+                elif t.id == 3:
+                    t.write("Alien Mode", 48, "bold")
+                elif t.id in self.STATS_TEXT:
+                    if t.source is None:
+                        self.bind_stats_text(t)
+                    t.refresh()
                 if t.id == 25:
                     t.write("God Mode Is On!", 24, "normal")
+            self._refresh.refresh_text = 0
         elif self._screen.mode == "Settings":
             for bu in self._button.buttons_on_screen_list:
                 if self._refresh.refresh_button == 1:
@@ -508,3 +473,68 @@ class TextRefresh:
                     t.write("Controls", 72, "bold")
                 elif t.id == 2:
                     t.write("God Mode Is On!", 24, "normal")
+
+        # Measure how many text boxes were redrawn in the last second
+        elapsed_time = game_clock.now - self._redraw_time
+        if elapsed_time >= 1:
+            self.redraws_per_second = (Text.redraw_count - self._redraw_count) / elapsed_time
+            self._redraw_time = game_clock.now
+            self._redraw_count = Text.redraw_count
+
+    def bind_game_text(self, t):
+        """
+            Binds a text box in Machine Mode or Alien Mode to the value that it shows.
+
+            :param t: The text box to bind
+            :type t: Text()
+
+            :return: None
+        """
+
+        if t.id == 1:
+            if self._screen.mode == "Machine_Mode":
+                t.bind(lambda: "Score: {}  High Score: {}".format(self._statistics.score, self._statistics.high_score_machine_war), 24, "normal")
+            else:
+                t.bind(lambda: "Score: {}  High Score: {}".format(self._statistics.score, self._statistics.high_score_alien_mode), 24, "normal")
+        elif t.id == 2:
+            t.bind(lambda: self.get_power_up_timer_text(self._yellow_power_up_indicator.yellow_power_up_indicator_turtle), 24, "normal")
+        elif t.id == 3:
+            t.bind(lambda: self.get_power_up_timer_text(self._blue_power_up_indicator.blue_power_up_indicator_turtle), 24, "normal")
+        elif t.id == 4:
+            t.bind(lambda: self.get_power_up_timer_text(self._extra_power_up_indicator.extra_power_up_indicator_turtle), 24, "normal")
+        elif t.id == 5:
+            t.bind(lambda: "{}".format(self._shop_config.total_coins), 24, "normal", "left")
+        elif t.id == 6:
+            t.bind(lambda: "God Mode Is On!", 24, "normal")
+
+    def bind_stats_text(self, t):
+        """
+            Binds a text box on the statistics screen to the statistic that it shows.
+
+            :param t: The text box to bind
+            :type t: Text()
+
+            :return: None
+        """
+
+        label, attribute = self.STATS_TEXT[t.id]
+        t.bind(lambda: label.format(getattr(self._statistics, attribute)), 24, "normal")
+
+    def get_power_up_timer_text(self, indicators):
+        """
+            Finds the text for a power up timer.
+
+            :param indicators: The list of power up indicators for one type of power up
+            :type indicators: list
+
+            :return: The seconds left on the power up ("0" when it is not active), or None if there is no indicator
+            :type: string
+        """
+
+        text = None
+        for indicator in indicators:
+            if indicator.get_power_up_active() == 1:
+                text = "{}".format(indicator.get_power_up_timer())
+            else:
+                text = "0"
+        return text
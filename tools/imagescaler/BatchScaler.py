@@ -0,0 +1,263 @@
+# Copyright (C) [2024] [Christian Marinkovich]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+    File: BatchScaler.py
+    Author: Christian Marinkovich
+    Date: 2024-08-01
+    Description:
+    This file contains the logic for the batch (command line) mode of the image scaler.
+    Every image in a folder (or in a list of images) is scaled for each of the given screen resolutions, in parallel
+        over several processes. The scaled images are saved straight into the texture cache of the game, and the cache
+        manifest is updated, so the game finds them in the cache when it is launched in fullscreen mode at one of
+        those resolutions instead of scaling them itself. The sizes, cache keys and manifest are handled by the same
+        functions the game uses (See source/utils/TextureCache.py).
+    The scaled images are marked as batch scaled in the manifest, so pruning the cache (cleanup.bat or cleanup.sh
+        without --all) keeps them until their original image is deleted.
+    Images that already have a scaled image newer than the original are skipped.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from source.utils.TextureCache import TextureCache
+from source.utils.TextureCache import add_entry
+from source.utils.TextureCache import get_cache_key
+from source.utils.TextureCache import get_scaled_size
+from source.utils.TextureCache import get_source_info
+from source.utils.TextureCache import load_manifest
+from source.utils.TextureCache import save_manifest
+from source.utils.TextureCache import scale_texture
+
+
+class BatchScaler:
+    """
+        Represents a batch of images to be scaled for several screen resolutions.
+
+        Class Variables:
+            DEFAULT_WIDTH (int): The width of the default game window (Textures are made for this size)
+            DEFAULT_HEIGHT (int): The height of the default game window
+            CACHE_DIRECTORY (string): The texture cache folder inside the game folder
+            MANIFEST_PATH (string): The path to the cache manifest that the game loads (Inside the game folder)
+            IMAGE_EXTENSIONS (tuple): The extensions of the files that are scaled
+            SCALED_SUFFIX (string): The suffix of the scaled textures made by the game (These are never scaled again)
+            FILTERS (tuple): The names of the Pillow resample filters that can be chosen
+
+        Attributes:
+            _game_directory (string): The folder the game is run from (Every path in the manifest is relative to it)
+            _resample_filter (string): The name of the Pillow resample filter used to scale the images
+            _workers (int): The number of processes used to scale the images
+            _force (bool): Scales every image again, even if its scaled images are newer than it
+            scaled (int): The number of images that were scaled during the last call to run()
+            skipped (int): The number of images that were already up-to-date during the last call to run()
+            errors (list): The error messages from images that could not be scaled during the last call to run()
+    """
+
+    DEFAULT_WIDTH = 1280
+    DEFAULT_HEIGHT = 720
+    CACHE_DIRECTORY = TextureCache.CACHE_DIRECTORY
+    MANIFEST_PATH = TextureCache.MANIFEST_PATH
+    IMAGE_EXTENSIONS = (".gif", ".png")
+    SCALED_SUFFIX = TextureCache.SCALED_SUFFIX
+    FILTERS = ("NEAREST", "BOX", "BILINEAR", "HAMMING", "BICUBIC", "LANCZOS")
+
+    def __init__(self, game_directory, resample_filter="BICUBIC", workers=None, force=False):
+        """
+            Creates the batch scaler.
+
+            :param game_directory: The folder the game is run from (The "source" folder)
+            :type game_directory: string
+
+            :param resample_filter: The name of the Pillow resample filter used to scale the images (The game scales
+                its textures with "BICUBIC", so only those images are found by the game)
+            :type resample_filter: string
+
+            :param workers: The number of processes used to scale the images (Defaults to the number of CPU cores)
+            :type workers: int
+
+            :param force: Scales every image again, even if its scaled images are newer than it
+            :type force: bool
+        """
+
+        if resample_filter not in self.FILTERS:
+            raise ValueError(f"resample_filter must be one of: {', '.join(self.FILTERS)}")
+        self._game_directory = game_directory
+        self._resample_filter = resample_filter
+        self._workers = workers or os.cpu_count() or 1
+        self._force = force
+        self.scaled = 0
+        self.skipped = 0
+        self.errors = []
+
+    def __del__(self):
+        """
+            Clear the variables from memory once the program has terminated
+
+            :return: None
+        """
+
+        del self._game_directory
+        del self._resample_filter
+        del self._workers
+        del self._force
+        del self.scaled
+        del self.skipped
+        del self.errors
+
+    @staticmethod
+    def parse_resolution(resolution):
+        """
+            Reads a screen resolution written as "<width>x<height>" (Ex: "1920x1080").
+
+            :param resolution: The resolution
+            :type resolution: string
+
+            :return: The width and height
+            :type: tuple
+        """
+
+        try:
+            width, height = (int(length) for length in resolution.lower().split("x"))
+        except ValueError:
+            raise ValueError(f"Invalid resolution {resolution} (Expected <width>x<height>, Ex: 1920x1080)")
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid resolution {resolution} (The width and height must be above 0)")
+        return width, height
+
+    def get_game_path(self, path):
+        """
+            Converts a path to the form the game uses (Relative to the game folder, with forward slashes).
+
+            :param path: The path to an image
+            :type path: string
+
+            :return: The path relative to the game folder
+            :type: string
+        """
+
+        return os.path.relpath(path, self._game_directory).replace(os.sep, "/")
+
+    def is_image(self, path):
+        """
+            Checks if a file is an original texture that should be scaled.
+
+            :param path: The path to the file
+            :type path: string
+
+            :return: True if the file should be scaled
+            :type: bool
+        """
+
+        name, ext = os.path.splitext(os.path.basename(path))
+        return ext.lower() in self.IMAGE_EXTENSIONS and not name.endswith(self.SCALED_SUFFIX)
+
+    def find_images(self, inputs):
+        """
+            Finds every image to scale. Each input is either a folder (Searched with every folder inside it), an image,
+                or a manifest listing the images to scale (A text file with one path per line, or a JSON list of paths).
+                The paths in a manifest are relative to the game folder.
+
+            :param inputs: The folders, images and manifests
+            :type inputs: list
+
+            :return: The paths to the images, with no duplicates
+            :type: list
+        """
+
+        images = []
+        for path in inputs:
+            if os.path.isdir(path):
+                cache_directory = os.path.normpath(os.path.join(self._game_directory, self.CACHE_DIRECTORY))
+                for root, directories, files in os.walk(path):
+                    # Never scale the images that are already in the cache
+                    directories[:] = sorted(d for d in directories
+                                            if os.path.normpath(os.path.join(root, d)) != cache_directory)
+                    images.extend(os.path.join(root, file) for file in sorted(files))
+            elif self.is_image(path):
+                images.append(path)
+            else:
+                with open(path, 'r') as manifest_file:
+                    contents = manifest_file.read()
+                try:
+                    listed_paths = json.loads(contents)
+                except ValueError:
+                    listed_paths = [line.strip() for line in contents.splitlines()]
+                images.extend(os.path.join(self._game_directory, p) for p in listed_paths if p and not p.startswith("#"))
+
+        found = []
+        seen = set()
+        for image in images:
+            if self.is_image(image) and os.path.normpath(image) not in seen:
+                seen.add(os.path.normpath(image))
+                found.append(image)
+        return found
+
+    def run(self, inputs, resolutions):
+        """
+            Scales every image for every resolution and updates the cache manifest of the game.
+
+            :param inputs: The folders, images and manifests of the images to scale
+            :type inputs: list
+
+            :param resolutions: The screen resolutions to scale the images for (Ex: [(1920, 1080), (2560, 1440)])
+            :type resolutions: list
+
+            :return: None
+        """
+
+        self.scaled = 0
+        self.skipped = 0
+        self.errors = []
+        os.makedirs(os.path.join(self._game_directory, self.CACHE_DIRECTORY), exist_ok=True)
+        manifest_path = os.path.join(self._game_directory, self.MANIFEST_PATH)
+        manifest = load_manifest(manifest_path)
+
+        jobs = {}
+        for source_path in self.find_images(inputs):
+            try:
+                info = get_source_info(manifest, source_path, self.get_game_path(source_path))
+            except OSError as e:
+                self.errors.append(f"Couldn't read {source_path}: {e}")
+                continue
+            source_mtime = os.stat(source_path).st_mtime_ns
+            ext = os.path.splitext(source_path)[1]
+            for screen_width, screen_height in resolutions:
+                width, height = get_scaled_size(info, screen_width / self.DEFAULT_WIDTH,
+                                                screen_height / self.DEFAULT_HEIGHT)
+                key = get_cache_key(info, width, height, self._resample_filter)
+                if key in jobs:
+                    continue
+                cache_path = f"{self.CACHE_DIRECTORY}/{key}{ext}"
+                output_path = os.path.join(self._game_directory, cache_path)
+                add_entry(manifest, key, cache_path, self.get_game_path(source_path), width, height,
+                          self._resample_filter, 1)
+                if not self._force and os.path.exists(output_path) and os.stat(output_path).st_mtime_ns > source_mtime:
+                    self.skipped = self.skipped + 1
+                else:
+                    jobs[key] = (source_path, output_path, width, height, self._resample_filter)
+
+        # Scale every image in parallel
+        if jobs:
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                futures = {key: executor.submit(scale_texture, *job) for key, job in jobs.items()}
+                for key, future in futures.items():
+                    try:
+                        future.result()
+                        self.scaled = self.scaled + 1
+                    except Exception as e:
+                        self.errors.append(f"Couldn't scale {jobs[key][0]}: {e}")
+                        del manifest["entries"][key]
+
+        save_manifest(manifest, manifest_path)
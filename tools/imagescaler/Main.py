@@ -21,14 +21,49 @@
     Main file for the image scaler sub application.
     This application is used to rescale textures in Laser Fighter. This is so that I do not have to manually rescale
         them myself.
+    With no arguments, the application window is opened. With arguments, the images are scaled in batch mode instead
+        (Ex: python -m tools.imagescaler.Main source/textures --resolutions 1920x1080 2560x1440).
 """
 
-import tkinter
-from tools.imagescaler.ImageScaler import ImageScalerApp
+import argparse
+import sys
+from tools.imagescaler.BatchScaler import BatchScaler
+
+
+# Batch mode
+def batch(arguments):
+    parser = argparse.ArgumentParser(description="Scales Laser Fighter textures for several screen resolutions and "
+                                                 "saves them to the texture cache of the game")
+    parser.add_argument("inputs", nargs="+",
+                        help="Folders or images to scale, or manifests listing them (One path per line, relative to "
+                             "the game folder)")
+    parser.add_argument("--resolutions", nargs="+", required=True, type=BatchScaler.parse_resolution,
+                        help="The screen resolutions to scale the images for (Ex: 1920x1080 2560x1440)")
+    parser.add_argument("--game-directory", default="source",
+                        help="The folder the game is run from (Default: source)")
+    parser.add_argument("--filter", default="BICUBIC", choices=BatchScaler.FILTERS,
+                        help="The resample filter (Default: BICUBIC, the only one the game uses)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="The number of processes to scale with (Default: the number of CPU cores)")
+    parser.add_argument("--force", action="store_true",
+                        help="Scale every image again, even if its scaled images are up-to-date")
+    arguments = parser.parse_args(arguments)
+
+    batch_scaler = BatchScaler(arguments.game_directory, arguments.filter, arguments.workers, arguments.force)
+    batch_scaler.run(arguments.inputs, arguments.resolutions)
+    for error in batch_scaler.errors:
+        print(f"Error: {error}")
+    print(f"Scaled: {batch_scaler.scaled}  Up-to-date: {batch_scaler.skipped}  Errors: {len(batch_scaler.errors)}")
+    return 1 if batch_scaler.errors else 0
 
 
 # Main function defined
 def main():
+    if len(sys.argv) > 1:
+        sys.exit(batch(sys.argv[1:]))
+    # Only the application window needs tkinter
+    import tkinter
+    from tools.imagescaler.ImageScaler import ImageScalerApp
     root = tkinter.Tk()
     app = ImageScalerApp(root)
     root.mainloop()